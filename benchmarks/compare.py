@@ -0,0 +1,88 @@
+"""Compare two benchmark result files and report regressions.
+
+Usage:
+    python -m benchmarks.compare baseline.json results.json --threshold 10
+
+The exit code is 1 if the mean time of any benchmark increased by more than the threshold
+percentage, so this can be used as a CI gate.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+
+def _key(result: dict[str, Any]) -> tuple[str, str, str]:
+    return result["name"], result["client"], result["json_handler"]
+
+
+def compare(
+    baseline: dict[str, Any], current: dict[str, Any], threshold: float
+) -> tuple[list[str], list[str]]:
+    """Compare the results of two benchmark runs.
+
+    Args:
+        baseline: The parsed baseline results file.
+        current: The parsed results file to check.
+        threshold: The percentage increase in mean time that counts as a regression.
+
+    Returns:
+        A tuple of the report lines and the regressed benchmarks.
+    """
+    baseline_results = {_key(x): x for x in baseline["results"]}
+    lines = []
+    regressions = []
+    for result in current["results"]:
+        key = _key(result)
+        old = baseline_results.get(key)
+        name = "/".join(key)
+        if old is None:
+            lines.append(f"{name:<50} {'new':>10} {result['mean_ms']:>10.3f}ms")
+            continue
+
+        change = (
+            (result["mean_ms"] - old["mean_ms"]) / old["mean_ms"] * 100 if old["mean_ms"] else 0.0
+        )
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        lines.append(
+            f"{name:<50} {old['mean_ms']:>10.3f}ms {result['mean_ms']:>10.3f}ms {change:>+8.1f}%{flag}"
+        )
+
+    return lines, regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare benchmark results")
+    parser.add_argument("baseline", type=Path, help="Baseline results file")
+    parser.add_argument("current", type=Path, help="Results file to check")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="Percentage increase in mean time that counts as a regression",
+    )
+    args = parser.parse_args(argv)
+
+    baseline = json.loads(args.baseline.read_text())
+    current = json.loads(args.current.read_text())
+    lines, regressions = compare(baseline, current, args.threshold)
+    sys.stdout.write("\n".join(lines) + "\n")
+
+    if regressions:
+        sys.stdout.write(
+            f"{len(regressions)} benchmark(s) regressed by more than {args.threshold}%\n"
+        )
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,103 @@
+"""Measure how long it takes to import the SDK.
+
+Usage:
+    python -m benchmarks.import_time --output import_results.json
+
+Each statement is run in a fresh interpreter with `-X importtime` and the cumulative import time
+of the top level modules it imports is recorded. The results use the same format as
+`benchmarks.run` so they can be compared with `benchmarks.compare`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+from dataclasses import asdict
+from datetime import datetime, timezone
+from functools import lru_cache
+
+from benchmarks.run import Result, _result
+
+STATEMENTS = {
+    "import_package": "import meilisearch_python_sdk",
+    "import_client": "from meilisearch_python_sdk import Client",
+    "import_async_client": "from meilisearch_python_sdk import AsyncClient",
+}
+
+
+def _top_level_imports(statement: str) -> dict[str, int]:
+    process = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    imports = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _, cumulative, name = line.split("|")
+        if not name.startswith("  "):
+            imports[name.strip()] = int(cumulative)
+
+    return imports
+
+
+@lru_cache(maxsize=1)
+def _startup_modules() -> frozenset[str]:
+    return frozenset(_top_level_imports("pass"))
+
+
+def import_time(statement: str) -> float:
+    """Run a statement in a new interpreter and return its import time in seconds.
+
+    Modules the interpreter imports at startup are excluded.
+    """
+    imports = _top_level_imports(statement)
+    startup = _startup_modules()
+
+    return sum(v for k, v in imports.items() if k not in startup) / 1_000_000
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the SDK import time")
+    parser.add_argument("--output", help="File to save the JSON results to")
+    parser.add_argument(
+        "--iterations", type=int, default=20, help="Interpreters started per import"
+    )
+    args = parser.parse_args(argv)
+
+    results: list[Result] = []
+    for name, statement in STATEMENTS.items():
+        timings = [import_time(statement) for _ in range(args.iterations)]
+        results.append(_result(name, "none", "none", timings))
+
+    for result in results:
+        sys.stdout.write(
+            f"{result.name:<20} mean {result.mean_ms:>9.3f}ms  p50 {result.p50_ms:>9.3f}ms  "
+            f"p95 {result.p95_ms:>9.3f}ms\n"
+        )
+
+    if args.output:
+        output = {
+            "meta": {
+                "python": platform.python_version(),
+                "implementation": platform.python_implementation(),
+                "platform": platform.platform(),
+                "timestamp": datetime.now(tz=timezone.utc).isoformat(),
+                "config": {"iterations": args.iterations},
+            },
+            "results": [asdict(x) for x in results],
+        }
+        with open(args.output, "w") as f:
+            json.dump(output, f, indent=2)
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
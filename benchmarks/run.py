@@ -0,0 +1,312 @@
+"""Measure the SDK overhead against the in-process stand-in server.
+
+Usage:
+    python -m benchmarks.run --output results.json
+
+Every benchmark runs against `benchmarks.stand_in.StandInServer` served through the httpx ASGI
+(AsyncClient) or WSGI (Client) transport, so no network or Meilisearch instance is involved and
+the timings reflect the work done by the SDK itself plus the configured stand-in latency.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from httpx2 import ASGITransport, WSGITransport
+from httpx2 import AsyncClient as HttpxAsyncClient
+from httpx2 import Client as HttpxClient
+
+from benchmarks.stand_in import StandInConfig, StandInServer
+from meilisearch_python_sdk import AsyncClient, Client
+from meilisearch_python_sdk._http_requests import AsyncHttpRequests, HttpRequests
+from meilisearch_python_sdk._version import VERSION
+from meilisearch_python_sdk.json_handler import BuiltinHandler, OrjsonHandler
+from meilisearch_python_sdk.models.search import SearchParams
+from meilisearch_python_sdk.plugins import AsyncEvent, AsyncIndexPlugins, Event, IndexPlugins
+
+BASE_URL = "http://meilisearch"
+INDEX_UID = "benchmark"
+
+
+@dataclass
+class Result:
+    name: str
+    client: str
+    json_handler: str
+    ops: int
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    ops_per_sec: float
+
+
+class _NoOpAsyncPlugin:
+    CONCURRENT_EVENT = True
+    POST_EVENT = True
+    PRE_EVENT = True
+
+    async def run_plugin(self, event: AsyncEvent, **kwargs: Any) -> None:  # noqa: ANN401
+        return None
+
+
+class _NoOpPlugin:
+    CONCURRENT_EVENT = False
+    POST_EVENT = True
+    PRE_EVENT = True
+
+    def run_plugin(self, event: Event, **kwargs: Any) -> None:  # noqa: ANN401
+        return None
+
+
+def _result(
+    name: str, client: str, json_handler: str, timings: list[float], ops_per_call: int = 1
+) -> Result:
+    timings_ms = sorted(x * 1000 for x in timings)
+    total = sum(timings)
+    return Result(
+        name=name,
+        client=client,
+        json_handler=json_handler,
+        ops=len(timings) * ops_per_call,
+        mean_ms=round(statistics.fmean(timings_ms), 4),
+        p50_ms=round(statistics.median(timings_ms), 4),
+        p95_ms=round(timings_ms[max(int(len(timings_ms) * 0.95) - 1, 0)], 4),
+        ops_per_sec=round(len(timings) * ops_per_call / total, 2) if total else 0.0,
+    )
+
+
+def _documents(count: int, size: int) -> list[dict[str, Any]]:
+    return [{"id": i, "title": f"Movie {i}", "overview": "x" * size} for i in range(count)]
+
+
+def _async_client(
+    server: StandInServer, json_handler: BuiltinHandler | OrjsonHandler
+) -> AsyncClient:
+    client = AsyncClient(BASE_URL, "masterKey", json_handler=json_handler)
+    client.http_client = HttpxAsyncClient(
+        base_url=BASE_URL,
+        headers=client._headers,
+        transport=ASGITransport(server.asgi),  # type: ignore[arg-type]
+    )
+    client._http_requests = AsyncHttpRequests(client.http_client, json_handler=json_handler)
+    return client
+
+
+def _client(server: StandInServer, json_handler: BuiltinHandler | OrjsonHandler) -> Client:
+    client = Client(BASE_URL, "masterKey", json_handler=json_handler)
+    client.http_client = HttpxClient(
+        base_url=BASE_URL,
+        headers=client._headers,
+        transport=WSGITransport(server.wsgi),  # type: ignore[arg-type]
+    )
+    client._http_requests = HttpRequests(client.http_client, json_handler=json_handler)
+    return client
+
+
+async def _time_async(func: Callable[[], Awaitable[Any]], iterations: int) -> list[float]:
+    await func()  # warm up
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await func()
+        timings.append(time.perf_counter() - start)
+
+    return timings
+
+
+def _time(func: Callable[[], Any], iterations: int) -> list[float]:
+    func()  # warm up
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    return timings
+
+
+async def run_async(
+    config: StandInConfig, json_handler: BuiltinHandler | OrjsonHandler, args: argparse.Namespace
+) -> list[Result]:
+    handler_name = type(json_handler).__name__
+    server = StandInServer(config)
+    client = _async_client(server, json_handler)
+    index = client.index(INDEX_UID)
+    plugin = _NoOpAsyncPlugin()
+    plugin_index = client.index(INDEX_UID, plugins=AsyncIndexPlugins(search_plugins=(plugin,)))
+    documents = _documents(args.documents, args.document_size)
+    queries = [{"index_uid": INDEX_UID, "query": "movie"} for _ in range(args.multi_search_queries)]
+
+    async def wait_for_task() -> None:
+        task = await index.add_documents(documents[:1])
+        await client.wait_for_task(task.task_uid, interval_in_ms=0)
+
+    async def multi_search() -> None:
+        await client.multi_search([SearchParams(**x) for x in queries])
+
+    results = [
+        _result(
+            "search",
+            "async",
+            handler_name,
+            await _time_async(lambda: index.search("movie"), args.iterations),
+        ),
+        _result(
+            "search_plugin_dispatch",
+            "async",
+            handler_name,
+            await _time_async(lambda: plugin_index.search("movie"), args.iterations),
+        ),
+        _result(
+            "multi_search",
+            "async",
+            handler_name,
+            await _time_async(multi_search, args.iterations),
+        ),
+        _result(
+            "add_documents_in_batches",
+            "async",
+            handler_name,
+            await _time_async(
+                lambda: index.add_documents_in_batches(documents, batch_size=args.batch_size),
+                args.ingest_iterations,
+            ),
+            ops_per_call=len(documents),
+        ),
+        _result(
+            "wait_for_task",
+            "async",
+            handler_name,
+            await _time_async(wait_for_task, args.iterations),
+        ),
+    ]
+    await client.aclose()
+
+    return results
+
+
+def run_sync(
+    config: StandInConfig, json_handler: BuiltinHandler | OrjsonHandler, args: argparse.Namespace
+) -> list[Result]:
+    handler_name = type(json_handler).__name__
+    server = StandInServer(config)
+    client = _client(server, json_handler)
+    index = client.index(INDEX_UID)
+    plugin = _NoOpPlugin()
+    plugin_index = client.index(INDEX_UID, plugins=IndexPlugins(search_plugins=(plugin,)))
+    documents = _documents(args.documents, args.document_size)
+    queries = [{"index_uid": INDEX_UID, "query": "movie"} for _ in range(args.multi_search_queries)]
+
+    def wait_for_task() -> None:
+        task = index.add_documents(documents[:1])
+        client.wait_for_task(task.task_uid, interval_in_ms=0)
+
+    def multi_search() -> None:
+        client.multi_search([SearchParams(**x) for x in queries])
+
+    results = [
+        _result(
+            "search", "sync", handler_name, _time(lambda: index.search("movie"), args.iterations)
+        ),
+        _result(
+            "search_plugin_dispatch",
+            "sync",
+            handler_name,
+            _time(lambda: plugin_index.search("movie"), args.iterations),
+        ),
+        _result("multi_search", "sync", handler_name, _time(multi_search, args.iterations)),
+        _result(
+            "add_documents_in_batches",
+            "sync",
+            handler_name,
+            _time(
+                lambda: index.add_documents_in_batches(documents, batch_size=args.batch_size),
+                args.ingest_iterations,
+            ),
+            ops_per_call=len(documents),
+        ),
+        _result("wait_for_task", "sync", handler_name, _time(wait_for_task, args.iterations)),
+    ]
+    client.close()
+
+    return results
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the Meilisearch Python SDK")
+    parser.add_argument("--output", help="File to save the JSON results to")
+    parser.add_argument("--iterations", type=int, default=200, help="Iterations per benchmark")
+    parser.add_argument(
+        "--ingest-iterations", type=int, default=5, help="Iterations of the ingestion benchmark"
+    )
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Stand-in server latency")
+    parser.add_argument("--hits", type=int, default=20, help="Hits returned per search")
+    parser.add_argument("--hit-size", type=int, default=256, help="Size in bytes of each hit")
+    parser.add_argument("--task-polls", type=int, default=1, help="Polls before a task succeeds")
+    parser.add_argument("--documents", type=int, default=10_000, help="Documents to ingest")
+    parser.add_argument("--document-size", type=int, default=256, help="Size of each document")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Ingestion batch size")
+    parser.add_argument(
+        "--multi-search-queries", type=int, default=5, help="Queries per multi search"
+    )
+    parser.add_argument(
+        "--client", choices=("async", "sync", "both"), default="both", help="Clients to run"
+    )
+
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    config = StandInConfig(
+        latency_ms=args.latency_ms,
+        hits=args.hits,
+        hit_size=args.hit_size,
+        task_polls=args.task_polls,
+    )
+
+    results: list[Result] = []
+    for json_handler in (BuiltinHandler(), OrjsonHandler()):
+        if args.client in ("async", "both"):
+            results.extend(asyncio.run(run_async(config, json_handler, args)))
+        if args.client in ("sync", "both"):
+            results.extend(run_sync(config, json_handler, args))
+
+    output = {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "sdk_version": VERSION,
+            "timestamp": datetime.now(tz=timezone.utc).isoformat(),
+            "config": {k: v for k, v in vars(args).items() if k != "output"},
+        },
+        "results": [asdict(x) for x in results],
+    }
+
+    for result in results:
+        sys.stdout.write(
+            f"{result.name:<26} {result.client:<6} {result.json_handler:<15} "
+            f"mean {result.mean_ms:>9.3f}ms  p95 {result.p95_ms:>9.3f}ms  "
+            f"{result.ops_per_sec:>12.1f} ops/s\n"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(output, f, indent=2)
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
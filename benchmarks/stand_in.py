@@ -0,0 +1,230 @@
+"""In-process stand-in for the Meilisearch API used by the benchmarks.
+
+The stand-in implements just enough of the API for the SDK to exercise its search, document,
+task, and multi-search code paths. Responses are generated from a `StandInConfig` so the latency
+and payload sizes can be controlled, and it can be served as an ASGI app for the AsyncClient or as
+a WSGI app for the Client without opening a socket.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import itertools
+import json
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+from meilisearch_python_sdk.types import JsonDict
+
+
+@dataclass
+class StandInConfig:
+    """Settings that control the stand-in responses.
+
+    latency_ms: Time added to every response.
+    hits: Number of hits returned by each search.
+    hit_size: Approximate size in bytes of each hit.
+    task_polls: Number of times a task is reported as processing before it succeeds.
+    """
+
+    latency_ms: float = 0.0
+    hits: int = 20
+    hit_size: int = 256
+    task_polls: int = 1
+
+
+@dataclass
+class _State:
+    task_uids: itertools.count = field(default_factory=itertools.count)
+    task_polls: dict[int, int] = field(default_factory=dict)
+    task_indexes: dict[int, str | None] = field(default_factory=dict)
+    documents_received: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class StandInServer:
+    """Stand-in Meilisearch server.
+
+    Examples:
+        >>> from httpx2 import ASGITransport, AsyncClient
+        >>> server = StandInServer(StandInConfig(latency_ms=1))
+        >>> http_client = AsyncClient(base_url="http://meilisearch", transport=ASGITransport(server.asgi))
+    """
+
+    def __init__(self, config: StandInConfig | None = None) -> None:
+        self.config = config or StandInConfig()
+        self._state = _State()
+        self._hits = [
+            {"id": i, "title": f"Movie {i}", "overview": "x" * self.config.hit_size}
+            for i in range(self.config.hits)
+        ]
+        self._search_response = json.dumps(
+            {
+                "hits": self._hits,
+                "query": "",
+                "processingTimeMs": 1,
+                "limit": self.config.hits,
+                "offset": 0,
+                "estimatedTotalHits": self.config.hits,
+            }
+        ).encode()
+
+    @property
+    def documents_received(self) -> int:
+        return self._state.documents_received
+
+    def handle(
+        self, method: str, path: str, headers: dict[str, str], body: bytes
+    ) -> tuple[int, bytes]:
+        parts = [x for x in path.split("/") if x]
+
+        if method == "GET" and parts == ["health"]:
+            return 200, b'{"status": "available"}'
+
+        if method == "POST" and parts == ["multi-search"]:
+            queries = json.loads(body)["queries"]
+            results = [
+                {**json.loads(self._search_response), "indexUid": x["indexUid"]} for x in queries
+            ]
+            return 200, json.dumps({"results": results}).encode()
+
+        if parts[:1] == ["tasks"] and len(parts) == 2 and method == "GET":
+            return self._get_task(int(parts[1]))
+
+        if parts[:1] == ["indexes"]:
+            if len(parts) == 1 and method == "POST":
+                return 202, self._enqueue(json.loads(body)["uid"], "indexCreation")
+
+            uid = parts[1]
+            route = parts[2] if len(parts) > 2 else None
+            if route is None and method == "GET":
+                now = _now()
+                return 200, json.dumps(
+                    {"uid": uid, "primaryKey": "id", "createdAt": now, "updatedAt": now}
+                ).encode()
+
+            if route == "search" and method == "POST":
+                return 200, self._search_response
+
+            if route == "documents" and len(parts) == 3 and method in ("POST", "PUT"):
+                if headers.get("content-encoding") == "gzip":
+                    body = gzip.decompress(body)
+                self._count_documents(body, headers.get("content-type", ""))
+                task_type = "documentAdditionOrUpdate"
+                return 202, self._enqueue(uid, task_type)
+
+        return 404, json.dumps(
+            {
+                "message": f"{method} {path} is not supported by the stand-in",
+                "code": "not_found",
+                "type": "invalid_request",
+                "link": "",
+            }
+        ).encode()
+
+    def _count_documents(self, body: bytes, content_type: str) -> None:
+        if "ndjson" in content_type:
+            count = body.count(b"\n") + (0 if body.endswith(b"\n") else 1)
+        elif "csv" in content_type:
+            count = max(body.count(b"\n") - 1, 0)
+        else:
+            count = len(json.loads(body))
+
+        with self._state.lock:
+            self._state.documents_received += count
+
+    def _enqueue(self, index_uid: str | None, task_type: str) -> bytes:
+        with self._state.lock:
+            task_uid = next(self._state.task_uids)
+            self._state.task_polls[task_uid] = 0
+            self._state.task_indexes[task_uid] = index_uid
+
+        return json.dumps(
+            {
+                "taskUid": task_uid,
+                "indexUid": index_uid,
+                "status": "enqueued",
+                "type": task_type,
+                "enqueuedAt": _now(),
+            }
+        ).encode()
+
+    def _get_task(self, task_uid: int) -> tuple[int, bytes]:
+        with self._state.lock:
+            if task_uid not in self._state.task_polls:
+                return 404, b'{"message": "task not found", "code": "task_not_found"}'
+            self._state.task_polls[task_uid] += 1
+            polls = self._state.task_polls[task_uid]
+            index_uid = self._state.task_indexes[task_uid]
+
+        status = "succeeded" if polls > self.config.task_polls else "processing"
+        return 200, json.dumps(
+            {
+                "uid": task_uid,
+                "indexUid": index_uid,
+                "status": status,
+                "type": "documentAdditionOrUpdate",
+                "enqueuedAt": _now(),
+            }
+        ).encode()
+
+    async def asgi(
+        self,
+        scope: JsonDict,
+        receive: Callable[[], Awaitable[JsonDict]],
+        send: Callable[[JsonDict], Awaitable[None]],
+    ) -> None:
+        if scope["type"] != "http":  # pragma: no cover
+            return
+
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+        headers = {k.decode().lower(): v.decode() for k, v in scope["headers"]}
+        status, content = self.handle(scope["method"], scope["path"], headers, body)
+
+        if self.config.latency_ms:
+            await asyncio.sleep(self.config.latency_ms / 1000)
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [(b"content-type", b"application/json")],
+            }
+        )
+        await send({"type": "http.response.body", "body": content})
+
+    def wsgi(
+        self, environ: JsonDict, start_response: Callable[[str, list[tuple[str, str]]], Any]
+    ) -> Iterable[bytes]:
+        length = int(environ.get("CONTENT_LENGTH") or 0)
+        body = environ["wsgi.input"].read(length) if length else b""
+        headers = {
+            k[5:].replace("_", "-").lower(): v for k, v in environ.items() if k.startswith("HTTP_")
+        }
+        if environ.get("CONTENT_TYPE"):
+            headers["content-type"] = environ["CONTENT_TYPE"]
+
+        status, content = self.handle(
+            environ["REQUEST_METHOD"], environ["PATH_INFO"], headers, body
+        )
+
+        if self.config.latency_ms:
+            time.sleep(self.config.latency_ms / 1000)
+
+        start_response(f"{status} STAND-IN", [("content-type", "application/json")])
+        return [content]
+
+
+def _now() -> str:
+    return datetime.now(tz=timezone.utc).isoformat()
@@ -1,8 +1,41 @@
-from meilisearch_python_sdk._client import AsyncClient, Client
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from meilisearch_python_sdk._version import VERSION
-from meilisearch_python_sdk.index import AsyncIndex, Index
+
+if TYPE_CHECKING:
+    from meilisearch_python_sdk._client import AsyncClient, Client
+    from meilisearch_python_sdk.index import AsyncIndex, Index
 
 __version__ = VERSION
 
 
+# The clients and indexes pull in httpx, pydantic, and all of the models so they are only imported
+# when first accessed. This keeps the cost of importing the package low for short lived processes,
+# but importing a client still loads httpx, pydantic, and the models its methods return.
+_LAZY_IMPORTS = {
+    "AsyncClient": "meilisearch_python_sdk._client._async_client",
+    "AsyncIndex": "meilisearch_python_sdk.index.async_index",
+    "Client": "meilisearch_python_sdk._client._client",
+    "Index": "meilisearch_python_sdk.index.index",
+}
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_IMPORTS])
+
+
 __all__ = ["AsyncClient", "AsyncIndex", "Client", "Index"]
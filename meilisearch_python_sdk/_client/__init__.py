@@ -1,4 +1,27 @@
-from meilisearch_python_sdk._client._async_client import AsyncClient
-from meilisearch_python_sdk._client._client import Client
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from meilisearch_python_sdk._client._async_client import AsyncClient
+    from meilisearch_python_sdk._client._client import Client
+
+_LAZY_IMPORTS = {
+    "AsyncClient": "meilisearch_python_sdk._client._async_client",
+    "Client": "meilisearch_python_sdk._client._client",
+}
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+
+    return value
+
 
 __all__ = ["AsyncClient", "Client"]
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from contextlib import nullcontext
 from datetime import datetime
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
 
+import aiofiles.os
 from camel_converter import dict_to_camel
 from httpx2 import AsyncClient as HttpxAsyncClient
 
@@ -17,8 +20,9 @@ from meilisearch_python_sdk._client._common import (
     build_update_key_payload,
 )
 from meilisearch_python_sdk._http_requests import AsyncHttpRequests
-from meilisearch_python_sdk.errors import MeilisearchApiError
-from meilisearch_python_sdk.index import AsyncIndex
+from meilisearch_python_sdk._transport import build_async_transport
+from meilisearch_python_sdk.errors import MeilisearchApiError, MeilisearchTaskFailedError
+from meilisearch_python_sdk.index.async_index import AsyncIndex
 from meilisearch_python_sdk.json_handler import BuiltinHandler, OrjsonHandler
 from meilisearch_python_sdk.models.client import (
     ClientStats,
@@ -46,10 +50,18 @@ from meilisearch_python_sdk.types import JsonDict
 
 if TYPE_CHECKING:
     import sys
+    from collections.abc import Sequence
     from ssl import SSLContext
     from types import TracebackType
 
+    from meilisearch_python_sdk.circuit_breaker import CircuitBreaker
+    from meilisearch_python_sdk.governor import Governor
+    from meilisearch_python_sdk.hedging import Hedging
+    from meilisearch_python_sdk.metrics import MetricsCollector
     from meilisearch_python_sdk.models.batch import BatchResult, BatchStatus
+    from meilisearch_python_sdk.multi_node import NodeRouter
+    from meilisearch_python_sdk.slow_log import SlowOperationLogger
+    from meilisearch_python_sdk.transport import TransportConfig
     from meilisearch_python_sdk.types import JsonMapping
 
     if sys.version_info >= (3, 11):
@@ -71,6 +83,13 @@ class AsyncClient(BaseClient):
         custom_headers: dict[str, str] | None = None,
         json_handler: BuiltinHandler | OrjsonHandler | None = None,
         http2: bool = False,
+        metrics: MetricsCollector | None = None,
+        slow_log: SlowOperationLogger | None = None,
+        transport_config: TransportConfig | None = None,
+        router: NodeRouter | None = None,
+        hedging: Hedging | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        governor: Governor | None = None,
     ) -> None:
         """Class initializer.
 
@@ -89,11 +108,51 @@ class AsyncClient(BaseClient):
                 Note that in order use orjson the corresponding extra needs to be included.
                 Default: OrjsonHandler if orjson is installed or BuiltinHandler if not.
             http2: Whether or not to use HTTP/2. Defaults to False.
+            metrics: If provided the latency, errors, and bytes sent of every request made by the
+                client, and the indexes it creates, are recorded in the collector. Defaults to None.
+            slow_log: If provided operations made by the client, and the indexes it creates, that
+                take longer than the logger's threshold are logged. Defaults to None.
+            transport_config: Connection pool limits, keep-alive, granular timeouts, and per
+                operation timeouts for the underlying HTTP client. Timeouts that are not set in
+                the config use `timeout`. Defaults to None.
+            router: If provided requests are routed across the router's nodes instead of only
+                being sent to `url`. See `meilisearch_python_sdk.multi_node`. Defaults to None.
+            hedging: If provided slow searches and multi-searches are hedged by sending a second
+                request and using whichever response arrives first. Defaults to None.
+            circuit_breaker: If provided requests fail fast with a `MeilisearchCircuitOpenError`
+                while the node, or index, they are sent to has a high error rate or latency.
+                Defaults to None.
+            governor: If provided requests wait for the governor's rate and concurrency limits
+                before being sent. Share one governor between clients to give them a single
+                budget. Defaults to None.
         """
         super().__init__(api_key, custom_headers, json_handler)
 
+        self.metrics = metrics
+        self.slow_log = slow_log
+        self.transport_config = transport_config
+        self.hedging = hedging
+        self.circuit_breaker = circuit_breaker
+        self.governor = governor
+        transport = build_async_transport(
+            verify=verify,
+            http2=http2,
+            metrics=metrics,
+            slow_log=slow_log,
+            config=transport_config,
+            router=router,
+            hedging=hedging,
+            circuit_breaker=circuit_breaker,
+            governor=governor,
+        )
+
         self.http_client = HttpxAsyncClient(
-            base_url=url, timeout=timeout, headers=self._headers, verify=verify, http2=http2
+            base_url=url,
+            timeout=transport_config.timeout(timeout) if transport_config else timeout,
+            headers=self._headers,
+            verify=verify,
+            http2=http2,
+            transport=transport,
         )
         self._http_requests = AsyncHttpRequests(self.http_client, json_handler=self.json_handler)
 
@@ -887,6 +946,131 @@ class AsyncClient(BaseClient):
 
         return TaskInfo(**self._http_requests.parse_json(response))
 
+    async def reindex(
+        self,
+        uid: str,
+        source: Sequence[JsonMapping] | Path | str,
+        *,
+        settings: MeilisearchSettings | None = None,
+        primary_key: str | None = None,
+        batch_size: int = 1000,
+        concurrency_limit: int | None = None,
+        document_type: str = "json",
+        csv_delimiter: str | None = None,
+        shadow_uid: str | None = None,
+        timeout_in_ms: int | None = None,
+    ) -> AsyncIndex:
+        """Rebuild an index in a shadow index and swap it in once it is ready.
+
+        The documents are added to a new shadow index with the batched document methods while the
+        live index keeps serving searches. Once every task for the shadow index has been processed
+        the two indexes are swapped with `swap_indexes`, and the old index, now under the shadow
+        uid, is deleted. If any task fails the live index is left unchanged and the shadow index
+        is kept so the failure can be inspected. When there is no live index yet the shadow index
+        is renamed to the uid instead, and deleted if any of its tasks fail.
+
+        Args:
+            uid: The uid of the index to rebuild. If it does not exist it is created by renaming
+                the shadow index.
+            source: The documents, or the path to a file or directory of files to load them from.
+            settings: The settings for the rebuilt index. Defaults to None, in which case the
+                settings of the live index are copied.
+            primary_key: The primary key of the documents. Defaults to None, in which case the
+                primary key of the live index is used.
+            batch_size: The number of documents that should be included in each batch.
+                Defaults to 1000.
+            concurrency_limit: If set this will limit the number of batches that will be sent
+                concurrently. Defaults to None.
+            document_type: The type of files to load when `source` is a directory. Accepted types
+                are json, csv, and ndjson. Defaults to json.
+            csv_delimiter: A single ASCII character to specify the delimiter for csv files.
+                Defaults to comma.
+            shadow_uid: The uid of the shadow index. An existing index with this uid is deleted
+                first. Defaults to None, in which case `{uid}_shadow` is used.
+            timeout_in_ms: Amount of time in milliseconds to wait for each step before raising a
+                MeilisearchTimeoutError. Defaults to None, which waits indefinitely.
+
+        Returns:
+            An instance of AsyncIndex for the rebuilt index.
+
+        Raises:
+            MeilisearchTaskFailedError: If a task for the shadow index or the swap failed.
+            MeilisearchTimeoutError: If a step takes longer than `timeout_in_ms`.
+            MeilisearchCommunicationError: If there was an error communicating with the server.
+            MeilisearchApiError: If the Meilisearch API returned an error.
+
+        Examples:
+            >>> from meilisearch_python_sdk import AsyncClient
+            >>> async with AsyncClient("http://localhost.com", "masterKey") as client:
+            >>>     index = await client.reindex("movies", "/path/to/movies.json")
+        """
+        shadow_uid = shadow_uid or f"{uid}_shadow"
+        try:
+            live: AsyncIndex | None = await self.get_index(uid)
+        except MeilisearchApiError as err:
+            if "index_not_found" not in err.code:
+                raise
+            live = None
+
+        if live is not None:
+            settings = settings or await live.get_settings()
+            primary_key = primary_key or live.primary_key
+
+        await self.delete_index_if_exists(shadow_uid)
+        shadow = await self.create_index(
+            shadow_uid, primary_key, settings=settings, timeout_in_ms=timeout_in_ms
+        )
+
+        if isinstance(source, (str, Path)) and await aiofiles.os.path.isdir(source):
+            tasks = await shadow.add_documents_from_directory_in_batches(
+                source,
+                batch_size=batch_size,
+                primary_key=primary_key,
+                document_type=document_type,
+                csv_delimiter=csv_delimiter,
+                concurrency_limit=concurrency_limit,
+            )
+        elif isinstance(source, (str, Path)):
+            tasks = await shadow.add_documents_from_file_in_batches(
+                source,
+                batch_size=batch_size,
+                primary_key=primary_key,
+                csv_delimiter=csv_delimiter,
+                concurrency_limit=concurrency_limit,
+            )
+        else:
+            tasks = await shadow.add_documents_in_batches(
+                source,
+                batch_size=batch_size,
+                primary_key=primary_key,
+                concurrency_limit=concurrency_limit,
+            )
+
+        failed = await _task.async_wait_for_index_tasks(
+            self.http_client,
+            shadow_uid,
+            [x.task_uid for x in tasks],
+            json_handler=self.json_handler,
+            timeout_in_ms=timeout_in_ms,
+        )
+        if failed:
+            if live is None:
+                await self.delete_index_if_exists(shadow_uid)
+            raise MeilisearchTaskFailedError(
+                f"{failed} tasks failed for the shadow index {shadow_uid}, {uid} was not changed"
+            )
+
+        if live is None:
+            # A rename moves the first uid to the second, which must not exist yet.
+            task = await self.swap_indexes([(shadow_uid, uid)], rename=True)
+        else:
+            task = await self.swap_indexes([(uid, shadow_uid)])
+        await self.wait_for_task(task.task_uid, timeout_in_ms=timeout_in_ms, raise_for_status=True)
+        if live is not None:
+            await self.delete_index_if_exists(shadow_uid)
+
+        return await self.get_index(uid)
+
     async def get_batch(self, batch_uid: int) -> BatchResult | None:
         return await async_get_batch(self, self.json_handler, batch_uid)
 
@@ -1061,6 +1245,8 @@ class AsyncClient(BaseClient):
         index_ids: list[str] | None = None,
         types: str | list[str] | None = None,
         reverse: bool | None = None,
+        statuses: str | list[str] | None = None,
+        limit: int | None = None,
     ) -> TaskStatus:
         """Get multiple tasks.
 
@@ -1069,6 +1255,9 @@ class AsyncClient(BaseClient):
                 tasks only for the specified indexes, if not all tasks will be returned. Default = None
             types: Specify specific task types to retrieve. Default = None
             reverse: If True the tasks will be returned in reverse order. Default = None
+            statuses: Specify the task statuses to retrieve, for example `enqueued`. Default = None
+            limit: The maximum number of tasks to return. The total number of matching tasks is
+                still included in the result. Default = None
 
         Returns:
             Task statuses.
@@ -1090,6 +1279,8 @@ class AsyncClient(BaseClient):
             index_ids=index_ids,
             types=types,
             reverse=reverse,
+            statuses=statuses,
+            limit=limit,
         )
 
     async def wait_for_task(
@@ -1131,14 +1322,16 @@ class AsyncClient(BaseClient):
             >>>     response = await index.add_documents(documents)
             >>>     await client.wait_for_task(client, response.update_id)
         """
-        return await _task.async_wait_for_task(
-            self.http_client,
-            task_id=task_id,
-            json_handler=self.json_handler,
-            timeout_in_ms=timeout_in_ms,
-            interval_in_ms=interval_in_ms,
-            raise_for_status=raise_for_status,
-        )
+        timer = self.metrics.time("wait_for_task") if self.metrics else nullcontext()
+        with timer:
+            return await _task.async_wait_for_task(
+                self.http_client,
+                task_id=task_id,
+                json_handler=self.json_handler,
+                timeout_in_ms=timeout_in_ms,
+                interval_in_ms=interval_in_ms,
+                raise_for_status=raise_for_status,
+            )
 
     # No cover because it requires multiple instances of Meilisearch
     async def transfer_documents(  # pragma: no cover
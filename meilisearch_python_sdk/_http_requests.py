@@ -45,19 +45,23 @@ class AsyncHttpRequests:
         body: Any | None = None,  # noqa: ANN401
         content_type: str = "application/json",
         compress: bool = False,
+        precompressed: bool = False,
     ) -> Response:
-        headers = build_headers(content_type, compress)
+        headers = build_headers(content_type, compress or precompressed)
+        # A bytes body is already encoded, so JSON bodies are only serialized if they are not.
+        serialize = content_type == "application/json" and not isinstance(body, (bytes, bytearray))
 
         try:
             if body is None:
                 response = await http_method(path)
-            elif content_type == "application/json" and not compress:
+            elif serialize and not compress:
                 response = await http_method(
                     path, content=self.json_handler.dump_bytes(body), headers=headers
                 )
             else:
-                if compress:
-                    if content_type == "application/json":
+                # A precompressed body is already gzip compressed, so it is sent as is.
+                if compress and not precompressed:
+                    if serialize:
                         body = gzip.compress(self.json_handler.dump_bytes(body))
                     else:
                         if isinstance(body, bytes):
@@ -103,8 +107,11 @@ class AsyncHttpRequests:
         body: Any | None = None,  # noqa: ANN401
         content_type: str = "application/json",
         compress: bool = False,
+        precompressed: bool = False,
     ) -> Response:
-        return await self._send_request(self.http_client.post, path, body, content_type, compress)
+        return await self._send_request(
+            self.http_client.post, path, body, content_type, compress, precompressed
+        )
 
     async def put(
         self,
@@ -112,8 +119,11 @@ class AsyncHttpRequests:
         body: Any | None = None,  # noqa: ANN401
         content_type: str = "application/json",
         compress: bool = False,
+        precompressed: bool = False,
     ) -> Response:
-        return await self._send_request(self.http_client.put, path, body, content_type, compress)
+        return await self._send_request(
+            self.http_client.put, path, body, content_type, compress, precompressed
+        )
 
     async def delete(self, path: str, body: dict | None = None) -> Response:
         return await self._send_request(self.http_client.delete, path, body)
@@ -135,18 +145,22 @@ class HttpRequests:
         body: Any | None = None,  # noqa: ANN401
         content_type: str = "application/json",
         compress: bool = False,
+        precompressed: bool = False,
     ) -> Response:
-        headers = build_headers(content_type, compress)
+        headers = build_headers(content_type, compress or precompressed)
+        # A bytes body is already encoded, so JSON bodies are only serialized if they are not.
+        serialize = content_type == "application/json" and not isinstance(body, (bytes, bytearray))
         try:
             if body is None:
                 response = http_method(path)
-            elif content_type == "application/json" and not compress:
+            elif serialize and not compress:
                 response = http_method(
                     path, content=self.json_handler.dump_bytes(body), headers=headers
                 )
             else:
-                if compress:
-                    if content_type == "application/json":
+                # A precompressed body is already gzip compressed, so it is sent as is.
+                if compress and not precompressed:
+                    if serialize:
                         body = gzip.compress(self.json_handler.dump_bytes(body))
                     else:
                         if isinstance(body, bytes):
@@ -193,8 +207,11 @@ class HttpRequests:
         body: Any | None = None,  # noqa: ANN401
         content_type: str = "application/json",
         compress: bool = False,
+        precompressed: bool = False,
     ) -> Response:
-        return self._send_request(self.http_client.post, path, body, content_type, compress)
+        return self._send_request(
+            self.http_client.post, path, body, content_type, compress, precompressed
+        )
 
     def put(
         self,
@@ -202,8 +219,11 @@ class HttpRequests:
         body: Any | None = None,  # noqa: ANN401
         content_type: str = "application/json",
         compress: bool = False,
+        precompressed: bool = False,
     ) -> Response:
-        return self._send_request(self.http_client.put, path, body, content_type, compress)
+        return self._send_request(
+            self.http_client.put, path, body, content_type, compress, precompressed
+        )
 
     def delete(self, path: str, body: dict | None = None) -> Response:
         return self._send_request(self.http_client.delete, path, body)
@@ -15,9 +15,14 @@ from meilisearch_python_sdk.errors import MeilisearchTaskFailedError, Meilisearc
 from meilisearch_python_sdk.models.task import TaskInfo, TaskResult, TaskStatus
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from meilisearch_python_sdk._client import AsyncClient, Client  # pragma: no cover
     from meilisearch_python_sdk.types import JsonHandler
 
+# The number of task uids filtered on in one request, which keeps the urls short.
+_TASK_UIDS_PER_REQUEST = 200
+
 
 async def async_cancel_tasks(
     client: HttpxAsyncClient | AsyncClient,
@@ -140,8 +145,14 @@ async def async_get_tasks(
     index_ids: list[str] | None = None,
     types: str | list[str] | None = None,
     reverse: bool | None = None,
+    statuses: str | list[str] | None = None,
+    limit: int | None = None,
+    uids: list[int] | None = None,
 ) -> TaskStatus:
     url = f"tasks?indexUids={','.join(index_ids)}" if index_ids else "tasks"
+    if uids:
+        formatted_uids = ",".join(str(x) for x in uids)
+        url = f"{url}&uids={formatted_uids}" if "?" in url else f"{url}?uids={formatted_uids}"
     if types:
         formatted_types = ",".join(types) if isinstance(types, list) else types
         url = f"{url}&types={formatted_types}" if "?" in url else f"{url}?types={formatted_types}"
@@ -151,6 +162,15 @@ async def async_get_tasks(
             if "?" in url
             else f"{url}?reverse={str(reverse).lower()}"
         )
+    if statuses:
+        formatted_statuses = ",".join(statuses) if isinstance(statuses, list) else statuses
+        url = (
+            f"{url}&statuses={formatted_statuses}"
+            if "?" in url
+            else f"{url}?statuses={formatted_statuses}"
+        )
+    if limit is not None:
+        url = f"{url}&limit={limit}" if "?" in url else f"{url}?limit={limit}"
     client_ = get_async_client(client)
     http_requests = AsyncHttpRequests(client_, json_handler)
     response = await http_requests.get(url)
@@ -198,6 +218,45 @@ async def async_wait_for_task(
             await asyncio.sleep(interval_in_ms / 1000)
 
 
+async def async_wait_for_index_tasks(
+    client: HttpxAsyncClient | AsyncClient,
+    index_uid: str,
+    task_uids: Sequence[int],
+    *,
+    json_handler: JsonHandler,
+    timeout_in_ms: int | None = None,
+    interval_in_ms: int = 500,
+) -> int:
+    # Only the given tasks are counted. The task history of an index uid is kept after the index
+    # is deleted, and a swap moves the tasks of the other index to it, so earlier failures are
+    # not failures of these tasks.
+    async def count(statuses: list[str]) -> int:
+        total = 0
+        for chunk in _task_uid_chunks(task_uids):
+            total += (
+                await async_get_tasks(
+                    client,
+                    json_handler=json_handler,
+                    index_ids=[index_uid],
+                    statuses=statuses,
+                    limit=1,
+                    uids=chunk,
+                )
+            ).total
+        return total
+
+    start = time.monotonic()
+    while await count(["enqueued", "processing"]):
+        if timeout_in_ms and (time.monotonic() - start) * 1000 >= timeout_in_ms:
+            raise MeilisearchTimeoutError(
+                f"timeout of {timeout_in_ms}ms has exceeded when waiting for the tasks of index "
+                f"{index_uid} to resolve."
+            )
+        await asyncio.sleep(interval_in_ms / 1000)
+
+    return await count(["failed"])
+
+
 def cancel_tasks(
     client: HttpxClient | Client,
     *,
@@ -285,8 +344,14 @@ def get_tasks(
     index_ids: list[str] | None = None,
     types: str | list[str] | None = None,
     reverse: bool | None = None,
+    statuses: str | list[str] | None = None,
+    limit: int | None = None,
+    uids: list[int] | None = None,
 ) -> TaskStatus:
     url = f"tasks?indexUids={','.join(index_ids)}" if index_ids else "tasks"
+    if uids:
+        formatted_uids = ",".join(str(x) for x in uids)
+        url = f"{url}&uids={formatted_uids}" if "?" in url else f"{url}?uids={formatted_uids}"
     if types:
         formatted_types = ",".join(types) if isinstance(types, list) else types
         url = f"{url}&types={formatted_types}" if "?" in url else f"{url}?types={formatted_types}"
@@ -296,6 +361,15 @@ def get_tasks(
             if "?" in url
             else f"{url}?reverse={str(reverse).lower()}"
         )
+    if statuses:
+        formatted_statuses = ",".join(statuses) if isinstance(statuses, list) else statuses
+        url = (
+            f"{url}&statuses={formatted_statuses}"
+            if "?" in url
+            else f"{url}?statuses={formatted_statuses}"
+        )
+    if limit is not None:
+        url = f"{url}&limit={limit}" if "?" in url else f"{url}?limit={limit}"
     client_ = get_client(client)
     http_requests = HttpRequests(client_, json_handler)
     response = http_requests.get(url)
@@ -343,6 +417,50 @@ def wait_for_task(
             time.sleep(interval_in_ms / 1000)
 
 
+def wait_for_index_tasks(
+    client: HttpxClient | Client,
+    index_uid: str,
+    task_uids: Sequence[int],
+    *,
+    json_handler: JsonHandler,
+    timeout_in_ms: int | None = None,
+    interval_in_ms: int = 500,
+) -> int:
+    # Only the given tasks are counted. The task history of an index uid is kept after the index
+    # is deleted, and a swap moves the tasks of the other index to it, so earlier failures are
+    # not failures of these tasks.
+    def count(statuses: list[str]) -> int:
+        return sum(
+            get_tasks(
+                client,
+                json_handler=json_handler,
+                index_ids=[index_uid],
+                statuses=statuses,
+                limit=1,
+                uids=chunk,
+            ).total
+            for chunk in _task_uid_chunks(task_uids)
+        )
+
+    start = time.monotonic()
+    while count(["enqueued", "processing"]):
+        if timeout_in_ms and (time.monotonic() - start) * 1000 >= timeout_in_ms:
+            raise MeilisearchTimeoutError(
+                f"timeout of {timeout_in_ms}ms has exceeded when waiting for the tasks of index "
+                f"{index_uid} to resolve."
+            )
+        time.sleep(interval_in_ms / 1000)
+
+    return count(["failed"])
+
+
+def _task_uid_chunks(task_uids: Sequence[int]) -> list[list[int]]:
+    return [
+        list(task_uids[i : i + _TASK_UIDS_PER_REQUEST])
+        for i in range(0, len(task_uids), _TASK_UIDS_PER_REQUEST)
+    ]
+
+
 def _process_params(
     uids: list[int] | None = None,
     index_uids: list[int] | None = None,
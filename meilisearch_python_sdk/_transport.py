@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from httpx2 import AsyncBaseTransport, AsyncHTTPTransport, BaseTransport, HTTPTransport
+
+if TYPE_CHECKING:
+    from ssl import SSLContext
+
+    from meilisearch_python_sdk.circuit_breaker import CircuitBreaker
+    from meilisearch_python_sdk.governor import Governor
+    from meilisearch_python_sdk.hedging import Hedging
+    from meilisearch_python_sdk.metrics import MetricsCollector
+    from meilisearch_python_sdk.multi_node import NodeRouter
+    from meilisearch_python_sdk.slow_log import SlowOperationLogger
+    from meilisearch_python_sdk.transport import TransportConfig
+
+
+def build_async_transport(
+    *,
+    verify: bool | SSLContext,
+    http2: bool,
+    metrics: MetricsCollector | None = None,
+    slow_log: SlowOperationLogger | None = None,
+    config: TransportConfig | None = None,
+    router: NodeRouter | None = None,
+    hedging: Hedging | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    governor: Governor | None = None,
+) -> AsyncBaseTransport | None:
+    """Build the transport chain for an AsyncClient.
+
+    None is returned when no wrapping transports are needed so httpx uses its default transport.
+    The wrapping transports are imported only when used to keep the client import cheap.
+    """
+    if all(
+        x is None for x in (metrics, slow_log, config, router, hedging, circuit_breaker, governor)
+    ):
+        return None
+
+    if config is None:
+        transport: AsyncBaseTransport = AsyncHTTPTransport(verify=verify, http2=http2)
+    else:
+        transport = AsyncHTTPTransport(
+            verify=verify, http2=http2, limits=config.limits(), retries=config.retries
+        )
+
+        if config.operation_timeouts:
+            from meilisearch_python_sdk.transport import AsyncOperationTimeoutTransport
+
+            transport = AsyncOperationTimeoutTransport(transport, config.operation_timeouts)
+
+    if circuit_breaker is not None:
+        # Below the routing so each node has its own circuits.
+        from meilisearch_python_sdk.circuit_breaker import AsyncCircuitBreakerTransport
+
+        transport = AsyncCircuitBreakerTransport(transport, circuit_breaker)
+
+    if governor is not None:
+        # Below the routing so retries and hedges on other nodes are also limited, and above the
+        # circuit breaker so time waiting for the governor is not counted as node latency.
+        from meilisearch_python_sdk.governor import AsyncGovernorTransport
+
+        transport = AsyncGovernorTransport(transport, governor)
+
+    if router is not None:
+        from meilisearch_python_sdk.multi_node import AsyncRoutingTransport
+
+        transport = AsyncRoutingTransport(transport, router)
+
+    if hedging is not None:
+        from meilisearch_python_sdk.hedging import AsyncHedgingTransport
+
+        transport = AsyncHedgingTransport(transport, hedging, metrics)
+
+    if slow_log is not None:
+        from meilisearch_python_sdk.slow_log import AsyncSlowLogTransport
+
+        transport = AsyncSlowLogTransport(transport, slow_log)
+
+    if metrics is not None:
+        from meilisearch_python_sdk.metrics import AsyncMetricsTransport
+
+        transport = AsyncMetricsTransport(transport, metrics)
+
+    return transport
+
+
+def build_transport(
+    *,
+    verify: bool | SSLContext,
+    http2: bool,
+    metrics: MetricsCollector | None = None,
+    slow_log: SlowOperationLogger | None = None,
+    config: TransportConfig | None = None,
+    router: NodeRouter | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    governor: Governor | None = None,
+) -> BaseTransport | None:
+    """Build the transport chain for a Client.
+
+    None is returned when no wrapping transports are needed so httpx uses its default transport.
+    """
+    if all(x is None for x in (metrics, slow_log, config, router, circuit_breaker, governor)):
+        return None
+
+    if config is None:
+        transport: BaseTransport = HTTPTransport(verify=verify, http2=http2)
+    else:
+        transport = HTTPTransport(
+            verify=verify, http2=http2, limits=config.limits(), retries=config.retries
+        )
+
+        if config.operation_timeouts:
+            from meilisearch_python_sdk.transport import OperationTimeoutTransport
+
+            transport = OperationTimeoutTransport(transport, config.operation_timeouts)
+
+    if circuit_breaker is not None:
+        # Below the routing so each node has its own circuits.
+        from meilisearch_python_sdk.circuit_breaker import CircuitBreakerTransport
+
+        transport = CircuitBreakerTransport(transport, circuit_breaker)
+
+    if governor is not None:
+        # Below the routing so retries and hedges on other nodes are also limited, and above the
+        # circuit breaker so time waiting for the governor is not counted as node latency.
+        from meilisearch_python_sdk.governor import GovernorTransport
+
+        transport = GovernorTransport(transport, governor)
+
+    if router is not None:
+        from meilisearch_python_sdk.multi_node import RoutingTransport
+
+        transport = RoutingTransport(transport, router)
+
+    if slow_log is not None:
+        from meilisearch_python_sdk.slow_log import SlowLogTransport
+
+        transport = SlowLogTransport(transport, slow_log)
+
+    if metrics is not None:
+        from meilisearch_python_sdk.metrics import MetricsTransport
+
+        transport = MetricsTransport(transport, metrics)
+
+    return transport
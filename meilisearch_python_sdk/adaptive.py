@@ -0,0 +1,426 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from itertools import islice
+from typing import TYPE_CHECKING, NamedTuple
+
+from meilisearch_python_sdk._batch import async_get_batch, get_batch
+from meilisearch_python_sdk._task import async_wait_for_task, wait_for_task
+from meilisearch_python_sdk.errors import MeilisearchTimeoutError
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterator, Sequence
+
+    from httpx2 import AsyncClient as HttpxAsyncClient
+    from httpx2 import Client as HttpxClient
+
+    from meilisearch_python_sdk.backpressure import AsyncTaskQueueGate, TaskQueueGate
+    from meilisearch_python_sdk.json_handler import BuiltinHandler, OrjsonHandler
+    from meilisearch_python_sdk.models.batch import BatchResult
+    from meilisearch_python_sdk.models.task import TaskInfo, TaskResult
+    from meilisearch_python_sdk.types import JsonMapping
+
+_logger = logging.getLogger(__name__)
+
+# The smallest step, as a multiple of the batch size, before the batch size is considered settled.
+_MIN_STEP = 1.05
+
+
+class AdaptiveRound(NamedTuple):
+    """The measurements for one round of batches."""
+
+    batch_size: int
+    concurrency: int
+    documents: int
+    documents_per_second: float
+    upload_seconds: float
+    processing_seconds: float
+
+
+class AdaptiveBatching:
+    """Chooses the batch size and concurrency of batched document uploads from measured throughput.
+
+    An instance can be passed to the `adaptive` parameter of `add_documents_in_batches` and
+    `update_documents_in_batches`, in which case their `batch_size` and `concurrency_limit` are
+    not used.
+
+    Documents are sent in rounds of `concurrency` batches. Once the tasks of a round have been
+    processed, the documents indexed per second of processing is calculated from the Meilisearch
+    batches that processed them (see `get_batch`). The batch size is then moved in the direction
+    that increased the documents per second, with smaller steps each time the direction changes,
+    until it settles.
+
+    The concurrency is increased while uploading a round takes longer than Meilisearch takes to
+    process it, meaning Meilisearch is waiting for documents, and decreased when processing takes
+    more than twice as long as uploading, meaning extra batches only queue up. The sync `Index`
+    sends batches one at a time, so only the batch size is adjusted.
+
+    The next round is sent while the previous one is measured so Meilisearch is not left idle. The
+    sync `Index` sends two rounds before measuring one, since its rounds are a single batch.
+    Because of this some rounds are sent before the last change is known, and only the rounds sent
+    after a change are used to make the next change. If the tasks of a round are not processed
+    within `timeout_in_ms` the round is not measured and the batch size and concurrency are kept.
+
+    Each round is logged with the chosen values at `level`, and recorded in `history`, so the best
+    values can be pinned once they are known.
+
+    Examples:
+        >>> from meilisearch_python_sdk import AsyncClient
+        >>> from meilisearch_python_sdk.adaptive import AdaptiveBatching
+        >>> adaptive = AdaptiveBatching(initial_batch_size=1000, max_concurrency=8)
+        >>> async with AsyncClient("http://localhost.com", "masterKey") as client:
+        >>>     index = client.index("movies")
+        >>>     await index.add_documents_in_batches(documents, adaptive=adaptive)
+        >>> adaptive.batch_size, adaptive.concurrency
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_batch_size: int = 1000,
+        min_batch_size: int = 100,
+        max_batch_size: int = 50_000,
+        initial_concurrency: int = 2,
+        max_concurrency: int = 8,
+        tolerance: float = 0.05,
+        timeout_in_ms: int | None = 60_000,
+        logger: logging.Logger | None = None,
+        level: int = logging.INFO,
+    ) -> None:
+        """Class initializer.
+
+        Args:
+            initial_batch_size: The batch size of the first round. Defaults to 1000.
+            min_batch_size: The smallest batch size that will be used. Defaults to 100.
+            max_batch_size: The largest batch size that will be used. Keep this low enough that
+                batches fit within the Meilisearch payload limit. Defaults to 50000.
+            initial_concurrency: The number of batches in the first round. Defaults to 2.
+            max_concurrency: The most batches that will be sent at once. Defaults to 8.
+            tolerance: The fraction that documents per second must increase by for a change to
+                count as an improvement. Defaults to 0.05.
+            timeout_in_ms: The most milliseconds to wait for the tasks of a round to be processed
+                before the round is skipped. If None there is no limit. Defaults to 60000.
+            logger: The logger to use. Defaults to the meilisearch_python_sdk.adaptive logger.
+            level: The level to log at. Defaults to logging.INFO.
+
+        Raises:
+            ValueError: If the sizes or concurrencies are less than 1 or out of order.
+        """
+        if not 1 <= min_batch_size <= initial_batch_size <= max_batch_size:
+            raise ValueError(
+                "Batch sizes must satisfy "
+                "1 <= min_batch_size <= initial_batch_size <= max_batch_size"
+            )
+
+        if not 1 <= initial_concurrency <= max_concurrency:
+            raise ValueError("Concurrency must satisfy 1 <= initial_concurrency <= max_concurrency")
+
+        self.min_batch_size = min_batch_size
+        self.max_batch_size = max_batch_size
+        self.max_concurrency = max_concurrency
+        self.tolerance = tolerance
+        self.timeout_in_ms = timeout_in_ms
+        self.logger = logger or _logger
+        self.level = level
+        self.batch_size = initial_batch_size
+        self.concurrency = initial_concurrency
+        self.history: list[AdaptiveRound] = []
+        self._step = 2.0
+        self._direction = 1
+        self._previous: AdaptiveRound | None = None
+        self._best: AdaptiveRound | None = None
+
+    @property
+    def settled(self) -> bool:
+        """True once the batch size has stopped changing."""
+        return self._step < _MIN_STEP
+
+    def observe(
+        self,
+        *,
+        batch_size: int,
+        concurrency: int,
+        documents: int,
+        processing_seconds: float,
+        upload_seconds: float,
+        adjust_concurrency: bool = True,
+    ) -> AdaptiveRound:
+        """Record a measured round and choose the batch size and concurrency of the next one.
+
+        Args:
+            batch_size: The batch size of the round.
+            concurrency: The number of batches sent at once in the round.
+            documents: The number of documents Meilisearch indexed.
+            processing_seconds: The seconds Meilisearch spent processing the batches.
+            upload_seconds: The seconds it took to send the round.
+            adjust_concurrency: If False only the batch size is adjusted. Defaults to True.
+
+        Returns:
+            The recorded round.
+        """
+        documents_per_second = documents / processing_seconds if processing_seconds > 0 else 0.0
+        measured = AdaptiveRound(
+            batch_size=batch_size,
+            concurrency=concurrency,
+            documents=documents,
+            documents_per_second=documents_per_second,
+            upload_seconds=upload_seconds,
+            processing_seconds=processing_seconds,
+        )
+        self.history.append(measured)
+
+        if self._best is None or documents_per_second > self._best.documents_per_second:
+            self._best = measured
+
+        if (
+            processing_seconds <= 0
+            or batch_size != self.batch_size
+            or (adjust_concurrency and concurrency != self.concurrency)
+        ):
+            # Nothing was measured, or the round was sent before the last change so it says
+            # nothing about the change.
+            self._log(measured)
+            return measured
+
+        if not self.settled:
+            previous = self._previous
+            if previous is not None and documents_per_second <= previous.documents_per_second * (
+                1 + self.tolerance
+            ):
+                # No improvement, turn around with a smaller step.
+                self._direction = -self._direction
+                self._step = self._step**0.5
+
+            self._previous = measured
+            if self.settled:
+                self.batch_size = self._best.batch_size
+            else:
+                resized = (
+                    batch_size * self._step if self._direction > 0 else batch_size / self._step
+                )
+                self.batch_size = min(max(int(resized), self.min_batch_size), self.max_batch_size)
+
+        if adjust_concurrency and upload_seconds > processing_seconds:
+            self.concurrency = min(concurrency + 1, self.max_concurrency)
+        elif adjust_concurrency and upload_seconds * 2 < processing_seconds:
+            self.concurrency = max(concurrency - 1, 1)
+
+        self._log(measured)
+
+        return measured
+
+    def skip(self, batch_size: int, concurrency: int) -> None:
+        """Keep the batch size and concurrency when a round could not be measured in time."""
+        self.logger.log(
+            self.level,
+            "Adaptive batching could not measure batch_size=%d, concurrency=%d within %s ms; "
+            "keeping batch_size=%d, concurrency=%d",
+            batch_size,
+            concurrency,
+            self.timeout_in_ms,
+            self.batch_size,
+            self.concurrency,
+        )
+
+    def _log(self, measured: AdaptiveRound) -> None:
+        self.logger.log(
+            self.level,
+            "Adaptive batching measured %.0f documents/s with batch_size=%d, concurrency=%d; "
+            "next batch_size=%d, concurrency=%d%s",
+            measured.documents_per_second,
+            measured.batch_size,
+            measured.concurrency,
+            self.batch_size,
+            self.concurrency,
+            " (settled)" if self.settled else "",
+        )
+
+
+class _Round(NamedTuple):
+    batch_size: int
+    concurrency: int
+    tasks: list[TaskInfo]
+    upload_seconds: float
+
+
+def _processing(
+    tasks: Sequence[TaskResult], batches: Sequence[BatchResult | None]
+) -> tuple[int, float]:
+    documents = 0
+    seconds = 0.0
+    for result in batches:
+        if result is None or result.started_at is None or result.finished_at is None:
+            continue
+        details = result.details or {}
+        documents += details.get("indexedDocuments") or 0
+        seconds += (result.finished_at - result.started_at).total_seconds()
+
+    if not seconds:
+        # Fall back to the task times if the batches have no timing.
+        started = [x.started_at for x in tasks if x.started_at is not None]
+        finished = [x.finished_at for x in tasks if x.finished_at is not None]
+        if started and finished:
+            seconds = (max(finished) - min(started)).total_seconds()
+
+    return documents, seconds
+
+
+def _remaining_ms(deadline: float | None) -> int | None:
+    if deadline is None:
+        return None
+
+    # A timeout of 0 would still wait for one check of the task.
+    return max(int((deadline - time.monotonic()) * 1000), 1)
+
+
+def _deadline(adaptive: AdaptiveBatching) -> float | None:
+    if adaptive.timeout_in_ms is None:
+        return None
+
+    return time.monotonic() + adaptive.timeout_in_ms / 1000
+
+
+def _take(iterator: Iterator[JsonMapping], size: int, count: int) -> list[list[JsonMapping]]:
+    chunks = []
+    for _ in range(count):
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            break
+        chunks.append(chunk)
+
+    return chunks
+
+
+async def async_send_adaptive(
+    http_client: HttpxAsyncClient,
+    documents: Sequence[JsonMapping],
+    adaptive: AdaptiveBatching,
+    send: Callable[[Sequence[JsonMapping]], Awaitable[TaskInfo]],
+    *,
+    json_handler: BuiltinHandler | OrjsonHandler,
+    gate: AsyncTaskQueueGate | None = None,
+) -> list[TaskInfo]:
+    """Send documents in batches sized by an AdaptiveBatching."""
+
+    async def send_batch(chunk: Sequence[JsonMapping]) -> TaskInfo:
+        if gate is not None:
+            await gate.wait()
+        return await send(chunk)
+
+    async def measure(sent: _Round) -> None:
+        deadline = _deadline(adaptive)
+        try:
+            tasks = [
+                await async_wait_for_task(
+                    http_client,
+                    x.task_uid,
+                    json_handler=json_handler,
+                    timeout_in_ms=_remaining_ms(deadline),
+                )
+                for x in sent.tasks
+            ]
+        except MeilisearchTimeoutError:
+            adaptive.skip(sent.batch_size, sent.concurrency)
+            return
+
+        batch_uids = {
+            x.batch_uid for x in tasks if x.status == "succeeded" and x.batch_uid is not None
+        }
+        batches = [await async_get_batch(http_client, json_handler, x) for x in sorted(batch_uids)]
+        indexed, seconds = _processing(tasks, batches)
+        adaptive.observe(
+            batch_size=sent.batch_size,
+            concurrency=sent.concurrency,
+            documents=indexed,
+            processing_seconds=seconds,
+            upload_seconds=sent.upload_seconds,
+        )
+
+    results: list[TaskInfo] = []
+    iterator = iter(documents)
+    previous: _Round | None = None
+    while True:
+        batch_size, concurrency = adaptive.batch_size, adaptive.concurrency
+        chunks = _take(iterator, batch_size, concurrency)
+        if not chunks:
+            break
+
+        start = time.perf_counter()
+        tasks = list(await asyncio.gather(*(send_batch(x) for x in chunks)))
+        results.extend(tasks)
+        sent = _Round(batch_size, concurrency, tasks, time.perf_counter() - start)
+
+        # The round that was just sent keeps Meilisearch busy while the previous one is measured.
+        if previous is not None:
+            await measure(previous)
+        previous = sent
+
+    return results
+
+
+def send_adaptive(
+    http_client: HttpxClient,
+    documents: Sequence[JsonMapping],
+    adaptive: AdaptiveBatching,
+    send: Callable[[Sequence[JsonMapping]], TaskInfo],
+    *,
+    json_handler: BuiltinHandler | OrjsonHandler,
+    gate: TaskQueueGate | None = None,
+) -> list[TaskInfo]:
+    """Send documents one batch at a time in batches sized by an AdaptiveBatching."""
+
+    def measure(sent: _Round) -> None:
+        deadline = _deadline(adaptive)
+        try:
+            tasks = [
+                wait_for_task(
+                    http_client,
+                    x.task_uid,
+                    json_handler=json_handler,
+                    timeout_in_ms=_remaining_ms(deadline),
+                )
+                for x in sent.tasks
+            ]
+        except MeilisearchTimeoutError:
+            adaptive.skip(sent.batch_size, 1)
+            return
+
+        batch_uids = {
+            x.batch_uid for x in tasks if x.status == "succeeded" and x.batch_uid is not None
+        }
+        batches = [get_batch(http_client, json_handler, x) for x in sorted(batch_uids)]
+        indexed, seconds = _processing(tasks, batches)
+        adaptive.observe(
+            batch_size=sent.batch_size,
+            concurrency=1,
+            documents=indexed,
+            processing_seconds=seconds,
+            upload_seconds=sent.upload_seconds,
+            adjust_concurrency=False,
+        )
+
+    results: list[TaskInfo] = []
+    iterator = iter(documents)
+    pending: deque[_Round] = deque()
+    while True:
+        batch_size = adaptive.batch_size
+        chunks = _take(iterator, batch_size, 1)
+        if not chunks:
+            break
+
+        if gate is not None:
+            gate.wait()
+        start = time.perf_counter()
+        task = send(chunks[0])
+        results.append(task)
+        pending.append(_Round(batch_size, 1, [task], time.perf_counter() - start))
+
+        # Measuring a round waits for it to be processed, so the two rounds sent after it keep
+        # Meilisearch busy in the meantime.
+        if len(pending) > 2:
+            measure(pending.popleft())
+
+    return results
@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+from datetime import date, time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pa = None  # type: ignore
+    pc = None  # type: ignore
+    pq = None  # type: ignore
+
+from meilisearch_python_sdk.errors import InvalidDocumentError
+from meilisearch_python_sdk.json_handler import BuiltinHandler
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator, Iterable
+
+    from meilisearch_python_sdk.json_handler import OrjsonHandler
+
+    ArrowData = pa.Table | pa.RecordBatch | pa.RecordBatchReader | Iterable[pa.RecordBatch]
+
+# Escapes for the control characters that are common in text. Strings with any other control
+# character are escaped by the json handler instead.
+_STRING_ESCAPES = (("\\", "\\\\"), ('"', '\\"'), ("\n", "\\n"), ("\r", "\\r"), ("\t", "\\t"))
+_OTHER_CONTROL_CHARACTERS = r"[\x00-\x08\x0b\x0c\x0e-\x1f]"
+
+
+def _require_pyarrow() -> None:
+    if pa is None:  # pragma: no cover
+        raise ValueError("pyarrow must be installed to add documents from Arrow or Parquet data")
+
+
+def _json_strings(values: pa.Array, json_handler: BuiltinHandler | OrjsonHandler) -> pa.StringArray:
+    if values.null_count == len(values):
+        return pc.cast(values, pa.string())
+
+    escaped = values
+    for old, new in _STRING_ESCAPES:
+        escaped = pc.replace_substring(escaped, old, new)
+
+    if pc.any(pc.match_substring_regex(escaped, _OTHER_CONTROL_CHARACTERS)).as_py():
+        return _json_values(values, json_handler)
+
+    return pc.binary_join_element_wise('"', escaped, '"', "")
+
+
+def _contains_type(kind: pa.DataType, predicate: Callable[[pa.DataType], bool]) -> bool:
+    if predicate(kind):
+        return True
+    if pa.types.is_dictionary(kind):
+        return _contains_type(kind.value_type, predicate)
+
+    return any(_contains_type(kind.field(i).type, predicate) for i in range(kind.num_fields))
+
+
+def _is_temporal(kind: pa.DataType) -> bool:
+    return pa.types.is_timestamp(kind) or pa.types.is_date(kind) or pa.types.is_time(kind)
+
+
+def _is_binary(kind: pa.DataType) -> bool:
+    return (
+        pa.types.is_binary(kind)
+        or pa.types.is_large_binary(kind)
+        or pa.types.is_fixed_size_binary(kind)
+        or pa.types.is_binary_view(kind)
+    )
+
+
+def _isoformat(value: Any) -> Any:  # noqa: ANN401
+    """Replace the dates, times, and datetimes in a nested value with ISO 8601 strings."""
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return {k: _isoformat(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_isoformat(x) for x in value]
+
+    return value
+
+
+def _json_values(values: pa.Array, json_handler: BuiltinHandler | OrjsonHandler) -> pa.StringArray:
+    values_list = values.to_pylist()
+    if _contains_type(values.type, _is_temporal):
+        values_list = [_isoformat(x) for x in values_list]
+
+    return pa.array(
+        [None if x is None else json_handler.dumps(x) for x in values_list], pa.string()
+    )
+
+
+def _to_json(values: pa.Array, json_handler: BuiltinHandler | OrjsonHandler) -> pa.StringArray:
+    """Serialize each value of a column to JSON, with nulls left as nulls."""
+    kind = values.type
+    if pa.types.is_dictionary(kind):
+        # Each distinct value is serialized once.
+        return _to_json(values.dictionary, json_handler).take(values.indices)
+    if pa.types.is_integer(kind) or pa.types.is_boolean(kind) or pa.types.is_decimal(kind):
+        return pc.cast(values, pa.string())
+    if pa.types.is_floating(kind):
+        # JSON has no NaN or infinity, so they are sent as null.
+        values = pc.cast(values, pa.float64())
+        return pc.cast(pc.if_else(pc.is_finite(values), values, None), pa.string())
+    if pa.types.is_timestamp(kind):
+        offset = "%z" if kind.tz else ""
+        return _json_strings(pc.strftime(values, f"%Y-%m-%dT%H:%M:%S{offset}"), json_handler)
+    if pa.types.is_date(kind) or pa.types.is_time(kind):
+        return _json_strings(pc.cast(values, pa.string()), json_handler)
+    if pa.types.is_string(kind):
+        return _json_strings(values, json_handler)
+    if pa.types.is_large_string(kind) or pa.types.is_string_view(kind):
+        return _json_strings(pc.cast(values, pa.string()), json_handler)
+
+    # Nested and other types are converted to Python values one column at a time.
+    return _json_values(values, json_handler)
+
+
+def record_batch_to_ndjson(
+    batch: pa.RecordBatch, *, json_handler: BuiltinHandler | OrjsonHandler | None = None
+) -> bytes:
+    """Serialize a record batch to NDJSON, one document per row.
+
+    The batch is serialized one column at a time with Arrow compute functions, and the rows are
+    joined into documents in Arrow, so no Python dict is built for each row. Integers, floats,
+    booleans, decimals, strings, dates, and times are serialized entirely in Arrow, with NaN and
+    infinite floats sent as null and timestamps sent as ISO 8601 strings. Lists, structs, and
+    other types are converted to Python values and serialized with the json handler, with any
+    dates and timestamps in them sent as ISO 8601 strings. Binary columns are not supported.
+
+    Args:
+        batch: The record batch to serialize.
+        json_handler: The json handler used for field names and for columns that cannot be
+            serialized in Arrow. Defaults to None, in which case the BuiltinHandler is used.
+
+    Returns:
+        The NDJSON payload.
+
+    Raises:
+        ValueError: If pyarrow is not installed.
+        InvalidDocumentError: If a column has binary values.
+
+    Examples:
+        >>> import pyarrow as pa
+        >>> from meilisearch_python_sdk.arrow import record_batch_to_ndjson
+        >>> batch = pa.record_batch({"id": [1, 2], "title": ["Alien", "Heat"]})
+        >>> record_batch_to_ndjson(batch)
+        b'{"id":1,"title":"Alien"}\\n{"id":2,"title":"Heat"}\\n'
+    """
+    _require_pyarrow()
+    json_handler = json_handler or BuiltinHandler()
+    if batch.num_columns == 0:
+        return b"{}\n" * batch.num_rows
+
+    parts: list[str | pa.StringArray] = []
+    for i, (name, column) in enumerate(zip(batch.schema.names, batch.columns, strict=True)):
+        if _contains_type(column.type, _is_binary):
+            raise InvalidDocumentError(
+                f"The {name} column has binary values, which JSON cannot hold"
+            )
+        parts.append(f"{'{' if i == 0 else ','}{json_handler.dumps(name)}:")
+        parts.append(pc.fill_null(_to_json(column, json_handler), "null"))
+    parts.append("}\n")
+
+    rows = pc.binary_join_element_wise(*parts, "")
+    # The rows are contiguous in the data buffer of the array, which is the NDJSON payload.
+    _, offsets, data = rows.buffers()
+    positions = memoryview(offsets).cast("i")
+    return data[positions[rows.offset] : positions[rows.offset + len(rows)]].to_pybytes()
+
+
+def _record_batches(data: ArrowData | Path | str, batch_size: int) -> Iterable[pa.RecordBatch]:
+    if isinstance(data, (str, Path)):
+        return pq.ParquetFile(data).iter_batches(batch_size=batch_size)
+    if isinstance(data, pa.Table):
+        return data.to_batches(max_chunksize=batch_size)
+    if isinstance(data, pa.RecordBatch):
+        return [data]
+
+    return data
+
+
+def iter_dataframe_batches(
+    df: Any,  # noqa: ANN401
+    *,
+    batch_size: int = 1000,
+) -> Generator[pa.RecordBatch, None, None]:
+    """Convert a pandas or polars DataFrame to record batches of at most `batch_size` rows.
+
+    A pandas DataFrame is converted one chunk of rows at a time, so a second copy of the whole
+    DataFrame is never made. Its index is not included, NaN and NaT become null, and object
+    columns of lists or dicts become list and struct columns. A polars DataFrame, or any other
+    DataFrame that supports the Arrow PyCapsule interface, is exported to Arrow, which does not
+    copy most columns.
+
+    Args:
+        df: A pandas or polars DataFrame.
+        batch_size: The maximum number of rows in each record batch. Defaults to 1000.
+
+    Yields:
+        Record batches.
+
+    Raises:
+        ValueError: If pyarrow is not installed.
+
+    Examples:
+        >>> import pandas as pd
+        >>> from meilisearch_python_sdk.arrow import iter_dataframe_batches
+        >>> df = pd.DataFrame({"id": [1, 2], "title": ["Alien", "Heat"]})
+        >>> for batch in iter_dataframe_batches(df, batch_size=500):
+        >>>     print(batch.num_rows)
+    """
+    _require_pyarrow()
+    if type(df).__module__.partition(".")[0] == "pandas":
+        for offset in range(0, len(df), batch_size):
+            yield pa.RecordBatch.from_pandas(
+                df.iloc[offset : offset + batch_size], preserve_index=False
+            )
+        return
+
+    yield from pa.table(df).to_batches(max_chunksize=batch_size)
+
+
+def iter_ndjson_payloads(
+    data: ArrowData | Path | str,
+    *,
+    batch_size: int = 1000,
+    json_handler: BuiltinHandler | OrjsonHandler | None = None,
+) -> Generator[bytes, None, None]:
+    """Serialize Arrow data to NDJSON payloads of at most `batch_size` documents.
+
+    Parquet files are read one batch at a time, so they do not have to fit in memory.
+
+    Args:
+        data: A pyarrow Table, RecordBatch, RecordBatchReader, an iterable of record batches, or
+            the path to a Parquet file.
+        batch_size: The maximum number of documents in each payload. Defaults to 1000.
+        json_handler: The json handler used for field names and for columns that cannot be
+            serialized in Arrow. Defaults to None, in which case the BuiltinHandler is used.
+
+    Yields:
+        NDJSON payloads.
+
+    Raises:
+        ValueError: If pyarrow is not installed.
+        InvalidDocumentError: If a column has binary values.
+
+    Examples:
+        >>> from meilisearch_python_sdk.arrow import iter_ndjson_payloads
+        >>> for payload in iter_ndjson_payloads("movies.parquet", batch_size=500):
+        >>>     print(len(payload))
+    """
+    _require_pyarrow()
+    for record_batch in _record_batches(data, batch_size):
+        for offset in range(0, record_batch.num_rows, batch_size):
+            yield record_batch_to_ndjson(
+                record_batch.slice(offset, batch_size), json_handler=json_handler
+            )
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import TYPE_CHECKING, NamedTuple
+
+from meilisearch_python_sdk._task import async_get_tasks, get_tasks
+
+if TYPE_CHECKING:
+    from httpx2 import AsyncClient as HttpxAsyncClient
+    from httpx2 import Client as HttpxClient
+
+    from meilisearch_python_sdk.json_handler import BuiltinHandler, OrjsonHandler
+    from meilisearch_python_sdk.types import JsonDict
+
+
+class Backpressure(NamedTuple):
+    """Pauses bulk ingest while the index has too many enqueued tasks.
+
+    Sending batches faster than Meilisearch can index them only grows the task queue, which slows
+    down indexing and every other task. With backpressure, sending pauses once the number of
+    enqueued tasks for the index reaches `high_water`, and resumes when it has fallen to
+    `low_water`.
+
+    The queue depth is estimated from the batches sent and is only checked with Meilisearch when
+    the estimate reaches `high_water`, so backpressure adds no requests while the queue is short.
+
+    high_water: The number of enqueued tasks that pauses sending. Defaults to 20.
+    low_water: The number of enqueued tasks that resumes sending. Defaults to 5.
+    poll_interval_ms: How often the queue depth is checked while paused. Defaults to 500.
+
+    Examples:
+        >>> from meilisearch_python_sdk import AsyncClient
+        >>> from meilisearch_python_sdk.backpressure import Backpressure
+        >>> async with AsyncClient("http://localhost.com", "masterKey") as client:
+        >>>     index = client.index("movies")
+        >>>     await index.add_documents_in_batches(
+        >>>         documents, backpressure=Backpressure(high_water=20, low_water=5)
+        >>>     )
+    """
+
+    high_water: int = 20
+    low_water: int = 5
+    poll_interval_ms: int = 500
+
+    def validate(self) -> None:
+        if self.high_water < 1 or not 0 <= self.low_water < self.high_water:
+            raise ValueError("high_water must be at least 1 and greater than low_water")
+
+
+class _QueueState:
+    def __init__(self, backpressure: Backpressure) -> None:
+        backpressure.validate()
+        self.backpressure = backpressure
+        # None until the depth has been checked with Meilisearch.
+        self.estimated_depth: int | None = None
+        self.pauses = 0
+        self.paused_seconds = 0.0
+
+    def stats(self) -> JsonDict:
+        return {
+            "estimated_depth": self.estimated_depth,
+            "pauses": self.pauses,
+            "paused_seconds": self.paused_seconds,
+        }
+
+
+class AsyncTaskQueueGate:
+    """Waits before each batch while the index's task queue is above the high-water mark."""
+
+    def __init__(
+        self,
+        http_client: HttpxAsyncClient,
+        index_uid: str,
+        backpressure: Backpressure,
+        *,
+        json_handler: BuiltinHandler | OrjsonHandler,
+    ) -> None:
+        self.http_client = http_client
+        self.index_uid = index_uid
+        self.json_handler = json_handler
+        self._state = _QueueState(backpressure)
+        self._lock = asyncio.Lock()
+
+    async def depth(self) -> int:
+        """The number of enqueued tasks for the index."""
+        tasks = await async_get_tasks(
+            self.http_client,
+            json_handler=self.json_handler,
+            index_ids=[self.index_uid],
+            statuses="enqueued",
+            limit=1,
+        )
+
+        return tasks.total
+
+    async def wait(self) -> None:
+        """Wait until a batch can be sent and count it in the estimated depth."""
+        state = self._state
+        async with self._lock:
+            depth = state.estimated_depth
+            if depth is None or depth >= state.backpressure.high_water:
+                depth = await self.depth()
+                if depth >= state.backpressure.high_water:
+                    state.pauses += 1
+                    start = time.monotonic()
+                    while depth > state.backpressure.low_water:
+                        await asyncio.sleep(state.backpressure.poll_interval_ms / 1000)
+                        depth = await self.depth()
+                    state.paused_seconds += time.monotonic() - start
+
+            state.estimated_depth = depth + 1
+
+    def stats(self) -> JsonDict:
+        """The estimated queue depth, the number of pauses, and the total seconds paused."""
+        return self._state.stats()
+
+
+class TaskQueueGate:
+    """Waits before each batch while the index's task queue is above the high-water mark."""
+
+    def __init__(
+        self,
+        http_client: HttpxClient,
+        index_uid: str,
+        backpressure: Backpressure,
+        *,
+        json_handler: BuiltinHandler | OrjsonHandler,
+    ) -> None:
+        self.http_client = http_client
+        self.index_uid = index_uid
+        self.json_handler = json_handler
+        self._state = _QueueState(backpressure)
+        self._lock = threading.Lock()
+
+    def depth(self) -> int:
+        """The number of enqueued tasks for the index."""
+        tasks = get_tasks(
+            self.http_client,
+            json_handler=self.json_handler,
+            index_ids=[self.index_uid],
+            statuses="enqueued",
+            limit=1,
+        )
+
+        return tasks.total
+
+    def wait(self) -> None:
+        """Wait until a batch can be sent and count it in the estimated depth."""
+        state = self._state
+        with self._lock:
+            depth = state.estimated_depth
+            if depth is None or depth >= state.backpressure.high_water:
+                depth = self.depth()
+                if depth >= state.backpressure.high_water:
+                    state.pauses += 1
+                    start = time.monotonic()
+                    while depth > state.backpressure.low_water:
+                        time.sleep(state.backpressure.poll_interval_ms / 1000)
+                        depth = self.depth()
+                    state.paused_seconds += time.monotonic() - start
+
+            state.estimated_depth = depth + 1
+
+    def stats(self) -> JsonDict:
+        """The estimated queue depth, the number of pauses, and the total seconds paused."""
+        return self._state.stats()
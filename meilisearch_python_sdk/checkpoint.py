@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+from meilisearch_python_sdk._task import async_get_task, get_task
+from meilisearch_python_sdk.errors import MeilisearchApiError
+from meilisearch_python_sdk.models.task import TaskInfo
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Sequence
+
+    from httpx2 import AsyncClient as HttpxAsyncClient
+    from httpx2 import Client as HttpxClient
+
+    from meilisearch_python_sdk.json_handler import BuiltinHandler, OrjsonHandler
+    from meilisearch_python_sdk.types import JsonDict, JsonMapping
+
+# Task statuses that mean the batch does not have to be sent again.
+_PENDING_STATUSES = {"enqueued", "processing"}
+
+
+class _Entry(NamedTuple):
+    task: TaskInfo
+    succeeded: bool
+
+
+class Checkpoint:
+    """Records the batches of a batched ingest in a local file so an interrupted ingest can resume.
+
+    An instance can be passed to the `checkpoint` parameter of the `*_in_batches` document methods,
+    including the from file and from directory variants. Each batch is identified by a hash of the
+    index, the operation, and the documents in the batch, and the `TaskInfo` returned for it is
+    appended to the file as soon as Meilisearch accepts the batch.
+
+    When the ingest is run again with the same file, batches that are already in the file are not
+    sent again. A recorded task that has not been seen to succeed is checked with Meilisearch
+    first: if it succeeded, or is still enqueued or processing, the batch is skipped and the
+    recorded `TaskInfo` is returned in its place. If it failed, was canceled, or no longer exists
+    the batch is sent again.
+
+    Because batches are identified by their contents, the documents and `batch_size` must be the
+    same for batches to be skipped. Once an ingest has finished the file can be removed with
+    `clear`.
+
+    Examples:
+        >>> from meilisearch_python_sdk import AsyncClient
+        >>> from meilisearch_python_sdk.checkpoint import Checkpoint
+        >>> checkpoint = Checkpoint("movies.checkpoint")
+        >>> async with AsyncClient("http://localhost.com", "masterKey") as client:
+        >>>     index = client.index("movies")
+        >>>     await index.add_documents_from_file_in_batches(
+        >>>         "movies.json", checkpoint=checkpoint
+        >>>     )
+        >>> checkpoint.clear()
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        """Class initializer.
+
+        Args:
+            path: The checkpoint file. It is created if it does not exist, and read if it does.
+        """
+        self.path = Path(path)
+        self.skipped = 0
+        self._entries: dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+
+        with self.path.open(encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A line cut short by the process stopping mid write.
+                    continue
+                self._entries[record["batch"]] = _Entry(
+                    TaskInfo(**record["task"]), record["succeeded"]
+                )
+
+    def batch_key(
+        self,
+        index_uid: str,
+        operation: str,
+        documents: Sequence[JsonMapping],
+        *,
+        json_handler: BuiltinHandler | OrjsonHandler,
+    ) -> str:
+        """The key that identifies a batch in the checkpoint file."""
+        digest = hashlib.sha256(f"{index_uid}\0{operation}\0".encode())
+        digest.update(json_handler.dump_bytes(documents))
+
+        return digest.hexdigest()
+
+    def record(self, key: str, task: TaskInfo, *, succeeded: bool = False) -> None:
+        """Append the task for a batch to the checkpoint file."""
+        line = json.dumps(
+            {
+                "batch": key,
+                "task": task.model_dump(by_alias=True, mode="json"),
+                "succeeded": succeeded,
+            }
+        )
+        with self._lock:
+            self._entries[key] = _Entry(task, succeeded)
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(f"{line}\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def clear(self) -> None:
+        """Forget all batches and remove the checkpoint file."""
+        with self._lock:
+            self._entries.clear()
+            self.skipped = 0
+            self.path.unlink(missing_ok=True)
+
+    def stats(self) -> JsonDict:
+        """The number of batches recorded, those known to have succeeded, and those skipped."""
+        return {
+            "batches": len(self._entries),
+            "succeeded": sum(x.succeeded for x in self._entries.values()),
+            "skipped": self.skipped,
+        }
+
+    def _resume(self, key: str, entry: _Entry, status: str | None) -> TaskInfo | None:
+        if not entry.succeeded and status == "succeeded":
+            self.record(key, entry.task, succeeded=True)
+        elif not entry.succeeded and status not in _PENDING_STATUSES:
+            return None
+
+        self.skipped += 1
+        return entry.task
+
+    def async_wrap(
+        self,
+        send: Callable[[Sequence[JsonMapping]], Awaitable[TaskInfo]],
+        http_client: HttpxAsyncClient,
+        index_uid: str,
+        operation: str,
+        *,
+        json_handler: BuiltinHandler | OrjsonHandler,
+    ) -> Callable[[Sequence[JsonMapping]], Awaitable[TaskInfo]]:
+        """Wrap a function that sends a batch so recorded batches are skipped."""
+
+        async def checkpointed(documents: Sequence[JsonMapping]) -> TaskInfo:
+            key = self.batch_key(index_uid, operation, documents, json_handler=json_handler)
+            entry = self._entries.get(key)
+            if entry is not None:
+                status = None
+                if not entry.succeeded:
+                    try:
+                        result = await async_get_task(
+                            http_client, json_handler, entry.task.task_uid
+                        )
+                        status = result.status
+                    except MeilisearchApiError:
+                        pass
+                task = self._resume(key, entry, status)
+                if task is not None:
+                    return task
+
+            task = await send(documents)
+            self.record(key, task)
+
+            return task
+
+        return checkpointed
+
+    def wrap(
+        self,
+        send: Callable[[Sequence[JsonMapping]], TaskInfo],
+        http_client: HttpxClient,
+        index_uid: str,
+        operation: str,
+        *,
+        json_handler: BuiltinHandler | OrjsonHandler,
+    ) -> Callable[[Sequence[JsonMapping]], TaskInfo]:
+        """Wrap a function that sends a batch so recorded batches are skipped."""
+
+        def checkpointed(documents: Sequence[JsonMapping]) -> TaskInfo:
+            key = self.batch_key(index_uid, operation, documents, json_handler=json_handler)
+            entry = self._entries.get(key)
+            if entry is not None:
+                status = None
+                if not entry.succeeded:
+                    try:
+                        status = get_task(http_client, json_handler, entry.task.task_uid).status
+                    except MeilisearchApiError:
+                        pass
+                task = self._resume(key, entry, status)
+                if task is not None:
+                    return task
+
+            task = send(documents)
+            self.record(key, task)
+
+            return task
+
+        return checkpointed
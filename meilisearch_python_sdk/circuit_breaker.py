@@ -0,0 +1,321 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING
+
+from httpx2 import AsyncBaseTransport, BaseTransport, TransportError
+
+from meilisearch_python_sdk.errors import MeilisearchCircuitOpenError
+from meilisearch_python_sdk.metrics import operation_name
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
+    from httpx2 import Request, Response
+
+DEFAULT_FAILURE_STATUS_CODES: frozenset[int] = frozenset((500, 502, 503, 504))
+
+
+class _Circuit:
+    __slots__ = (
+        "half_open_in_flight",
+        "half_open_round",
+        "half_open_successes",
+        "opened_at",
+        "outcomes",
+        "state",
+    )
+
+    def __init__(self, window_size: int) -> None:
+        self.state = "closed"
+        self.outcomes: deque[tuple[bool, bool]] = deque(maxlen=window_size)
+        self.opened_at = 0.0
+        self.half_open_in_flight = 0
+        self.half_open_successes = 0
+        self.half_open_round = 0
+
+
+class CircuitBreaker:
+    """Fails requests fast while a node, or an index on a node, is unhealthy.
+
+    An instance can be passed to the `circuit_breaker` parameter of the `AsyncClient` or `Client`.
+    A circuit is kept for each node, and for each index on each node when `per_index` is True.
+
+    While a circuit is closed the outcome of the last `window_size` requests is tracked. Once at
+    least `min_requests` have been made, the circuit opens if the fraction of failed requests
+    reaches `failure_rate_threshold`, or the fraction of requests slower than `slow_call_ms` reaches
+    `slow_call_rate_threshold`. A request fails if it raises a connection or timeout error, or the
+    response status is in `failure_status_codes`.
+
+    While a circuit is open requests raise a `MeilisearchCircuitOpenError` without being sent.
+    After `open_seconds` the circuit is half-open and lets `half_open_probes` requests through. If
+    they all succeed the circuit closes, and if any of them fail it opens again.
+
+    Examples:
+        >>> from meilisearch_python_sdk import AsyncClient
+        >>> from meilisearch_python_sdk.circuit_breaker import CircuitBreaker
+        >>> breaker = CircuitBreaker(failure_rate_threshold=0.5, slow_call_ms=2000, per_index=True)
+        >>> client = AsyncClient("http://localhost.com", "masterKey", circuit_breaker=breaker)
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_rate_threshold: float = 0.5,
+        slow_call_ms: float | None = None,
+        slow_call_rate_threshold: float = 1.0,
+        window_size: int = 50,
+        min_requests: int = 20,
+        open_seconds: float = 30.0,
+        half_open_probes: int = 3,
+        per_index: bool = False,
+        failure_status_codes: Collection[int] = DEFAULT_FAILURE_STATUS_CODES,
+    ) -> None:
+        """Class initializer.
+
+        Args:
+            failure_rate_threshold: The fraction of failed requests, between 0.0 and 1.0, that
+                opens the circuit. Defaults to 0.5.
+            slow_call_ms: Requests that take at least this many milliseconds are slow. If None
+                latency is not tracked. Defaults to None.
+            slow_call_rate_threshold: The fraction of slow requests, between 0.0 and 1.0, that
+                opens the circuit. Defaults to 1.0.
+            window_size: The number of recent requests the rates are calculated from. Defaults to
+                50.
+            min_requests: The number of requests needed before the circuit can open. Defaults to
+                20.
+            open_seconds: Seconds the circuit stays open before letting probes through. Defaults
+                to 30.0.
+            half_open_probes: The number of requests let through while half-open. Defaults to 3.
+            per_index: If True a circuit is kept for each index on each node instead of only each
+                node. Defaults to False.
+            failure_status_codes: Response status codes that count as failures. Defaults to
+                DEFAULT_FAILURE_STATUS_CODES, 500, 502, 503, and 504.
+
+        Raises:
+            ValueError: If a threshold is not between 0.0 and 1.0 or min_requests,
+                half_open_probes, or window_size is less than 1.
+        """
+        if not 0.0 < failure_rate_threshold <= 1.0:
+            raise ValueError("failure_rate_threshold must be greater than 0.0 and at most 1.0")
+
+        if not 0.0 < slow_call_rate_threshold <= 1.0:
+            raise ValueError("slow_call_rate_threshold must be greater than 0.0 and at most 1.0")
+
+        if min(window_size, min_requests, half_open_probes) < 1:
+            raise ValueError("window_size, min_requests, and half_open_probes must be at least 1")
+
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_ms = slow_call_ms
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.window_size = window_size
+        self.min_requests = min(min_requests, window_size)
+        self.open_seconds = open_seconds
+        self.half_open_probes = half_open_probes
+        self.per_index = per_index
+        self.failure_status_codes = frozenset(failure_status_codes)
+        self._circuits: dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def key(self, request: Request) -> str:
+        """The circuit a request belongs to."""
+        origin = f"{request.url.scheme}://{request.url.netloc.decode('ascii')}"
+        if not self.per_index:
+            return origin
+
+        _, index = operation_name(request.method, request.url.path)
+
+        return origin if index is None else f"{origin}/indexes/{index}"
+
+    def acquire(self, key: str) -> int | None:
+        """Check if a request can be sent.
+
+        Returns:
+            The half-open round the request is a probe for, or None if the circuit is closed. It
+            is passed back to `record` or `release` so only probes change the half-open counts.
+
+        Raises:
+            MeilisearchCircuitOpenError: If the circuit is open.
+        """
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                self._circuits[key] = _Circuit(self.window_size)
+                return None
+
+            if circuit.state == "open":
+                remaining = circuit.opened_at + self.open_seconds - time.monotonic()
+                if remaining > 0:
+                    raise MeilisearchCircuitOpenError(key, remaining)
+
+                circuit.state = "half_open"
+                circuit.half_open_in_flight = 0
+                circuit.half_open_successes = 0
+                circuit.half_open_round += 1
+
+            if circuit.state == "half_open":
+                if circuit.half_open_in_flight >= self.half_open_probes:
+                    raise MeilisearchCircuitOpenError(key, 0.0)
+                circuit.half_open_in_flight += 1
+                return circuit.half_open_round
+
+            return None
+
+    def release(self, key: str, probe: int | None = None) -> None:
+        """Release a request that finished without an outcome, for example because it was
+        cancelled.
+
+        Args:
+            key: The circuit the request belongs to.
+            probe: The value returned by `acquire` for the request.
+        """
+        with self._lock:
+            circuit = self._circuits[key]
+            if self._is_probe(circuit, probe):
+                circuit.half_open_in_flight -= 1
+
+    def record(
+        self, key: str, *, failed: bool, elapsed_ms: float, probe: int | None = None
+    ) -> None:
+        """Record the outcome of a request.
+
+        Args:
+            key: The circuit the request belongs to.
+            failed: If the request failed.
+            elapsed_ms: How long the request took in milliseconds.
+            probe: The value returned by `acquire` for the request.
+        """
+        slow = self.slow_call_ms is not None and elapsed_ms >= self.slow_call_ms
+        with self._lock:
+            circuit = self._circuits[key]
+            if probe is not None or circuit.state == "half_open":
+                if not self._is_probe(circuit, probe):
+                    # A request that started before the current half-open round, its outcome
+                    # says nothing about whether the node recovered.
+                    return
+
+                circuit.half_open_in_flight -= 1
+                if failed or slow:
+                    self._open(circuit)
+                else:
+                    circuit.half_open_successes += 1
+                    if circuit.half_open_successes >= self.half_open_probes:
+                        circuit.state = "closed"
+                        circuit.outcomes.clear()
+                return
+
+            if circuit.state == "open":
+                # A request that started before the circuit opened.
+                return
+
+            circuit.outcomes.append((failed, slow))
+            total = len(circuit.outcomes)
+            if total < self.min_requests:
+                return
+
+            failures = sum(1 for x in circuit.outcomes if x[0])
+            slow_calls = sum(1 for x in circuit.outcomes if x[1])
+            if (
+                failures / total >= self.failure_rate_threshold
+                or slow_calls / total >= self.slow_call_rate_threshold
+            ):
+                self._open(circuit)
+
+    @staticmethod
+    def _is_probe(circuit: _Circuit, probe: int | None) -> bool:
+        return (
+            probe is not None and circuit.state == "half_open" and probe == circuit.half_open_round
+        )
+
+    def _open(self, circuit: _Circuit) -> None:
+        circuit.state = "open"
+        circuit.opened_at = time.monotonic()
+        circuit.outcomes.clear()
+
+    def states(self) -> dict[str, str]:
+        """The state, closed, open, or half_open, of every circuit."""
+        with self._lock:
+            return {k: v.state for k, v in self._circuits.items()}
+
+    def reset(self) -> None:
+        """Close all circuits."""
+        with self._lock:
+            self._circuits.clear()
+
+
+class AsyncCircuitBreakerTransport(AsyncBaseTransport):
+    """httpx transport that passes requests through a CircuitBreaker."""
+
+    def __init__(self, transport: AsyncBaseTransport, breaker: CircuitBreaker) -> None:
+        self.transport = transport
+        self.breaker = breaker
+
+    async def handle_async_request(self, request: Request) -> Response:
+        key = self.breaker.key(request)
+        probe = self.breaker.acquire(key)
+        start = time.perf_counter()
+        try:
+            response = await self.transport.handle_async_request(request)
+        except TransportError:
+            self.breaker.record(
+                key,
+                failed=True,
+                elapsed_ms=(time.perf_counter() - start) * 1000,
+                probe=probe,
+            )
+            raise
+        except BaseException:
+            self.breaker.release(key, probe)
+            raise
+
+        self.breaker.record(
+            key,
+            failed=response.status_code in self.breaker.failure_status_codes,
+            elapsed_ms=(time.perf_counter() - start) * 1000,
+            probe=probe,
+        )
+
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class CircuitBreakerTransport(BaseTransport):
+    """httpx transport that passes requests through a CircuitBreaker."""
+
+    def __init__(self, transport: BaseTransport, breaker: CircuitBreaker) -> None:
+        self.transport = transport
+        self.breaker = breaker
+
+    def handle_request(self, request: Request) -> Response:
+        key = self.breaker.key(request)
+        probe = self.breaker.acquire(key)
+        start = time.perf_counter()
+        try:
+            response = self.transport.handle_request(request)
+        except TransportError:
+            self.breaker.record(
+                key,
+                failed=True,
+                elapsed_ms=(time.perf_counter() - start) * 1000,
+                probe=probe,
+            )
+            raise
+        except BaseException:
+            self.breaker.release(key, probe)
+            raise
+
+        self.breaker.record(
+            key,
+            failed=response.status_code in self.breaker.failure_status_codes,
+            elapsed_ms=(time.perf_counter() - start) * 1000,
+            probe=probe,
+        )
+
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import csv
+import re
+from functools import partial
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Literal
+
+from meilisearch_python_sdk.errors import InvalidDocumentError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator, Mapping, Sequence
+    from typing import TextIO
+
+ColumnType = Literal["string", "int", "float", "number", "bool", "list"]
+
+# The types Meilisearch accepts in csv headers, for example `price:number`.
+_HEADER_TYPES: dict[str, ColumnType] = {"string": "string", "number": "number", "boolean": "bool"}
+
+_INT = re.compile(r"[+-]?\d+")
+_FLOAT = re.compile(r"[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?")
+# Numbers with leading zeros, such as zip codes, are identifiers rather than numbers.
+_LEADING_ZERO = re.compile(r"[+-]?0\d")
+_BOOLS = {"true": True, "false": False}
+
+
+def _parse_bool(value: str) -> bool:
+    try:
+        return _BOOLS[value.lower()]
+    except KeyError:
+        raise ValueError(value) from None
+
+
+def _parse_number(value: str) -> int | float:
+    return int(value) if _INT.fullmatch(value) else float(value)
+
+
+def _split(value: str, separator: str) -> list[str]:
+    return [x.strip() for x in value.split(separator)]
+
+
+def _infer(values: Sequence[str | None]) -> ColumnType:
+    sample = [x for x in values if x]
+    if not sample or any(_LEADING_ZERO.match(x) for x in sample):
+        return "string"
+    # Numbers are inferred as "number" rather than int or float so that a later chunk with
+    # decimals in a column of whole numbers still fits.
+    if all(_FLOAT.fullmatch(x) for x in sample):
+        return "number"
+    if all(x.lower() in _BOOLS for x in sample):
+        return "bool"
+
+    return "string"
+
+
+class CsvSchema:
+    """The types of the columns of csv documents, so values are not all sent as strings.
+
+    `csv.DictReader` reads every value as a string, so numbers and booleans from csv files cannot
+    be used in numeric filters or sorted. A schema converts the values of each column to the
+    declared type, a chunk of rows at a time and one column at a time.
+
+    A column's type is taken from `columns`, then from a Meilisearch type annotation in the header
+    such as `price:number` or `available:boolean`, which is removed from the field name. If
+    `infer` is True, the remaining columns are given the first of number, bool, and string that
+    fits every value in the first chunk of rows. Values with leading zeros, such as zip codes,
+    stay strings. Inferred types are fixed after the first chunk, and a later value that does not
+    fit its inferred type is sent as a string rather than raising, so a valid file is never
+    rejected after some of its chunks were sent. Values that do not fit a declared type or a
+    header annotation raise an `InvalidDocumentError`. When several files are read, types are
+    inferred separately for each file.
+
+    Empty values in typed columns become None, and list columns are split on `list_separator`.
+
+    Args:
+        columns: The types of the columns keyed by field name. The types are string, int, float,
+            number (int or float depending on the value), bool (true or false in any case), and
+            list. Defaults to None.
+        infer: If set to True the types of columns that are not declared are inferred, otherwise
+            they are strings. Defaults to True.
+        list_separator: The separator of the items in list columns. Defaults to ",".
+
+    Examples:
+        >>> from meilisearch_python_sdk import AsyncClient
+        >>> from meilisearch_python_sdk.csv_schema import CsvSchema
+        >>> schema = CsvSchema({"genres": "list", "release_date": "int"}, list_separator="|")
+        >>> async with AsyncClient("http://localhost.com", "masterKey") as client:
+        >>>     index = client.index("movies")
+        >>>     await index.add_documents_from_file_in_batches("movies.csv", csv_schema=schema)
+    """
+
+    def __init__(
+        self,
+        columns: Mapping[str, ColumnType] | None = None,
+        *,
+        infer: bool = True,
+        list_separator: str = ",",
+    ) -> None:
+        self.columns = dict(columns or {})
+        self.infer = infer
+        self.list_separator = list_separator
+
+    def read(
+        self, f: TextIO, *, delimiter: str | None = None, chunk_size: int | None = None
+    ) -> Generator[list[dict[str, Any]], None, None]:
+        """Read typed documents from a csv file.
+
+        Args:
+            f: The open csv file. The first row is the header.
+            delimiter: The delimiter of the csv file. Defaults to None, in which case a comma is
+                used.
+            chunk_size: The number of documents in each chunk. Defaults to None, in which case
+                all the documents are returned in one chunk.
+
+        Yields:
+            Chunks of documents.
+
+        Raises:
+            InvalidDocumentError: If a row has more fields than the header or a value cannot be
+                converted to the declared type of its column.
+        """
+        # Blank lines are skipped, as they are by csv.DictReader.
+        reader = (x for x in csv.reader(f, delimiter=delimiter or ",") if x)
+        header = next(reader, None)
+        if header is None:
+            return
+
+        names = []
+        types: dict[str, ColumnType] = {}
+        for field in header:
+            name, _, annotation = field.rpartition(":")
+            if name and annotation in _HEADER_TYPES:
+                types[name] = _HEADER_TYPES[annotation]
+                names.append(name)
+            else:
+                names.append(field)
+        types.update(self.columns)
+
+        converters: list[Callable[[str | None], Any] | None] | None = None
+        row_number = 1
+        while rows := list(islice(reader, chunk_size)):
+            columns = self._columns(rows, len(names), row_number)
+            if converters is None:
+                inferred = set()
+                for name, values in zip(names, columns, strict=True):
+                    if name not in types:
+                        types[name] = _infer(values) if self.infer else "string"
+                        inferred.add(name)
+                converters = [self._converter(types[x], strict=x not in inferred) for x in names]
+
+            converted = [
+                values
+                if convert is None
+                else self._convert(name, types[name], convert, values, row_number)
+                for name, convert, values in zip(names, converters, columns, strict=True)
+            ]
+            yield [dict(zip(names, values, strict=True)) for values in zip(*converted, strict=True)]
+            row_number += len(rows)
+
+    def _converter(
+        self, column_type: ColumnType, *, strict: bool = True
+    ) -> Callable[[str | None], Any] | None:
+        if column_type == "string":
+            return None
+
+        parse: Callable[[str], Any]
+        if column_type == "list":
+            parse = partial(_split, separator=self.list_separator)
+        else:
+            parse = {"int": int, "float": float, "number": _parse_number, "bool": _parse_bool}[
+                column_type
+            ]
+
+        def convert(value: str | None) -> Any:  # noqa: ANN401
+            return parse(value) if value else None
+
+        if strict:
+            return convert
+
+        def convert_or_keep(value: str | None) -> Any:  # noqa: ANN401
+            try:
+                return convert(value)
+            except ValueError:
+                return value
+
+        return convert_or_keep
+
+    @staticmethod
+    def _columns(rows: list[list[str]], width: int, row_number: int) -> list[Sequence[str | None]]:
+        if any(len(x) != width for x in rows):
+            padded: list[list[str | None]] = []
+            for i, row in enumerate(rows):
+                if len(row) > width:
+                    raise InvalidDocumentError(
+                        f"Row {row_number + i} has more fields than the csv header"
+                    )
+                padded.append([*row, *[None] * (width - len(row))])
+            rows = padded  # type: ignore[assignment]
+
+        return list(zip(*rows, strict=True))
+
+    @staticmethod
+    def _convert(
+        name: str,
+        column_type: ColumnType,
+        convert: Callable[[str | None], Any],
+        values: Sequence[str | None],
+        row_number: int,
+    ) -> list[Any]:
+        try:
+            return list(map(convert, values))
+        except ValueError:
+            for i, value in enumerate(values):
+                try:
+                    convert(value)
+                except ValueError:
+                    raise InvalidDocumentError(
+                        f"Row {row_number + i}: {value!r} in column {name!r} is not a valid "
+                        f"{column_type}"
+                    ) from None
+            raise  # pragma: no cover
@@ -0,0 +1,382 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import sqlite3
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+from meilisearch_python_sdk._task import async_wait_for_task, wait_for_task
+from meilisearch_python_sdk.errors import InvalidDocumentError
+
+if TYPE_CHECKING:
+    import sys
+    from collections.abc import Iterable, Sequence
+    from types import TracebackType
+
+    from meilisearch_python_sdk.index.async_index import AsyncIndex
+    from meilisearch_python_sdk.index.index import Index
+    from meilisearch_python_sdk.json_handler import BuiltinHandler, OrjsonHandler
+    from meilisearch_python_sdk.models.task import TaskInfo
+    from meilisearch_python_sdk.types import JsonMapping
+
+    if sys.version_info >= (3, 11):
+        from typing import Self
+    else:
+        from typing_extensions import Self
+
+# Keys looked up per query, kept below SQLite's limit on query parameters.
+_LOOKUP_SIZE = 500
+
+
+class DeltaSyncResult(NamedTuple):
+    """The outcome of a delta sync.
+
+    sent: The number of new or changed documents that were sent.
+    unchanged: The number of documents that were skipped because they had not changed.
+    deleted: The number of documents deleted because they were no longer in the source.
+    tasks: The tasks for the updates and deletions.
+    """
+
+    sent: int
+    unchanged: int
+    deleted: int
+    tasks: list[TaskInfo]
+
+
+class HashStore:
+    """A local SQLite store of the content hash of each document sent to an index.
+
+    The store maps each primary key to a hash of the document that was last sent, so unchanged
+    documents can be left out of the next sync. Hashes are only saved once the task that sent the
+    document has succeeded, so a failed task does not hide a change from the next sync. One store
+    can hold the hashes for several indexes.
+
+    Examples:
+        >>> from meilisearch_python_sdk import AsyncClient
+        >>> from meilisearch_python_sdk.delta_sync import HashStore, async_delta_sync
+        >>> with HashStore("movies.sqlite") as store:
+        >>>     async with AsyncClient("http://localhost.com", "masterKey") as client:
+        >>>         index = client.index("movies")
+        >>>         await async_delta_sync(index, documents, store, primary_key="id")
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        """Class initializer.
+
+        Args:
+            path: The SQLite file. It is created if it does not exist.
+        """
+        self.path = Path(path)
+        self._connection = sqlite3.connect(self.path)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS hashes "
+            "(index_uid TEXT NOT NULL, pk TEXT NOT NULL, hash BLOB NOT NULL, "
+            "PRIMARY KEY (index_uid, pk)) WITHOUT ROWID"
+        )
+        self._connection.execute("CREATE TEMP TABLE IF NOT EXISTS seen (pk TEXT PRIMARY KEY)")
+        self._connection.commit()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        et: type[BaseException] | None,
+        ev: type[BaseException] | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        self._connection.close()
+
+    def diff(
+        self,
+        index_uid: str,
+        documents: Sequence[JsonMapping],
+        primary_key: str,
+        *,
+        json_handler: BuiltinHandler | OrjsonHandler,
+    ) -> tuple[list[JsonMapping], list[tuple[str, bytes]]]:
+        """Find the documents that are new or have changed since they were last saved.
+
+        The primary keys of all the documents are also remembered for `missing`.
+
+        Args:
+            index_uid: The uid of the index.
+            documents: The documents from the source.
+            primary_key: The primary key of the documents.
+            json_handler: The handler used to serialize the documents for hashing.
+
+        Returns:
+            The new or changed documents, and their primary keys and hashes to save once they
+            have been sent.
+
+        Raises:
+            InvalidDocumentError: If a document does not have the primary key.
+        """
+        self._connection.execute("DELETE FROM seen")
+        changed: list[JsonMapping] = []
+        hashes: list[tuple[str, bytes]] = []
+        for start in range(0, len(documents), _LOOKUP_SIZE):
+            chunk = documents[start : start + _LOOKUP_SIZE]
+            keyed = []
+            for document in chunk:
+                if primary_key not in document:
+                    raise InvalidDocumentError(
+                        f"Document is missing the primary key {primary_key}: {document}"
+                    )
+                digest = hashlib.blake2b(json_handler.dump_bytes(document), digest_size=16)
+                keyed.append((str(document[primary_key]), digest.digest(), document))
+
+            keys = [x[0] for x in keyed]
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO seen (pk) VALUES (?)", ((x,) for x in keys)
+            )
+            placeholders = ",".join("?" * len(keys))
+            stored = dict(
+                self._connection.execute(
+                    f"SELECT pk, hash FROM hashes WHERE index_uid = ? AND pk IN ({placeholders})",  # noqa: S608
+                    (index_uid, *keys),
+                )
+            )
+            for key, digest, document in keyed:
+                if stored.get(key) != digest:
+                    changed.append(document)
+                    hashes.append((key, digest))
+
+        self._connection.commit()
+
+        return changed, hashes
+
+    def missing(self, index_uid: str) -> list[str]:
+        """The saved primary keys that were not in the documents of the last `diff`."""
+        return [
+            x[0]
+            for x in self._connection.execute(
+                "SELECT pk FROM hashes WHERE index_uid = ? AND pk NOT IN (SELECT pk FROM seen)",
+                (index_uid,),
+            )
+        ]
+
+    def save(self, index_uid: str, hashes: Iterable[tuple[str, bytes]]) -> None:
+        """Save the hashes of documents that have been sent."""
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO hashes (index_uid, pk, hash) VALUES (?, ?, ?)",
+            ((index_uid, key, digest) for key, digest in hashes),
+        )
+        self._connection.commit()
+
+    def remove(self, index_uid: str, keys: Iterable[str]) -> None:
+        """Remove the hashes of documents that have been deleted."""
+        self._connection.executemany(
+            "DELETE FROM hashes WHERE index_uid = ? AND pk = ?", ((index_uid, x) for x in keys)
+        )
+        self._connection.commit()
+
+    def clear(self, index_uid: str | None = None) -> None:
+        """Remove the saved hashes for an index, or for all indexes if no index is given."""
+        if index_uid is None:
+            self._connection.execute("DELETE FROM hashes")
+        else:
+            self._connection.execute("DELETE FROM hashes WHERE index_uid = ?", (index_uid,))
+        self._connection.commit()
+
+    def count(self, index_uid: str) -> int:
+        """The number of saved hashes for an index."""
+        return self._connection.execute(
+            "SELECT COUNT(*) FROM hashes WHERE index_uid = ?", (index_uid,)
+        ).fetchone()[0]
+
+
+def _chunks(items: Sequence, size: int) -> list[Sequence]:
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+async def async_delta_sync(
+    index: AsyncIndex,
+    documents: Sequence[JsonMapping],
+    store: HashStore,
+    *,
+    primary_key: str | None = None,
+    batch_size: int = 1000,
+    concurrency_limit: int | None = None,
+    delete_missing: bool = False,
+) -> DeltaSyncResult:
+    """Send only the documents that are new or have changed since the last sync.
+
+    New and changed documents are sent with `update_documents_in_batches`. The sync then waits
+    for the tasks, and saves the hashes of the documents whose task succeeded.
+
+    Args:
+        index: The index to sync.
+        documents: All the documents from the source.
+        store: The store of hashes from previous syncs.
+        primary_key: The primary key of the documents. Defaults to None, in which case the primary
+            key of the index is used.
+        batch_size: The number of documents that should be included in each batch.
+            Defaults to 1000.
+        concurrency_limit: If set this will limit the number of batches that will be sent
+            concurrently. Defaults to None.
+        delete_missing: If set to True documents that were saved by a previous sync but are no
+            longer in `documents` are deleted from the index. Defaults to False.
+
+    Returns:
+        The number of documents sent, unchanged, and deleted, and the tasks.
+
+    Raises:
+        InvalidDocumentError: If a document does not have the primary key.
+        ValueError: If no primary key is given and the index does not have one.
+        MeilisearchCommunicationError: If there was an error communicating with the server.
+        MeilisearchApiError: If the Meilisearch API returned an error.
+
+    Examples:
+        >>> from meilisearch_python_sdk import AsyncClient
+        >>> from meilisearch_python_sdk.delta_sync import HashStore, async_delta_sync
+        >>> with HashStore("movies.sqlite") as store:
+        >>>     async with AsyncClient("http://localhost.com", "masterKey") as client:
+        >>>         index = client.index("movies")
+        >>>         await async_delta_sync(
+        >>>             index, documents, store, primary_key="id", delete_missing=True
+        >>>         )
+    """
+    primary_key = primary_key or await index.get_primary_key()
+    if primary_key is None:
+        raise ValueError("A primary_key is required when the index does not have one")
+
+    changed, hashes = store.diff(
+        index.uid, documents, primary_key, json_handler=index._json_handler
+    )
+    tasks: list[TaskInfo] = []
+    if changed:
+        tasks = await index.update_documents_in_batches(
+            changed,
+            batch_size=batch_size,
+            primary_key=primary_key,
+            concurrency_limit=concurrency_limit,
+        )
+        results = await asyncio.gather(
+            *(
+                async_wait_for_task(
+                    index.http_client,
+                    x.task_uid,
+                    json_handler=index._json_handler,
+                    timeout_in_ms=None,
+                )
+                for x in tasks
+            )
+        )
+        for result, saved in zip(results, _chunks(hashes, batch_size), strict=True):
+            if result.status == "succeeded":
+                store.save(index.uid, saved)
+
+    deleted: list[str] = []
+    if delete_missing:
+        for keys in _chunks(store.missing(index.uid), batch_size):
+            task = await index.delete_documents(list(keys))
+            tasks.append(task)
+            result = await async_wait_for_task(
+                index.http_client,
+                task.task_uid,
+                json_handler=index._json_handler,
+                timeout_in_ms=None,
+            )
+            if result.status == "succeeded":
+                store.remove(index.uid, keys)
+                deleted.extend(keys)
+
+    return DeltaSyncResult(
+        sent=len(changed),
+        unchanged=len(documents) - len(changed),
+        deleted=len(deleted),
+        tasks=tasks,
+    )
+
+
+def delta_sync(
+    index: Index,
+    documents: Sequence[JsonMapping],
+    store: HashStore,
+    *,
+    primary_key: str | None = None,
+    batch_size: int = 1000,
+    delete_missing: bool = False,
+) -> DeltaSyncResult:
+    """Send only the documents that are new or have changed since the last sync.
+
+    New and changed documents are sent with `update_documents_in_batches`. The sync then waits
+    for the tasks, and saves the hashes of the documents whose task succeeded.
+
+    Args:
+        index: The index to sync.
+        documents: All the documents from the source.
+        store: The store of hashes from previous syncs.
+        primary_key: The primary key of the documents. Defaults to None, in which case the primary
+            key of the index is used.
+        batch_size: The number of documents that should be included in each batch.
+            Defaults to 1000.
+        delete_missing: If set to True documents that were saved by a previous sync but are no
+            longer in `documents` are deleted from the index. Defaults to False.
+
+    Returns:
+        The number of documents sent, unchanged, and deleted, and the tasks.
+
+    Raises:
+        InvalidDocumentError: If a document does not have the primary key.
+        ValueError: If no primary key is given and the index does not have one.
+        MeilisearchCommunicationError: If there was an error communicating with the server.
+        MeilisearchApiError: If the Meilisearch API returned an error.
+
+    Examples:
+        >>> from meilisearch_python_sdk import Client
+        >>> from meilisearch_python_sdk.delta_sync import HashStore, delta_sync
+        >>> with HashStore("movies.sqlite") as store:
+        >>>     client = Client("http://localhost.com", "masterKey")
+        >>>     index = client.index("movies")
+        >>>     delta_sync(index, documents, store, primary_key="id", delete_missing=True)
+    """
+    primary_key = primary_key or index.get_primary_key()
+    if primary_key is None:
+        raise ValueError("A primary_key is required when the index does not have one")
+
+    changed, hashes = store.diff(
+        index.uid, documents, primary_key, json_handler=index._json_handler
+    )
+    tasks: list[TaskInfo] = []
+    if changed:
+        tasks = index.update_documents_in_batches(
+            changed, batch_size=batch_size, primary_key=primary_key
+        )
+        for task, saved in zip(tasks, _chunks(hashes, batch_size), strict=True):
+            result = wait_for_task(
+                index.http_client,
+                task.task_uid,
+                json_handler=index._json_handler,
+                timeout_in_ms=None,
+            )
+            if result.status == "succeeded":
+                store.save(index.uid, saved)
+
+    deleted: list[str] = []
+    if delete_missing:
+        for keys in _chunks(store.missing(index.uid), batch_size):
+            task = index.delete_documents(list(keys))
+            tasks.append(task)
+            result = wait_for_task(
+                index.http_client,
+                task.task_uid,
+                json_handler=index._json_handler,
+                timeout_in_ms=None,
+            )
+            if result.status == "succeeded":
+                store.remove(index.uid, keys)
+                deleted.extend(keys)
+
+    return DeltaSyncResult(
+        sent=len(changed),
+        unchanged=len(documents) - len(changed),
+        deleted=len(deleted),
+        tasks=tasks,
+    )
@@ -56,6 +56,18 @@ class MeilisearchApiError(MeilisearchError):
         return f"MeilisearchApiError.{self.code} {self.message} {self.error_type} {self.link}"
 
 
+class MeilisearchCircuitOpenError(MeilisearchError):
+    """Error when a request is not sent because the circuit breaker for it is open."""
+
+    def __init__(self, circuit: str, retry_after: float) -> None:
+        self.circuit = circuit
+        self.retry_after = retry_after
+        super().__init__(f"Circuit for {circuit} is open, retry after {retry_after:.1f} seconds")
+
+    def __str__(self) -> str:
+        return f"MeilisearchCircuitOpenError, {self.message}"
+
+
 class MeilisearchCommunicationError(MeilisearchError):
     """Error when connecting to Meilisearch."""
 
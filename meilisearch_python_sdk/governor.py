@@ -0,0 +1,331 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, NamedTuple
+
+from httpx2 import AsyncBaseTransport, BaseTransport
+
+from meilisearch_python_sdk.metrics import _TimedAsyncStream, _TimedSyncStream, operation_name
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
+    from httpx2 import Request, Response
+
+    from meilisearch_python_sdk.types import JsonDict
+
+DEFAULT_READ_OPERATIONS: frozenset[str] = frozenset(
+    ("facet_search", "get_documents", "multi_search", "search", "search_similar_documents")
+)
+
+
+class GovernorLimits(NamedTuple):
+    """The limits for one pool of requests in a Governor.
+
+    Limits that are None are not applied.
+
+    requests_per_second: The sustained number of requests per second. Defaults to None.
+    bytes_per_second: The sustained number of request body bytes per second. Defaults to None.
+    max_concurrent: The maximum number of requests in flight at once. Defaults to None.
+    burst_seconds: How many seconds of the rates can be used in a burst after an idle period.
+        Defaults to 1.0.
+    """
+
+    requests_per_second: float | None = None
+    bytes_per_second: float | None = None
+    max_concurrent: int | None = None
+    burst_seconds: float = 1.0
+
+
+class _TokenBucket:
+    __slots__ = ("_lock", "capacity", "rate", "tokens", "updated")
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float) -> float:
+        """Take `amount` tokens and return the seconds to wait until they are available.
+
+        The balance can go negative so large requests wait in proportion to their size instead of
+        never fitting in the bucket, and later requests queue behind them.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= amount
+
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class _Slots:
+    """A concurrency limit that is shared by async and sync requests.
+
+    Released slots are handed to waiting async requests first, then to waiting sync requests.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.in_use = 0
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    async def acquire_async(self) -> None:
+        with self._lock:
+            if self.in_use < self.limit and not self._waiters:
+                self.in_use += 1
+                return
+
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                    raise
+
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over before the cancellation.
+                self.release()
+            raise
+
+    def acquire(self) -> None:
+        with self._condition:
+            while self.in_use >= self.limit:
+                self._condition.wait()
+            self.in_use += 1
+
+    def release(self) -> None:
+        with self._lock:
+            if self._waiters:
+                # The slot passes directly to the waiter so in_use is unchanged.
+                waiter = self._waiters.popleft()
+                waiter.get_loop().call_soon_threadsafe(self._hand_over, waiter)
+                return
+
+            self.in_use -= 1
+            self._condition.notify()
+
+    def _hand_over(self, waiter: asyncio.Future[None]) -> None:
+        if waiter.cancelled():
+            self.release()
+        else:
+            waiter.set_result(None)
+
+
+class _Pool:
+    def __init__(self, limits: GovernorLimits) -> None:
+        self.limits = limits
+        self.requests = (
+            None
+            if limits.requests_per_second is None
+            else _TokenBucket(
+                limits.requests_per_second,
+                max(limits.requests_per_second * limits.burst_seconds, 1.0),
+            )
+        )
+        self.bytes = (
+            None
+            if limits.bytes_per_second is None
+            else _TokenBucket(
+                limits.bytes_per_second, limits.bytes_per_second * limits.burst_seconds
+            )
+        )
+        self.slots = None if limits.max_concurrent is None else _Slots(limits.max_concurrent)
+        self.total = 0
+        self.delayed = 0
+        self.delay_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self, size: int) -> float:
+        delay = 0.0
+        if self.requests is not None:
+            delay = self.requests.reserve(1)
+        if self.bytes is not None and size:
+            delay = max(delay, self.bytes.reserve(size))
+
+        with self._lock:
+            self.total += 1
+            if delay > 0:
+                self.delayed += 1
+                self.delay_seconds += delay
+
+        return delay
+
+    def stats(self) -> JsonDict:
+        with self._lock:
+            return {
+                "requests": self.total,
+                "delayed": self.delayed,
+                "delay_seconds": self.delay_seconds,
+                "in_flight": 0 if self.slots is None else self.slots.in_use,
+            }
+
+
+class Governor:
+    """Limits the rate and concurrency of requests across every client that shares it.
+
+    An instance can be passed to the `governor` parameter of the `AsyncClient` or `Client`. Every
+    request made by the clients, and the indexes they create, waits for the governor before it is
+    sent. Sharing one governor between all clients and tasks in a process keeps them within a
+    single budget instead of each one sending as fast as it can.
+
+    Reads and writes have separate pools so, for example, a bulk ingest can be rate limited
+    without slowing searches. GET requests and requests for an operation in `read_operations` are
+    reads, and all other requests are writes.
+
+    Each pool has a token bucket for requests per second, a token bucket for request body bytes
+    per second, and a maximum number of requests in flight. A request holds its place in flight
+    until its response has been read.
+
+    Examples:
+        >>> from meilisearch_python_sdk import AsyncClient
+        >>> from meilisearch_python_sdk.governor import Governor, GovernorLimits
+        >>> governor = Governor(
+        >>>     reads=GovernorLimits(max_concurrent=50),
+        >>>     writes=GovernorLimits(bytes_per_second=20_000_000, max_concurrent=4),
+        >>> )
+        >>> client = AsyncClient("http://localhost.com", "masterKey", governor=governor)
+    """
+
+    def __init__(
+        self,
+        reads: GovernorLimits | None = None,
+        writes: GovernorLimits | None = None,
+        *,
+        read_operations: Collection[str] = DEFAULT_READ_OPERATIONS,
+    ) -> None:
+        """Class initializer.
+
+        Args:
+            reads: The limits for reads. If None reads are not limited. Defaults to None.
+            writes: The limits for writes. If None writes are not limited. Defaults to None.
+            read_operations: The operations, in addition to GET requests, that are reads.
+                Defaults to DEFAULT_READ_OPERATIONS.
+
+        Raises:
+            ValueError: If a rate or max_concurrent is not greater than 0.
+        """
+        for limits in (reads, writes):
+            if limits is None:
+                continue
+            if any(
+                x is not None and x <= 0
+                for x in (
+                    limits.requests_per_second,
+                    limits.bytes_per_second,
+                    limits.max_concurrent,
+                )
+            ):
+                raise ValueError("Rates and max_concurrent must be greater than 0")
+
+        self.read_operations = frozenset(read_operations)
+        self.reads = None if reads is None else _Pool(reads)
+        self.writes = None if writes is None else _Pool(writes)
+
+    def pool(self, request: Request) -> _Pool | None:
+        """The pool a request belongs to, or None if it is not limited."""
+        if request.method == "GET":
+            return self.reads
+
+        operation, _ = operation_name(request.method, request.url.path)
+
+        return self.reads if operation in self.read_operations else self.writes
+
+    def stats(self) -> JsonDict:
+        """The number of requests, requests that were delayed by a rate limit, total seconds of
+        delay, and requests in flight for each pool.
+        """
+        return {
+            "reads": None if self.reads is None else self.reads.stats(),
+            "writes": None if self.writes is None else self.writes.stats(),
+        }
+
+
+def _request_size(request: Request) -> int:
+    return int(request.headers.get("content-length", 0))
+
+
+class AsyncGovernorTransport(AsyncBaseTransport):
+    """httpx transport that makes requests wait for a Governor."""
+
+    def __init__(self, transport: AsyncBaseTransport, governor: Governor) -> None:
+        self.transport = transport
+        self.governor = governor
+
+    async def handle_async_request(self, request: Request) -> Response:
+        pool = self.governor.pool(request)
+        if pool is None:
+            return await self.transport.handle_async_request(request)
+
+        delay = pool.reserve(_request_size(request))
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        if pool.slots is None:
+            return await self.transport.handle_async_request(request)
+
+        await pool.slots.acquire_async()
+        try:
+            response = await self.transport.handle_async_request(request)
+        except BaseException:
+            pool.slots.release()
+            raise
+
+        if response.is_closed:
+            pool.slots.release()
+        else:
+            response.stream = _TimedAsyncStream(response.stream, pool.slots.release)
+
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class GovernorTransport(BaseTransport):
+    """httpx transport that makes requests wait for a Governor."""
+
+    def __init__(self, transport: BaseTransport, governor: Governor) -> None:
+        self.transport = transport
+        self.governor = governor
+
+    def handle_request(self, request: Request) -> Response:
+        pool = self.governor.pool(request)
+        if pool is None:
+            return self.transport.handle_request(request)
+
+        delay = pool.reserve(_request_size(request))
+        if delay > 0:
+            time.sleep(delay)
+
+        if pool.slots is None:
+            return self.transport.handle_request(request)
+
+        pool.slots.acquire()
+        try:
+            response = self.transport.handle_request(request)
+        except BaseException:
+            pool.slots.release()
+            raise
+
+        if response.is_closed:
+            pool.slots.release()
+        else:
+            response.stream = _TimedSyncStream(response.stream, pool.slots.release)
+
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING
+
+from httpx2 import AsyncBaseTransport, Request, RequestNotRead, Response
+
+from meilisearch_python_sdk.metrics import operation_name
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
+    from meilisearch_python_sdk.metrics import MetricsCollector
+    from meilisearch_python_sdk.types import JsonDict
+
+DEFAULT_HEDGED_OPERATIONS: frozenset[str] = frozenset(("multi_search", "search"))
+
+# How many new latency samples are collected before the hedge delay is recalculated.
+_RECALCULATE_EVERY = 50
+
+
+class Hedging:
+    """Sends a second copy of slow search requests and uses whichever response arrives first.
+
+    An instance can be passed to the `hedging` parameter of the `AsyncClient`. If a search or
+    multi-search has not received a response after the hedge delay, a duplicate request is sent
+    and the first response to arrive is used while the other request is cancelled. With the
+    `AsyncMultiNodeClient` the duplicate is routed to the least busy node, otherwise it is sent to
+    the same node.
+
+    The hedge delay is the `percentile` of recently observed latencies. Until `min_samples`
+    latencies have been observed `initial_delay_ms` is used.
+
+    `budget` caps the extra load. Each request earns `budget` hedges, up to `max_burst`, and each
+    hedge spends one, so with the default budget of 0.05 no more than about 5% extra requests are
+    sent.
+    """
+
+    def __init__(
+        self,
+        *,
+        percentile: float = 0.95,
+        initial_delay_ms: float = 100.0,
+        min_delay_ms: float = 1.0,
+        min_samples: int = 100,
+        window: int = 1000,
+        budget: float = 0.05,
+        max_burst: float = 10.0,
+        operations: Collection[str] = DEFAULT_HEDGED_OPERATIONS,
+    ) -> None:
+        """Class initializer.
+
+        Args:
+            percentile: The percentile of observed latencies, between 0.0 and 1.0, used as the
+                hedge delay. Defaults to 0.95.
+            initial_delay_ms: The hedge delay used until `min_samples` latencies have been
+                observed. Defaults to 100.0.
+            min_delay_ms: The lowest hedge delay that will be used. Defaults to 1.0.
+            min_samples: The number of latencies needed before the percentile is used. Defaults
+                to 100.
+            window: The number of recent latencies the percentile is calculated from. Defaults to
+                1000.
+            budget: The hedges earned by each request. Defaults to 0.05.
+            max_burst: The most hedges that can be saved up. Defaults to 10.0.
+            operations: The operations that can be hedged. Defaults to DEFAULT_HEDGED_OPERATIONS,
+                search and multi_search.
+
+        Raises:
+            ValueError: If percentile is not between 0.0 and 1.0 or budget is negative.
+        """
+        if not 0.0 <= percentile <= 1.0:
+            raise ValueError("percentile must be between 0.0 and 1.0")
+
+        if budget < 0.0:
+            raise ValueError("budget must not be negative")
+
+        self.percentile = percentile
+        self.initial_delay_ms = initial_delay_ms
+        self.min_delay_ms = min_delay_ms
+        self.min_samples = min_samples
+        self.budget = budget
+        self.max_burst = max_burst
+        self.operations = frozenset(operations)
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._new_samples = 0
+        self._delay_ms = initial_delay_ms
+        self._calculated = False
+        self._tokens = 0.0
+        self._lock = threading.Lock()
+
+    def delay_ms(self) -> float:
+        """The current hedge delay in milliseconds."""
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return max(self.initial_delay_ms, self.min_delay_ms)
+
+            if self._new_samples >= _RECALCULATE_EVERY or not self._calculated:
+                ordered = sorted(self._latencies)
+                self._delay_ms = ordered[min(int(len(ordered) * self.percentile), len(ordered) - 1)]
+                self._new_samples = 0
+                self._calculated = True
+
+            return max(self._delay_ms, self.min_delay_ms)
+
+    def observe(self, latency_ms: float) -> None:
+        with self._lock:
+            self._latencies.append(latency_ms)
+            self._new_samples += 1
+
+    def start_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+            self._tokens = min(self._tokens + self.budget, self.max_burst)
+
+    def try_hedge(self) -> bool:
+        """Spend one hedge from the budget if one is available."""
+        with self._lock:
+            if self._tokens < 1.0:
+                return False
+
+            self._tokens -= 1.0
+            self.hedged += 1
+
+        return True
+
+    def record_win(self) -> None:
+        with self._lock:
+            self.hedge_wins += 1
+
+    def stats(self) -> JsonDict:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "hedged": self.hedged,
+                "hedge_wins": self.hedge_wins,
+                "delay_ms": self._delay_ms,
+            }
+
+
+def _copy_request(request: Request) -> Request | None:
+    try:
+        content = request.content
+    except RequestNotRead:  # pragma: no cover
+        # Streaming bodies can't be sent twice.
+        return None
+
+    return Request(
+        request.method,
+        request.url,
+        headers=request.headers,
+        content=content,
+        extensions=dict(request.extensions),
+    )
+
+
+async def _discard(tasks: Collection[asyncio.Task[Response]]) -> None:
+    for task in tasks:
+        task.cancel()
+
+    for result in await asyncio.gather(*tasks, return_exceptions=True):
+        if isinstance(result, Response):
+            await result.aclose()
+
+
+class AsyncHedgingTransport(AsyncBaseTransport):
+    """httpx transport that hedges requests as configured by a Hedging instance."""
+
+    def __init__(
+        self,
+        transport: AsyncBaseTransport,
+        hedging: Hedging,
+        metrics: MetricsCollector | None = None,
+    ) -> None:
+        self.transport = transport
+        self.hedging = hedging
+        self.metrics = metrics
+
+    async def _timed(self, request: Request) -> Response:
+        start = time.perf_counter()
+        response = await self.transport.handle_async_request(request)
+        self.hedging.observe((time.perf_counter() - start) * 1000)
+
+        return response
+
+    async def handle_async_request(self, request: Request) -> Response:
+        operation, index = operation_name(request.method, request.url.path)
+        if operation not in self.hedging.operations:
+            return await self.transport.handle_async_request(request)
+
+        hedge_request = _copy_request(request)
+        self.hedging.start_request()
+        delay = self.hedging.delay_ms() / 1000
+        first = asyncio.create_task(self._timed(request))
+        try:
+            done, _ = await asyncio.wait((first,), timeout=delay)
+        except BaseException:
+            await _discard((first,))
+            raise
+
+        if done or hedge_request is None or not self.hedging.try_hedge():
+            return await first
+
+        if self.metrics is not None:
+            self.metrics.record_retry(operation, index=index)
+
+        second = asyncio.create_task(self._timed(hedge_request))
+        pending: set[asyncio.Task[Response]] = {first, second}
+        errors: list[BaseException] = []
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    task_error = task.exception()
+                    if task_error is None:
+                        if task is second:
+                            self.hedging.record_win()
+                        await _discard([*pending, *(x for x in done if x is not task)])
+                        return task.result()
+                    errors.append(task_error)
+        except BaseException:
+            await _discard(pending)
+            raise
+
+        # Both requests failed.
+        raise errors[0]
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
@@ -1,4 +1,27 @@
-from meilisearch_python_sdk.index.async_index import AsyncIndex
-from meilisearch_python_sdk.index.index import Index
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from meilisearch_python_sdk.index.async_index import AsyncIndex
+    from meilisearch_python_sdk.index.index import Index
+
+_LAZY_IMPORTS = {
+    "AsyncIndex": "meilisearch_python_sdk.index.async_index",
+    "Index": "meilisearch_python_sdk.index.index",
+}
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+
+    return value
+
 
 __all__ = ["AsyncIndex", "Index"]
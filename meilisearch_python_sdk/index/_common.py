@@ -1,15 +1,29 @@
 from __future__ import annotations
 
-from collections.abc import Generator, MutableMapping, Sequence
+import gzip
+import io
+import json
+import os
+import re
+from collections import deque
+from collections.abc import Generator, Iterable, MutableMapping, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from csv import DictReader
 from datetime import datetime
+from functools import partial
 from itertools import chain, islice
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, Literal, TextIO
 from urllib.parse import urlencode
 
 from pydantic import TypeAdapter
 
-from meilisearch_python_sdk.errors import MeilisearchError
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None  # type: ignore
+
+from meilisearch_python_sdk.errors import InvalidDocumentError, MeilisearchError
 from meilisearch_python_sdk.json_handler import BuiltinHandler, OrjsonHandler
 from meilisearch_python_sdk.models.search import Hybrid, Personalize
 from meilisearch_python_sdk.models.settings import (
@@ -32,6 +46,9 @@ from meilisearch_python_sdk.plugins import (
 from meilisearch_python_sdk.types import JsonDict
 
 if TYPE_CHECKING:
+    from meilisearch_python_sdk.adaptive import AdaptiveBatching
+    from meilisearch_python_sdk.checkpoint import Checkpoint
+    from meilisearch_python_sdk.csv_schema import CsvSchema
     from meilisearch_python_sdk.types import Filter, JsonMapping, PluginEvent
 
 
@@ -93,6 +110,332 @@ def batch(
         yield batch_slice
 
 
+# The number of batches read from a file at a time when a file is streamed in batches.
+STREAM_CHUNK_BATCHES = 8
+
+# The number of files loaded or waiting to be sent per process when files are loaded in processes.
+FILES_PER_WORKER = 2
+
+# The number of payloads sent at once when streamed payloads are sent without a concurrency_limit,
+# so that a large source, such as a Parquet file, is not read into memory ahead of the requests.
+MAX_PENDING_PAYLOADS = 4 * (os.cpu_count() or 1)
+
+
+# The number of characters read from a JSON file at a time when it is streamed.
+JSON_READ_SIZE = 1 << 20
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# What can follow a number that was cut off at the end of the buffer, such as the "." of "1.5".
+_NUMBER_TAIL = re.compile(r"\.|[eE][-+]?")
+
+# The longest text a JSON decoding error can be reported before the end of the buffer when the
+# buffer ends in the middle of a token, such as "-Infinity" or the "uXXXX" of an escape.
+_MAX_CUT_OFF = len("-Infinity")
+
+_COMPRESSIONS: dict[str, Literal["gzip", "zstd"]] = {".gz": "gzip", ".zst": "zstd"}
+
+
+def compression(file_path: Path) -> Literal["gzip", "zstd"] | None:
+    """The compression of a file from its extension, for example gzip for `movies.ndjson.gz`."""
+    return _COMPRESSIONS.get(file_path.suffix)
+
+
+def document_suffix(file_path: Path) -> str:
+    """The extension of the documents in a file, ignoring a compression extension."""
+    if compression(file_path) is None:
+        return file_path.suffix
+
+    return Path(file_path.stem).suffix
+
+
+def open_document_file(file_path: Path) -> TextIO:
+    """Open a document file for reading as text, decompressing it if it is compressed."""
+    kind = compression(file_path)
+    if kind == "gzip":
+        return gzip.open(file_path, "rt")
+    if kind == "zstd":
+        if zstandard is None:  # pragma: no cover
+            raise ValueError("zstandard must be installed to read zstd compressed files")
+        reader = zstandard.ZstdDecompressor().stream_reader(open(file_path, "rb"))
+        return io.TextIOWrapper(reader)
+
+    return open(file_path)
+
+
+def iter_ndjson(
+    lines: Iterable[str], json_handler: BuiltinHandler | OrjsonHandler
+) -> Generator[Any, None, None]:
+    """Parse ndjson lines one document at a time, skipping blank lines."""
+    for line in lines:
+        if line.strip():
+            yield json_handler.loads(line)
+
+
+def iter_json_array(
+    f: TextIO,
+    read_size: int = JSON_READ_SIZE,
+    *,
+    json_handler: BuiltinHandler | OrjsonHandler | None = None,
+) -> Generator[Any, None, None]:
+    """Parse the items of a JSON array one at a time without reading the whole file.
+
+    A file of at most `read_size` characters is parsed in one go with the json handler, which is
+    faster than decoding it an item at a time. Larger files are parsed an item at a time, and at
+    most `read_size` characters plus the item being parsed are held in memory at once.
+
+    Raises:
+        InvalidDocumentError: If the file does not contain a valid JSON array, or if there is
+            anything other than whitespace after the array.
+    """
+    buffer = f.read(read_size)
+    chunk = f.read(read_size) if buffer else ""
+    if buffer and not chunk:
+        try:
+            documents = (json_handler or BuiltinHandler()).loads(buffer)
+        except json.JSONDecodeError:
+            # Invalid files are parsed again below, which tells trailing data after the array
+            # apart from invalid JSON.
+            pass
+        else:
+            if not isinstance(documents, list):
+                raise InvalidDocumentError("Meilisearch requires documents to be in a list")
+            yield from documents
+            return
+
+    decoder = json.JSONDecoder()
+    buffer += chunk
+    pos = 0
+    eof = not chunk
+    # What comes next: the opening bracket, the first item or the closing bracket, an item, a
+    # comma or the closing bracket, or nothing but whitespace after the closing bracket.
+    state = "open"
+
+    while True:
+        pos = _WHITESPACE.match(buffer, pos).end()  # type: ignore[union-attr]
+        if state == "end":
+            if pos < len(buffer):
+                raise InvalidDocumentError("Unexpected data after the JSON array of documents")
+            if eof:
+                return
+        elif pos < len(buffer):
+            char = buffer[pos]
+            if state == "open":
+                if char != "[":
+                    raise InvalidDocumentError("Meilisearch requires documents to be in a list")
+                pos += 1
+                state = "first"
+                continue
+            if char == "]" and state != "item":
+                pos += 1
+                state = "end"
+                continue
+            if state == "separator":
+                if char != ",":
+                    raise InvalidDocumentError(
+                        f"Expecting ',' delimiter in the JSON array of documents at {pos}"
+                    )
+                pos += 1
+                state = "item"
+                continue
+
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError as err:
+                # Only an error at the end of the buffer can be caused by an item being cut off,
+                # so any other error is raised without reading the rest of the file.
+                if eof or not (
+                    err.msg.startswith("Unterminated string")
+                    or len(buffer) - err.pos <= _MAX_CUT_OFF
+                ):
+                    raise InvalidDocumentError(
+                        f"Invalid JSON in the array of documents: {err}"
+                    ) from err
+                end = len(buffer)
+            else:
+                if not eof and type(item) in (int, float) and _NUMBER_TAIL.fullmatch(buffer, end):
+                    end = len(buffer)
+
+            # An item that ends at the end of the buffer may be cut off, for example a number, so
+            # it is parsed again once more of the file has been read.
+            if end < len(buffer) or eof:
+                yield item
+                pos = end
+                state = "separator"
+                continue
+        elif eof:
+            raise InvalidDocumentError(
+                "The JSON array of documents ends before its closing bracket"
+            )
+
+        chunk = f.read(read_size)
+        buffer = buffer[pos:] + chunk
+        pos = 0
+        eof = not chunk
+
+
+def validate_csv_delimiter(csv_delimiter: str | None) -> None:
+    if csv_delimiter and (len(csv_delimiter) != 1 or not csv_delimiter.isascii()):
+        raise ValueError("csv_delimiter must be a single ascii character")
+
+
+def read_csv(
+    f: TextIO,
+    csv_delimiter: str | None = None,
+    *,
+    chunk_size: int | None = None,
+    csv_schema: CsvSchema | None = None,
+) -> Generator[list[dict[Any, Any]], None, None]:
+    """Read csv documents `chunk_size` at a time, or all at once if `chunk_size` is None."""
+    if csv_schema is not None:
+        yield from csv_schema.read(f, delimiter=csv_delimiter, chunk_size=chunk_size)
+        return
+
+    rows = DictReader(f, delimiter=csv_delimiter) if csv_delimiter else DictReader(f)
+    while documents := list(islice(rows, chunk_size)):
+        yield documents
+
+
+def iter_document_chunks(
+    f: TextIO,
+    suffix: str,
+    csv_delimiter: str | None = None,
+    *,
+    chunk_size: int,
+    json_handler: BuiltinHandler | OrjsonHandler,
+    csv_schema: CsvSchema | None = None,
+) -> Generator[list[dict[Any, Any]], None, None]:
+    """Read the documents of an open json, ndjson, or csv file `chunk_size` at a time."""
+    if suffix == ".csv":
+        yield from read_csv(f, csv_delimiter, chunk_size=chunk_size, csv_schema=csv_schema)
+        return
+
+    items = (
+        iter_json_array(f, json_handler=json_handler)
+        if suffix == ".json"
+        else iter_ndjson(f, json_handler)
+    )
+    while documents := list(islice(items, chunk_size)):
+        yield documents
+
+
+def load_documents_from_file(
+    file_path: Path | str,
+    csv_delimiter: str | None = None,
+    *,
+    json_handler: BuiltinHandler | OrjsonHandler,
+    csv_schema: CsvSchema | None = None,
+) -> list[dict[Any, Any]]:
+    if isinstance(file_path, str):
+        file_path = Path(file_path)
+
+    validate_file_type(file_path)
+
+    suffix = document_suffix(file_path)
+    if suffix == ".csv":
+        validate_csv_delimiter(csv_delimiter)
+        with open_document_file(file_path) as f:
+            return next(read_csv(f, csv_delimiter, csv_schema=csv_schema), [])
+
+    if suffix == ".ndjson":
+        with open_document_file(file_path) as f:
+            return list(iter_ndjson(f, json_handler))
+
+    with open_document_file(file_path) as f:
+        data = f.read()
+        documents = json_handler.loads(data)
+
+        if not isinstance(documents, list):
+            raise InvalidDocumentError("Meilisearch requires documents to be in a list")
+
+        return documents
+
+
+def submit_file_loads(
+    pool: ProcessPoolExecutor,
+    paths: Sequence[Path],
+    csv_delimiter: str | None = None,
+    *,
+    json_handler: BuiltinHandler | OrjsonHandler,
+    csv_schema: CsvSchema | None = None,
+    max_workers: int,
+) -> Generator[Future[list[dict[Any, Any]]], None, None]:
+    """Submit files to a pool of processes, yielding the futures in the order of `paths`.
+
+    A file is only submitted to the pool once an earlier one has been taken, so at most
+    `FILES_PER_WORKER * max_workers` files are loaded and waiting at a time.
+    """
+    load = partial(
+        load_documents_from_file,
+        csv_delimiter=csv_delimiter,
+        json_handler=json_handler,
+        csv_schema=csv_schema,
+    )
+    remaining = iter(paths)
+    pending = deque(pool.submit(load, x) for x in islice(remaining, FILES_PER_WORKER * max_workers))
+    try:
+        while pending:
+            future = pending.popleft()
+            pending.extend(pool.submit(load, x) for x in islice(remaining, 1))
+            yield future
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def take_chunks(documents: list[Any], chunk_size: int) -> Generator[list[Any], None, None]:
+    """Remove and yield full chunks of `chunk_size` documents from the start of `documents`.
+
+    The yielded chunks are removed from `documents` together once the generator finishes.
+    """
+    offset = 0
+    try:
+        while len(documents) - offset >= chunk_size:
+            yield documents[offset : offset + chunk_size]
+            offset += chunk_size
+    finally:
+        del documents[:offset]
+
+
+def load_files_in_processes(
+    paths: Sequence[Path],
+    csv_delimiter: str | None = None,
+    *,
+    chunk_size: int | None = None,
+    json_handler: BuiltinHandler | OrjsonHandler,
+    csv_schema: CsvSchema | None = None,
+    max_workers: int,
+) -> Generator[list[dict[Any, Any]], None, None]:
+    """Load files in a pool of processes, yielding their documents in the order of `paths`.
+
+    If `chunk_size` is None the documents of each file are yielded on their own, otherwise the
+    documents of all the files are combined and yielded `chunk_size` at a time.
+    """
+    pool = ProcessPoolExecutor(max_workers)
+    try:
+        combined: list[dict[Any, Any]] = []
+        for future in submit_file_loads(
+            pool,
+            paths,
+            csv_delimiter,
+            json_handler=json_handler,
+            csv_schema=csv_schema,
+            max_workers=max_workers,
+        ):
+            documents = future.result()
+            if chunk_size is None:
+                yield documents
+                continue
+
+            combined += documents
+            yield from take_chunks(combined, chunk_size)
+
+        if combined:
+            yield combined
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
 def combine_documents(documents: list[list[Any]]) -> list[Any]:
     return list(chain.from_iterable(documents))
 
@@ -327,22 +670,82 @@ def prepare_raw_file_upload(
     if not upload_path.exists():
         raise MeilisearchError("No file found at the specified path")
 
-    if upload_path.suffix not in (".csv", ".ndjson"):
+    suffix = document_suffix(upload_path)
+    if suffix not in (".csv", ".ndjson"):
         raise ValueError("Only csv and ndjson files can be sent as binary files")
 
-    if csv_delimiter and upload_path.suffix != ".csv":
+    if csv_delimiter and suffix != ".csv":
         raise ValueError("A csv_delimiter can only be used with csv files")
 
     if csv_delimiter and len(csv_delimiter) != 1 or csv_delimiter and not csv_delimiter.isascii():
         raise ValueError("csv_delimiter must be a single ascii character")
 
-    content_type = "text/csv" if upload_path.suffix == ".csv" else "application/x-ndjson"
+    content_type = "text/csv" if suffix == ".csv" else "application/x-ndjson"
     return upload_path, content_type
 
 
+def read_raw_file(file_path: Path) -> bytes:
+    """The content of a file to send as is, decompressed unless it is gzip compressed."""
+    if compression(file_path) == "zstd":
+        with open_document_file(file_path) as f:
+            return f.read().encode("utf-8")
+
+    return file_path.read_bytes()
+
+
+PayloadContentType = Literal["application/json", "application/x-ndjson"]
+
+
+def batch_ndjson(chunks: Iterable[bytes], batch_size: int) -> Generator[bytes, None, None]:
+    """Join NDJSON chunks into payloads of at most `batch_size` documents.
+
+    A chunk can hold any number of documents, one per line, such as a single message from a queue
+    or a block of lines from a file. The documents are never decoded.
+    """
+    lines: list[bytes] = []
+    for chunk in chunks:
+        lines.extend(x for x in chunk.splitlines() if x and not x.isspace())
+        offset = 0
+        while len(lines) - offset >= batch_size:
+            yield b"\n".join(lines[offset : offset + batch_size]) + b"\n"
+            offset += batch_size
+        del lines[:offset]
+
+    if lines:
+        yield b"\n".join(lines) + b"\n"
+
+
+def prepare_payloads(
+    data: bytes | Iterable[bytes], content_type: PayloadContentType, batch_size: int | None
+) -> Iterable[bytes]:
+    if content_type not in ("application/json", "application/x-ndjson"):
+        raise ValueError("content_type must be application/json or application/x-ndjson")
+
+    if batch_size is not None and batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+
+    chunks = [data] if isinstance(data, (bytes, bytearray)) else data
+    # JSON payloads cannot be split or joined without decoding them, so they are sent as is.
+    if batch_size is None or content_type != "application/x-ndjson":
+        return chunks
+
+    return batch_ndjson(chunks, batch_size)
+
+
+def validate_adaptive_checkpoint(
+    adaptive: AdaptiveBatching | None, checkpoint: Checkpoint | None
+) -> None:
+    # Checkpoints identify batches by their documents, and adaptive batch sizes change from run
+    # to run, so a resumed ingest would not find any of its batches in the checkpoint.
+    if adaptive is not None and checkpoint is not None:
+        raise ValueError("adaptive and checkpoint cannot be used together")
+
+
 def validate_file_type(file_path: Path) -> None:
-    if file_path.suffix not in (".json", ".csv", ".ndjson"):
+    if document_suffix(file_path) not in (".json", ".csv", ".ndjson"):
         raise MeilisearchError("File must be a json, ndjson, or csv file")
+    if compression(file_path) == "zstd" and zstandard is None:
+        raise ValueError("zstandard must be installed to read zstd compressed files")
 
 
 def validate_ranking_score_threshold(ranking_score_threshold: float) -> None:
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import asyncio
-from csv import DictReader
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime
 from functools import cached_property, partial
 from pathlib import Path
@@ -16,16 +18,31 @@ from meilisearch_python_sdk._task import async_wait_for_task
 from meilisearch_python_sdk._utils import use_task_groups
 from meilisearch_python_sdk.errors import InvalidDocumentError
 from meilisearch_python_sdk.index._common import (
+    MAX_PENDING_PAYLOADS,
+    STREAM_CHUNK_BATCHES,
     BaseIndex,
+    PayloadContentType,
     batch,
     build_encoded_url,
+    compression,
+    document_suffix,
     embedder_json_to_embedders_model,
     embedder_json_to_settings_model,
     filter_plugins,
+    iter_document_chunks,
+    iter_ndjson,
+    open_document_file,
     plugin_has_method,
+    prepare_payloads,
     prepare_raw_file_upload,
     process_search_parameters,
     raise_on_no_documents,
+    read_csv,
+    read_raw_file,
+    submit_file_loads,
+    take_chunks,
+    validate_adaptive_checkpoint,
+    validate_csv_delimiter,
     validate_file_type,
     validate_ranking_score_threshold,
 )
@@ -64,8 +81,15 @@ from meilisearch_python_sdk.types import JsonDict
 
 if TYPE_CHECKING:
     import sys
-    from collections.abc import Sequence
+    from collections.abc import Awaitable, Callable, Iterable, Sequence
 
+    from httpx2 import Response
+
+    from meilisearch_python_sdk.adaptive import AdaptiveBatching
+    from meilisearch_python_sdk.arrow import ArrowData
+    from meilisearch_python_sdk.backpressure import Backpressure
+    from meilisearch_python_sdk.checkpoint import Checkpoint
+    from meilisearch_python_sdk.csv_schema import CsvSchema
     from meilisearch_python_sdk.types import Filter, JsonMapping
 
     if sys.version_info >= (3, 11):
@@ -1467,6 +1491,9 @@ class AsyncIndex(BaseIndex):
         custom_metadata: str | None = None,
         compress: bool = False,
         concurrency_limit: int | None = None,
+        backpressure: Backpressure | None = None,
+        adaptive: AdaptiveBatching | None = None,
+        checkpoint: Checkpoint | None = None,
     ) -> list[TaskInfo]:
         """Adds documents in batches to reduce RAM usage with indexing.
 
@@ -1481,6 +1508,15 @@ class AsyncIndex(BaseIndex):
             concurrency_limit: If set this will limit the number of batches that will be sent
                 concurrently. This can be helpful if you find you are overloading the Meilisearch
                 server with requests. Defaults to None.
+            backpressure: If set sending pauses while the index has more enqueued tasks than the
+                high-water mark, and resumes when the queue has fallen to the low-water mark.
+                Defaults to None.
+            adaptive: If set the batch size and concurrency are chosen from the measured indexing
+                throughput instead of using `batch_size` and `concurrency_limit`. Defaults to None.
+            checkpoint: If set the batches Meilisearch accepted are recorded in the checkpoint file
+                and batches already recorded there are skipped, so an interrupted ingest can be
+                resumed. It cannot be used with `adaptive`, because the batches of a resumed run
+                would have different sizes. Defaults to None.
 
         Returns:
             List of update ids to track the action.
@@ -1488,6 +1524,7 @@ class AsyncIndex(BaseIndex):
         Raises:
             MeilisearchCommunicationError: If there was an error communicating with the server.
             MeilisearchApiError: If the Meilisearch API returned an error.
+            ValueError: If both `adaptive` and `checkpoint` are set.
 
         Examples:
             >>> from meilisearch_python_sdk import AsyncClient
@@ -1499,14 +1536,47 @@ class AsyncIndex(BaseIndex):
             >>>     index = client.index("movies")
             >>>     await index.add_documents_in_batches(documents)
         """
-        if concurrency_limit:
-            semaphore = asyncio.Semaphore(concurrency_limit)
+        validate_adaptive_checkpoint(adaptive, checkpoint)
+        gate = None
+        if backpressure is not None:
+            # Imported here so the backpressure module is only loaded when it is used.
+            from meilisearch_python_sdk.backpressure import AsyncTaskQueueGate
+
+            gate = AsyncTaskQueueGate(
+                self.http_client, self.uid, backpressure, json_handler=self._json_handler
+            )
+        send: Callable[[Sequence[JsonMapping]], Awaitable[TaskInfo]] = partial(
+            self.add_documents,
+            primary_key=primary_key,
+            custom_metadata=custom_metadata,
+            compress=compress,
+        )
+        if checkpoint is not None:
+            send = checkpoint.async_wrap(
+                send, self.http_client, self.uid, "add", json_handler=self._json_handler
+            )
+
+        if adaptive is not None:
+            # Imported here so the adaptive module is only loaded when it is used.
+            from meilisearch_python_sdk.adaptive import async_send_adaptive
+
+            return await async_send_adaptive(
+                self.http_client,
+                documents,
+                adaptive,
+                send,
+                json_handler=self._json_handler,
+                gate=gate,
+            )
+
+        if concurrency_limit or gate is not None:
+            semaphore = asyncio.Semaphore(concurrency_limit) if concurrency_limit else None
 
             async def add_batch_with_limit(batch_data: Sequence[JsonMapping]) -> TaskInfo:
-                async with semaphore:
-                    return await self.add_documents(
-                        batch_data, primary_key, custom_metadata=custom_metadata, compress=compress
-                    )
+                async with semaphore or nullcontext():
+                    if gate is not None:
+                        await gate.wait()
+                    return await send(batch_data)
 
             if not use_task_groups():
                 batches = [add_batch_with_limit(data) for data in batch(documents, batch_size)]
@@ -1520,23 +1590,11 @@ class AsyncIndex(BaseIndex):
             return [x.result() for x in tasks]
 
         if not use_task_groups():
-            batches = [
-                self.add_documents(
-                    x, primary_key, custom_metadata=custom_metadata, compress=compress
-                )
-                for x in batch(documents, batch_size)
-            ]
+            batches = [send(x) for x in batch(documents, batch_size)]
             return await asyncio.gather(*batches)
 
         async with asyncio.TaskGroup() as tg:  # type: ignore[attr-defined]
-            tasks = [
-                tg.create_task(
-                    self.add_documents(
-                        x, primary_key, custom_metadata=custom_metadata, compress=compress
-                    )
-                )
-                for x in batch(documents, batch_size)
-            ]
+            tasks = [tg.create_task(send(x)) for x in batch(documents, batch_size)]
 
         return [x.result() for x in tasks]
 
@@ -1562,6 +1620,7 @@ class AsyncIndex(BaseIndex):
             document_type: The type of document being added. Accepted types are json, csv, and
                 ndjson. For csv files the first row of the document should be a header row
                 containing the field names, and ever for should have a title.
+                Files of this type compressed with gzip (.gz) or zstd (.zst) are also loaded.
             csv_delimiter: A single ASCII character to specify the delimiter for csv files. This
                 can only be used if the file is a csv file. Defaults to comma.
             combine_documents: If set to True this will combine the documents from all the files
@@ -1593,7 +1652,7 @@ class AsyncIndex(BaseIndex):
         if combine_documents:
             all_documents = []
             for path in directory.iterdir():
-                if path.suffix == f".{document_type}":
+                if document_suffix(path) == f".{document_type}":
                     documents = await _async_load_documents_from_file(
                         path, csv_delimiter, json_handler=self._json_handler
                     )
@@ -1625,7 +1684,7 @@ class AsyncIndex(BaseIndex):
             if not use_task_groups():
                 add_documents = []
                 for path in directory.iterdir():
-                    if path.suffix == f".{document_type}":
+                    if document_suffix(path) == f".{document_type}":
                         documents = await _async_load_documents_from_file(
                             path, csv_delimiter, json_handler=self._json_handler
                         )
@@ -1649,7 +1708,7 @@ class AsyncIndex(BaseIndex):
                 tasks = []
                 all_results = []
                 for i, path in enumerate(directory.iterdir()):
-                    if path.suffix == f".{document_type}":
+                    if document_suffix(path) == f".{document_type}":
                         documents = await _async_load_documents_from_file(
                             path, csv_delimiter, json_handler=self._json_handler
                         )
@@ -1663,7 +1722,7 @@ class AsyncIndex(BaseIndex):
         if not use_task_groups():
             add_documents = []
             for path in directory.iterdir():
-                if path.suffix == f".{document_type}":
+                if document_suffix(path) == f".{document_type}":
                     documents = await _async_load_documents_from_file(
                         path, csv_delimiter, json_handler=self._json_handler
                     )
@@ -1694,7 +1753,7 @@ class AsyncIndex(BaseIndex):
             tasks = []
             all_results = []
             for i, path in enumerate(directory.iterdir()):
-                if path.suffix == f".{document_type}":
+                if document_suffix(path) == f".{document_type}":
                     documents = await _async_load_documents_from_file(
                         path, csv_delimiter, json_handler=self._json_handler
                     )
@@ -1733,9 +1792,12 @@ class AsyncIndex(BaseIndex):
         custom_metadata: str | None = None,
         document_type: str = "json",
         csv_delimiter: str | None = None,
+        csv_schema: CsvSchema | None = None,
         combine_documents: bool = True,
         compress: bool = False,
         concurrency_limit: int | None = None,
+        checkpoint: Checkpoint | None = None,
+        max_workers: int | None = None,
     ) -> list[TaskInfo]:
         """Load all json files from a directory and add the documents to the index in batches.
 
@@ -1749,14 +1811,24 @@ class AsyncIndex(BaseIndex):
             document_type: The type of document being added. Accepted types are json, csv, and
                 ndjson. For csv files the first row of the document should be a header row containing
                 the field names, and ever for should have a title.
+                Files of this type compressed with gzip (.gz) or zstd (.zst) are also loaded.
             csv_delimiter: A single ASCII character to specify the delimiter for csv files. This
                 can only be used if the file is a csv file. Defaults to comma.
+            csv_schema: If set the values of csv files are converted to the types of their columns
+                instead of all being strings. Defaults to None.
             combine_documents: If set to True this will combine the documents from all the files
                 before indexing them. Defaults to True.
             compress: If set to True the data will be sent in gzip format. Defaults to False.
             concurrency_limit: If set this will limit the number of batches that will be sent
                 concurrently. This can be helpful if you find you are overloading the Meilisearch
                 server with requests. Defaults to None.
+            checkpoint: If set the batches Meilisearch accepted are recorded in the checkpoint file
+                and batches already recorded there are skipped, so an interrupted ingest can be
+                resumed. Defaults to None.
+            max_workers: If set the files are loaded in a pool of this many processes while the
+                documents already loaded are being sent, instead of being loaded one at a time.
+                Only a few files per process are held in memory at once, and if combine_documents
+                is True the combined documents are sent as they are loaded. Defaults to None.
 
         Returns:
             List of update ids to track the action.
@@ -1777,12 +1849,37 @@ class AsyncIndex(BaseIndex):
         """
         directory = Path(directory_path) if isinstance(directory_path, str) else directory_path
 
+        if max_workers:
+            paths = [x for x in directory.iterdir() if document_suffix(x) == f".{document_type}"]
+            raise_on_no_documents(paths, document_type, directory_path)
+
+            return await _async_send_files_in_processes(
+                paths,
+                partial(
+                    self.add_documents_in_batches,
+                    batch_size=batch_size,
+                    primary_key=primary_key,
+                    custom_metadata=custom_metadata,
+                    compress=compress,
+                    concurrency_limit=concurrency_limit,
+                    checkpoint=checkpoint,
+                ),
+                csv_delimiter,
+                chunk_size=batch_size * STREAM_CHUNK_BATCHES if combine_documents else None,
+                json_handler=self._json_handler,
+                csv_schema=csv_schema,
+                max_workers=max_workers,
+            )
+
         if combine_documents:
             all_documents = []
             for path in directory.iterdir():
-                if path.suffix == f".{document_type}":
+                if document_suffix(path) == f".{document_type}":
                     documents = await _async_load_documents_from_file(
-                        path, csv_delimiter=csv_delimiter, json_handler=self._json_handler
+                        path,
+                        csv_delimiter=csv_delimiter,
+                        json_handler=self._json_handler,
+                        csv_schema=csv_schema,
                     )
                     all_documents.append(documents)
 
@@ -1798,15 +1895,19 @@ class AsyncIndex(BaseIndex):
                 custom_metadata=custom_metadata,
                 compress=compress,
                 concurrency_limit=concurrency_limit,
+                checkpoint=checkpoint,
             )
 
         responses: list[TaskInfo] = []
 
         add_documents = []
         for path in directory.iterdir():
-            if path.suffix == f".{document_type}":
+            if document_suffix(path) == f".{document_type}":
                 documents = await _async_load_documents_from_file(
-                    path, csv_delimiter, json_handler=self._json_handler
+                    path,
+                    csv_delimiter,
+                    json_handler=self._json_handler,
+                    csv_schema=csv_schema,
                 )
                 add_documents.append(
                     self.add_documents_in_batches(
@@ -1816,6 +1917,7 @@ class AsyncIndex(BaseIndex):
                         custom_metadata=custom_metadata,
                         compress=compress,
                         concurrency_limit=concurrency_limit,
+                        checkpoint=checkpoint,
                     )
                 )
 
@@ -1843,7 +1945,8 @@ class AsyncIndex(BaseIndex):
         """Add documents to the index from a json file.
 
         Args:
-            file_path: Path to the json file.
+            file_path: Path to the json file. The file can be compressed with gzip (.gz) or zstd
+                (.zst).
             primary_key: The primary key of the documents. This will be ignored if already set.
                 Defaults to None.
             custom_metadata: An arbitrary string accessible via the task. Defaults to None.
@@ -1882,13 +1985,16 @@ class AsyncIndex(BaseIndex):
         primary_key: str | None = None,
         custom_metadata: str | None = None,
         csv_delimiter: str | None = None,
+        csv_schema: CsvSchema | None = None,
         compress: bool = False,
         concurrency_limit: int | None = None,
+        checkpoint: Checkpoint | None = None,
     ) -> list[TaskInfo]:
         """Adds documents form a json file in batches to reduce RAM usage with indexing.
 
         Args:
-            file_path: Path to the json file.
+            file_path: Path to the json file. The file can be compressed with gzip (.gz) or zstd
+                (.zst).
             batch_size: The number of documents that should be included in each batch.
                 Defaults to 1000.
             primary_key: The primary key of the documents. This will be ignored if already set.
@@ -1896,10 +2002,15 @@ class AsyncIndex(BaseIndex):
             custom_metadata: An arbitrary string accessible via the task. Defaults to None.
             csv_delimiter: A single ASCII character to specify the delimiter for csv files. This
                 can only be used if the file is a csv file. Defaults to comma.
+            csv_schema: If set the values of csv files are converted to the types of their columns
+                instead of all being strings. Defaults to None.
             compress: If set to True the data will be sent in gzip format. Defaults to False.
             concurrency_limit: If set this will limit the number of batches that will be sent
                 concurrently. This can be helpful if you find you are overloading the Meilisearch
                 server with requests. Defaults to None.
+            checkpoint: If set the batches Meilisearch accepted are recorded in the checkpoint file
+                and batches already recorded there are skipped, so an interrupted ingest can be
+                resumed. Defaults to None.
 
         Returns:
             List of update ids to track the action.
@@ -1918,17 +2029,21 @@ class AsyncIndex(BaseIndex):
             >>>     index = client.index("movies")
             >>>     await index.add_documents_from_file_in_batches(file_path)
         """
-        documents = await _async_load_documents_from_file(
-            file_path, csv_delimiter, json_handler=self._json_handler
-        )
-
-        return await self.add_documents_in_batches(
-            documents,
-            batch_size=batch_size,
-            primary_key=primary_key,
-            custom_metadata=custom_metadata,
-            compress=compress,
-            concurrency_limit=concurrency_limit,
+        return await _async_send_document_chunks(
+            file_path,
+            partial(
+                self.add_documents_in_batches,
+                batch_size=batch_size,
+                primary_key=primary_key,
+                custom_metadata=custom_metadata,
+                compress=compress,
+                concurrency_limit=concurrency_limit,
+                checkpoint=checkpoint,
+            ),
+            csv_delimiter,
+            chunk_size=batch_size * STREAM_CHUNK_BATCHES,
+            json_handler=self._json_handler,
+            csv_schema=csv_schema,
         )
 
     async def add_documents_from_raw_file(
@@ -1947,7 +2062,8 @@ class AsyncIndex(BaseIndex):
 
         Args:
             file_path: The path to the file to send to Meilisearch. Only csv and ndjson files are
-                allowed.
+                allowed. They can be compressed with gzip (.gz) or zstd (.zst), and gzip files are
+                sent as is without being decompressed.
             primary_key: The primary key of the documents. This will be ignored if already set.
                 Defaults to None.
             custom_metadata: An arbitrary string accessible via the task. Defaults to None.
@@ -1988,15 +2104,268 @@ class AsyncIndex(BaseIndex):
         else:
             url = self._documents_url
 
-        async with aiofiles.open(upload_path) as f:
-            data = await f.read()
+        loop = asyncio.get_running_loop()
+        data = await loop.run_in_executor(None, partial(read_raw_file, upload_path))
 
         response = await self._http_requests.post(
-            url, body=data, content_type=content_type, compress=compress
+            url,
+            body=data,
+            content_type=content_type,
+            compress=compress,
+            precompressed=compression(upload_path) == "gzip",
         )
 
         return TaskInfo(**self._http_requests.parse_json(response))
 
+    async def add_documents_from_arrow(
+        self,
+        data: ArrowData | Path | str,
+        *,
+        batch_size: int = 1000,
+        primary_key: str | None = None,
+        custom_metadata: str | None = None,
+        compress: bool = False,
+        concurrency_limit: int | None = None,
+    ) -> list[TaskInfo]:
+        """Add documents from Arrow data or a Parquet file in batches.
+
+        Each record batch is serialized to NDJSON one column at a time with Arrow compute
+        functions and sent as is, without building a Python dict for each document. Parquet files
+        are read one batch at a time, and the next batch is serialized while the previous ones are
+        being sent. This requires pyarrow, which can be installed with the `pyarrow` extra.
+
+        Args:
+            data: A pyarrow Table, RecordBatch, RecordBatchReader, an iterable of record batches, or
+                the path to a Parquet file.
+            batch_size: The maximum number of documents that should be included in each batch.
+                Defaults to 1000.
+            primary_key: The primary key of the documents. This will be ignored if already set.
+                Defaults to None.
+            custom_metadata: An arbitrary string accessible via the task. Defaults to None.
+            compress: If set to True the data will be sent in gzip format. Defaults to False.
+            concurrency_limit: If set this will limit the number of batches that will be sent
+                concurrently. This can be helpful if you find you are overloading the Meilisearch
+                server with requests. If None at most 4 batches per CPU are sent at once, so the
+                source is not read ahead of the requests. Defaults to None.
+
+        Returns:
+            List of update ids to track the action.
+
+        Raises:
+            ValueError: If pyarrow is not installed.
+            InvalidDocumentError: If a column has binary values.
+            MeilisearchCommunicationError: If there was an error communicating with the server.
+            MeilisearchApiError: If the Meilisearch API returned an error.
+
+        Examples:
+            >>> from meilisearch_python_sdk import AsyncClient
+            >>> async with AsyncClient("http://localhost.com", "masterKey") as client:
+            >>>     index = client.index("movies")
+            >>>     await index.add_documents_from_arrow("movies.parquet")
+        """
+        # Imported here so pyarrow is only loaded when it is used.
+        from meilisearch_python_sdk.arrow import iter_ndjson_payloads
+
+        return await self._send_payloads(
+            self._http_requests.post,
+            iter_ndjson_payloads(data, batch_size=batch_size, json_handler=self._json_handler),
+            content_type="application/x-ndjson",
+            primary_key=primary_key,
+            custom_metadata=custom_metadata,
+            compress=compress,
+            concurrency_limit=concurrency_limit,
+            serialize_in_executor=True,
+        )
+
+    async def add_dataframe(
+        self,
+        df: Any,  # noqa: ANN401
+        *,
+        batch_size: int = 1000,
+        primary_key: str | None = None,
+        custom_metadata: str | None = None,
+        compress: bool = False,
+        concurrency_limit: int | None = None,
+    ) -> list[TaskInfo]:
+        """Add the rows of a pandas or polars DataFrame as documents in batches.
+
+        The DataFrame is converted to Arrow a chunk of rows at a time and each chunk is serialized
+        to NDJSON one column at a time, without building a dict for each row as
+        `to_dict("records")` does. NaN, NaT, and other missing values are sent as null, datetimes
+        are sent as ISO 8601 strings, and the index of a pandas DataFrame is not sent. This
+        requires pyarrow, which can be installed with the `pyarrow` extra.
+
+        Args:
+            df: A pandas or polars DataFrame.
+            batch_size: The number of rows that should be included in each batch.
+                Defaults to 1000.
+            primary_key: The primary key of the documents. This will be ignored if already set.
+                Defaults to None.
+            custom_metadata: An arbitrary string accessible via the task. Defaults to None.
+            compress: If set to True the data will be sent in gzip format. Defaults to False.
+            concurrency_limit: If set this will limit the number of batches that will be sent
+                concurrently. This can be helpful if you find you are overloading the Meilisearch
+                server with requests. If None at most 4 batches per CPU are sent at once, so the
+                source is not read ahead of the requests. Defaults to None.
+
+        Returns:
+            List of update ids to track the action.
+
+        Raises:
+            ValueError: If pyarrow is not installed.
+            InvalidDocumentError: If a column has binary values.
+            MeilisearchCommunicationError: If there was an error communicating with the server.
+            MeilisearchApiError: If the Meilisearch API returned an error.
+
+        Examples:
+            >>> import pandas as pd
+            >>> from meilisearch_python_sdk import AsyncClient
+            >>> df = pd.DataFrame({"id": [1, 2], "title": ["Movie 1", "Movie 2"]})
+            >>> async with AsyncClient("http://localhost.com", "masterKey") as client:
+            >>>     index = client.index("movies")
+            >>>     await index.add_dataframe(df)
+        """
+        # Imported here so pyarrow is only loaded when it is used.
+        from meilisearch_python_sdk.arrow import iter_dataframe_batches, iter_ndjson_payloads
+
+        return await self._send_payloads(
+            self._http_requests.post,
+            iter_ndjson_payloads(
+                iter_dataframe_batches(df, batch_size=batch_size),
+                batch_size=batch_size,
+                json_handler=self._json_handler,
+            ),
+            content_type="application/x-ndjson",
+            primary_key=primary_key,
+            custom_metadata=custom_metadata,
+            compress=compress,
+            concurrency_limit=concurrency_limit,
+            serialize_in_executor=True,
+        )
+
+    async def add_documents_from_bytes(
+        self,
+        data: bytes | Iterable[bytes],
+        *,
+        content_type: PayloadContentType = "application/x-ndjson",
+        batch_size: int | None = 1000,
+        primary_key: str | None = None,
+        custom_metadata: str | None = None,
+        compress: bool = False,
+        concurrency_limit: int | None = None,
+    ) -> list[TaskInfo]:
+        """Add documents that are already JSON or NDJSON encoded.
+
+        The payloads are sent as is, so documents that arrive encoded, for example from a message
+        queue, do not have to be decoded only to be encoded again. NDJSON payloads are joined, or
+        split on line breaks, into batches of `batch_size` documents, and JSON payloads are each
+        sent in their own request.
+
+        Args:
+            data: One payload, or an iterable of payloads. Each payload is a JSON array or object,
+                or NDJSON with one document per line, depending on `content_type`.
+            content_type: The content type of the payloads, either application/json or
+                application/x-ndjson. Defaults to application/x-ndjson.
+            batch_size: The number of documents in each batch of NDJSON documents, so a payload
+                can be a single document. If set to None each NDJSON payload is sent as is. JSON
+                payloads are always sent as is. Defaults to 1000.
+            primary_key: The primary key of the documents. This will be ignored if already set.
+                Defaults to None.
+            custom_metadata: An arbitrary string accessible via the task. Defaults to None.
+            compress: If set to True the data will be sent in gzip format. Defaults to False.
+            concurrency_limit: If set this will limit the number of batches that will be sent
+                concurrently. This can be helpful if you find you are overloading the Meilisearch
+                server with requests. If None at most 4 batches per CPU are sent at once, so the
+                source is not read ahead of the requests. Defaults to None.
+
+        Returns:
+            List of update ids to track the action.
+
+        Raises:
+            ValueError: If the content_type is not supported or the batch_size is less than 1.
+            MeilisearchCommunicationError: If there was an error communicating with the server.
+            MeilisearchApiError: If the Meilisearch API returned an error.
+
+        Examples:
+            >>> from meilisearch_python_sdk import AsyncClient
+            >>> messages = [b'{"id": 1, "title": "Movie 1"}', b'{"id": 2, "title": "Movie 2"}']
+            >>> async with AsyncClient("http://localhost.com", "masterKey") as client:
+            >>>     index = client.index("movies")
+            >>>     await index.add_documents_from_bytes(messages)
+        """
+        return await self._send_payloads(
+            self._http_requests.post,
+            prepare_payloads(data, content_type, batch_size),
+            content_type=content_type,
+            primary_key=primary_key,
+            custom_metadata=custom_metadata,
+            compress=compress,
+            concurrency_limit=concurrency_limit,
+        )
+
+    async def _send_payloads(
+        self,
+        send: Callable[..., Awaitable[Response]],
+        payloads: Iterable[bytes],
+        *,
+        content_type: str,
+        primary_key: str | None,
+        custom_metadata: str | None,
+        compress: bool,
+        concurrency_limit: int | None,
+        skip_creation: bool = False,
+        serialize_in_executor: bool = False,
+    ) -> list[TaskInfo]:
+        parameters = {}
+        if primary_key:
+            parameters["primaryKey"] = primary_key
+        if custom_metadata:
+            parameters["customMetadata"] = custom_metadata
+        if skip_creation:
+            parameters["skipCreation"] = "true"
+
+        if parameters:
+            url = build_encoded_url(self._documents_url, parameters)
+        else:
+            url = self._documents_url
+
+        # Arrow payloads are serialized in the executor so that serializing the next one overlaps
+        # with sending the previous ones. Other payloads are already encoded and are iterated on
+        # the event loop, since the caller's iterator may not be safe to use from other threads.
+        chunks = iter(payloads)
+        max_pending = concurrency_limit or MAX_PENDING_PAYLOADS
+        loop = asyncio.get_running_loop()
+        pending: deque[asyncio.Task[Response]] = deque()
+        responses = []
+        try:
+            while (
+                payload := (
+                    await loop.run_in_executor(None, next, chunks, None)
+                    if serialize_in_executor
+                    else next(chunks, None)
+                )
+            ) is not None:
+                if len(pending) >= max_pending:
+                    responses.append(await pending.popleft())
+                pending.append(
+                    asyncio.create_task(
+                        send(
+                            url,
+                            body=payload,
+                            content_type=content_type,
+                            compress=compress,
+                        )
+                    )
+                )
+            while pending:
+                responses.append(await pending.popleft())
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        return [TaskInfo(**self._http_requests.parse_json(x)) for x in responses]
+
     async def edit_documents(
         self,
         function: str,
@@ -2210,6 +2579,9 @@ class AsyncIndex(BaseIndex):
         compress: bool = False,
         skip_creation: bool = False,
         concurrency_limit: int | None = None,
+        backpressure: Backpressure | None = None,
+        adaptive: AdaptiveBatching | None = None,
+        checkpoint: Checkpoint | None = None,
     ) -> list[TaskInfo]:
         """Update documents in batches to reduce RAM usage with indexing.
 
@@ -2228,6 +2600,15 @@ class AsyncIndex(BaseIndex):
             concurrency_limit: If set this will limit the number of batches that will be sent
                 concurrently. This can be helpful if you find you are overloading the Meilisearch
                 server with requests. Defaults to None.
+            backpressure: If set sending pauses while the index has more enqueued tasks than the
+                high-water mark, and resumes when the queue has fallen to the low-water mark.
+                Defaults to None.
+            adaptive: If set the batch size and concurrency are chosen from the measured indexing
+                throughput instead of using `batch_size` and `concurrency_limit`. Defaults to None.
+            checkpoint: If set the batches Meilisearch accepted are recorded in the checkpoint file
+                and batches already recorded there are skipped, so an interrupted ingest can be
+                resumed. It cannot be used with `adaptive`, because the batches of a resumed run
+                would have different sizes. Defaults to None.
 
         Returns:
             List of update ids to track the action.
@@ -2235,6 +2616,7 @@ class AsyncIndex(BaseIndex):
         Raises:
             MeilisearchCommunicationError: If there was an error communicating with the server.
             MeilisearchApiError: If the Meilisearch API returned an error.
+            ValueError: If both `adaptive` and `checkpoint` are set.
 
         Examples:
             >>> from meilisearch_python_sdk import AsyncClient
@@ -2246,18 +2628,48 @@ class AsyncIndex(BaseIndex):
             >>>     index = client.index("movies")
             >>>     await index.update_documents_in_batches(documents)
         """
-        if concurrency_limit:
-            semaphore = asyncio.Semaphore(concurrency_limit)
+        validate_adaptive_checkpoint(adaptive, checkpoint)
+        gate = None
+        if backpressure is not None:
+            # Imported here so the backpressure module is only loaded when it is used.
+            from meilisearch_python_sdk.backpressure import AsyncTaskQueueGate
+
+            gate = AsyncTaskQueueGate(
+                self.http_client, self.uid, backpressure, json_handler=self._json_handler
+            )
+        send: Callable[[Sequence[JsonMapping]], Awaitable[TaskInfo]] = partial(
+            self.update_documents,
+            primary_key=primary_key,
+            custom_metadata=custom_metadata,
+            skip_creation=skip_creation,
+            compress=compress,
+        )
+        if checkpoint is not None:
+            send = checkpoint.async_wrap(
+                send, self.http_client, self.uid, "update", json_handler=self._json_handler
+            )
+
+        if adaptive is not None:
+            # Imported here so the adaptive module is only loaded when it is used.
+            from meilisearch_python_sdk.adaptive import async_send_adaptive
+
+            return await async_send_adaptive(
+                self.http_client,
+                documents,
+                adaptive,
+                send,
+                json_handler=self._json_handler,
+                gate=gate,
+            )
+
+        if concurrency_limit or gate is not None:
+            semaphore = asyncio.Semaphore(concurrency_limit) if concurrency_limit else None
 
             async def update_batch_with_limit(batch_data: Sequence[JsonMapping]) -> TaskInfo:
-                async with semaphore:
-                    return await self.update_documents(
-                        batch_data,
-                        primary_key=primary_key,
-                        custom_metadata=custom_metadata,
-                        skip_creation=skip_creation,
-                        compress=compress,
-                    )
+                async with semaphore or nullcontext():
+                    if gate is not None:
+                        await gate.wait()
+                    return await send(batch_data)
 
             if not use_task_groups():
                 batches = [update_batch_with_limit(x) for x in batch(documents, batch_size)]
@@ -2270,31 +2682,12 @@ class AsyncIndex(BaseIndex):
             return [x.result() for x in tasks]
 
         if not use_task_groups():
-            batches = [
-                self.update_documents(
-                    x,
-                    primary_key,
-                    custom_metadata=custom_metadata,
-                    skip_creation=skip_creation,
-                    compress=compress,
-                )
-                for x in batch(documents, batch_size)
-            ]
+            batches = [send(x) for x in batch(documents, batch_size)]
             return await asyncio.gather(*batches)
 
         async with asyncio.TaskGroup() as tg:  # type: ignore[attr-defined]
-            tasks = [
-                tg.create_task(
-                    self.update_documents(
-                        x,
-                        primary_key,
-                        custom_metadata=custom_metadata,
-                        skip_creation=skip_creation,
-                        compress=compress,
-                    )
-                )
-                for x in batch(documents, batch_size)
-            ]
+            tasks = [tg.create_task(send(x)) for x in batch(documents, batch_size)]
+
         return [x.result() for x in tasks]
 
     async def update_documents_from_directory(
@@ -2319,6 +2712,7 @@ class AsyncIndex(BaseIndex):
             document_type: The type of document being added. Accepted types are json, csv, and
                 ndjson. For csv files the first row of the document should be a header row containing
                 the field names, and ever for should have a title.
+                Files of this type compressed with gzip (.gz) or zstd (.zst) are also loaded.
             csv_delimiter: A single ASCII character to specify the delimiter for csv files. This
                 can only be used if the file is a csv file. Defaults to comma.
             combine_documents: If set to True this will combine the documents from all the files
@@ -2349,7 +2743,7 @@ class AsyncIndex(BaseIndex):
         if combine_documents:
             all_documents = []
             for path in directory.iterdir():
-                if path.suffix == f".{document_type}":
+                if document_suffix(path) == f".{document_type}":
                     documents = await _async_load_documents_from_file(
                         path, csv_delimiter, json_handler=self._json_handler
                     )
@@ -2372,7 +2766,7 @@ class AsyncIndex(BaseIndex):
         if not use_task_groups():
             update_documents = []
             for path in directory.iterdir():
-                if path.suffix == f".{document_type}":
+                if document_suffix(path) == f".{document_type}":
                     documents = await _async_load_documents_from_file(
                         path, csv_delimiter, json_handler=self._json_handler
                     )
@@ -2403,7 +2797,7 @@ class AsyncIndex(BaseIndex):
             tasks = []
             results = []
             for i, path in enumerate(directory.iterdir()):
-                if path.suffix == f".{document_type}":
+                if document_suffix(path) == f".{document_type}":
                     documents = await _async_load_documents_from_file(
                         path, csv_delimiter, json_handler=self._json_handler
                     )
@@ -2443,10 +2837,13 @@ class AsyncIndex(BaseIndex):
         custom_metadata: str | None = None,
         document_type: str = "json",
         csv_delimiter: str | None = None,
+        csv_schema: CsvSchema | None = None,
         combine_documents: bool = True,
         compress: bool = False,
         skip_creation: bool = False,
         concurrency_limit: int | None = None,
+        checkpoint: Checkpoint | None = None,
+        max_workers: int | None = None,
     ) -> list[TaskInfo]:
         """Load all json files from a directory and update the documents.
 
@@ -2460,8 +2857,11 @@ class AsyncIndex(BaseIndex):
             document_type: The type of document being added. Accepted types are json, csv, and
                 ndjson. For csv files the first row of the document should be a header row containing
                 the field names, and ever for should have a title.
+                Files of this type compressed with gzip (.gz) or zstd (.zst) are also loaded.
             csv_delimiter: A single ASCII character to specify the delimiter for csv files. This
                 can only be used if the file is a csv file. Defaults to comma.
+            csv_schema: If set the values of csv files are converted to the types of their columns
+                instead of all being strings. Defaults to None.
             combine_documents: If set to True this will combine the documents from all the files
                 before indexing them. Defaults to True.
             compress: If set to True the data will be sent in gzip format. Defaults to False.
@@ -2470,6 +2870,13 @@ class AsyncIndex(BaseIndex):
             concurrency_limit: If set this will limit the number of batches that will be sent
                 concurrently. This can be helpful if you find you are overloading the Meilisearch
                 server with requests. Defaults to None.
+            checkpoint: If set the batches Meilisearch accepted are recorded in the checkpoint file
+                and batches already recorded there are skipped, so an interrupted ingest can be
+                resumed. Defaults to None.
+            max_workers: If set the files are loaded in a pool of this many processes while the
+                documents already loaded are being sent, instead of being loaded one at a time.
+                Only a few files per process are held in memory at once, and if combine_documents
+                is True the combined documents are sent as they are loaded. Defaults to None.
 
         Returns:
             List of update ids to track the action.
@@ -2490,12 +2897,38 @@ class AsyncIndex(BaseIndex):
         """
         directory = Path(directory_path) if isinstance(directory_path, str) else directory_path
 
+        if max_workers:
+            paths = [x for x in directory.iterdir() if document_suffix(x) == f".{document_type}"]
+            raise_on_no_documents(paths, document_type, directory_path)
+
+            return await _async_send_files_in_processes(
+                paths,
+                partial(
+                    self.update_documents_in_batches,
+                    batch_size=batch_size,
+                    primary_key=primary_key,
+                    custom_metadata=custom_metadata,
+                    compress=compress,
+                    skip_creation=skip_creation,
+                    concurrency_limit=concurrency_limit,
+                    checkpoint=checkpoint,
+                ),
+                csv_delimiter,
+                chunk_size=batch_size * STREAM_CHUNK_BATCHES if combine_documents else None,
+                json_handler=self._json_handler,
+                csv_schema=csv_schema,
+                max_workers=max_workers,
+            )
+
         if combine_documents:
             all_documents = []
             for path in directory.iterdir():
-                if path.suffix == f".{document_type}":
+                if document_suffix(path) == f".{document_type}":
                     documents = await _async_load_documents_from_file(
-                        path, csv_delimiter, json_handler=self._json_handler
+                        path,
+                        csv_delimiter,
+                        json_handler=self._json_handler,
+                        csv_schema=csv_schema,
                     )
                     all_documents.append(documents)
 
@@ -2512,6 +2945,7 @@ class AsyncIndex(BaseIndex):
                 compress=compress,
                 skip_creation=skip_creation,
                 concurrency_limit=concurrency_limit,
+                checkpoint=checkpoint,
             )
 
         if not use_task_groups():
@@ -2519,9 +2953,12 @@ class AsyncIndex(BaseIndex):
 
             update_documents = []
             for path in directory.iterdir():
-                if path.suffix == f".{document_type}":
+                if document_suffix(path) == f".{document_type}":
                     documents = await _async_load_documents_from_file(
-                        path, csv_delimiter, json_handler=self._json_handler
+                        path,
+                        csv_delimiter,
+                        json_handler=self._json_handler,
+                        csv_schema=csv_schema,
                     )
                     update_documents.append(
                         self.update_documents_in_batches(
@@ -2532,6 +2969,7 @@ class AsyncIndex(BaseIndex):
                             compress=compress,
                             skip_creation=skip_creation,
                             concurrency_limit=concurrency_limit,
+                            checkpoint=checkpoint,
                         )
                     )
 
@@ -2552,9 +2990,12 @@ class AsyncIndex(BaseIndex):
             results = []
             tasks = []
             for i, path in enumerate(directory.iterdir()):
-                if path.suffix == f".{document_type}":
+                if document_suffix(path) == f".{document_type}":
                     documents = await _async_load_documents_from_file(
-                        path, csv_delimiter, json_handler=self._json_handler
+                        path,
+                        csv_delimiter,
+                        json_handler=self._json_handler,
+                        csv_schema=csv_schema,
                     )
                     if i == 0:
                         results = await self.update_documents_in_batches(
@@ -2565,6 +3006,7 @@ class AsyncIndex(BaseIndex):
                             compress=compress,
                             skip_creation=skip_creation,
                             concurrency_limit=concurrency_limit,
+                            checkpoint=checkpoint,
                         )
                     else:
                         tasks.append(
@@ -2577,6 +3019,7 @@ class AsyncIndex(BaseIndex):
                                     compress=compress,
                                     skip_creation=skip_creation,
                                     concurrency_limit=concurrency_limit,
+                                    checkpoint=checkpoint,
                                 )
                             )
                         )
@@ -2598,7 +3041,8 @@ class AsyncIndex(BaseIndex):
         """Add documents in the index from a json file.
 
         Args:
-            file_path: Path to the json file.
+            file_path: Path to the json file. The file can be compressed with gzip (.gz) or zstd
+                (.zst).
             primary_key: The primary key of the documents. This will be ignored if already set.
                 Defaults to None.
             csv_delimiter: A single ASCII character to specify the delimiter for csv files. This
@@ -2642,25 +3086,33 @@ class AsyncIndex(BaseIndex):
         batch_size: int = 1000,
         primary_key: str | None = None,
         custom_metadata: str | None = None,
+        csv_schema: CsvSchema | None = None,
         compress: bool = False,
         skip_creation: bool = False,
         concurrency_limit: int | None = None,
+        checkpoint: Checkpoint | None = None,
     ) -> list[TaskInfo]:
         """Updates documents form a json file in batches to reduce RAM usage with indexing.
 
         Args:
-            file_path: Path to the json file.
+            file_path: Path to the json file. The file can be compressed with gzip (.gz) or zstd
+                (.zst).
             batch_size: The number of documents that should be included in each batch.
                 Defaults to 1000.
             primary_key: The primary key of the documents. This will be ignored if already set.
                 Defaults to None.
             custom_metadata: An arbitrary string accessible via the task. Defaults to None.
+            csv_schema: If set the values of csv files are converted to the types of their columns
+                instead of all being strings. Defaults to None.
             compress: If set to True the data will be sent in gzip format. Defaults to False.
             skip_creation: When set to true, documents that don't exist in the index are silently
                 ignored rather than created. Default = False.
             concurrency_limit: If set this will limit the number of batches that will be sent
                 concurrently. This can be helpful if you find you are overloading the Meilisearch
                 server with requests. Defaults to None.
+            checkpoint: If set the batches Meilisearch accepted are recorded in the checkpoint file
+                and batches already recorded there are skipped, so an interrupted ingest can be
+                resumed. Defaults to None.
 
         Returns:
             List of update ids to track the action.
@@ -2677,18 +3129,21 @@ class AsyncIndex(BaseIndex):
             >>>     index = client.index("movies")
             >>>     await index.update_documents_from_file_in_batches(file_path)
         """
-        documents = await _async_load_documents_from_file(
-            file_path, json_handler=self._json_handler
-        )
-
-        return await self.update_documents_in_batches(
-            documents,
-            batch_size=batch_size,
-            primary_key=primary_key,
-            custom_metadata=custom_metadata,
-            compress=compress,
-            skip_creation=skip_creation,
-            concurrency_limit=concurrency_limit,
+        return await _async_send_document_chunks(
+            file_path,
+            partial(
+                self.update_documents_in_batches,
+                batch_size=batch_size,
+                primary_key=primary_key,
+                custom_metadata=custom_metadata,
+                compress=compress,
+                skip_creation=skip_creation,
+                concurrency_limit=concurrency_limit,
+                checkpoint=checkpoint,
+            ),
+            chunk_size=batch_size * STREAM_CHUNK_BATCHES,
+            json_handler=self._json_handler,
+            csv_schema=csv_schema,
         )
 
     async def update_documents_from_raw_file(
@@ -2708,7 +3163,8 @@ class AsyncIndex(BaseIndex):
 
         Args:
             file_path: The path to the file to send to Meilisearch. Only csv and ndjson files are
-                allowed.
+                allowed. They can be compressed with gzip (.gz) or zstd (.zst), and gzip files are
+                sent as is without being decompressed.
             primary_key: The primary key of the documents. This will be ignored if already set.
                 Defaults to None.
             csv_delimiter: A single ASCII character to specify the delimiter for csv files. This
@@ -2753,15 +3209,147 @@ class AsyncIndex(BaseIndex):
         else:
             url = self._documents_url
 
-        async with aiofiles.open(upload_path) as f:
-            data = await f.read()
+        loop = asyncio.get_running_loop()
+        data = await loop.run_in_executor(None, partial(read_raw_file, upload_path))
 
         response = await self._http_requests.put(
-            url, body=data, content_type=content_type, compress=compress
+            url,
+            body=data,
+            content_type=content_type,
+            compress=compress,
+            precompressed=compression(upload_path) == "gzip",
         )
 
         return TaskInfo(**self._http_requests.parse_json(response))
 
+    async def update_documents_from_arrow(
+        self,
+        data: ArrowData | Path | str,
+        *,
+        batch_size: int = 1000,
+        primary_key: str | None = None,
+        custom_metadata: str | None = None,
+        skip_creation: bool = False,
+        compress: bool = False,
+        concurrency_limit: int | None = None,
+    ) -> list[TaskInfo]:
+        """Update documents from Arrow data or a Parquet file in batches.
+
+        Each record batch is serialized to NDJSON one column at a time with Arrow compute
+        functions and sent as is, without building a Python dict for each document. Parquet files
+        are read one batch at a time, and the next batch is serialized while the previous ones are
+        being sent. This requires pyarrow, which can be installed with the `pyarrow` extra.
+
+        Args:
+            data: A pyarrow Table, RecordBatch, RecordBatchReader, an iterable of record batches, or
+                the path to a Parquet file.
+            batch_size: The maximum number of documents that should be included in each batch.
+                Defaults to 1000.
+            primary_key: The primary key of the documents. This will be ignored if already set.
+                Defaults to None.
+            custom_metadata: An arbitrary string accessible via the task. Defaults to None.
+            skip_creation: When set to true, documents that don't exist in the index are silently
+                ignored rather than created. Default = False.
+            compress: If set to True the data will be sent in gzip format. Defaults to False.
+            concurrency_limit: If set this will limit the number of batches that will be sent
+                concurrently. This can be helpful if you find you are overloading the Meilisearch
+                server with requests. If None at most 4 batches per CPU are sent at once, so the
+                source is not read ahead of the requests. Defaults to None.
+
+        Returns:
+            List of update ids to track the action.
+
+        Raises:
+            ValueError: If pyarrow is not installed.
+            InvalidDocumentError: If a column has binary values.
+            MeilisearchCommunicationError: If there was an error communicating with the server.
+            MeilisearchApiError: If the Meilisearch API returned an error.
+
+        Examples:
+            >>> from meilisearch_python_sdk import AsyncClient
+            >>> async with AsyncClient("http://localhost.com", "masterKey") as client:
+            >>>     index = client.index("movies")
+            >>>     await index.update_documents_from_arrow("movies.parquet")
+        """
+        # Imported here so pyarrow is only loaded when it is used.
+        from meilisearch_python_sdk.arrow import iter_ndjson_payloads
+
+        return await self._send_payloads(
+            self._http_requests.put,
+            iter_ndjson_payloads(data, batch_size=batch_size, json_handler=self._json_handler),
+            content_type="application/x-ndjson",
+            primary_key=primary_key,
+            custom_metadata=custom_metadata,
+            compress=compress,
+            concurrency_limit=concurrency_limit,
+            serialize_in_executor=True,
+            skip_creation=skip_creation,
+        )
+
+    async def update_documents_from_bytes(
+        self,
+        data: bytes | Iterable[bytes],
+        *,
+        content_type: PayloadContentType = "application/x-ndjson",
+        batch_size: int | None = 1000,
+        primary_key: str | None = None,
+        custom_metadata: str | None = None,
+        skip_creation: bool = False,
+        compress: bool = False,
+        concurrency_limit: int | None = None,
+    ) -> list[TaskInfo]:
+        """Update documents that are already JSON or NDJSON encoded.
+
+        The payloads are sent as is, so documents that arrive encoded, for example from a message
+        queue, do not have to be decoded only to be encoded again. NDJSON payloads are joined, or
+        split on line breaks, into batches of `batch_size` documents, and JSON payloads are each
+        sent in their own request.
+
+        Args:
+            data: One payload, or an iterable of payloads. Each payload is a JSON array or object,
+                or NDJSON with one document per line, depending on `content_type`.
+            content_type: The content type of the payloads, either application/json or
+                application/x-ndjson. Defaults to application/x-ndjson.
+            batch_size: The number of documents in each batch of NDJSON documents, so a payload
+                can be a single document. If set to None each NDJSON payload is sent as is. JSON
+                payloads are always sent as is. Defaults to 1000.
+            primary_key: The primary key of the documents. This will be ignored if already set.
+                Defaults to None.
+            custom_metadata: An arbitrary string accessible via the task. Defaults to None.
+            skip_creation: When set to true, documents that don't exist in the index are silently
+                ignored rather than created. Default = False.
+            compress: If set to True the data will be sent in gzip format. Defaults to False.
+            concurrency_limit: If set this will limit the number of batches that will be sent
+                concurrently. This can be helpful if you find you are overloading the Meilisearch
+                server with requests. If None at most 4 batches per CPU are sent at once, so the
+                source is not read ahead of the requests. Defaults to None.
+
+        Returns:
+            List of update ids to track the action.
+
+        Raises:
+            ValueError: If the content_type is not supported or the batch_size is less than 1.
+            MeilisearchCommunicationError: If there was an error communicating with the server.
+            MeilisearchApiError: If the Meilisearch API returned an error.
+
+        Examples:
+            >>> from meilisearch_python_sdk import AsyncClient
+            >>> messages = [b'{"id": 1, "title": "Movie 1"}', b'{"id": 2, "title": "Movie 2"}']
+            >>> async with AsyncClient("http://localhost.com", "masterKey") as client:
+            >>>     index = client.index("movies")
+            >>>     await index.update_documents_from_bytes(messages)
+        """
+        return await self._send_payloads(
+            self._http_requests.put,
+            prepare_payloads(data, content_type, batch_size),
+            content_type=content_type,
+            primary_key=primary_key,
+            custom_metadata=custom_metadata,
+            compress=compress,
+            concurrency_limit=concurrency_limit,
+            skip_creation=skip_creation,
+        )
+
     async def delete_document(
         self, document_id: str, *, custom_metadata: str | None = None
     ) -> TaskInfo:
@@ -4881,6 +5469,7 @@ async def _async_load_documents_from_file(
     csv_delimiter: str | None = None,
     *,
     json_handler: BuiltinHandler | OrjsonHandler,
+    csv_schema: CsvSchema | None = None,
 ) -> list[dict[Any, Any]]:
     if isinstance(file_path, str):
         file_path = Path(file_path)
@@ -4888,32 +5477,134 @@ async def _async_load_documents_from_file(
     loop = asyncio.get_running_loop()
     await loop.run_in_executor(None, partial(validate_file_type, file_path))
 
-    if file_path.suffix == ".csv":
-        if (
-            csv_delimiter
-            and len(csv_delimiter) != 1
-            or csv_delimiter
-            and not csv_delimiter.isascii()
-        ):
-            raise ValueError("csv_delimiter must be a single ascii character")
-        with open(file_path) as f:  # noqa: ASYNC230
-            if csv_delimiter:
-                documents = await loop.run_in_executor(
-                    None, partial(DictReader, f, delimiter=csv_delimiter)
-                )
-            else:
-                documents = await loop.run_in_executor(None, partial(DictReader, f))
-            return list(documents)
+    suffix = document_suffix(file_path)
+    if suffix == ".csv":
+        validate_csv_delimiter(csv_delimiter)
+        with open_document_file(file_path) as f:
+            return await loop.run_in_executor(
+                None, partial(next, read_csv(f, csv_delimiter, csv_schema=csv_schema), [])
+            )
+
+    if suffix == ".ndjson":
+        with open_document_file(file_path) as f:
+            return await loop.run_in_executor(None, partial(list, iter_ndjson(f, json_handler)))
 
-    if file_path.suffix == ".ndjson":
-        with open(file_path) as f:  # noqa: ASYNC230
-            return [await loop.run_in_executor(None, partial(json_handler.loads, x)) for x in f]
+    if compression(file_path) is None:
+        async with aiofiles.open(file_path) as f:  # type: ignore
+            data = await f.read()  # type: ignore
+    else:
+        with open_document_file(file_path) as f:
+            data = await loop.run_in_executor(None, f.read)
 
-    async with aiofiles.open(file_path) as f:  # type: ignore
-        data = await f.read()  # type: ignore
-        documents = await loop.run_in_executor(None, partial(json_handler.loads, data))
+    documents = await loop.run_in_executor(None, partial(json_handler.loads, data))
 
-        if not isinstance(documents, list):
-            raise InvalidDocumentError("Meilisearch requires documents to be in a list")
+    if not isinstance(documents, list):
+        raise InvalidDocumentError("Meilisearch requires documents to be in a list")
 
-        return documents
+    return documents
+
+
+async def _async_send_document_chunks(
+    file_path: Path | str,
+    send: Callable[[list[dict[Any, Any]]], Awaitable[list[TaskInfo]]],
+    csv_delimiter: str | None = None,
+    *,
+    chunk_size: int,
+    json_handler: BuiltinHandler | OrjsonHandler,
+    csv_schema: CsvSchema | None = None,
+) -> list[TaskInfo]:
+    """Read a file `chunk_size` documents at a time and send each chunk while the next is read.
+
+    The file is opened, read, and closed in the default executor so the event loop is never
+    blocked, and one chunk is read ahead while the previous one is uploaded.
+    """
+    if isinstance(file_path, str):
+        file_path = Path(file_path)
+
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, partial(validate_file_type, file_path))
+    validate_csv_delimiter(csv_delimiter)
+
+    f = await loop.run_in_executor(None, partial(open_document_file, file_path))
+    chunks = iter_document_chunks(
+        f,
+        document_suffix(file_path),
+        csv_delimiter,
+        chunk_size=chunk_size,
+        json_handler=json_handler,
+        csv_schema=csv_schema,
+    )
+    next_chunk = loop.run_in_executor(None, partial(next, chunks, []))
+    try:
+        task_infos: list[TaskInfo] = []
+        while documents := await next_chunk:
+            next_chunk = loop.run_in_executor(None, partial(next, chunks, []))
+            task_infos += await send(documents)
+    finally:
+        # The chunk being read ahead has to finish before the file can be closed.
+        await asyncio.gather(next_chunk, return_exceptions=True)
+        await loop.run_in_executor(None, f.close)
+
+    return task_infos
+
+
+async def _async_send_files_in_processes(
+    paths: Sequence[Path],
+    send: Callable[[list[dict[Any, Any]]], Awaitable[list[TaskInfo]]],
+    csv_delimiter: str | None = None,
+    *,
+    chunk_size: int | None = None,
+    json_handler: BuiltinHandler | OrjsonHandler,
+    csv_schema: CsvSchema | None = None,
+    max_workers: int,
+) -> list[TaskInfo]:
+    """Load files in a pool of processes and send their documents while more files are loaded.
+
+    Loaded documents are passed to the sender through a queue of at most `max_workers` chunks, so
+    files keep being parsed while earlier documents are uploaded. The chunks are sent in the
+    order of `paths`, and are split and combined in the same way as by `load_files_in_processes`.
+    """
+    queue: asyncio.Queue[list[dict[Any, Any]] | None] = asyncio.Queue(max_workers)
+    pool = ProcessPoolExecutor(max_workers)
+
+    async def load() -> None:
+        try:
+            combined: list[dict[Any, Any]] = []
+            for future in submit_file_loads(
+                pool,
+                paths,
+                csv_delimiter,
+                json_handler=json_handler,
+                csv_schema=csv_schema,
+                max_workers=max_workers,
+            ):
+                documents = await asyncio.wrap_future(future)
+                if chunk_size is None:
+                    await queue.put(documents)
+                    continue
+
+                combined += documents
+                for chunk in take_chunks(combined, chunk_size):
+                    await queue.put(chunk)
+
+            if combined:
+                await queue.put(combined)
+        except Exception:
+            # The sender stops at the None and then raises this error when awaiting the loader.
+            await queue.put(None)
+            raise
+        await queue.put(None)
+
+    loader = asyncio.create_task(load())
+    try:
+        task_infos: list[TaskInfo] = []
+        while (documents := await queue.get()) is not None:
+            task_infos += await send(documents)
+        await loader
+    finally:
+        loader.cancel()
+        await asyncio.gather(loader, return_exceptions=True)
+        # Waiting for files that are still loading would block the event loop.
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    return task_infos
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-from csv import DictReader
 from datetime import datetime
-from functools import cached_property
+from functools import cached_property, partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
 
@@ -11,22 +10,35 @@ from httpx2 import Client
 
 from meilisearch_python_sdk._http_requests import HttpRequests
 from meilisearch_python_sdk._task import wait_for_task
-from meilisearch_python_sdk.errors import InvalidDocumentError
 from meilisearch_python_sdk.index._common import (
+    STREAM_CHUNK_BATCHES,
     BaseIndex,
+    PayloadContentType,
     batch,
     build_encoded_url,
+    compression,
+    document_suffix,
     embedder_json_to_embedders_model,
     embedder_json_to_settings_model,
     filter_plugins,
+    iter_document_chunks,
+    load_files_in_processes,
+    open_document_file,
     plugin_has_method,
+    prepare_payloads,
     prepare_raw_file_upload,
     process_search_parameters,
     raise_on_no_documents,
+    read_raw_file,
+    validate_adaptive_checkpoint,
+    validate_csv_delimiter,
     validate_file_type,
     validate_ranking_score_threshold,
 )
 from meilisearch_python_sdk.index._common import combine_documents as combine_documents_
+from meilisearch_python_sdk.index._common import (
+    load_documents_from_file as _load_documents_from_file,
+)
 from meilisearch_python_sdk.json_handler import BuiltinHandler, OrjsonHandler
 from meilisearch_python_sdk.models.documents import DocumentsInfo
 from meilisearch_python_sdk.models.index import Field, FieldResults, FieldsFilter, IndexStats
@@ -61,8 +73,15 @@ from meilisearch_python_sdk.types import JsonDict
 
 if TYPE_CHECKING:
     import sys
-    from collections.abc import Sequence
+    from collections.abc import Callable, Generator, Iterable, Sequence
+
+    from httpx2 import Response
 
+    from meilisearch_python_sdk.adaptive import AdaptiveBatching
+    from meilisearch_python_sdk.arrow import ArrowData
+    from meilisearch_python_sdk.backpressure import Backpressure
+    from meilisearch_python_sdk.checkpoint import Checkpoint
+    from meilisearch_python_sdk.csv_schema import CsvSchema
     from meilisearch_python_sdk.types import Filter, JsonMapping
 
     if sys.version_info >= (3, 11):
@@ -1126,6 +1145,9 @@ class Index(BaseIndex):
         primary_key: str | None = None,
         custom_metadata: str | None = None,
         compress: bool = False,
+        backpressure: Backpressure | None = None,
+        adaptive: AdaptiveBatching | None = None,
+        checkpoint: Checkpoint | None = None,
     ) -> list[TaskInfo]:
         """Adds documents in batches to reduce RAM usage with indexing.
 
@@ -1137,6 +1159,15 @@ class Index(BaseIndex):
                 Defaults to None.
             custom_metadata: An arbitrary string accessible via the task. Defaults to None.
             compress: If set to True the data will be sent in gzip format. Defaults to False.
+            backpressure: If set sending pauses while the index has more enqueued tasks than the
+                high-water mark, and resumes when the queue has fallen to the low-water mark.
+                Defaults to None.
+            adaptive: If set the batch size is chosen from the measured indexing throughput
+                instead of using `batch_size`. Defaults to None.
+            checkpoint: If set the batches Meilisearch accepted are recorded in the checkpoint file
+                and batches already recorded there are skipped, so an interrupted ingest can be
+                resumed. It cannot be used with `adaptive`, because the batches of a resumed run
+                would have different sizes. Defaults to None.
 
         Returns:
             List of update ids to track the action.
@@ -1144,6 +1175,7 @@ class Index(BaseIndex):
         Raises:
             MeilisearchCommunicationError: If there was an error communicating with the server.
             MeilisearchApiError: If the Meilisearch API returned an error.
+            ValueError: If both `adaptive` and `checkpoint` are set.
 
         Examples:
             >>> from meilisearch_python_sdk import Client
@@ -1155,10 +1187,46 @@ class Index(BaseIndex):
             >>>     index = client.index("movies")
             >>>     index.add_documents_in_batches(documents)
         """
-        return [
-            self.add_documents(x, primary_key, custom_metadata=custom_metadata, compress=compress)
-            for x in batch(documents, batch_size)
-        ]
+        validate_adaptive_checkpoint(adaptive, checkpoint)
+        gate = None
+        if backpressure is not None:
+            # Imported here so the backpressure module is only loaded when it is used.
+            from meilisearch_python_sdk.backpressure import TaskQueueGate
+
+            gate = TaskQueueGate(
+                self.http_client, self.uid, backpressure, json_handler=self._json_handler
+            )
+        send: Callable[[Sequence[JsonMapping]], TaskInfo] = partial(
+            self.add_documents,
+            primary_key=primary_key,
+            custom_metadata=custom_metadata,
+            compress=compress,
+        )
+        if checkpoint is not None:
+            send = checkpoint.wrap(
+                send, self.http_client, self.uid, "add", json_handler=self._json_handler
+            )
+
+        if adaptive is not None:
+            # Imported here so the adaptive module is only loaded when it is used.
+            from meilisearch_python_sdk.adaptive import send_adaptive
+
+            return send_adaptive(
+                self.http_client,
+                documents,
+                adaptive,
+                send,
+                json_handler=self._json_handler,
+                gate=gate,
+            )
+
+        results = []
+        for x in batch(documents, batch_size):
+            if gate is not None:
+                gate.wait()
+            results.append(send(x))
+
+        return results
 
     def add_documents_from_directory(
         self,
@@ -1181,6 +1249,7 @@ class Index(BaseIndex):
             document_type: The type of document being added. Accepted types are json, csv, and
                 ndjson. For csv files the first row of the document should be a header row containing
                 the field names, and ever for should have a title.
+                Files of this type compressed with gzip (.gz) or zstd (.zst) are also loaded.
             csv_delimiter: A single ASCII character to specify the delimiter for csv files. This
                 can only be used if the file is a csv file. Defaults to comma.
             combine_documents: If set to True this will combine the documents from all the files
@@ -1209,7 +1278,7 @@ class Index(BaseIndex):
         if combine_documents:
             all_documents = []
             for path in directory.iterdir():
-                if path.suffix == f".{document_type}":
+                if document_suffix(path) == f".{document_type}":
                     documents = _load_documents_from_file(
                         path, csv_delimiter, json_handler=self._json_handler
                     )
@@ -1227,7 +1296,7 @@ class Index(BaseIndex):
 
         responses = []
         for path in directory.iterdir():
-            if path.suffix == f".{document_type}":
+            if document_suffix(path) == f".{document_type}":
                 documents = _load_documents_from_file(
                     path, csv_delimiter, json_handler=self._json_handler
                 )
@@ -1250,8 +1319,11 @@ class Index(BaseIndex):
         custom_metadata: str | None = None,
         document_type: str = "json",
         csv_delimiter: str | None = None,
+        csv_schema: CsvSchema | None = None,
         combine_documents: bool = True,
         compress: bool = False,
+        checkpoint: Checkpoint | None = None,
+        max_workers: int | None = None,
     ) -> list[TaskInfo]:
         """Load all json files from a directory and add the documents to the index in batches.
 
@@ -1265,11 +1337,21 @@ class Index(BaseIndex):
             document_type: The type of document being added. Accepted types are json, csv, and
                 ndjson. For csv files the first row of the document should be a header row containing
                 the field names, and ever for should have a title.
+                Files of this type compressed with gzip (.gz) or zstd (.zst) are also loaded.
             csv_delimiter: A single ASCII character to specify the delimiter for csv files. This
                 can only be used if the file is a csv file. Defaults to comma.
+            csv_schema: If set the values of csv files are converted to the types of their columns
+                instead of all being strings. Defaults to None.
             combine_documents: If set to True this will combine the documents from all the files
                 before indexing them. Defaults to True.
             compress: If set to True the data will be sent in gzip format. Defaults to False.
+            checkpoint: If set the batches Meilisearch accepted are recorded in the checkpoint file
+                and batches already recorded there are skipped, so an interrupted ingest can be
+                resumed. Defaults to None.
+            max_workers: If set the files are loaded in a pool of this many processes while the
+                documents already loaded are being sent, instead of being loaded one at a time.
+                Only a few files per process are held in memory at once, and if combine_documents
+                is True the combined documents are sent as they are loaded. Defaults to None.
 
         Returns:
             List of update ids to track the action.
@@ -1290,12 +1372,39 @@ class Index(BaseIndex):
         """
         directory = Path(directory_path) if isinstance(directory_path, str) else directory_path
 
+        if max_workers:
+            paths = [x for x in directory.iterdir() if document_suffix(x) == f".{document_type}"]
+            raise_on_no_documents(paths, document_type, directory_path)
+
+            task_infos: list[TaskInfo] = []
+            for documents in load_files_in_processes(
+                paths,
+                csv_delimiter,
+                chunk_size=batch_size * STREAM_CHUNK_BATCHES if combine_documents else None,
+                json_handler=self._json_handler,
+                csv_schema=csv_schema,
+                max_workers=max_workers,
+            ):
+                task_infos += self.add_documents_in_batches(
+                    documents,
+                    batch_size=batch_size,
+                    primary_key=primary_key,
+                    custom_metadata=custom_metadata,
+                    compress=compress,
+                    checkpoint=checkpoint,
+                )
+
+            return task_infos
+
         if combine_documents:
             all_documents = []
             for path in directory.iterdir():
-                if path.suffix == f".{document_type}":
+                if document_suffix(path) == f".{document_type}":
                     documents = _load_documents_from_file(
-                        path, csv_delimiter=csv_delimiter, json_handler=self._json_handler
+                        path,
+                        csv_delimiter=csv_delimiter,
+                        json_handler=self._json_handler,
+                        csv_schema=csv_schema,
                     )
                     all_documents.append(documents)
 
@@ -1309,13 +1418,17 @@ class Index(BaseIndex):
                 primary_key=primary_key,
                 custom_metadata=custom_metadata,
                 compress=compress,
+                checkpoint=checkpoint,
             )
 
         responses: list[TaskInfo] = []
         for path in directory.iterdir():
-            if path.suffix == f".{document_type}":
+            if document_suffix(path) == f".{document_type}":
                 documents = _load_documents_from_file(
-                    path, csv_delimiter, json_handler=self._json_handler
+                    path,
+                    csv_delimiter,
+                    json_handler=self._json_handler,
+                    csv_schema=csv_schema,
                 )
                 responses.extend(
                     self.add_documents_in_batches(
@@ -1324,6 +1437,7 @@ class Index(BaseIndex):
                         primary_key=primary_key,
                         custom_metadata=custom_metadata,
                         compress=compress,
+                        checkpoint=checkpoint,
                     )
                 )
 
@@ -1342,7 +1456,8 @@ class Index(BaseIndex):
         """Add documents to the index from a json file.
 
         Args:
-            file_path: Path to the json file.
+            file_path: Path to the json file. The file can be compressed with gzip (.gz) or zstd
+                (.zst).
             primary_key: The primary key of the documents. This will be ignored if already set.
                 Defaults to None.
             custom_metadata: An arbitrary string accessible via the task. Defaults to None.
@@ -1379,12 +1494,15 @@ class Index(BaseIndex):
         primary_key: str | None = None,
         custom_metadata: str | None = None,
         csv_delimiter: str | None = None,
+        csv_schema: CsvSchema | None = None,
         compress: bool = False,
+        checkpoint: Checkpoint | None = None,
     ) -> list[TaskInfo]:
         """Adds documents form a json file in batches to reduce RAM usage with indexing.
 
         Args:
-            file_path: Path to the json file.
+            file_path: Path to the json file. The file can be compressed with gzip (.gz) or zstd
+                (.zst).
             batch_size: The number of documents that should be included in each batch.
                 Defaults to 1000.
             primary_key: The primary key of the documents. This will be ignored if already set.
@@ -1392,7 +1510,12 @@ class Index(BaseIndex):
             custom_metadata: An arbitrary string accessible via the task. Defaults to None.
             csv_delimiter: A single ASCII character to specify the delimiter for csv files. This
                 can only be used if the file is a csv file. Defaults to comma.
+            csv_schema: If set the values of csv files are converted to the types of their columns
+                instead of all being strings. Defaults to None.
             compress: If set to True the data will be sent in gzip format. Defaults to False.
+            checkpoint: If set the batches Meilisearch accepted are recorded in the checkpoint file
+                and batches already recorded there are skipped, so an interrupted ingest can be
+                resumed. Defaults to None.
 
         Returns:
             List of update ids to track the action.
@@ -1411,17 +1534,24 @@ class Index(BaseIndex):
             >>>     index = client.index("movies")
             >>>     index.add_documents_from_file_in_batches(file_path)
         """
-        documents = _load_documents_from_file(
-            file_path, csv_delimiter, json_handler=self._json_handler
-        )
+        tasks: list[TaskInfo] = []
+        for documents in _load_document_chunks(
+            file_path,
+            csv_delimiter,
+            chunk_size=batch_size * STREAM_CHUNK_BATCHES,
+            json_handler=self._json_handler,
+            csv_schema=csv_schema,
+        ):
+            tasks += self.add_documents_in_batches(
+                documents,
+                batch_size=batch_size,
+                primary_key=primary_key,
+                custom_metadata=custom_metadata,
+                compress=compress,
+                checkpoint=checkpoint,
+            )
 
-        return self.add_documents_in_batches(
-            documents,
-            batch_size=batch_size,
-            primary_key=primary_key,
-            custom_metadata=custom_metadata,
-            compress=compress,
-        )
+        return tasks
 
     def add_documents_from_raw_file(
         self,
@@ -1439,7 +1569,8 @@ class Index(BaseIndex):
 
         Args:
             file_path: The path to the file to send to Meilisearch. Only csv and ndjson files are
-                allowed.
+                allowed. They can be compressed with gzip (.gz) or zstd (.zst), and gzip files are
+                sent as is without being decompressed.
             primary_key: The primary key of the documents. This will be ignored if already set.
                 Defaults to None.
             custom_metadata: An arbitrary string accessible via the task. Defaults to None.
@@ -1480,15 +1611,217 @@ class Index(BaseIndex):
         else:
             url = self._documents_url
 
-        with open(upload_path) as f:
-            data = f.read()
+        data = read_raw_file(upload_path)
 
         response = self._http_requests.post(
-            url, body=data, content_type=content_type, compress=compress
+            url,
+            body=data,
+            content_type=content_type,
+            compress=compress,
+            precompressed=compression(upload_path) == "gzip",
         )
 
         return TaskInfo(**self._http_requests.parse_json(response))
 
+    def add_documents_from_arrow(
+        self,
+        data: ArrowData | Path | str,
+        *,
+        batch_size: int = 1000,
+        primary_key: str | None = None,
+        custom_metadata: str | None = None,
+        compress: bool = False,
+    ) -> list[TaskInfo]:
+        """Add documents from Arrow data or a Parquet file in batches.
+
+        Each record batch is serialized to NDJSON one column at a time with Arrow compute
+        functions and sent as is, without building a Python dict for each document. Parquet files
+        are read one batch at a time. This requires pyarrow, which can be installed with the
+        `pyarrow` extra.
+
+        Args:
+            data: A pyarrow Table, RecordBatch, RecordBatchReader, an iterable of record batches, or
+                the path to a Parquet file.
+            batch_size: The maximum number of documents that should be included in each batch.
+                Defaults to 1000.
+            primary_key: The primary key of the documents. This will be ignored if already set.
+                Defaults to None.
+            custom_metadata: An arbitrary string accessible via the task. Defaults to None.
+            compress: If set to True the data will be sent in gzip format. Defaults to False.
+
+        Returns:
+            List of update ids to track the action.
+
+        Raises:
+            ValueError: If pyarrow is not installed.
+            InvalidDocumentError: If a column has binary values.
+            MeilisearchCommunicationError: If there was an error communicating with the server.
+            MeilisearchApiError: If the Meilisearch API returned an error.
+
+        Examples:
+            >>> from meilisearch_python_sdk import Client
+            >>> with Client("http://localhost.com", "masterKey") as client:
+            >>>     index = client.index("movies")
+            >>>     index.add_documents_from_arrow("movies.parquet")
+        """
+        # Imported here so pyarrow is only loaded when it is used.
+        from meilisearch_python_sdk.arrow import iter_ndjson_payloads
+
+        return self._send_payloads(
+            self._http_requests.post,
+            iter_ndjson_payloads(data, batch_size=batch_size, json_handler=self._json_handler),
+            content_type="application/x-ndjson",
+            primary_key=primary_key,
+            custom_metadata=custom_metadata,
+            compress=compress,
+        )
+
+    def add_dataframe(
+        self,
+        df: Any,  # noqa: ANN401
+        *,
+        batch_size: int = 1000,
+        primary_key: str | None = None,
+        custom_metadata: str | None = None,
+        compress: bool = False,
+    ) -> list[TaskInfo]:
+        """Add the rows of a pandas or polars DataFrame as documents in batches.
+
+        The DataFrame is converted to Arrow a chunk of rows at a time and each chunk is serialized
+        to NDJSON one column at a time, without building a dict for each row as
+        `to_dict("records")` does. NaN, NaT, and other missing values are sent as null, datetimes
+        are sent as ISO 8601 strings, and the index of a pandas DataFrame is not sent. This
+        requires pyarrow, which can be installed with the `pyarrow` extra.
+
+        Args:
+            df: A pandas or polars DataFrame.
+            batch_size: The number of rows that should be included in each batch.
+                Defaults to 1000.
+            primary_key: The primary key of the documents. This will be ignored if already set.
+                Defaults to None.
+            custom_metadata: An arbitrary string accessible via the task. Defaults to None.
+            compress: If set to True the data will be sent in gzip format. Defaults to False.
+
+        Returns:
+            List of update ids to track the action.
+
+        Raises:
+            ValueError: If pyarrow is not installed.
+            InvalidDocumentError: If a column has binary values.
+            MeilisearchCommunicationError: If there was an error communicating with the server.
+            MeilisearchApiError: If the Meilisearch API returned an error.
+
+        Examples:
+            >>> import pandas as pd
+            >>> from meilisearch_python_sdk import Client
+            >>> df = pd.DataFrame({"id": [1, 2], "title": ["Movie 1", "Movie 2"]})
+            >>> with Client("http://localhost.com", "masterKey") as client:
+            >>>     index = client.index("movies")
+            >>>     index.add_dataframe(df)
+        """
+        # Imported here so pyarrow is only loaded when it is used.
+        from meilisearch_python_sdk.arrow import iter_dataframe_batches, iter_ndjson_payloads
+
+        return self._send_payloads(
+            self._http_requests.post,
+            iter_ndjson_payloads(
+                iter_dataframe_batches(df, batch_size=batch_size),
+                batch_size=batch_size,
+                json_handler=self._json_handler,
+            ),
+            content_type="application/x-ndjson",
+            primary_key=primary_key,
+            custom_metadata=custom_metadata,
+            compress=compress,
+        )
+
+    def add_documents_from_bytes(
+        self,
+        data: bytes | Iterable[bytes],
+        *,
+        content_type: PayloadContentType = "application/x-ndjson",
+        batch_size: int | None = 1000,
+        primary_key: str | None = None,
+        custom_metadata: str | None = None,
+        compress: bool = False,
+    ) -> list[TaskInfo]:
+        """Add documents that are already JSON or NDJSON encoded.
+
+        The payloads are sent as is, so documents that arrive encoded, for example from a message
+        queue, do not have to be decoded only to be encoded again. NDJSON payloads are joined, or
+        split on line breaks, into batches of `batch_size` documents, and JSON payloads are each
+        sent in their own request.
+
+        Args:
+            data: One payload, or an iterable of payloads. Each payload is a JSON array or object,
+                or NDJSON with one document per line, depending on `content_type`.
+            content_type: The content type of the payloads, either application/json or
+                application/x-ndjson. Defaults to application/x-ndjson.
+            batch_size: The number of documents in each batch of NDJSON documents, so a payload
+                can be a single document. If set to None each NDJSON payload is sent as is. JSON
+                payloads are always sent as is. Defaults to 1000.
+            primary_key: The primary key of the documents. This will be ignored if already set.
+                Defaults to None.
+            custom_metadata: An arbitrary string accessible via the task. Defaults to None.
+            compress: If set to True the data will be sent in gzip format. Defaults to False.
+
+        Returns:
+            List of update ids to track the action.
+
+        Raises:
+            ValueError: If the content_type is not supported or the batch_size is less than 1.
+            MeilisearchCommunicationError: If there was an error communicating with the server.
+            MeilisearchApiError: If the Meilisearch API returned an error.
+
+        Examples:
+            >>> from meilisearch_python_sdk import Client
+            >>> messages = [b'{"id": 1, "title": "Movie 1"}', b'{"id": 2, "title": "Movie 2"}']
+            >>> with Client("http://localhost.com", "masterKey") as client:
+            >>>     index = client.index("movies")
+            >>>     index.add_documents_from_bytes(messages)
+        """
+        return self._send_payloads(
+            self._http_requests.post,
+            prepare_payloads(data, content_type, batch_size),
+            content_type=content_type,
+            primary_key=primary_key,
+            custom_metadata=custom_metadata,
+            compress=compress,
+        )
+
+    def _send_payloads(
+        self,
+        send: Callable[..., Response],
+        payloads: Iterable[bytes],
+        *,
+        content_type: str,
+        primary_key: str | None,
+        custom_metadata: str | None,
+        compress: bool,
+        skip_creation: bool = False,
+    ) -> list[TaskInfo]:
+        parameters = {}
+        if primary_key:
+            parameters["primaryKey"] = primary_key
+        if custom_metadata:
+            parameters["customMetadata"] = custom_metadata
+        if skip_creation:
+            parameters["skipCreation"] = "true"
+
+        if parameters:
+            url = build_encoded_url(self._documents_url, parameters)
+        else:
+            url = self._documents_url
+
+        return [
+            TaskInfo(
+                **self._http_requests.parse_json(
+                    send(url, body=x, content_type=content_type, compress=compress)
+                )
+            )
+            for x in payloads
+        ]
+
     def edit_documents(
         self,
         function: str,
@@ -1619,6 +1952,9 @@ class Index(BaseIndex):
         custom_metadata: str | None = None,
         skip_creation: bool = False,
         compress: bool = False,
+        backpressure: Backpressure | None = None,
+        adaptive: AdaptiveBatching | None = None,
+        checkpoint: Checkpoint | None = None,
     ) -> list[TaskInfo]:
         """Update documents in batches to reduce RAM usage with indexing.
 
@@ -1634,6 +1970,15 @@ class Index(BaseIndex):
             skip_creation: When set to true, documents that don't exist in the index are silently
                 ignored rather than created. Default = False.
             compress: If set to True the data will be sent in gzip format. Defaults to False.
+            backpressure: If set sending pauses while the index has more enqueued tasks than the
+                high-water mark, and resumes when the queue has fallen to the low-water mark.
+                Defaults to None.
+            adaptive: If set the batch size is chosen from the measured indexing throughput
+                instead of using `batch_size`. Defaults to None.
+            checkpoint: If set the batches Meilisearch accepted are recorded in the checkpoint file
+                and batches already recorded there are skipped, so an interrupted ingest can be
+                resumed. It cannot be used with `adaptive`, because the batches of a resumed run
+                would have different sizes. Defaults to None.
 
         Returns:
             List of update ids to track the action.
@@ -1641,6 +1986,7 @@ class Index(BaseIndex):
         Raises:
             MeilisearchCommunicationError: If there was an error communicating with the server.
             MeilisearchApiError: If the Meilisearch API returned an error.
+            ValueError: If both `adaptive` and `checkpoint` are set.
 
         Examples:
             >>> from meilisearch_python_sdk import Client
@@ -1652,16 +1998,47 @@ class Index(BaseIndex):
             >>>     index = client.index("movies")
             >>>     index.update_documents_in_batches(documents)
         """
-        return [
-            self.update_documents(
-                x,
-                primary_key,
-                custom_metadata=custom_metadata,
-                skip_creation=skip_creation,
-                compress=compress,
+        validate_adaptive_checkpoint(adaptive, checkpoint)
+        gate = None
+        if backpressure is not None:
+            # Imported here so the backpressure module is only loaded when it is used.
+            from meilisearch_python_sdk.backpressure import TaskQueueGate
+
+            gate = TaskQueueGate(
+                self.http_client, self.uid, backpressure, json_handler=self._json_handler
             )
-            for x in batch(documents, batch_size)
-        ]
+        send: Callable[[Sequence[JsonMapping]], TaskInfo] = partial(
+            self.update_documents,
+            primary_key=primary_key,
+            custom_metadata=custom_metadata,
+            skip_creation=skip_creation,
+            compress=compress,
+        )
+        if checkpoint is not None:
+            send = checkpoint.wrap(
+                send, self.http_client, self.uid, "update", json_handler=self._json_handler
+            )
+
+        if adaptive is not None:
+            # Imported here so the adaptive module is only loaded when it is used.
+            from meilisearch_python_sdk.adaptive import send_adaptive
+
+            return send_adaptive(
+                self.http_client,
+                documents,
+                adaptive,
+                send,
+                json_handler=self._json_handler,
+                gate=gate,
+            )
+
+        results = []
+        for x in batch(documents, batch_size):
+            if gate is not None:
+                gate.wait()
+            results.append(send(x))
+
+        return results
 
     def update_documents_from_directory(
         self,
@@ -1685,6 +2062,7 @@ class Index(BaseIndex):
             document_type: The type of document being added. Accepted types are json, csv, and
                 ndjson. For csv files the first row of the document should be a header row containing
                 the field names, and ever for should have a title.
+                Files of this type compressed with gzip (.gz) or zstd (.zst) are also loaded.
             csv_delimiter: A single ASCII character to specify the delimiter for csv files. This
                 can only be used if the file is a csv file. Defaults to comma.
             combine_documents: If set to True this will combine the documents from all the files
@@ -1715,7 +2093,7 @@ class Index(BaseIndex):
         if combine_documents:
             all_documents = []
             for path in directory.iterdir():
-                if path.suffix == f".{document_type}":
+                if document_suffix(path) == f".{document_type}":
                     documents = _load_documents_from_file(
                         path, csv_delimiter, json_handler=self._json_handler
                     )
@@ -1736,7 +2114,7 @@ class Index(BaseIndex):
 
         responses = []
         for path in directory.iterdir():
-            if path.suffix == f".{document_type}":
+            if document_suffix(path) == f".{document_type}":
                 documents = _load_documents_from_file(
                     path, csv_delimiter, json_handler=self._json_handler
                 )
@@ -1763,9 +2141,12 @@ class Index(BaseIndex):
         custom_metadata: str | None = None,
         document_type: str = "json",
         csv_delimiter: str | None = None,
+        csv_schema: CsvSchema | None = None,
         combine_documents: bool = True,
         skip_creation: bool = False,
         compress: bool = False,
+        checkpoint: Checkpoint | None = None,
+        max_workers: int | None = None,
     ) -> list[TaskInfo]:
         """Load all json files from a directory and update the documents.
 
@@ -1779,13 +2160,23 @@ class Index(BaseIndex):
             document_type: The type of document being added. Accepted types are json, csv, and
                 ndjson. For csv files the first row of the document should be a header row
                 containing the field names, and ever for should have a title.
+                Files of this type compressed with gzip (.gz) or zstd (.zst) are also loaded.
             csv_delimiter: A single ASCII character to specify the delimiter for csv files. This
                 can only be used if the file is a csv file. Defaults to comma.
+            csv_schema: If set the values of csv files are converted to the types of their columns
+                instead of all being strings. Defaults to None.
             combine_documents: If set to True this will combine the documents from all the files
                 before indexing them. Defaults to True.
             skip_creation: When set to true, documents that don't exist in the index are silently
                 ignored rather than created. Default = False.
             compress: If set to True the data will be sent in gzip format. Defaults to False.
+            checkpoint: If set the batches Meilisearch accepted are recorded in the checkpoint file
+                and batches already recorded there are skipped, so an interrupted ingest can be
+                resumed. Defaults to None.
+            max_workers: If set the files are loaded in a pool of this many processes while the
+                documents already loaded are being sent, instead of being loaded one at a time.
+                Only a few files per process are held in memory at once, and if combine_documents
+                is True the combined documents are sent as they are loaded. Defaults to None.
 
         Returns:
             List of update ids to track the action.
@@ -1806,12 +2197,40 @@ class Index(BaseIndex):
         """
         directory = Path(directory_path) if isinstance(directory_path, str) else directory_path
 
+        if max_workers:
+            paths = [x for x in directory.iterdir() if document_suffix(x) == f".{document_type}"]
+            raise_on_no_documents(paths, document_type, directory_path)
+
+            task_infos: list[TaskInfo] = []
+            for documents in load_files_in_processes(
+                paths,
+                csv_delimiter,
+                chunk_size=batch_size * STREAM_CHUNK_BATCHES if combine_documents else None,
+                json_handler=self._json_handler,
+                csv_schema=csv_schema,
+                max_workers=max_workers,
+            ):
+                task_infos += self.update_documents_in_batches(
+                    documents,
+                    batch_size=batch_size,
+                    primary_key=primary_key,
+                    custom_metadata=custom_metadata,
+                    compress=compress,
+                    skip_creation=skip_creation,
+                    checkpoint=checkpoint,
+                )
+
+            return task_infos
+
         if combine_documents:
             all_documents = []
             for path in directory.iterdir():
-                if path.suffix == f".{document_type}":
+                if document_suffix(path) == f".{document_type}":
                     documents = _load_documents_from_file(
-                        path, csv_delimiter, json_handler=self._json_handler
+                        path,
+                        csv_delimiter,
+                        json_handler=self._json_handler,
+                        csv_schema=csv_schema,
                     )
                     all_documents.append(documents)
 
@@ -1826,14 +2245,18 @@ class Index(BaseIndex):
                 custom_metadata=custom_metadata,
                 skip_creation=skip_creation,
                 compress=compress,
+                checkpoint=checkpoint,
             )
 
         responses: list[TaskInfo] = []
 
         for path in directory.iterdir():
-            if path.suffix == f".{document_type}":
+            if document_suffix(path) == f".{document_type}":
                 documents = _load_documents_from_file(
-                    path, csv_delimiter, json_handler=self._json_handler
+                    path,
+                    csv_delimiter,
+                    json_handler=self._json_handler,
+                    csv_schema=csv_schema,
                 )
                 responses.extend(
                     self.update_documents_in_batches(
@@ -1843,6 +2266,7 @@ class Index(BaseIndex):
                         custom_metadata=custom_metadata,
                         skip_creation=skip_creation,
                         compress=compress,
+                        checkpoint=checkpoint,
                     )
                 )
 
@@ -1863,7 +2287,8 @@ class Index(BaseIndex):
         """Add documents in the index from a json file.
 
         Args:
-            file_path: Path to the json file.
+            file_path: Path to the json file. The file can be compressed with gzip (.gz) or zstd
+                (.zst).
             primary_key: The primary key of the documents. This will be ignored if already set.
                 Defaults to None.
             csv_delimiter: A single ASCII character to specify the delimiter for csv files. This
@@ -1907,21 +2332,29 @@ class Index(BaseIndex):
         batch_size: int = 1000,
         primary_key: str | None = None,
         custom_metadata: str | None = None,
+        csv_schema: CsvSchema | None = None,
         skip_creation: bool = False,
         compress: bool = False,
+        checkpoint: Checkpoint | None = None,
     ) -> list[TaskInfo]:
         """Updates documents form a json file in batches to reduce RAM usage with indexing.
 
         Args:
-            file_path: Path to the json file.
+            file_path: Path to the json file. The file can be compressed with gzip (.gz) or zstd
+                (.zst).
             batch_size: The number of documents that should be included in each batch.
                 Defaults to 1000.
             primary_key: The primary key of the documents. This will be ignored if already set.
                 Defaults to None.
             custom_metadata: An arbitrary string accessible via the task. Defaults to None.
+            csv_schema: If set the values of csv files are converted to the types of their columns
+                instead of all being strings. Defaults to None.
             skip_creation: When set to true, documents that don't exist in the index are silently
                 ignored rather than created. Default = False.
             compress: If set to True the data will be sent in gzip format. Defaults to False.
+            checkpoint: If set the batches Meilisearch accepted are recorded in the checkpoint file
+                and batches already recorded there are skipped, so an interrupted ingest can be
+                resumed. Defaults to None.
 
         Returns:
             List of update ids to track the action.
@@ -1938,16 +2371,24 @@ class Index(BaseIndex):
             >>>     index = client.index("movies")
             >>>     index.update_documents_from_file_in_batches(file_path)
         """
-        documents = _load_documents_from_file(file_path, json_handler=self._json_handler)
+        tasks: list[TaskInfo] = []
+        for documents in _load_document_chunks(
+            file_path,
+            chunk_size=batch_size * STREAM_CHUNK_BATCHES,
+            json_handler=self._json_handler,
+            csv_schema=csv_schema,
+        ):
+            tasks += self.update_documents_in_batches(
+                documents,
+                batch_size=batch_size,
+                primary_key=primary_key,
+                custom_metadata=custom_metadata,
+                skip_creation=skip_creation,
+                compress=compress,
+                checkpoint=checkpoint,
+            )
 
-        return self.update_documents_in_batches(
-            documents,
-            batch_size=batch_size,
-            primary_key=primary_key,
-            custom_metadata=custom_metadata,
-            skip_creation=skip_creation,
-            compress=compress,
-        )
+        return tasks
 
     def update_documents_from_raw_file(
         self,
@@ -1966,7 +2407,8 @@ class Index(BaseIndex):
 
         Args:
             file_path: The path to the file to send to Meilisearch. Only csv and ndjson files are
-                allowed.
+                allowed. They can be compressed with gzip (.gz) or zstd (.zst), and gzip files are
+                sent as is without being decompressed.
             primary_key: The primary key of the documents. This will be ignored if already set.
                 Defaults to None.
             csv_delimiter: A single ASCII character to specify the delimiter for csv files. This
@@ -2011,15 +2453,133 @@ class Index(BaseIndex):
         else:
             url = self._documents_url
 
-        with open(upload_path) as f:
-            data = f.read()
+        data = read_raw_file(upload_path)
 
         response = self._http_requests.put(
-            url, body=data, content_type=content_type, compress=compress
+            url,
+            body=data,
+            content_type=content_type,
+            compress=compress,
+            precompressed=compression(upload_path) == "gzip",
         )
 
         return TaskInfo(**self._http_requests.parse_json(response))
 
+    def update_documents_from_arrow(
+        self,
+        data: ArrowData | Path | str,
+        *,
+        batch_size: int = 1000,
+        primary_key: str | None = None,
+        custom_metadata: str | None = None,
+        skip_creation: bool = False,
+        compress: bool = False,
+    ) -> list[TaskInfo]:
+        """Update documents from Arrow data or a Parquet file in batches.
+
+        Each record batch is serialized to NDJSON one column at a time with Arrow compute
+        functions and sent as is, without building a Python dict for each document. Parquet files
+        are read one batch at a time. This requires pyarrow, which can be installed with the
+        `pyarrow` extra.
+
+        Args:
+            data: A pyarrow Table, RecordBatch, RecordBatchReader, an iterable of record batches, or
+                the path to a Parquet file.
+            batch_size: The maximum number of documents that should be included in each batch.
+                Defaults to 1000.
+            primary_key: The primary key of the documents. This will be ignored if already set.
+                Defaults to None.
+            custom_metadata: An arbitrary string accessible via the task. Defaults to None.
+            skip_creation: When set to true, documents that don't exist in the index are silently
+                ignored rather than created. Default = False.
+            compress: If set to True the data will be sent in gzip format. Defaults to False.
+
+        Returns:
+            List of update ids to track the action.
+
+        Raises:
+            ValueError: If pyarrow is not installed.
+            InvalidDocumentError: If a column has binary values.
+            MeilisearchCommunicationError: If there was an error communicating with the server.
+            MeilisearchApiError: If the Meilisearch API returned an error.
+
+        Examples:
+            >>> from meilisearch_python_sdk import Client
+            >>> with Client("http://localhost.com", "masterKey") as client:
+            >>>     index = client.index("movies")
+            >>>     index.update_documents_from_arrow("movies.parquet")
+        """
+        # Imported here so pyarrow is only loaded when it is used.
+        from meilisearch_python_sdk.arrow import iter_ndjson_payloads
+
+        return self._send_payloads(
+            self._http_requests.put,
+            iter_ndjson_payloads(data, batch_size=batch_size, json_handler=self._json_handler),
+            content_type="application/x-ndjson",
+            primary_key=primary_key,
+            custom_metadata=custom_metadata,
+            skip_creation=skip_creation,
+            compress=compress,
+        )
+
+    def update_documents_from_bytes(
+        self,
+        data: bytes | Iterable[bytes],
+        *,
+        content_type: PayloadContentType = "application/x-ndjson",
+        batch_size: int | None = 1000,
+        primary_key: str | None = None,
+        custom_metadata: str | None = None,
+        skip_creation: bool = False,
+        compress: bool = False,
+    ) -> list[TaskInfo]:
+        """Update documents that are already JSON or NDJSON encoded.
+
+        The payloads are sent as is, so documents that arrive encoded, for example from a message
+        queue, do not have to be decoded only to be encoded again. NDJSON payloads are joined, or
+        split on line breaks, into batches of `batch_size` documents, and JSON payloads are each
+        sent in their own request.
+
+        Args:
+            data: One payload, or an iterable of payloads. Each payload is a JSON array or object,
+                or NDJSON with one document per line, depending on `content_type`.
+            content_type: The content type of the payloads, either application/json or
+                application/x-ndjson. Defaults to application/x-ndjson.
+            batch_size: The number of documents in each batch of NDJSON documents, so a payload
+                can be a single document. If set to None each NDJSON payload is sent as is. JSON
+                payloads are always sent as is. Defaults to 1000.
+            primary_key: The primary key of the documents. This will be ignored if already set.
+                Defaults to None.
+            custom_metadata: An arbitrary string accessible via the task. Defaults to None.
+            skip_creation: When set to true, documents that don't exist in the index are silently
+                ignored rather than created. Default = False.
+            compress: If set to True the data will be sent in gzip format. Defaults to False.
+
+        Returns:
+            List of update ids to track the action.
+
+        Raises:
+            ValueError: If the content_type is not supported or the batch_size is less than 1.
+            MeilisearchCommunicationError: If there was an error communicating with the server.
+            MeilisearchApiError: If the Meilisearch API returned an error.
+
+        Examples:
+            >>> from meilisearch_python_sdk import Client
+            >>> messages = [b'{"id": 1, "title": "Movie 1"}', b'{"id": 2, "title": "Movie 2"}']
+            >>> with Client("http://localhost.com", "masterKey") as client:
+            >>>     index = client.index("movies")
+            >>>     index.update_documents_from_bytes(messages)
+        """
+        return self._send_payloads(
+            self._http_requests.put,
+            prepare_payloads(data, content_type, batch_size),
+            content_type=content_type,
+            primary_key=primary_key,
+            custom_metadata=custom_metadata,
+            compress=compress,
+            skip_creation=skip_creation,
+        )
+
     def delete_document(self, document_id: str, *, custom_metadata: str | None = None) -> TaskInfo:
         """Delete one document from the index.
 
@@ -3887,41 +4447,26 @@ def _run_plugins(
     return results
 
 
-def _load_documents_from_file(
+def _load_document_chunks(
     file_path: Path | str,
     csv_delimiter: str | None = None,
     *,
+    chunk_size: int,
     json_handler: BuiltinHandler | OrjsonHandler,
-) -> list[dict[Any, Any]]:
+    csv_schema: CsvSchema | None = None,
+) -> Generator[list[dict[Any, Any]], None, None]:
     if isinstance(file_path, str):
         file_path = Path(file_path)
 
     validate_file_type(file_path)
-
-    if file_path.suffix == ".csv":
-        if (
-            csv_delimiter
-            and len(csv_delimiter) != 1
-            or csv_delimiter
-            and not csv_delimiter.isascii()
-        ):
-            raise ValueError("csv_delimiter must be a single ascii character")
-        with open(file_path) as f:
-            if csv_delimiter:
-                documents = DictReader(f, delimiter=csv_delimiter)
-            else:
-                documents = DictReader(f)
-            return list(documents)
-
-    if file_path.suffix == ".ndjson":
-        with open(file_path) as f:
-            return [json_handler.loads(x) for x in f]
-
-    with open(file_path) as f:
-        data = f.read()
-        documents = json_handler.loads(data)
-
-        if not isinstance(documents, list):
-            raise InvalidDocumentError("Meilisearch requires documents to be in a list")
-
-        return documents
+    validate_csv_delimiter(csv_delimiter)
+
+    with open_document_file(file_path) as f:
+        yield from iter_document_chunks(
+            f,
+            document_suffix(file_path),
+            csv_delimiter,
+            chunk_size=chunk_size,
+            json_handler=json_handler,
+            csv_schema=csv_schema,
+        )
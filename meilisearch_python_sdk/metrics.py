@@ -0,0 +1,636 @@
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from collections.abc import AsyncIterator, Generator, Iterator, Sequence
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+from httpx2 import AsyncBaseTransport, AsyncByteStream, BaseTransport, SyncByteStream
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from httpx2 import Request, Response
+
+    from meilisearch_python_sdk.models.search import SearchResults, SearchResultsFederated
+    from meilisearch_python_sdk.types import JsonDict
+
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+_INDEX_ROUTES: dict[tuple[str, str], str] = {
+    ("GET", "search"): "search",
+    ("POST", "search"): "search",
+    ("POST", "facet-search"): "facet_search",
+    ("GET", "similar"): "search_similar_documents",
+    ("POST", "similar"): "search_similar_documents",
+    ("GET", "documents"): "get_documents",
+    ("POST", "documents"): "add_documents",
+    ("PUT", "documents"): "update_documents",
+    ("DELETE", "documents"): "delete_all_documents",
+    ("GET", "stats"): "get_stats",
+    ("GET", "settings"): "get_settings",
+    ("PATCH", "settings"): "update_settings",
+    ("PUT", "settings"): "update_settings",
+    ("POST", "settings"): "update_settings",
+    ("DELETE", "settings"): "reset_settings",
+}
+
+_DOCUMENT_ROUTES: dict[str, str] = {
+    "delete": "delete_documents_by_filter",
+    "delete-batch": "delete_documents",
+    "edit": "edit_documents",
+    "fetch": "get_documents",
+}
+
+
+def operation_name(method: str, path: str) -> tuple[str, str | None]:
+    """Map an HTTP request to the SDK operation and index it belongs to.
+
+    Args:
+        method: The HTTP method of the request.
+        path: The path of the request url.
+
+    Returns:
+        A tuple of the operation name and the index uid, or None if the request is not for a
+        specific index.
+
+    Examples:
+        >>> from meilisearch_python_sdk.metrics import operation_name
+        >>> operation_name("POST", "/indexes/movies/search")
+        ('search', 'movies')
+    """
+    method = method.upper()
+    parts = [x for x in path.split("/") if x]
+    if not parts:
+        return f"{method.lower()}_root", None
+
+    if "indexes" in parts:
+        parts = parts[parts.index("indexes") + 1 :]
+        if not parts:
+            return ("create_index" if method == "POST" else "get_indexes"), None
+
+        uid, *rest = parts
+        if not rest:
+            if method == "GET":
+                return "get_index", uid
+            if method == "DELETE":
+                return "delete_index", uid
+            return "update_index", uid
+
+        route = rest[0]
+        if route == "documents" and len(rest) > 1:
+            if method == "POST" and rest[1] in _DOCUMENT_ROUTES:
+                return _DOCUMENT_ROUTES[rest[1]], uid
+            return ("delete_document" if method == "DELETE" else "get_document"), uid
+
+        name = _INDEX_ROUTES.get((method, route))
+        if name is None:
+            name = f"{method.lower()}_{route.replace('-', '_')}"
+
+        return name, uid
+
+    root = parts[0]
+    if root == "multi-search":
+        return "multi_search", None
+    if root == "tasks" and len(parts) > 1 and method == "GET":
+        return "get_task", None
+    if root == "batches" and len(parts) > 1 and method == "GET":
+        return "get_batch", None
+
+    return f"{method.lower()}_{root.replace('-', '_')}", None
+
+
+class Histogram:
+    """Fixed bucket histogram for latency observations."""
+
+    __slots__ = ("bounds", "count", "counts", "sum")
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """Class initializer.
+
+        Args:
+            bounds: The upper bounds, in seconds, of the buckets. An implicit +Inf bucket is always
+                included. Defaults to DEFAULT_BUCKETS.
+        """
+        self.bounds = tuple(sorted(bounds))
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative_counts(self) -> list[int]:
+        total = 0
+        cumulative = []
+        for bucket_count in self.counts:
+            total += bucket_count
+            cumulative.append(total)
+
+        return cumulative
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate a quantile from the buckets.
+
+        The estimate uses linear interpolation inside the bucket containing the quantile, the same
+        way Prometheus' histogram_quantile does.
+
+        Args:
+            q: The quantile to estimate, between 0.0 and 1.0.
+
+        Returns:
+            The estimated value, or None if nothing has been observed.
+        """
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("q must be between 0.0 and 1.0")
+
+        if not self.count:
+            return None
+
+        rank = q * self.count
+        lower = 0.0
+        previous = 0
+        for i, cumulative in enumerate(self.cumulative_counts()):
+            if cumulative >= rank and cumulative > 0:
+                if i == len(self.bounds):
+                    # The +Inf bucket has no upper bound so the highest finite bound is the best
+                    # estimate available.
+                    return self.bounds[-1] if self.bounds else self.sum / self.count
+                upper = self.bounds[i]
+                in_bucket = cumulative - previous
+                return lower + (upper - lower) * ((rank - previous) / in_bucket)
+            previous = cumulative
+            lower = self.bounds[i]
+
+        return None  # pragma: no cover
+
+    def to_dict(self) -> JsonDict:
+        buckets: JsonDict = {
+            str(bound): count
+            for bound, count in zip(self.bounds, self.cumulative_counts()[:-1], strict=True)
+        }
+        buckets["+Inf"] = self.count
+
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "buckets": buckets,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+        }
+
+
+class _OperationMetrics:
+    __slots__ = ("bytes_sent", "errors", "histogram", "retries")
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self.histogram = Histogram(bounds)
+        self.errors = 0
+        self.retries = 0
+        self.bytes_sent = 0
+
+
+class MetricsCollector:
+    """Collects latency histograms and counters per operation and index.
+
+    An instance can be passed to the `metrics` parameter of the `AsyncClient` or `Client`, in which
+    case every request sent by the client, and any index created by it, is recorded.
+    """
+
+    def __init__(
+        self, *, buckets: Sequence[float] = DEFAULT_BUCKETS, namespace: str = "meilisearch_sdk"
+    ) -> None:
+        """Class initializer.
+
+        Args:
+            buckets: The upper bounds, in seconds, of the latency histogram buckets. Defaults to
+                DEFAULT_BUCKETS.
+            namespace: The prefix used for the metric names in the Prometheus output. Defaults to
+                meilisearch_sdk.
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.namespace = namespace
+        self._metrics: dict[tuple[str, str | None], _OperationMetrics] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, operation: str, index: str | None) -> _OperationMetrics:
+        key = (operation, index)
+        metrics = self._metrics.get(key)
+        if metrics is None:
+            metrics = _OperationMetrics(self.buckets)
+            self._metrics[key] = metrics
+
+        return metrics
+
+    def observe(
+        self,
+        operation: str,
+        duration: float,
+        *,
+        index: str | None = None,
+        bytes_sent: int = 0,
+        error: bool = False,
+    ) -> None:
+        """Record one completed operation.
+
+        Args:
+            operation: The name of the operation, i.e. search.
+            duration: How long the operation took in seconds.
+            index: The uid of the index the operation was for. Defaults to None.
+            bytes_sent: The size of the request body in bytes. Defaults to 0.
+            error: Set to True if the operation failed. Defaults to False.
+        """
+        with self._lock:
+            metrics = self._get(operation, index)
+            metrics.histogram.observe(duration)
+            metrics.bytes_sent += bytes_sent
+            if error:
+                metrics.errors += 1
+
+    def record_retry(self, operation: str, *, index: str | None = None) -> None:
+        """Record that an operation was sent again.
+
+        Args:
+            operation: The name of the operation, i.e. search.
+            index: The uid of the index the operation was for. Defaults to None.
+        """
+        with self._lock:
+            self._get(operation, index).retries += 1
+
+    @contextmanager
+    def time(self, operation: str, *, index: str | None = None) -> Generator[None, None, None]:
+        """Context manager that records how long the wrapped block takes.
+
+        If the block raises an exception it is recorded as an error and the exception is re-raised.
+
+        Args:
+            operation: The name of the operation, i.e. wait_for_task.
+            index: The uid of the index the operation was for. Defaults to None.
+
+        Examples:
+            >>> from meilisearch_python_sdk.metrics import MetricsCollector
+            >>> metrics = MetricsCollector()
+            >>> with metrics.time("reindex", index="movies"):
+            >>>     ...
+        """
+        start = time.perf_counter()
+        error = False
+        try:
+            yield
+        except BaseException:
+            error = True
+            raise
+        finally:
+            self.observe(operation, time.perf_counter() - start, index=index, error=error)
+
+    def reset(self) -> None:
+        """Clear all recorded metrics."""
+        with self._lock:
+            self._metrics.clear()
+
+    def to_dict(self) -> JsonDict:
+        """Get the recorded metrics as a dictionary.
+
+        Returns:
+            A dictionary keyed by operation name, then by index uid. Operations that are not for a
+            specific index use None as the index key.
+        """
+        result: JsonDict = {}
+        with self._lock:
+            for (operation, index), metrics in sorted(
+                self._metrics.items(), key=lambda x: (x[0][0], x[0][1] or "")
+            ):
+                result.setdefault(operation, {})[index] = {
+                    "latency": metrics.histogram.to_dict(),
+                    "errors": metrics.errors,
+                    "retries": metrics.retries,
+                    "bytes_sent": metrics.bytes_sent,
+                }
+
+        return result
+
+    def to_prometheus(self) -> str:
+        """Render the recorded metrics in the Prometheus text exposition format.
+
+        Returns:
+            The metrics as text that can be returned from a /metrics endpoint.
+        """
+        duration = f"{self.namespace}_request_duration_seconds"
+        counters = (
+            ("errors", f"{self.namespace}_errors_total", "Number of failed operations."),
+            ("retries", f"{self.namespace}_retries_total", "Number of operations sent again."),
+            ("bytes_sent", f"{self.namespace}_sent_bytes_total", "Request body bytes sent."),
+        )
+
+        with self._lock:
+            items = sorted(self._metrics.items(), key=lambda x: (x[0][0], x[0][1] or ""))
+            lines = [
+                f"# HELP {duration} Latency of Meilisearch operations in seconds.",
+                f"# TYPE {duration} histogram",
+            ]
+            for (operation, index), metrics in items:
+                labels = _labels(operation, index)
+                histogram = metrics.histogram
+                for bound, count in zip(
+                    histogram.bounds, histogram.cumulative_counts()[:-1], strict=True
+                ):
+                    lines.append(f'{duration}_bucket{{{labels},le="{bound}"}} {count}')
+                lines.append(f'{duration}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+                lines.append(f"{duration}_sum{{{labels}}} {histogram.sum}")
+                lines.append(f"{duration}_count{{{labels}}} {histogram.count}")
+
+            for attribute, name, help_text in counters:
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} counter")
+                for (operation, index), metrics in items:
+                    lines.append(
+                        f"{name}{{{_labels(operation, index)}}} {getattr(metrics, attribute)}"
+                    )
+
+        return "\n".join(lines) + "\n"
+
+
+class _PerformanceSamples:
+    __slots__ = ("client_ms", "max_samples", "overhead_ms", "server_ms", "stages")
+
+    def __init__(self, max_samples: int) -> None:
+        self.max_samples = max_samples
+        self.stages: dict[str, deque[float]] = {}
+        self.server_ms: deque[float] = deque(maxlen=max_samples)
+        self.client_ms: deque[float] = deque(maxlen=max_samples)
+        self.overhead_ms: deque[float] = deque(maxlen=max_samples)
+
+
+class PerformanceAggregator:
+    """Aggregates search performance traces over many queries.
+
+    Server side timings come from the `performance_details` returned when searching with
+    `show_performance_details=True`, or `processing_time_ms` when no trace is available. When the
+    client side wall time is also recorded the difference between the two is reported as the
+    overhead, i.e. network, serialization, and SDK time.
+
+    Only the most recent `max_samples` values are kept for each index and stage.
+    """
+
+    def __init__(self, *, max_samples: int = 10_000) -> None:
+        """Class initializer.
+
+        Args:
+            max_samples: The maximum number of samples to keep per index and stage. Defaults to
+                10000.
+        """
+        self.max_samples = max_samples
+        self._indexes: dict[str | None, _PerformanceSamples] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        search_results: SearchResults | SearchResultsFederated,
+        *,
+        index: str | None = None,
+        client_ms: float | None = None,
+    ) -> None:
+        """Record the timings from one search.
+
+        Args:
+            search_results: The results of the search.
+            index: The uid of the index that was searched. If not provided the index_uid of the
+                results is used when available, i.e. for multi-search results. Defaults to None.
+            client_ms: The wall time in milliseconds measured by the caller for the search.
+                Defaults to None.
+
+        Examples:
+            >>> import time
+            >>> from meilisearch_python_sdk import AsyncClient
+            >>> from meilisearch_python_sdk.metrics import PerformanceAggregator
+            >>> aggregator = PerformanceAggregator()
+            >>> async with AsyncClient("http://localhost.com", "masterKey") as client:
+            >>>     index = client.index("movies")
+            >>>     start = time.perf_counter()
+            >>>     results = await index.search("Tron", show_performance_details=True)
+            >>>     client_ms = (time.perf_counter() - start) * 1000
+            >>>     aggregator.record(results, index=index.uid, client_ms=client_ms)
+        """
+        if index is None:
+            index = getattr(search_results, "index_uid", None)
+
+        details = search_results.performance_trace
+        server_ms = details.total_ms if details is not None else None
+        if server_ms is None:
+            server_ms = float(search_results.processing_time_ms)
+
+        with self._lock:
+            samples = self._indexes.get(index)
+            if samples is None:
+                samples = _PerformanceSamples(self.max_samples)
+                self._indexes[index] = samples
+
+            if details is not None:
+                for stage, duration in details.durations_ms().items():
+                    stage_samples = samples.stages.get(stage)
+                    if stage_samples is None:
+                        stage_samples = deque(maxlen=self.max_samples)
+                        samples.stages[stage] = stage_samples
+                    stage_samples.append(duration)
+
+            samples.server_ms.append(server_ms)
+            if client_ms is not None:
+                samples.client_ms.append(client_ms)
+                samples.overhead_ms.append(max(client_ms - server_ms, 0.0))
+
+    def reset(self) -> None:
+        """Clear all recorded samples."""
+        with self._lock:
+            self._indexes.clear()
+
+    def summary(self, quantiles: Sequence[float] = (0.5, 0.95)) -> JsonDict:
+        """Summarize the recorded timings.
+
+        Args:
+            quantiles: The quantiles to calculate. Defaults to (0.5, 0.95).
+
+        Returns:
+            A dictionary keyed by index uid containing the quantiles, in milliseconds, for each
+            stage along with the server time, client time, and overhead.
+        """
+        result: JsonDict = {}
+        with self._lock:
+            for index, samples in self._indexes.items():
+                result[index] = {
+                    "stages": {
+                        stage: _summarize(values, quantiles)
+                        for stage, values in sorted(samples.stages.items())
+                    },
+                    "server_ms": _summarize(samples.server_ms, quantiles),
+                    "client_ms": _summarize(samples.client_ms, quantiles),
+                    "overhead_ms": _summarize(samples.overhead_ms, quantiles),
+                }
+
+        return result
+
+
+class _TimedAsyncStream(AsyncByteStream):
+    def __init__(self, stream: Any, on_close: Callable[[], None]) -> None:  # noqa: ANN401
+        self._stream = stream
+        self._on_close = on_close
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for part in self._stream:
+            yield part
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._on_close()
+
+
+class _TimedSyncStream(SyncByteStream):
+    def __init__(self, stream: Any, on_close: Callable[[], None]) -> None:  # noqa: ANN401
+        self._stream = stream
+        self._on_close = on_close
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            self._on_close()
+
+
+class AsyncMetricsTransport(AsyncBaseTransport):
+    """httpx transport that records every request in a MetricsCollector.
+
+    The recorded time covers sending the request through reading the full response body.
+    """
+
+    def __init__(self, transport: AsyncBaseTransport, metrics: MetricsCollector) -> None:
+        self.transport = transport
+        self.metrics = metrics
+
+    async def handle_async_request(self, request: Request) -> Response:
+        operation, index = operation_name(request.method, request.url.path)
+        bytes_sent = int(request.headers.get("content-length", 0))
+        start = time.perf_counter()
+        try:
+            response = await self.transport.handle_async_request(request)
+        except Exception:
+            self.metrics.observe(
+                operation,
+                time.perf_counter() - start,
+                index=index,
+                bytes_sent=bytes_sent,
+                error=True,
+            )
+            raise
+
+        def on_close() -> None:
+            self.metrics.observe(
+                operation,
+                time.perf_counter() - start,
+                index=index,
+                bytes_sent=bytes_sent,
+                error=response.status_code >= 400,
+            )
+
+        if response.is_closed:
+            # The body was already read by the transport so there is nothing left to time.
+            on_close()
+        else:
+            response.stream = _TimedAsyncStream(response.stream, on_close)
+
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class MetricsTransport(BaseTransport):
+    """httpx transport that records every request in a MetricsCollector.
+
+    The recorded time covers sending the request through reading the full response body.
+    """
+
+    def __init__(self, transport: BaseTransport, metrics: MetricsCollector) -> None:
+        self.transport = transport
+        self.metrics = metrics
+
+    def handle_request(self, request: Request) -> Response:
+        operation, index = operation_name(request.method, request.url.path)
+        bytes_sent = int(request.headers.get("content-length", 0))
+        start = time.perf_counter()
+        try:
+            response = self.transport.handle_request(request)
+        except Exception:
+            self.metrics.observe(
+                operation,
+                time.perf_counter() - start,
+                index=index,
+                bytes_sent=bytes_sent,
+                error=True,
+            )
+            raise
+
+        def on_close() -> None:
+            self.metrics.observe(
+                operation,
+                time.perf_counter() - start,
+                index=index,
+                bytes_sent=bytes_sent,
+                error=response.status_code >= 400,
+            )
+
+        if response.is_closed:
+            # The body was already read by the transport so there is nothing left to time.
+            on_close()
+        else:
+            response.stream = _TimedSyncStream(response.stream, on_close)
+
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(operation: str, index: str | None) -> str:
+    return f'operation="{_escape_label(operation)}",index="{_escape_label(index or "")}"'
+
+
+def _percentile(sorted_values: Sequence[float], q: float) -> float:
+    position = (len(sorted_values) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def _summarize(values: Sequence[float], quantiles: Sequence[float]) -> JsonDict:
+    ordered = sorted(values)
+    summary: JsonDict = {"count": len(ordered)}
+    for q in quantiles:
+        summary[f"p{q * 100:g}"] = _percentile(ordered, q) if ordered else None
+
+    return summary
@@ -1,15 +1,52 @@
 from __future__ import annotations
 
-from typing import Generic, Literal, TypeVar
+import re
+from collections.abc import Iterator
+from typing import Any, Generic, Literal, TypeVar
 
 from camel_converter.pydantic_base import CamelBase
-from pydantic import Field, field_validator
+from pydantic import Field, RootModel, field_validator
 
 from meilisearch_python_sdk.errors import MeilisearchError
 from meilisearch_python_sdk.types import Filter, JsonDict, JsonMapping
 
 T = TypeVar("T")
 
+_DURATION_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([a-zµμ]*)\s*$")
+_DURATION_UNITS_MS = {
+    "ns": 1e-6,
+    "µs": 1e-3,
+    "μs": 1e-3,
+    "us": 1e-3,
+    "ms": 1.0,
+    "": 1.0,
+    "s": 1000.0,
+    "m": 60_000.0,
+    "h": 3_600_000.0,
+}
+
+
+def parse_duration_ms(value: Any) -> float | None:  # noqa: ANN401
+    """Convert a Meilisearch duration, i.e. 295.29µs or 3.56ms, to milliseconds.
+
+    Numbers are assumed to already be in milliseconds. None is returned if the value can't be
+    parsed.
+    """
+    if isinstance(value, bool):
+        return None
+
+    if isinstance(value, (int, float)):
+        return float(value)
+
+    if not isinstance(value, str):
+        return None
+
+    match = _DURATION_PATTERN.match(value)
+    if not match or match.group(2) not in _DURATION_UNITS_MS:
+        return None
+
+    return float(match.group(1)) * _DURATION_UNITS_MS[match.group(2)]
+
 
 class FacetHits(CamelBase):
     value: str
@@ -50,6 +87,67 @@ class Personalize(CamelBase):
     user_context: str
 
 
+class PerformanceStage(CamelBase):
+    name: str
+    duration_ms: float | None = None
+
+    @property
+    def path(self) -> list[str]:
+        return self.name.split(" > ")
+
+    @property
+    def depth(self) -> int:
+        return len(self.path) - 1
+
+
+class PerformanceDetails(RootModel[dict[str, Any]]):
+    """The performance trace returned when searching with `show_performance_details`.
+
+    The keys are the stage names reported by Meilisearch, with nested stages separated by " > ",
+    and the values are the durations, i.e. {"search > keyword search": "515.71µs"}. The model can
+    be read like the dictionary Meilisearch returns. Search results keep that dictionary in
+    `performance_details` and return it as this model from `performance_trace`.
+    """
+
+    def __getitem__(self, key: str) -> Any:  # noqa: ANN401
+        return self.root[key]
+
+    def __iter__(self) -> Iterator[str]:  # type: ignore[override]
+        return iter(self.root)
+
+    def __len__(self) -> int:
+        return len(self.root)
+
+    def get(self, key: str, default: Any = None) -> Any:  # noqa: ANN401
+        return self.root.get(key, default)
+
+    def keys(self) -> list[str]:
+        return list(self.root.keys())
+
+    def items(self) -> list[tuple[str, Any]]:
+        return list(self.root.items())
+
+    @property
+    def stages(self) -> list[PerformanceStage]:
+        return [
+            PerformanceStage(name=name, duration_ms=parse_duration_ms(value))
+            for name, value in self.root.items()
+        ]
+
+    def durations_ms(self) -> dict[str, float]:
+        """Get the duration of each stage in milliseconds, skipping values that can't be parsed."""
+        return {x.name: x.duration_ms for x in self.stages if x.duration_ms is not None}
+
+    @property
+    def total_ms(self) -> float | None:
+        """The server side time in milliseconds, calculated from the top level stages."""
+        top_level = [x.duration_ms for x in self.stages if x.depth == 0 and x.duration_ms]
+        if not top_level:
+            return None
+
+        return sum(top_level)
+
+
 class SearchParams(CamelBase):
     index_uid: str
     query: str | None = Field(None, alias="q")
@@ -108,6 +206,14 @@ class SearchResults(CamelBase, Generic[T]):
     query_vector: list[float] | None = None
     performance_details: JsonDict | None = None
 
+    @property
+    def performance_trace(self) -> PerformanceDetails | None:
+        """The performance details parsed into stages and durations in milliseconds."""
+        if self.performance_details is None:
+            return None
+
+        return PerformanceDetails(self.performance_details)
+
 
 class SearchResultsWithUID(SearchResults, Generic[T]):
     index_uid: str
@@ -127,6 +233,15 @@ class SearchResultsFederated(CamelBase, Generic[T]):
     hits_per_page: int | None = None
     semantic_hit_count: int | None = None
     facets_by_index: JsonDict | None = None
+    performance_details: JsonDict | None = None
+
+    @property
+    def performance_trace(self) -> PerformanceDetails | None:
+        """The performance details parsed into stages and durations in milliseconds."""
+        if self.performance_details is None:
+            return None
+
+        return PerformanceDetails(self.performance_details)
 
 
 class SimilarSearchResults(CamelBase, Generic[T]):
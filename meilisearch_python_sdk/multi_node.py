@@ -0,0 +1,656 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import threading
+import time
+from collections.abc import Sequence
+from functools import partial
+from typing import TYPE_CHECKING, Literal
+
+from httpx2 import URL, AsyncBaseTransport, BaseTransport, Request, Timeout, TransportError
+
+from meilisearch_python_sdk._client._async_client import AsyncClient
+from meilisearch_python_sdk._client._client import Client
+from meilisearch_python_sdk.errors import MeilisearchCircuitOpenError
+from meilisearch_python_sdk.metrics import operation_name
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+    from ssl import SSLContext
+
+    from httpx2 import Response
+
+    from meilisearch_python_sdk.circuit_breaker import CircuitBreaker
+    from meilisearch_python_sdk.governor import Governor
+    from meilisearch_python_sdk.hedging import Hedging
+    from meilisearch_python_sdk.json_handler import BuiltinHandler, OrjsonHandler
+    from meilisearch_python_sdk.metrics import MetricsCollector
+    from meilisearch_python_sdk.slow_log import SlowOperationLogger
+    from meilisearch_python_sdk.transport import TransportConfig
+    from meilisearch_python_sdk.types import JsonDict
+
+DEFAULT_READ_OPERATIONS: frozenset[str] = frozenset(
+    ("facet_search", "get_document", "get_documents", "multi_search", "search")
+)
+
+_EWMA_ALPHA = 0.3
+_RETRYABLE_STATUS_CODES = frozenset((502, 503, 504))
+_PROBE_EXTENSION = "meilisearch_probe"
+
+
+class Node:
+    """The routing state of a single Meilisearch node."""
+
+    __slots__ = (
+        "consecutive_failures",
+        "ejected_until",
+        "ewma_ms",
+        "host",
+        "outstanding",
+        "prefix",
+        "probing",
+        "requests",
+        "url",
+    )
+
+    def __init__(self, url: str) -> None:
+        self.url = URL(url)
+        self.host = self.url.netloc.decode("ascii")
+        self.prefix = self.url.raw_path.split(b"?")[0].rstrip(b"/")
+        self.outstanding = 0
+        self.ewma_ms = 0.0
+        self.consecutive_failures = 0
+        self.ejected_until: float | None = None
+        self.probing = False
+        self.requests = 0
+
+    @property
+    def healthy(self) -> bool:
+        return self.ejected_until is None
+
+    def to_dict(self) -> JsonDict:
+        return {
+            "url": str(self.url),
+            "healthy": self.healthy,
+            "outstanding": self.outstanding,
+            "ewma_ms": round(self.ewma_ms, 3),
+            "requests": self.requests,
+            "consecutive_failures": self.consecutive_failures,
+        }
+
+
+class NodeRouter:
+    """Routes reads across replicas and writes to the primary.
+
+    Read operations are sent to the healthy replica with the fewest outstanding requests
+    (`least_outstanding`), or with the lowest latency EWMA weighted by its outstanding requests
+    (`ewma`). All other operations are sent to the primary. If no replica is healthy reads fall
+    back to the primary.
+
+    A node that fails `max_failures` times in a row, either with a connection error or a 502, 503,
+    or 504 response, is ejected for `eject_seconds`. After that the next request starts a probe of
+    the `/health` endpoint in the background, and the node is added back once the probe finds it
+    available, or ejected again if not. Requests only read the routing state, so they never wait
+    for a probe.
+    """
+
+    def __init__(
+        self,
+        primary_url: str,
+        replica_urls: Sequence[str],
+        *,
+        strategy: Literal["least_outstanding", "ewma"] = "least_outstanding",
+        read_operations: Collection[str] = DEFAULT_READ_OPERATIONS,
+        read_from_primary: bool = False,
+        max_failures: int = 3,
+        eject_seconds: float = 10.0,
+        probe_timeout: float = 2.0,
+    ) -> None:
+        """Class initializer.
+
+        Args:
+            primary_url: The url of the primary node that receives writes.
+            replica_urls: The urls of the replicas that serve reads.
+            strategy: How replicas are chosen, either `least_outstanding` or `ewma`. Defaults to
+                least_outstanding.
+            read_operations: The operations routed to replicas. Defaults to
+                DEFAULT_READ_OPERATIONS, search, facet_search, multi_search, get_document, and
+                get_documents.
+            read_from_primary: If True the primary also serves reads. Defaults to False.
+            max_failures: Consecutive failures before a node is ejected. Defaults to 3.
+            eject_seconds: Seconds a node is ejected before it is probed. Defaults to 10.0.
+            probe_timeout: Timeout in seconds of the health probe. Defaults to 2.0.
+
+        Raises:
+            ValueError: If the strategy is not valid or max_failures is less than 1.
+        """
+        if strategy not in ("least_outstanding", "ewma"):
+            raise ValueError("strategy must be least_outstanding or ewma")
+
+        if max_failures < 1:
+            raise ValueError("max_failures must be at least 1")
+
+        self.primary = Node(primary_url)
+        self.replicas = [Node(x) for x in replica_urls]
+        self.strategy = strategy
+        self.read_operations = frozenset(read_operations)
+        self.read_from_primary = read_from_primary
+        self.max_failures = max_failures
+        self.eject_seconds = eject_seconds
+        self.probe_timeout = probe_timeout
+        self._readers = [*self.replicas, self.primary] if read_from_primary else self.replicas
+        self._rotation = itertools.count()
+        self._lock = threading.Lock()
+
+    @property
+    def nodes(self) -> list[Node]:
+        return [self.primary, *self.replicas]
+
+    def is_read(self, request: Request) -> bool:
+        operation, _ = operation_name(request.method, request.url.path)
+        return operation in self.read_operations
+
+    def read_candidates(self) -> list[Node]:
+        """The nodes to try for a read, in order of preference."""
+        with self._lock:
+            healthy = [x for x in self._readers if x.healthy]
+            if healthy:
+                # Rotating the nodes spreads ties between them.
+                offset = next(self._rotation) % len(healthy)
+                healthy = healthy[offset:] + healthy[:offset]
+
+            if self.strategy == "ewma":
+                healthy.sort(key=lambda x: x.ewma_ms * (x.outstanding + 1))
+            else:
+                healthy.sort(key=lambda x: x.outstanding)
+
+        if self.primary not in healthy:
+            healthy.append(self.primary)
+
+        return healthy
+
+    def probes_due(self) -> list[Node]:
+        """Ejected nodes that are ready to be probed, the nodes are marked as probing."""
+        now = time.monotonic()
+        due = []
+        with self._lock:
+            for node in self.nodes:
+                if (
+                    node.ejected_until is not None
+                    and node.ejected_until <= now
+                    and not node.probing
+                ):
+                    node.probing = True
+                    due.append(node)
+
+        return due
+
+    def probe_request(self, node: Node) -> Request:
+        return Request(
+            "GET",
+            node.url.copy_with(raw_path=node.prefix + b"/health"),
+            extensions={"timeout": Timeout(self.probe_timeout).as_dict()},
+        )
+
+    def probe_result(self, node: Node, response_body: bytes | None) -> bool:
+        try:
+            available = (
+                response_body is not None and json.loads(response_body).get("status") == "available"
+            )
+        except ValueError:
+            available = False
+
+        with self._lock:
+            node.probing = False
+            if available:
+                node.ejected_until = None
+                node.consecutive_failures = 0
+            else:
+                node.ejected_until = time.monotonic() + self.eject_seconds
+
+        return available
+
+    def route(self, request: Request, node: Node, path: bytes) -> None:
+        """Point the request at a node."""
+        request.url = request.url.copy_with(
+            scheme=node.url.scheme,
+            host=node.url.host,
+            port=node.url.port,
+            raw_path=node.prefix + path,
+        )
+        request.headers["Host"] = node.host
+
+    def relative_path(self, request: Request) -> bytes:
+        path = request.url.raw_path
+        if self.primary.prefix and path.startswith(self.primary.prefix):
+            return path[len(self.primary.prefix) :]
+
+        return path
+
+    def start(self, node: Node) -> None:
+        with self._lock:
+            node.outstanding += 1
+            node.requests += 1
+
+    def finish(self, node: Node, elapsed_ms: float, *, failed: bool) -> None:
+        with self._lock:
+            node.outstanding -= 1
+            if failed:
+                node.consecutive_failures += 1
+                if node.consecutive_failures >= self.max_failures and node.healthy:
+                    node.ejected_until = time.monotonic() + self.eject_seconds
+                return
+
+            node.consecutive_failures = 0
+            if node.ewma_ms == 0.0:
+                node.ewma_ms = elapsed_ms
+            else:
+                node.ewma_ms = _EWMA_ALPHA * elapsed_ms + (1 - _EWMA_ALPHA) * node.ewma_ms
+
+    def stats(self) -> list[JsonDict]:
+        with self._lock:
+            return [x.to_dict() for x in self.nodes]
+
+
+class AsyncRoutingTransport(AsyncBaseTransport):
+    """httpx transport that sends requests to the node chosen by a NodeRouter."""
+
+    def __init__(self, transport: AsyncBaseTransport, router: NodeRouter) -> None:
+        self.transport = transport
+        self.router = router
+        # References to the running probes so they are not garbage collected before they finish.
+        self._probes: set[asyncio.Task[bool]] = set()
+
+    async def probe(self, node: Node) -> bool:
+        try:
+            response = await self.transport.handle_async_request(self.router.probe_request(node))
+            body = await response.aread() if response.status_code == 200 else None
+            await response.aclose()
+        except (TransportError, MeilisearchCircuitOpenError):
+            body = None
+
+        return self.router.probe_result(node, body)
+
+    def _probe_done(self, node: Node, task: asyncio.Task[bool]) -> None:
+        self._probes.discard(task)
+        # A probe that was cancelled, possibly before it started, or that failed unexpectedly
+        # counts as unavailable so the node is probed again later.
+        if task.cancelled() or task.exception() is not None:
+            self.router.probe_result(node, None)
+
+    async def handle_async_request(self, request: Request) -> Response:
+        if request.extensions.get(_PROBE_EXTENSION):
+            return await self.transport.handle_async_request(request)
+
+        for node in self.router.probes_due():
+            task = asyncio.create_task(self.probe(node))
+            self._probes.add(task)
+            task.add_done_callback(partial(self._probe_done, node))
+
+        path = self.router.relative_path(request)
+        if not self.router.is_read(request):
+            return await self._send(request, self.router.primary, path)
+
+        candidates = self.router.read_candidates()
+        for i, node in enumerate(candidates):
+            try:
+                return await self._send(request, node, path)
+            except (TransportError, MeilisearchCircuitOpenError):
+                # Reads are safe to retry on the next node.
+                if i == len(candidates) - 1:
+                    raise
+
+        raise RuntimeError("No nodes available")  # pragma: no cover
+
+    async def _send(self, request: Request, node: Node, path: bytes) -> Response:
+        self.router.route(request, node, path)
+        self.router.start(node)
+        start = time.perf_counter()
+        try:
+            response = await self.transport.handle_async_request(request)
+        except TransportError:
+            self.router.finish(node, 0.0, failed=True)
+            raise
+        except BaseException:
+            self.router.finish(node, 0.0, failed=False)
+            raise
+
+        self.router.finish(
+            node,
+            (time.perf_counter() - start) * 1000,
+            failed=response.status_code in _RETRYABLE_STATUS_CODES,
+        )
+
+        return response
+
+    async def aclose(self) -> None:
+        for task in self._probes:
+            task.cancel()
+        await asyncio.gather(*self._probes, return_exceptions=True)
+        await self.transport.aclose()
+
+
+class RoutingTransport(BaseTransport):
+    """httpx transport that sends requests to the node chosen by a NodeRouter."""
+
+    def __init__(self, transport: BaseTransport, router: NodeRouter) -> None:
+        self.transport = transport
+        self.router = router
+
+    def probe(self, node: Node) -> bool:
+        try:
+            response = self.transport.handle_request(self.router.probe_request(node))
+            body = response.read() if response.status_code == 200 else None
+            response.close()
+        except (TransportError, MeilisearchCircuitOpenError):
+            body = None
+
+        return self.router.probe_result(node, body)
+
+    def _probe_in_background(self, node: Node) -> None:
+        try:
+            self.probe(node)
+        except Exception:
+            # A probe that failed unexpectedly counts as unavailable so the node is probed again
+            # later.
+            self.router.probe_result(node, None)
+            raise
+
+    def handle_request(self, request: Request) -> Response:
+        if request.extensions.get(_PROBE_EXTENSION):
+            return self.transport.handle_request(request)
+
+        for node in self.router.probes_due():
+            threading.Thread(
+                target=self._probe_in_background,
+                args=(node,),
+                name="meilisearch-probe",
+                daemon=True,
+            ).start()
+
+        path = self.router.relative_path(request)
+        if not self.router.is_read(request):
+            return self._send(request, self.router.primary, path)
+
+        candidates = self.router.read_candidates()
+        for i, node in enumerate(candidates):
+            try:
+                return self._send(request, node, path)
+            except (TransportError, MeilisearchCircuitOpenError):
+                # Reads are safe to retry on the next node.
+                if i == len(candidates) - 1:
+                    raise
+
+        raise RuntimeError("No nodes available")  # pragma: no cover
+
+    def _send(self, request: Request, node: Node, path: bytes) -> Response:
+        self.router.route(request, node, path)
+        self.router.start(node)
+        start = time.perf_counter()
+        try:
+            response = self.transport.handle_request(request)
+        except TransportError:
+            self.router.finish(node, 0.0, failed=True)
+            raise
+        except BaseException:
+            self.router.finish(node, 0.0, failed=False)
+            raise
+
+        self.router.finish(
+            node,
+            (time.perf_counter() - start) * 1000,
+            failed=response.status_code in _RETRYABLE_STATUS_CODES,
+        )
+
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncMultiNodeClient(AsyncClient):
+    """Async client that spreads reads across Meilisearch replicas.
+
+    Writes, tasks, settings, and every other operation that is not a read are sent to the primary.
+    Indexes created from the client use the same routing.
+    """
+
+    def __init__(
+        self,
+        primary_url: str,
+        replica_urls: Sequence[str],
+        api_key: str | None = None,
+        *,
+        strategy: Literal["least_outstanding", "ewma"] = "least_outstanding",
+        read_operations: Collection[str] = DEFAULT_READ_OPERATIONS,
+        read_from_primary: bool = False,
+        max_failures: int = 3,
+        eject_seconds: float = 10.0,
+        timeout: int | None = None,
+        verify: bool | SSLContext = True,
+        custom_headers: dict[str, str] | None = None,
+        json_handler: BuiltinHandler | OrjsonHandler | None = None,
+        http2: bool = False,
+        metrics: MetricsCollector | None = None,
+        slow_log: SlowOperationLogger | None = None,
+        transport_config: TransportConfig | None = None,
+        hedging: Hedging | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        governor: Governor | None = None,
+    ) -> None:
+        """Class initializer.
+
+        Args:
+            primary_url: The url of the primary node that receives writes.
+            replica_urls: The urls of the replicas that serve reads.
+            api_key: The optional API key for Meilisearch. Defaults to None.
+            strategy: How replicas are chosen for reads, either `least_outstanding` or `ewma`.
+                Defaults to least_outstanding.
+            read_operations: The operations routed to replicas. Defaults to
+                DEFAULT_READ_OPERATIONS.
+            read_from_primary: If True the primary also serves reads. Defaults to False.
+            max_failures: Consecutive failures before a node is ejected. Defaults to 3.
+            eject_seconds: Seconds a node is ejected before it is probed. Defaults to 10.0.
+            timeout: The amount of time in seconds that the client will wait for a response before
+                timing out. Defaults to None.
+            verify: SSL certificates (a.k.a CA bundle) used to
+                verify the identity of requested hosts. Either `True` (default CA bundle),
+                a path to an SSL certificate file, or `False` (disable verification)
+            custom_headers: Custom headers to add when sending data to Meilisearch. Defaults to
+                None.
+            json_handler: The module to use for json operations. Defaults to OrjsonHandler if
+                orjson is installed or BuiltinHandler if not.
+            http2: Whether or not to use HTTP/2. Defaults to False.
+            metrics: If provided the requests made by the client are recorded in the collector.
+                Defaults to None.
+            slow_log: If provided slow operations are logged. Defaults to None.
+            transport_config: Connection pool and timeout settings. The pool limits apply across
+                all nodes. Defaults to None.
+            hedging: If provided slow searches and multi-searches are hedged by sending a second
+                request to the least busy node. Defaults to None.
+            circuit_breaker: If provided each node has its own circuits, and reads skip nodes with
+                an open circuit. Defaults to None.
+            governor: If provided requests wait for the governor's rate and concurrency limits
+                before being sent. The limits apply across all nodes. Defaults to None.
+
+        Examples:
+            >>> from meilisearch_python_sdk.multi_node import AsyncMultiNodeClient
+            >>> async with AsyncMultiNodeClient(
+            >>>     "http://primary:7700",
+            >>>     ["http://replica-1:7700", "http://replica-2:7700"],
+            >>>     "masterKey",
+            >>> ) as client:
+            >>>     index = client.index("movies")
+            >>>     await index.search("Tron")
+        """
+        self.router = NodeRouter(
+            primary_url,
+            replica_urls,
+            strategy=strategy,
+            read_operations=read_operations,
+            read_from_primary=read_from_primary,
+            max_failures=max_failures,
+            eject_seconds=eject_seconds,
+        )
+        super().__init__(
+            primary_url,
+            api_key,
+            timeout=timeout,
+            verify=verify,
+            custom_headers=custom_headers,
+            json_handler=json_handler,
+            http2=http2,
+            metrics=metrics,
+            slow_log=slow_log,
+            transport_config=transport_config,
+            router=self.router,
+            hedging=hedging,
+            circuit_breaker=circuit_breaker,
+            governor=governor,
+        )
+
+    async def check_nodes(self) -> dict[str, bool]:
+        """Probe every node with the health endpoint and update the routing.
+
+        Returns:
+            A dictionary of node urls and whether or not they are available.
+        """
+        result = {}
+        for node in self.router.nodes:
+            request = self.router.probe_request(node)
+            request.extensions[_PROBE_EXTENSION] = True
+            try:
+                response = await self.http_client.send(request)
+                body = response.content if response.status_code == 200 else None
+            except (TransportError, MeilisearchCircuitOpenError):
+                body = None
+            result[str(node.url)] = self.router.probe_result(node, body)
+
+        return result
+
+    def node_stats(self) -> list[JsonDict]:
+        """The routing state of every node, the primary is first."""
+        return self.router.stats()
+
+
+class MultiNodeClient(Client):
+    """Client that spreads reads across Meilisearch replicas.
+
+    Writes, tasks, settings, and every other operation that is not a read are sent to the primary.
+    Indexes created from the client use the same routing.
+    """
+
+    def __init__(
+        self,
+        primary_url: str,
+        replica_urls: Sequence[str],
+        api_key: str | None = None,
+        *,
+        strategy: Literal["least_outstanding", "ewma"] = "least_outstanding",
+        read_operations: Collection[str] = DEFAULT_READ_OPERATIONS,
+        read_from_primary: bool = False,
+        max_failures: int = 3,
+        eject_seconds: float = 10.0,
+        timeout: int | None = None,
+        verify: bool | SSLContext = True,
+        custom_headers: dict[str, str] | None = None,
+        json_handler: BuiltinHandler | OrjsonHandler | None = None,
+        http2: bool = False,
+        metrics: MetricsCollector | None = None,
+        slow_log: SlowOperationLogger | None = None,
+        transport_config: TransportConfig | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        governor: Governor | None = None,
+    ) -> None:
+        """Class initializer.
+
+        Args:
+            primary_url: The url of the primary node that receives writes.
+            replica_urls: The urls of the replicas that serve reads.
+            api_key: The optional API key for Meilisearch. Defaults to None.
+            strategy: How replicas are chosen for reads, either `least_outstanding` or `ewma`.
+                Defaults to least_outstanding.
+            read_operations: The operations routed to replicas. Defaults to
+                DEFAULT_READ_OPERATIONS.
+            read_from_primary: If True the primary also serves reads. Defaults to False.
+            max_failures: Consecutive failures before a node is ejected. Defaults to 3.
+            eject_seconds: Seconds a node is ejected before it is probed. Defaults to 10.0.
+            timeout: The amount of time in seconds that the client will wait for a response before
+                timing out. Defaults to None.
+            verify: SSL certificates (a.k.a CA bundle) used to
+                verify the identity of requested hosts. Either `True` (default CA bundle),
+                a path to an SSL certificate file, or `False` (disable verification)
+            custom_headers: Custom headers to add when sending data to Meilisearch. Defaults to
+                None.
+            json_handler: The module to use for json operations. Defaults to OrjsonHandler if
+                orjson is installed or BuiltinHandler if not.
+            http2: Whether or not to use HTTP/2. Defaults to False.
+            metrics: If provided the requests made by the client are recorded in the collector.
+                Defaults to None.
+            slow_log: If provided slow operations are logged. Defaults to None.
+            transport_config: Connection pool and timeout settings. The pool limits apply across
+                all nodes. Defaults to None.
+            circuit_breaker: If provided each node has its own circuits, and reads skip nodes with
+                an open circuit. Defaults to None.
+            governor: If provided requests wait for the governor's rate and concurrency limits
+                before being sent. The limits apply across all nodes. Defaults to None.
+
+        Examples:
+            >>> from meilisearch_python_sdk.multi_node import MultiNodeClient
+            >>> with MultiNodeClient(
+            >>>     "http://primary:7700",
+            >>>     ["http://replica-1:7700", "http://replica-2:7700"],
+            >>>     "masterKey",
+            >>> ) as client:
+            >>>     index = client.index("movies")
+            >>>     index.search("Tron")
+        """
+        self.router = NodeRouter(
+            primary_url,
+            replica_urls,
+            strategy=strategy,
+            read_operations=read_operations,
+            read_from_primary=read_from_primary,
+            max_failures=max_failures,
+            eject_seconds=eject_seconds,
+        )
+        super().__init__(
+            primary_url,
+            api_key,
+            timeout=timeout,
+            verify=verify,
+            custom_headers=custom_headers,
+            json_handler=json_handler,
+            http2=http2,
+            metrics=metrics,
+            slow_log=slow_log,
+            transport_config=transport_config,
+            router=self.router,
+            circuit_breaker=circuit_breaker,
+            governor=governor,
+        )
+
+    def check_nodes(self) -> dict[str, bool]:
+        """Probe every node with the health endpoint and update the routing.
+
+        Returns:
+            A dictionary of node urls and whether or not they are available.
+        """
+        result = {}
+        for node in self.router.nodes:
+            request = self.router.probe_request(node)
+            request.extensions[_PROBE_EXTENSION] = True
+            try:
+                response = self.http_client.send(request)
+                body = response.content if response.status_code == 200 else None
+            except (TransportError, MeilisearchCircuitOpenError):
+                body = None
+            result[str(node.url)] = self.router.probe_result(node, body)
+
+        return result
+
+    def node_stats(self) -> list[JsonDict]:
+        """The routing state of every node, the primary is first."""
+        return self.router.stats()
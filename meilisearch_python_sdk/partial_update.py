@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple
+
+from meilisearch_python_sdk.errors import InvalidDocumentError
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from meilisearch_python_sdk.index.async_index import AsyncIndex
+    from meilisearch_python_sdk.index.index import Index
+    from meilisearch_python_sdk.models.task import TaskInfo
+    from meilisearch_python_sdk.types import JsonDict, JsonMapping
+
+
+class PartialUpdateResult(NamedTuple):
+    """The outcome of sending only the changed fields of documents.
+
+    updated: The number of documents sent with only their changed fields, including new documents
+        which are sent in full.
+    replaced: The number of documents sent in full because a field was removed.
+    unchanged: The number of documents that were not sent because nothing changed.
+    tasks: The tasks for the documents that were sent.
+    """
+
+    updated: int
+    replaced: int
+    unchanged: int
+    tasks: list[TaskInfo]
+
+
+def field_diff(
+    previous: JsonMapping | None, current: JsonMapping, primary_key: str
+) -> JsonDict | None:
+    """The top level fields of a document that changed, along with its primary key.
+
+    Meilisearch replaces a top level field as a whole when a document is updated, so nested
+    objects are compared as a whole.
+
+    Args:
+        previous: The previous version of the document, or None if it is new.
+        current: The new version of the document.
+        primary_key: The primary key of the document.
+
+    Returns:
+        None if nothing changed, otherwise the primary key and the fields that are new or changed.
+        If the document is new all of its fields are returned.
+
+    Examples:
+        >>> from meilisearch_python_sdk.partial_update import field_diff
+        >>> previous = {"id": 1, "title": "Old", "genre": "comedy"}
+        >>> field_diff(previous, {"id": 1, "title": "New", "genre": "comedy"}, "id")
+        {'id': 1, 'title': 'New'}
+    """
+    if previous is None:
+        return dict(current)
+
+    changed = {k: v for k, v in current.items() if k not in previous or previous[k] != v}
+    if not changed:
+        return None
+
+    return {primary_key: current[primary_key], **changed}
+
+
+def _key(document: JsonMapping, primary_key: str) -> str:
+    if primary_key not in document:
+        raise InvalidDocumentError(f"Document is missing the primary key {primary_key}: {document}")
+
+    return str(document[primary_key])
+
+
+class _Split:
+    def __init__(self) -> None:
+        self.partial: list[JsonMapping] = []
+        self.full: list[JsonMapping] = []
+        self.unchanged = 0
+
+    def add(
+        self,
+        documents: Sequence[JsonMapping],
+        previous: Mapping[str, JsonMapping],
+        primary_key: str,
+    ) -> None:
+        for document in documents:
+            old = previous.get(_key(document, primary_key))
+            if old is not None and any(x not in document for x in old):
+                # A removed field can only be dropped by replacing the whole document.
+                self.full.append(document)
+                continue
+
+            diff = field_diff(old, document, primary_key)
+            if diff is None:
+                self.unchanged += 1
+            else:
+                self.partial.append(diff)
+
+
+def _chunks(items: Sequence[JsonMapping], size: int) -> list[Sequence[JsonMapping]]:
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+async def async_update_changed_fields(
+    index: AsyncIndex,
+    documents: Sequence[JsonMapping],
+    *,
+    primary_key: str | None = None,
+    previous: Mapping[str, JsonMapping] | None = None,
+    batch_size: int = 1000,
+    concurrency_limit: int | None = None,
+) -> PartialUpdateResult:
+    """Send only the fields of each document that changed since its previous version.
+
+    Each document is compared with its previous version, and only its primary key and the top
+    level fields that are new or changed are sent with `update_documents_in_batches`. Documents
+    that did not change are not sent. A document that no longer has a field it used to have is
+    sent in full with `add_documents_in_batches`, because an update cannot remove a field.
+
+    Args:
+        index: The index to update.
+        documents: The new versions of the documents.
+        primary_key: The primary key of the documents. Defaults to None, in which case the primary
+            key of the index is used.
+        previous: The previous versions of the documents keyed by their primary key as a string,
+            for example from a local store. Defaults to None, in which case the previous versions
+            are fetched from the index with `get_documents` one batch at a time.
+        batch_size: The number of documents that should be included in each batch, and in each
+            fetch of previous versions. Defaults to 1000.
+        concurrency_limit: If set this will limit the number of batches that will be sent
+            concurrently. Defaults to None.
+
+    Returns:
+        The number of documents updated, replaced, and unchanged, and the tasks.
+
+    Raises:
+        InvalidDocumentError: If a document does not have the primary key.
+        ValueError: If no primary key is given and the index does not have one.
+        MeilisearchCommunicationError: If there was an error communicating with the server.
+        MeilisearchApiError: If the Meilisearch API returned an error.
+
+    Examples:
+        >>> from meilisearch_python_sdk import AsyncClient
+        >>> from meilisearch_python_sdk.partial_update import async_update_changed_fields
+        >>> async with AsyncClient("http://localhost.com", "masterKey") as client:
+        >>>     index = client.index("movies")
+        >>>     await async_update_changed_fields(index, documents, primary_key="id")
+    """
+    primary_key = primary_key or await index.get_primary_key()
+    if primary_key is None:
+        raise ValueError("A primary_key is required when the index does not have one")
+
+    split = _Split()
+    for chunk in _chunks(documents, batch_size):
+        if previous is None:
+            fetched = await index.get_documents(
+                ids=[_key(x, primary_key) for x in chunk], limit=len(chunk)
+            )
+            split.add(chunk, {str(x[primary_key]): x for x in fetched.results}, primary_key)
+        else:
+            split.add(chunk, previous, primary_key)
+
+    tasks: list[TaskInfo] = []
+    if split.partial:
+        tasks += await index.update_documents_in_batches(
+            split.partial,
+            batch_size=batch_size,
+            primary_key=primary_key,
+            concurrency_limit=concurrency_limit,
+        )
+    if split.full:
+        tasks += await index.add_documents_in_batches(
+            split.full,
+            batch_size=batch_size,
+            primary_key=primary_key,
+            concurrency_limit=concurrency_limit,
+        )
+
+    return PartialUpdateResult(
+        updated=len(split.partial),
+        replaced=len(split.full),
+        unchanged=split.unchanged,
+        tasks=tasks,
+    )
+
+
+def update_changed_fields(
+    index: Index,
+    documents: Sequence[JsonMapping],
+    *,
+    primary_key: str | None = None,
+    previous: Mapping[str, JsonMapping] | None = None,
+    batch_size: int = 1000,
+) -> PartialUpdateResult:
+    """Send only the fields of each document that changed since its previous version.
+
+    Each document is compared with its previous version, and only its primary key and the top
+    level fields that are new or changed are sent with `update_documents_in_batches`. Documents
+    that did not change are not sent. A document that no longer has a field it used to have is
+    sent in full with `add_documents_in_batches`, because an update cannot remove a field.
+
+    Args:
+        index: The index to update.
+        documents: The new versions of the documents.
+        primary_key: The primary key of the documents. Defaults to None, in which case the primary
+            key of the index is used.
+        previous: The previous versions of the documents keyed by their primary key as a string,
+            for example from a local store. Defaults to None, in which case the previous versions
+            are fetched from the index with `get_documents` one batch at a time.
+        batch_size: The number of documents that should be included in each batch, and in each
+            fetch of previous versions. Defaults to 1000.
+
+    Returns:
+        The number of documents updated, replaced, and unchanged, and the tasks.
+
+    Raises:
+        InvalidDocumentError: If a document does not have the primary key.
+        ValueError: If no primary key is given and the index does not have one.
+        MeilisearchCommunicationError: If there was an error communicating with the server.
+        MeilisearchApiError: If the Meilisearch API returned an error.
+
+    Examples:
+        >>> from meilisearch_python_sdk import Client
+        >>> from meilisearch_python_sdk.partial_update import update_changed_fields
+        >>> client = Client("http://localhost.com", "masterKey")
+        >>> index = client.index("movies")
+        >>> update_changed_fields(index, documents, primary_key="id")
+    """
+    primary_key = primary_key or index.get_primary_key()
+    if primary_key is None:
+        raise ValueError("A primary_key is required when the index does not have one")
+
+    split = _Split()
+    for chunk in _chunks(documents, batch_size):
+        if previous is None:
+            fetched = index.get_documents(
+                ids=[_key(x, primary_key) for x in chunk], limit=len(chunk)
+            )
+            split.add(chunk, {str(x[primary_key]): x for x in fetched.results}, primary_key)
+        else:
+            split.add(chunk, previous, primary_key)
+
+    tasks: list[TaskInfo] = []
+    if split.partial:
+        tasks += index.update_documents_in_batches(
+            split.partial, batch_size=batch_size, primary_key=primary_key
+        )
+    if split.full:
+        tasks += index.add_documents_in_batches(
+            split.full, batch_size=batch_size, primary_key=primary_key
+        )
+
+    return PartialUpdateResult(
+        updated=len(split.partial),
+        replaced=len(split.full),
+        unchanged=split.unchanged,
+        tasks=tasks,
+    )
@@ -0,0 +1,519 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import heapq
+from collections.abc import Awaitable, Sequence
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, TypeVar
+
+from meilisearch_python_sdk._utils import use_task_groups
+from meilisearch_python_sdk.errors import InvalidDocumentError
+from meilisearch_python_sdk.models.search import SearchResults
+
+if TYPE_CHECKING:
+    import sys
+
+    from meilisearch_python_sdk._client import AsyncClient
+    from meilisearch_python_sdk.index import AsyncIndex
+    from meilisearch_python_sdk.models.search import Hybrid
+    from meilisearch_python_sdk.models.settings import MeilisearchSettings
+    from meilisearch_python_sdk.models.task import TaskInfo, TaskResult
+    from meilisearch_python_sdk.types import Filter, JsonDict, JsonMapping
+
+    if sys.version_info >= (3, 11):
+        from typing import Self
+    else:
+        from typing_extensions import Self
+
+T = TypeVar("T")
+
+
+class ShardTask(NamedTuple):
+    """A task enqueued on one shard.
+
+    shard: The position of the shard's client in the sharded index.
+    task: The task information returned by the shard.
+    """
+
+    shard: int
+    task: TaskInfo
+
+
+async def _gather(coroutines: Sequence[Awaitable[T]]) -> list[T]:
+    if not use_task_groups():
+        return list(await asyncio.gather(*coroutines))
+
+    async with asyncio.TaskGroup() as tg:  # type: ignore[attr-defined]
+        tasks = [tg.create_task(x) for x in coroutines]  # type: ignore[arg-type]
+
+    return [x.result() for x in tasks]
+
+
+def shard_for(document_id: str | int, shards: int) -> int:
+    """Get the shard a document belongs to.
+
+    The shard is chosen from a hash of the document id that is stable across processes and
+    Python versions, so the same document is always routed to the same shard.
+
+    Args:
+        document_id: The primary key value of the document.
+        shards: The number of shards.
+
+    Returns:
+        The position of the shard.
+
+    Examples:
+        >>> from meilisearch_python_sdk.sharding import shard_for
+        >>> shard_for("tron", 3)
+    """
+    digest = hashlib.blake2b(str(document_id).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % shards
+
+
+def merge_search_results(
+    results: Sequence[SearchResults], *, offset: int, limit: int, keep_ranking_score: bool
+) -> SearchResults:
+    """Merge the search results from multiple shards into one result.
+
+    Each shard's hits must be sorted by ranking score and include `_rankingScore`. Hits are merged
+    by `_rankingScore`, facet distributions and the estimated total hits are summed, and facet
+    stats are combined.
+
+    Args:
+        results: The search results from each shard.
+        offset: The number of hits to skip.
+        limit: The maximum number of hits to return.
+        keep_ranking_score: If False `_rankingScore` is removed from the hits.
+
+    Returns:
+        The merged search results.
+    """
+    merged = heapq.merge(*(x.hits for x in results), key=lambda hit: -hit.get("_rankingScore", 0.0))
+    hits = []
+    for i, hit in enumerate(merged):
+        if i >= offset + limit:
+            break
+        if i >= offset:
+            kept = hit
+            if not keep_ranking_score:
+                kept = {k: v for k, v in hit.items() if k != "_rankingScore"}
+            hits.append(kept)
+
+    facet_distribution: JsonDict | None = None
+    facet_stats: JsonDict | None = None
+    estimated_total_hits = None
+    semantic_hit_count = None
+    for result in results:
+        if result.estimated_total_hits is not None:
+            estimated_total_hits = (estimated_total_hits or 0) + result.estimated_total_hits
+
+        if result.semantic_hit_count is not None:
+            semantic_hit_count = (semantic_hit_count or 0) + result.semantic_hit_count
+
+        if result.facet_distribution is not None:
+            facet_distribution = facet_distribution or {}
+            for facet, values in result.facet_distribution.items():
+                counts = facet_distribution.setdefault(facet, {})
+                for value, count in values.items():
+                    counts[value] = counts.get(value, 0) + count
+
+        if result.facet_stats is not None:
+            facet_stats = facet_stats or {}
+            for facet, stats in result.facet_stats.items():
+                if facet not in facet_stats:
+                    facet_stats[facet] = dict(stats)
+                else:
+                    facet_stats[facet]["min"] = min(facet_stats[facet]["min"], stats["min"])
+                    facet_stats[facet]["max"] = max(facet_stats[facet]["max"], stats["max"])
+
+    return SearchResults(
+        hits=hits,
+        offset=offset,
+        limit=limit,
+        estimated_total_hits=estimated_total_hits,
+        processing_time_ms=max((x.processing_time_ms for x in results), default=0),
+        query=results[0].query if results else "",
+        facet_distribution=facet_distribution,
+        facet_stats=facet_stats,
+        semantic_hit_count=semantic_hit_count,
+    )
+
+
+class AsyncShardedIndex:
+    """One logical index split across multiple Meilisearch instances.
+
+    Each document is stored on a single shard chosen by a hash of its primary key. Searches are
+    sent to every shard concurrently and the hits are merged by `_rankingScore`. Because of this
+    `sort` and page based pagination are not supported, and `distinct` is only applied within each
+    shard.
+
+    Examples:
+        >>> from meilisearch_python_sdk import AsyncClient
+        >>> from meilisearch_python_sdk.sharding import AsyncShardedIndex
+        >>> clients = [
+        >>>     AsyncClient("http://shard-1:7700", "masterKey"),
+        >>>     AsyncClient("http://shard-2:7700", "masterKey"),
+        >>> ]
+        >>> index = AsyncShardedIndex(clients, "movies", primary_key="id")
+        >>> tasks = await index.add_documents([{"id": 1, "title": "Tron"}])
+        >>> await index.wait_for_tasks(tasks)
+        >>> results = await index.search("Tron")
+    """
+
+    def __init__(self, clients: Sequence[AsyncClient], uid: str, *, primary_key: str) -> None:
+        """Class initializer.
+
+        Args:
+            clients: A client for each shard. The order of the clients must not change once
+                documents have been added because it determines which shard a document is on.
+            uid: The index's unique identifier, this is the same on every shard.
+            primary_key: The primary key of the documents.
+
+        Raises:
+            ValueError: If no clients are provided.
+        """
+        if not clients:
+            raise ValueError("At least one client is required")
+
+        self.clients = list(clients)
+        self.uid = uid
+        self.primary_key = primary_key
+        self.indexes: list[AsyncIndex] = [x.index(uid) for x in self.clients]
+
+    @classmethod
+    async def create(
+        cls,
+        clients: Sequence[AsyncClient],
+        uid: str,
+        primary_key: str,
+        *,
+        settings: MeilisearchSettings | None = None,
+        wait: bool = True,
+        timeout_in_ms: int | None = None,
+    ) -> Self:
+        """Create the index on every shard.
+
+        Args:
+            clients: A client for each shard.
+            uid: The index's unique identifier.
+            primary_key: The primary key of the documents.
+            settings: Settings for the index. Defaults to None.
+            wait: If set to True and settings are being updated, the index will be returned after
+                the settings update has completed on every shard. Defaults to True.
+            timeout_in_ms: Amount of time in milliseconds to wait before raising a
+                MeilisearchTimeoutError. Defaults to None.
+
+        Returns:
+            An instance of AsyncShardedIndex.
+
+        Raises:
+            MeilisearchCommunicationError: If there was an error communicating with the server.
+            MeilisearchApiError: If the Meilisearch API returned an error.
+        """
+        await _gather(
+            [
+                x.create_index(
+                    uid, primary_key, settings=settings, wait=wait, timeout_in_ms=timeout_in_ms
+                )
+                for x in clients
+            ]
+        )
+
+        return cls(clients, uid, primary_key=primary_key)
+
+    def shard_for(self, document_id: str | int) -> int:
+        """Get the position of the shard a document belongs to."""
+        return shard_for(document_id, len(self.indexes))
+
+    def _split(self, documents: Sequence[JsonMapping]) -> list[list[JsonMapping]]:
+        shards: list[list[JsonMapping]] = [[] for _ in self.indexes]
+        for document in documents:
+            try:
+                document_id = document[self.primary_key]
+            except KeyError as e:
+                raise InvalidDocumentError(
+                    f"Document is missing the primary key {self.primary_key}"
+                ) from e
+            shards[self.shard_for(document_id)].append(document)
+
+        return shards
+
+    async def add_documents(
+        self, documents: Sequence[JsonMapping], *, compress: bool = False
+    ) -> list[ShardTask]:
+        """Add documents, each document is sent to its shard.
+
+        Args:
+            documents: List of documents.
+            compress: If set to True the data will be sent in gzip format. Defaults to False.
+
+        Returns:
+            The task for each shard that received documents.
+
+        Raises:
+            InvalidDocumentError: If a document does not have the primary key.
+            MeilisearchCommunicationError: If there was an error communicating with the server.
+            MeilisearchApiError: If the Meilisearch API returned an error.
+        """
+        shards = [(i, x) for i, x in enumerate(self._split(documents)) if x]
+        tasks = await _gather(
+            [
+                self.indexes[i].add_documents(x, self.primary_key, compress=compress)
+                for i, x in shards
+            ]
+        )
+
+        return [ShardTask(i, task) for (i, _), task in zip(shards, tasks, strict=True)]
+
+    async def update_documents(
+        self, documents: Sequence[JsonMapping], *, compress: bool = False
+    ) -> list[ShardTask]:
+        """Update documents, each document is sent to its shard.
+
+        Args:
+            documents: List of documents.
+            compress: If set to True the data will be sent in gzip format. Defaults to False.
+
+        Returns:
+            The task for each shard that received documents.
+
+        Raises:
+            InvalidDocumentError: If a document does not have the primary key.
+            MeilisearchCommunicationError: If there was an error communicating with the server.
+            MeilisearchApiError: If the Meilisearch API returned an error.
+        """
+        shards = [(i, x) for i, x in enumerate(self._split(documents)) if x]
+        tasks = await _gather(
+            [
+                self.indexes[i].update_documents(x, self.primary_key, compress=compress)
+                for i, x in shards
+            ]
+        )
+
+        return [ShardTask(i, task) for (i, _), task in zip(shards, tasks, strict=True)]
+
+    async def get_document(self, document_id: str | int) -> JsonDict:
+        """Get one document from its shard.
+
+        Args:
+            document_id: Unique identifier of the document.
+
+        Returns:
+            The document.
+
+        Raises:
+            MeilisearchCommunicationError: If there was an error communicating with the server.
+            MeilisearchApiError: If the Meilisearch API returned an error.
+        """
+        return await self.indexes[self.shard_for(document_id)].get_document(str(document_id))
+
+    async def delete_document(self, document_id: str | int) -> ShardTask:
+        """Delete one document from its shard.
+
+        Args:
+            document_id: Unique identifier of the document.
+
+        Returns:
+            The task of the shard the document was deleted from.
+
+        Raises:
+            MeilisearchCommunicationError: If there was an error communicating with the server.
+            MeilisearchApiError: If the Meilisearch API returned an error.
+        """
+        shard = self.shard_for(document_id)
+        task = await self.indexes[shard].delete_document(str(document_id))
+
+        return ShardTask(shard, task)
+
+    async def delete_documents(self, ids: Sequence[str | int]) -> list[ShardTask]:
+        """Delete documents from their shards.
+
+        Args:
+            ids: List of unique identifiers of documents.
+
+        Returns:
+            The task for each shard documents were deleted from.
+
+        Raises:
+            MeilisearchCommunicationError: If there was an error communicating with the server.
+            MeilisearchApiError: If the Meilisearch API returned an error.
+        """
+        shards: list[list[str]] = [[] for _ in self.indexes]
+        for document_id in ids:
+            shards[self.shard_for(document_id)].append(str(document_id))
+
+        used = [(i, x) for i, x in enumerate(shards) if x]
+        tasks = await _gather([self.indexes[i].delete_documents(x) for i, x in used])
+
+        return [ShardTask(i, task) for (i, _), task in zip(used, tasks, strict=True)]
+
+    async def update_settings(self, body: MeilisearchSettings) -> list[ShardTask]:
+        """Update the settings on every shard.
+
+        Args:
+            body: Settings of the index.
+
+        Returns:
+            The task for each shard.
+
+        Raises:
+            MeilisearchCommunicationError: If there was an error communicating with the server.
+            MeilisearchApiError: If the Meilisearch API returned an error.
+        """
+        tasks = await _gather([x.update_settings(body) for x in self.indexes])
+
+        return [ShardTask(i, task) for i, task in enumerate(tasks)]
+
+    async def delete(self) -> list[ShardTask]:
+        """Delete the index from every shard.
+
+        Returns:
+            The task for each shard.
+
+        Raises:
+            MeilisearchCommunicationError: If there was an error communicating with the server.
+            MeilisearchApiError: If the Meilisearch API returned an error.
+        """
+        tasks = await _gather([x.delete() for x in self.indexes])
+
+        return [ShardTask(i, task) for i, task in enumerate(tasks)]
+
+    async def wait_for_tasks(
+        self,
+        tasks: Sequence[ShardTask],
+        *,
+        timeout_in_ms: int | None = 5000,
+        interval_in_ms: int = 50,
+        raise_for_status: bool = False,
+    ) -> list[TaskResult]:
+        """Wait for tasks on their shards to complete.
+
+        Args:
+            tasks: The shard tasks to wait for.
+            timeout_in_ms: Amount of time in milliseconds to wait before raising a
+                MeilisearchTimeoutError. Defaults to 5000.
+            interval_in_ms: Time interval in milliseconds to sleep between requests. Defaults to
+                50.
+            raise_for_status: When set to `True` a MeilisearchTaskFailedError will be raised if a
+                task has a failed status. Defaults to False.
+
+        Returns:
+            The result of each task.
+
+        Raises:
+            MeilisearchCommunicationError: If there was an error communicating with the server.
+            MeilisearchApiError: If the Meilisearch API returned an error.
+            MeilisearchTimeoutError: If the connection times out.
+            MeilisearchTaskFailedError: If `raise_for_status` is `True` and a task fails.
+        """
+        return await _gather(
+            [
+                self.clients[x.shard].wait_for_task(
+                    x.task.task_uid,
+                    timeout_in_ms=timeout_in_ms,
+                    interval_in_ms=interval_in_ms,
+                    raise_for_status=raise_for_status,
+                )
+                for x in tasks
+            ]
+        )
+
+    async def search(
+        self,
+        query: str | None = None,
+        *,
+        offset: int = 0,
+        limit: int = 20,
+        filter: Filter | None = None,
+        facets: list[str] | None = None,
+        attributes_to_retrieve: list[str] | None = None,
+        attributes_to_crop: list[str] | None = None,
+        crop_length: int = 200,
+        attributes_to_highlight: list[str] | None = None,
+        show_matches_position: bool = False,
+        highlight_pre_tag: str = "<em>",
+        highlight_post_tag: str = "</em>",
+        crop_marker: str = "...",
+        matching_strategy: Literal["all", "last", "frequency"] = "last",
+        attributes_to_search_on: list[str] | None = None,
+        distinct: str | None = None,
+        show_ranking_score: bool = False,
+        ranking_score_threshold: float | None = None,
+        vector: list[float] | None = None,
+        hybrid: Hybrid | None = None,
+        locales: list[str] | None = None,
+        retrieve_vectors: bool | None = None,
+    ) -> SearchResults:
+        """Search every shard and merge the results.
+
+        Each shard is asked for `offset + limit` hits, then the hits are merged by ranking score
+        and `offset` and `limit` are applied to the merged hits.
+
+        Args:
+            query: String containing the word(s) to search
+            offset: Number of documents to skip. Defaults to 0.
+            limit: Maximum number of documents returned. Defaults to 20.
+            filter: Filter queries by an attribute value. Defaults to None.
+            facets: Facets for which to retrieve the matching count. Defaults to None.
+            attributes_to_retrieve: Attributes to display in the returned documents.
+                Defaults to ["*"].
+            attributes_to_crop: Attributes whose values have to be cropped. Defaults to None.
+            crop_length: The maximum number of words to display. Defaults to 200.
+            attributes_to_highlight: Attributes whose values will contain highlighted matching terms.
+                Defaults to None.
+            show_matches_position: Defines whether an object that contains information about the
+                matches should be returned or not. Defaults to False.
+            highlight_pre_tag: The opening tag for highlighting text. Defaults to <em>.
+            highlight_post_tag: The closing tag for highlighting text. Defaults to </em>
+            crop_marker: Marker to display when the number of words exceeds the `crop_length`.
+                Defaults to ...
+            matching_strategy: Specifies the matching strategy Meilisearch should use. Defaults to
+                `last`.
+            attributes_to_search_on: List of field names. Allow search over a subset of searchable
+                attributes without modifying the index settings. Defaults to None.
+            distinct: If set the distinct value will return at most one result for the filterable
+                attribute on each shard. Defaults to None.
+            show_ranking_score: If set to True the ranking score will be returned with each
+                document in the search. Defaults to False.
+            ranking_score_threshold: If set, no document whose _rankingScore is under the
+                rankingScoreThreshold is returned. Defaults to None.
+            vector: List of vectors for vector search. Defaults to None.
+            hybrid: Hybrid search information. Defaults to None.
+            locales: Specifies the languages for the search. Defaults to None.
+            retrieve_vectors: Return document vector data with search result.
+
+        Returns:
+            The merged results of the search.
+
+        Raises:
+            MeilisearchCommunicationError: If there was an error communicating with the server.
+            MeilisearchApiError: If the Meilisearch API returned an error.
+        """
+        search_params: dict[str, Any] = {
+            "offset": 0,
+            "limit": offset + limit,
+            "filter": filter,
+            "facets": facets,
+            "attributes_to_retrieve": attributes_to_retrieve,
+            "attributes_to_crop": attributes_to_crop,
+            "crop_length": crop_length,
+            "attributes_to_highlight": attributes_to_highlight,
+            "show_matches_position": show_matches_position,
+            "highlight_pre_tag": highlight_pre_tag,
+            "highlight_post_tag": highlight_post_tag,
+            "crop_marker": crop_marker,
+            "matching_strategy": matching_strategy,
+            "attributes_to_search_on": attributes_to_search_on,
+            "distinct": distinct,
+            "show_ranking_score": True,
+            "ranking_score_threshold": ranking_score_threshold,
+            "vector": vector,
+            "hybrid": hybrid,
+            "locales": locales,
+            "retrieve_vectors": retrieve_vectors,
+        }
+        results = await _gather([x.search(query, **search_params) for x in self.indexes])
+
+        return merge_search_results(
+            results, offset=offset, limit=limit, keep_ranking_score=show_ranking_score
+        )
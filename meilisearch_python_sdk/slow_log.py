@@ -0,0 +1,400 @@
+from __future__ import annotations
+
+import json
+import logging
+import random
+import re
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
+from typing import TYPE_CHECKING, Any
+
+from httpx2 import AsyncBaseTransport, AsyncByteStream, BaseTransport, SyncByteStream
+
+from meilisearch_python_sdk.metrics import operation_name
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Collection
+
+    from httpx2 import Request, Response
+
+    from meilisearch_python_sdk.types import JsonDict
+
+DEFAULT_SLOW_OPERATIONS: frozenset[str] = frozenset(
+    (
+        "add_documents",
+        "delete_all_documents",
+        "delete_document",
+        "delete_documents",
+        "delete_documents_by_filter",
+        "edit_documents",
+        "facet_search",
+        "get_document",
+        "get_documents",
+        "multi_search",
+        "search",
+        "search_similar_documents",
+        "update_documents",
+    )
+)
+
+_MASKED_KEYS = frozenset(("q", "facetQuery"))
+_FILTER_LITERAL = re.compile(r"(\"[^\"]*\"|'[^']*'|(?<![\w.])-?\d+(?:\.\d+)?(?![\w.]))")
+
+_logger = logging.getLogger(__name__)
+
+
+def normalize_body(
+    body: bytes, content_type: str = "application/json", max_length: int = 500
+) -> str:
+    """Reduce a request body to its shape so similar requests can be grouped together.
+
+    Search text and literals in filters are replaced with `?`, vectors are replaced with their
+    length, and for documents only the number of documents and the fields of the first document
+    are kept. The result is truncated to `max_length` characters.
+
+    Args:
+        body: The raw request body.
+        content_type: The content type of the body. Defaults to application/json.
+        max_length: The maximum length of the returned string. Defaults to 500.
+
+    Returns:
+        The normalized body.
+
+    Examples:
+        >>> from meilisearch_python_sdk.slow_log import normalize_body
+        >>> normalize_body(b'{"q": "tron", "filter": "year > 1980"}')
+        '{"filter": "year > ?", "q": "?"}'
+    """
+    if not body:
+        normalized = ""
+    elif "json" not in content_type or "ndjson" in content_type:
+        normalized = f"<{len(body)} bytes {content_type}>"
+    else:
+        try:
+            normalized = json.dumps(_normalize(json.loads(body)), sort_keys=True)
+        except ValueError:
+            normalized = f"<{len(body)} bytes {content_type}>"
+
+    if len(normalized) > max_length:
+        return f"{normalized[:max_length]}..."
+
+    return normalized
+
+
+def _normalize(value: Any, key: str | None = None) -> Any:  # noqa: ANN401
+    if isinstance(value, list):
+        if key is None:
+            # A top level list is a batch of documents or document ids.
+            first = value[0] if value else None
+            return {
+                "documents": len(value),
+                "fields": sorted(first) if isinstance(first, dict) else None,
+            }
+        if key == "vector":
+            return f"<vector {len(value)}>"
+        return [_normalize(x, key) for x in value]
+
+    if isinstance(value, dict):
+        return {k: _normalize(v, k) for k, v in value.items()}
+
+    if key in _MASKED_KEYS and value is not None:
+        return "?"
+
+    if key == "filter" and isinstance(value, str):
+        return _FILTER_LITERAL.sub("?", value)
+
+    return value
+
+
+class SlowOperationLogger:
+    """Logs operations that take longer than a threshold.
+
+    An instance can be passed to the `slow_log` parameter of the `AsyncClient` or `Client`. Each
+    slow operation is logged with its operation name, index, normalized request body, request and
+    response sizes, and a timing breakdown. The full record is also attached to the log record as
+    the `meilisearch` attribute so it can be used by structured log handlers.
+
+    Sampling keeps the logging cost bounded at high request rates. `sample_rate` is the fraction of
+    slow operations that are logged, and `max_per_second` caps how many are logged each second.
+    """
+
+    def __init__(
+        self,
+        *,
+        threshold_ms: float = 500,
+        sample_rate: float = 1.0,
+        max_per_second: float | None = None,
+        max_body_length: int = 500,
+        operations: Collection[str] | None = DEFAULT_SLOW_OPERATIONS,
+        logger: logging.Logger | None = None,
+        level: int = logging.WARNING,
+    ) -> None:
+        """Class initializer.
+
+        Args:
+            threshold_ms: Operations that take at least this many milliseconds are logged.
+                Defaults to 500.
+            sample_rate: The fraction, between 0.0 and 1.0, of slow operations to log. Defaults to
+                1.0.
+            max_per_second: If set no more than this many slow operations are logged per second.
+                Defaults to None.
+            max_body_length: The maximum length of the normalized request body. Defaults to 500.
+            operations: The operations that can be logged. Setting this to None logs all
+                operations. Defaults to DEFAULT_SLOW_OPERATIONS, the search and document operations.
+            logger: The logger to use. Defaults to the meilisearch_python_sdk.slow_log logger.
+            level: The level to log at. Defaults to logging.WARNING.
+        """
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0.0 and 1.0")
+
+        if max_per_second is not None and max_per_second <= 0:
+            raise ValueError("max_per_second must be greater than 0")
+
+        self.threshold_ms = threshold_ms
+        self.sample_rate = sample_rate
+        self.max_per_second = max_per_second
+        self.max_body_length = max_body_length
+        self.operations = frozenset(operations) if operations is not None else None
+        self.logger = logger or _logger
+        self.level = level
+        self._tokens = max_per_second or 0.0
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def is_tracked(self, operation: str) -> bool:
+        return self.operations is None or operation in self.operations
+
+    def _sampled(self) -> bool:
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return False
+
+        if self.max_per_second is None:
+            return True
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                max(self.max_per_second, 1.0),
+                self._tokens + (now - self._last_refill) * self.max_per_second,
+            )
+            self._last_refill = now
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+
+        return True
+
+    def record(
+        self,
+        *,
+        operation: str,
+        index: str | None,
+        status_code: int | None,
+        request_body: bytes,
+        request_bytes: int,
+        content_type: str,
+        response_bytes: int,
+        time_to_headers_ms: float,
+        total_ms: float,
+    ) -> JsonDict | None:
+        """Log an operation if it is slow and selected by sampling.
+
+        Returns:
+            The logged record, or None if nothing was logged.
+        """
+        if total_ms < self.threshold_ms or not self._sampled():
+            return None
+
+        slow_record: JsonDict = {
+            "operation": operation,
+            "index": index,
+            "status_code": status_code,
+            "body": normalize_body(request_body, content_type, self.max_body_length),
+            "request_bytes": request_bytes,
+            "response_bytes": response_bytes,
+            "timing_ms": {
+                "total": round(total_ms, 3),
+                "time_to_headers": round(time_to_headers_ms, 3),
+                "body_read": round(total_ms - time_to_headers_ms, 3),
+            },
+        }
+        self.logger.log(
+            self.level,
+            "Slow Meilisearch operation %s on index %s took %.1fms: %s",
+            operation,
+            index,
+            total_ms,
+            slow_record["body"],
+            extra={"meilisearch": slow_record},
+        )
+
+        return slow_record
+
+
+class _SlowLogAsyncStream(AsyncByteStream):
+    def __init__(self, stream: Any, on_close: Callable[[int], None]) -> None:  # noqa: ANN401
+        self._stream = stream
+        self._on_close = on_close
+        self._size = 0
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for part in self._stream:
+            self._size += len(part)
+            yield part
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._on_close(self._size)
+
+
+class _SlowLogSyncStream(SyncByteStream):
+    def __init__(self, stream: Any, on_close: Callable[[int], None]) -> None:  # noqa: ANN401
+        self._stream = stream
+        self._on_close = on_close
+        self._size = 0
+
+    def __iter__(self) -> Iterator[bytes]:
+        for part in self._stream:
+            self._size += len(part)
+            yield part
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            self._on_close(self._size)
+
+
+def _request_details(request: Request) -> tuple[bytes, int, str]:
+    size = int(request.headers.get("content-length", 0))
+    content_type = request.headers.get("content-type", "application/json")
+    if request.headers.get("content-encoding"):
+        # Compressed bodies are not decompressed just for logging.
+        return b"", size, f"{content_type}; {request.headers['content-encoding']}"
+
+    try:
+        body = request.content
+    except Exception:  # pragma: no cover
+        # Streaming request bodies are not read just for logging.
+        body = b""
+
+    return body, size, content_type
+
+
+class AsyncSlowLogTransport(AsyncBaseTransport):
+    """httpx transport that passes the timing of every request to a SlowOperationLogger."""
+
+    def __init__(self, transport: AsyncBaseTransport, slow_log: SlowOperationLogger) -> None:
+        self.transport = transport
+        self.slow_log = slow_log
+
+    async def handle_async_request(self, request: Request) -> Response:
+        operation, index = operation_name(request.method, request.url.path)
+        if not self.slow_log.is_tracked(operation):
+            return await self.transport.handle_async_request(request)
+
+        start = time.perf_counter()
+        try:
+            response = await self.transport.handle_async_request(request)
+        except Exception:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            body, size, content_type = _request_details(request)
+            self.slow_log.record(
+                operation=operation,
+                index=index,
+                status_code=None,
+                request_body=body,
+                request_bytes=size,
+                content_type=content_type,
+                response_bytes=0,
+                time_to_headers_ms=elapsed_ms,
+                total_ms=elapsed_ms,
+            )
+            raise
+
+        time_to_headers_ms = (time.perf_counter() - start) * 1000
+
+        def on_close(response_bytes: int) -> None:
+            body, size, content_type = _request_details(request)
+            self.slow_log.record(
+                operation=operation,
+                index=index,
+                status_code=response.status_code,
+                request_body=body,
+                request_bytes=size,
+                content_type=content_type,
+                response_bytes=response_bytes,
+                time_to_headers_ms=time_to_headers_ms,
+                total_ms=(time.perf_counter() - start) * 1000,
+            )
+
+        if response.is_closed:
+            on_close(len(response.content))
+        else:
+            response.stream = _SlowLogAsyncStream(response.stream, on_close)
+
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class SlowLogTransport(BaseTransport):
+    """httpx transport that passes the timing of every request to a SlowOperationLogger."""
+
+    def __init__(self, transport: BaseTransport, slow_log: SlowOperationLogger) -> None:
+        self.transport = transport
+        self.slow_log = slow_log
+
+    def handle_request(self, request: Request) -> Response:
+        operation, index = operation_name(request.method, request.url.path)
+        if not self.slow_log.is_tracked(operation):
+            return self.transport.handle_request(request)
+
+        start = time.perf_counter()
+        try:
+            response = self.transport.handle_request(request)
+        except Exception:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            body, size, content_type = _request_details(request)
+            self.slow_log.record(
+                operation=operation,
+                index=index,
+                status_code=None,
+                request_body=body,
+                request_bytes=size,
+                content_type=content_type,
+                response_bytes=0,
+                time_to_headers_ms=elapsed_ms,
+                total_ms=elapsed_ms,
+            )
+            raise
+
+        time_to_headers_ms = (time.perf_counter() - start) * 1000
+
+        def on_close(response_bytes: int) -> None:
+            body, size, content_type = _request_details(request)
+            self.slow_log.record(
+                operation=operation,
+                index=index,
+                status_code=response.status_code,
+                request_body=body,
+                request_bytes=size,
+                content_type=content_type,
+                response_bytes=response_bytes,
+                time_to_headers_ms=time_to_headers_ms,
+                total_ms=(time.perf_counter() - start) * 1000,
+            )
+
+        if response.is_closed:
+            on_close(len(response.content))
+        else:
+            response.stream = _SlowLogSyncStream(response.stream, on_close)
+
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, NamedTuple
+
+from httpx2 import AsyncBaseTransport, BaseTransport, Limits, Timeout
+
+from meilisearch_python_sdk.metrics import operation_name
+
+if TYPE_CHECKING:
+    from httpx2 import Request, Response
+
+
+class TransportConfig(NamedTuple):
+    """Connection pool and timeout settings for the AsyncClient and Client.
+
+    The timeouts are in seconds. Any timeout that is not set uses the `timeout` passed to the
+    client. `pool_timeout` is how long a request waits for a free connection when all
+    `max_connections` are in use. Setting it makes an exhausted pool raise a `PoolTimeout` instead
+    of requests queuing without a limit.
+
+    `operation_timeouts` overrides the timeouts for specific operations so, for example, long
+    document uploads and short searches do not share one timeout. The keys are operation names such
+    as `search`, `multi_search`, `add_documents`, and `update_documents` (see
+    `meilisearch_python_sdk.metrics.operation_name`), and the values are either the number of
+    seconds for all timeouts or an `httpx2.Timeout`.
+
+    max_connections: The maximum number of concurrent connections. Defaults to 100.
+    max_keepalive_connections: The maximum number of idle connections kept open. Defaults to 20.
+    keepalive_expiry: Seconds an idle connection is kept open. Defaults to 5.0.
+    connect_timeout: Timeout for establishing a connection. Defaults to None.
+    read_timeout: Timeout for receiving a chunk of the response. Defaults to None.
+    write_timeout: Timeout for sending a chunk of the request. Defaults to None.
+    pool_timeout: Timeout for acquiring a connection from the pool. Defaults to None.
+    operation_timeouts: Timeouts for specific operations. Defaults to None.
+    retries: The number of times to retry failed connection attempts. Defaults to 0.
+
+    Examples:
+        >>> from meilisearch_python_sdk import AsyncClient
+        >>> from meilisearch_python_sdk.transport import TransportConfig
+        >>> config = TransportConfig(
+        >>>     max_connections=500,
+        >>>     pool_timeout=1.0,
+        >>>     operation_timeouts={"search": 2.0, "add_documents": 120.0},
+        >>> )
+        >>> client = AsyncClient("http://localhost.com", "masterKey", transport_config=config)
+    """
+
+    max_connections: int | None = 100
+    max_keepalive_connections: int | None = 20
+    keepalive_expiry: float | None = 5.0
+    connect_timeout: float | None = None
+    read_timeout: float | None = None
+    write_timeout: float | None = None
+    pool_timeout: float | None = None
+    operation_timeouts: Mapping[str, float | Timeout] | None = None
+    retries: int = 0
+
+    def limits(self) -> Limits:
+        return Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def timeout(self, default: float | None) -> Timeout:
+        """Build the client timeout, using `default` for any timeout that is not set."""
+        return Timeout(
+            default,
+            connect=default if self.connect_timeout is None else self.connect_timeout,
+            read=default if self.read_timeout is None else self.read_timeout,
+            write=default if self.write_timeout is None else self.write_timeout,
+            pool=default if self.pool_timeout is None else self.pool_timeout,
+        )
+
+
+def _operation_timeouts(timeouts: Mapping[str, float | Timeout]) -> dict[str, dict]:
+    return {k: (v if isinstance(v, Timeout) else Timeout(v)).as_dict() for k, v in timeouts.items()}
+
+
+def _with_operation_timeout(request: Request, timeouts: dict[str, dict]) -> None:
+    operation, _ = operation_name(request.method, request.url.path)
+    timeout = timeouts.get(operation)
+    if timeout is not None:
+        request.extensions = {**request.extensions, "timeout": timeout}
+
+
+class AsyncOperationTimeoutTransport(AsyncBaseTransport):
+    """httpx transport that applies per operation timeouts to requests."""
+
+    def __init__(
+        self, transport: AsyncBaseTransport, timeouts: Mapping[str, float | Timeout]
+    ) -> None:
+        self.transport = transport
+        self.timeouts = _operation_timeouts(timeouts)
+
+    async def handle_async_request(self, request: Request) -> Response:
+        _with_operation_timeout(request, self.timeouts)
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class OperationTimeoutTransport(BaseTransport):
+    """httpx transport that applies per operation timeouts to requests."""
+
+    def __init__(self, transport: BaseTransport, timeouts: Mapping[str, float | Timeout]) -> None:
+        self.transport = transport
+        self.timeouts = _operation_timeouts(timeouts)
+
+    def handle_request(self, request: Request) -> Response:
+        _with_operation_timeout(request, self.timeouts)
+        return self.transport.handle_request(request)
+
+    def close(self) -> None:
+        self.transport.close()
@@ -0,0 +1,205 @@
+import json
+import logging
+
+import pytest
+from httpx2 import AsyncClient as HttpxAsyncClient
+from httpx2 import Client as HttpxClient
+from httpx2 import MockTransport, Response
+
+from meilisearch_python_sdk.adaptive import AdaptiveBatching
+from meilisearch_python_sdk.index.async_index import AsyncIndex
+from meilisearch_python_sdk.index.index import Index
+
+
+def _server(seconds_per_batch, status="succeeded"):
+    """Mock Meilisearch where every batch takes the same time regardless of its size, so bigger
+    batches index more documents per second.
+    """
+    state = {"tasks": {}, "sizes": []}
+
+    def handler(request):
+        path = request.url.path
+        if request.method in ("POST", "PUT") and path.endswith("/documents"):
+            uid = len(state["tasks"])
+            size = len(json.loads(request.content))
+            state["tasks"][uid] = size
+            state["sizes"].append(size)
+            return Response(
+                202,
+                json={
+                    "taskUid": uid,
+                    "indexUid": "movies",
+                    "status": "enqueued",
+                    "type": "documentAdditionOrUpdate",
+                    "enqueuedAt": "2024-01-01T00:00:00Z",
+                },
+            )
+        if path.startswith("/tasks/"):
+            uid = int(path.rsplit("/", 1)[1])
+            return Response(
+                200,
+                json={
+                    "uid": uid,
+                    "indexUid": "movies",
+                    "status": status,
+                    "type": "documentAdditionOrUpdate",
+                    "enqueuedAt": "2024-01-01T00:00:00Z",
+                    "batchUid": uid,
+                },
+            )
+        if path.startswith("/batches/"):
+            uid = int(path.rsplit("/", 1)[1])
+            return Response(
+                200,
+                json={
+                    "uid": uid,
+                    "details": {"indexedDocuments": state["tasks"][uid]},
+                    "stats": {"totalNbTasks": 1, "status": {"succeeded": 1}},
+                    "startedAt": "2024-01-01T00:00:00Z",
+                    "finishedAt": f"2024-01-01T00:00:{seconds_per_batch:06.3f}Z",
+                },
+            )
+        return Response(404, json={})
+
+    return handler, state
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    (
+        {"min_batch_size": 0},
+        {"initial_batch_size": 10, "min_batch_size": 100},
+        {"initial_batch_size": 1000, "max_batch_size": 500},
+        {"initial_concurrency": 0},
+        {"initial_concurrency": 4, "max_concurrency": 2},
+    ),
+)
+def test_adaptive_invalid(kwargs):
+    with pytest.raises(ValueError):
+        AdaptiveBatching(**kwargs)
+
+
+def test_adaptive_grows_while_improving():
+    adaptive = AdaptiveBatching(initial_batch_size=100, min_batch_size=10, max_batch_size=10_000)
+    adaptive.observe(
+        batch_size=100, concurrency=2, documents=200, processing_seconds=1.0, upload_seconds=0.5
+    )
+    assert adaptive.batch_size == 200
+
+    adaptive.observe(
+        batch_size=200, concurrency=2, documents=400, processing_seconds=1.0, upload_seconds=0.5
+    )
+    assert adaptive.batch_size == 400
+
+
+def test_adaptive_turns_around_and_settles():
+    adaptive = AdaptiveBatching(initial_batch_size=100, min_batch_size=10, max_batch_size=10_000)
+    batch_size = adaptive.batch_size
+    # Throughput peaks at a batch size of 400.
+    for _ in range(20):
+        documents_per_second = 1000 - abs(batch_size - 400)
+        adaptive.observe(
+            batch_size=batch_size,
+            concurrency=1,
+            documents=documents_per_second,
+            processing_seconds=1.0,
+            upload_seconds=0.6,
+            adjust_concurrency=False,
+        )
+        batch_size = adaptive.batch_size
+
+    assert adaptive.settled
+    assert adaptive.batch_size == 400
+    assert adaptive.concurrency == 2
+    assert len(adaptive.history) == 20
+
+
+def test_adaptive_respects_bounds():
+    adaptive = AdaptiveBatching(initial_batch_size=100, min_batch_size=100, max_batch_size=150)
+    adaptive.observe(
+        batch_size=100, concurrency=2, documents=100, processing_seconds=1.0, upload_seconds=0.5
+    )
+
+    assert adaptive.batch_size == 150
+
+
+@pytest.mark.parametrize(
+    "upload_seconds, expected",
+    ((2.0, 3), (0.4, 1), (0.8, 2)),
+)
+def test_adaptive_concurrency(upload_seconds, expected):
+    adaptive = AdaptiveBatching(initial_concurrency=2, max_concurrency=3)
+    adaptive.observe(
+        batch_size=1000,
+        concurrency=2,
+        documents=1000,
+        processing_seconds=1.0,
+        upload_seconds=upload_seconds,
+    )
+
+    assert adaptive.concurrency == expected
+
+
+def test_adaptive_logs(caplog):
+    adaptive = AdaptiveBatching()
+    with caplog.at_level(logging.INFO, logger="meilisearch_python_sdk.adaptive"):
+        adaptive.observe(
+            batch_size=1000, concurrency=2, documents=1000, processing_seconds=1.0, upload_seconds=1
+        )
+
+    assert "batch_size=1000" in caplog.text
+    assert "next batch_size=2000" in caplog.text
+
+
+async def test_async_add_documents_adaptive():
+    handler, state = _server(1.0)
+    adaptive = AdaptiveBatching(initial_batch_size=10, min_batch_size=10, initial_concurrency=1)
+    async with HttpxAsyncClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        index = AsyncIndex(client, "movies")
+        tasks = await index.add_documents_in_batches(
+            [{"id": x} for x in range(300)], adaptive=adaptive
+        )
+
+    assert sum(state["sizes"]) == 300
+    assert len(tasks) == len(state["sizes"])
+    # Each round is measured after the next one is sent so every size is used for two rounds.
+    assert state["sizes"] == [10, 10, 20, 20, 40, 40, 80, 80]
+    assert adaptive.history[0].documents_per_second == 10
+
+
+def test_update_documents_adaptive():
+    handler, state = _server(1.0)
+    adaptive = AdaptiveBatching(initial_batch_size=10, min_batch_size=10)
+    with HttpxClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        index = Index(client, "movies")
+        tasks = index.update_documents_in_batches(
+            [{"id": x} for x in range(100)], adaptive=adaptive
+        )
+
+    # Each round is measured after the next two are sent so every size is used for three rounds.
+    assert state["sizes"] == [10, 10, 10, 20, 20, 20, 10]
+    assert len(tasks) == 7
+
+
+async def test_async_add_documents_adaptive_timeout():
+    handler, state = _server(1.0, status="processing")
+    adaptive = AdaptiveBatching(
+        initial_batch_size=10, min_batch_size=10, initial_concurrency=1, timeout_in_ms=50
+    )
+    async with HttpxAsyncClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        index = AsyncIndex(client, "movies")
+        await index.add_documents_in_batches([{"id": x} for x in range(30)], adaptive=adaptive)
+
+    assert state["sizes"] == [10, 10, 10]
+    assert adaptive.history == []
+
+
+def test_update_documents_adaptive_timeout():
+    handler, state = _server(1.0, status="processing")
+    adaptive = AdaptiveBatching(initial_batch_size=10, min_batch_size=10, timeout_in_ms=50)
+    with HttpxClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        index = Index(client, "movies")
+        index.update_documents_in_batches([{"id": x} for x in range(40)], adaptive=adaptive)
+
+    assert state["sizes"] == [10, 10, 10, 10]
+    assert adaptive.history == []
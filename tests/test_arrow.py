@@ -0,0 +1,236 @@
+import datetime
+import json
+
+import pytest
+from httpx2 import AsyncClient as HttpxAsyncClient
+from httpx2 import Client as HttpxClient
+from httpx2 import MockTransport, Response
+
+from meilisearch_python_sdk.errors import InvalidDocumentError
+from meilisearch_python_sdk.index.async_index import AsyncIndex
+from meilisearch_python_sdk.index.index import Index
+from meilisearch_python_sdk.json_handler import BuiltinHandler, OrjsonHandler
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from meilisearch_python_sdk.arrow import (  # noqa: E402
+    iter_dataframe_batches,
+    iter_ndjson_payloads,
+    record_batch_to_ndjson,
+)
+
+
+def _server():
+    """Mock Meilisearch that records the requests sent."""
+    sent = []
+
+    def handler(request):
+        sent.append(request)
+        return Response(
+            202,
+            json={
+                "taskUid": len(sent),
+                "indexUid": "movies",
+                "status": "enqueued",
+                "type": "documentAdditionOrUpdate",
+                "enqueuedAt": "2024-01-01T00:00:00Z",
+            },
+        )
+
+    return handler, sent
+
+
+def _documents(payload):
+    return [json.loads(x) for x in payload.splitlines()]
+
+
+def test_record_batch_to_ndjson():
+    batch = pa.record_batch(
+        {
+            "id": [1, 2, None],
+            "rating": [8.5, float("nan"), None],
+            "title": ['Say "hi"\\\n', "Amélie", None],
+            "genre": pa.array(["drama", "comedy", "drama"]).dictionary_encode(),
+            "available": [True, False, None],
+            "released": [datetime.datetime(1979, 5, 25, 1, 2, 3)] * 3,
+            "tags": [["a", "b"], [], None],
+            "cast": [{"name": "Ripley"}, None, {"name": "Hanna"}],
+        }
+    )
+
+    assert _documents(record_batch_to_ndjson(batch)) == [
+        {
+            "id": 1,
+            "rating": 8.5,
+            "title": 'Say "hi"\\\n',
+            "genre": "drama",
+            "available": True,
+            "released": "1979-05-25T01:02:03.000000",
+            "tags": ["a", "b"],
+            "cast": {"name": "Ripley"},
+        },
+        {
+            "id": 2,
+            "rating": None,
+            "title": "Amélie",
+            "genre": "comedy",
+            "available": False,
+            "released": "1979-05-25T01:02:03.000000",
+            "tags": [],
+            "cast": None,
+        },
+        {
+            "id": None,
+            "rating": None,
+            "title": None,
+            "genre": "drama",
+            "available": None,
+            "released": "1979-05-25T01:02:03.000000",
+            "tags": None,
+            "cast": {"name": "Hanna"},
+        },
+    ]
+
+
+@pytest.mark.parametrize("json_handler", (BuiltinHandler(), OrjsonHandler()))
+def test_record_batch_to_ndjson_nested_temporal(json_handler):
+    batch = pa.record_batch(
+        {
+            "dates": [[datetime.date(1979, 5, 25)], None],
+            "release": [{"at": datetime.datetime(1979, 5, 25, 1, 2, 3)}, {"at": None}],
+        }
+    )
+
+    assert _documents(record_batch_to_ndjson(batch, json_handler=json_handler)) == [
+        {"dates": ["1979-05-25"], "release": {"at": "1979-05-25T01:02:03"}},
+        {"dates": None, "release": {"at": None}},
+    ]
+
+
+@pytest.mark.parametrize("values", (pa.array([b"a"]), pa.array([[b"a"]], pa.list_(pa.binary()))))
+def test_record_batch_to_ndjson_binary(values):
+    batch = pa.record_batch({"id": [1], "poster": values})
+
+    with pytest.raises(InvalidDocumentError, match="poster"):
+        record_batch_to_ndjson(batch)
+
+
+def test_record_batch_to_ndjson_control_characters():
+    batch = pa.record_batch({"title": pa.array(["a\x01b", "c"], pa.large_string())})
+
+    assert _documents(record_batch_to_ndjson(batch)) == [{"title": "a\x01b"}, {"title": "c"}]
+
+
+def test_record_batch_to_ndjson_slice():
+    batch = pa.record_batch({"id": list(range(5)), "title": [str(x) for x in range(5)]})
+
+    assert record_batch_to_ndjson(batch.slice(3)) == b'{"id":3,"title":"3"}\n{"id":4,"title":"4"}\n'
+
+
+def test_iter_ndjson_payloads_parquet(tmp_path):
+    path = tmp_path / "movies.parquet"
+    pq.write_table(pa.table({"id": list(range(5))}), path)
+
+    payloads = list(iter_ndjson_payloads(path, batch_size=2))
+
+    assert [[x["id"] for x in _documents(p)] for p in payloads] == [[0, 1], [2, 3], [4]]
+
+
+def test_iter_ndjson_payloads_reader():
+    batches = pa.table({"id": list(range(5))}).to_batches(max_chunksize=3)
+    reader = pa.RecordBatchReader.from_batches(batches[0].schema, batches)
+
+    assert [len(_documents(x)) for x in iter_ndjson_payloads(reader, batch_size=2)] == [2, 1, 2]
+
+
+def test_add_documents_from_arrow():
+    handler, sent = _server()
+    with HttpxClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        tasks = Index(client, "movies").add_documents_from_arrow(
+            pa.table({"id": list(range(3))}), batch_size=2, primary_key="id"
+        )
+
+    assert len(tasks) == 2
+    assert [x.method for x in sent] == ["POST", "POST"]
+    assert sent[0].url.params["primaryKey"] == "id"
+    assert sent[0].headers["content-type"] == "application/x-ndjson"
+    assert [_documents(x.content) for x in sent] == [[{"id": 0}, {"id": 1}], [{"id": 2}]]
+
+
+async def test_async_update_documents_from_arrow(tmp_path):
+    path = tmp_path / "movies.parquet"
+    pq.write_table(pa.table({"id": list(range(5))}), path)
+    handler, sent = _server()
+    async with HttpxAsyncClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        tasks = await AsyncIndex(client, "movies").update_documents_from_arrow(
+            path, batch_size=2, skip_creation=True, concurrency_limit=2
+        )
+
+    assert [x.task_uid for x in tasks] == [1, 2, 3]
+    assert {x.method for x in sent} == {"PUT"}
+    assert sent[0].url.params["skipCreation"] == "true"
+    assert [x["id"] for r in sent for x in _documents(r.content)] == [0, 1, 2, 3, 4]
+
+
+def test_iter_dataframe_batches_pandas():
+    pd = pytest.importorskip("pandas")
+    df = pd.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "rating": [8.5, float("nan"), 7.0],
+            "released": pd.to_datetime(["1979-05-25", None, "1995-12-15"]),
+            "genres": [["horror"], [], None],
+        },
+        index=[10, 11, 12],
+    )
+
+    payloads = [record_batch_to_ndjson(x) for x in iter_dataframe_batches(df, batch_size=2)]
+
+    assert [_documents(x) for x in payloads] == [
+        [
+            {
+                "id": 1,
+                "rating": 8.5,
+                "released": "1979-05-25T00:00:00.000000",
+                "genres": ["horror"],
+            },
+            {"id": 2, "rating": None, "released": None, "genres": []},
+        ],
+        [{"id": 3, "rating": 7, "released": "1995-12-15T00:00:00.000000", "genres": None}],
+    ]
+
+
+def test_add_dataframe_polars():
+    pl = pytest.importorskip("polars")
+    df = pl.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "title": ["Alien", None, "Up"],
+            "genre": pl.Series(["horror", "crime", "horror"], dtype=pl.Categorical),
+        }
+    )
+    handler, sent = _server()
+    with HttpxClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        tasks = Index(client, "movies").add_dataframe(df, batch_size=2)
+
+    assert len(tasks) == 2
+    assert sent[0].headers["content-type"] == "application/x-ndjson"
+    assert [x for r in sent for x in _documents(r.content)] == [
+        {"id": 1, "title": "Alien", "genre": "horror"},
+        {"id": 2, "title": None, "genre": "crime"},
+        {"id": 3, "title": "Up", "genre": "horror"},
+    ]
+
+
+async def test_async_add_dataframe():
+    pd = pytest.importorskip("pandas")
+    df = pd.DataFrame({"id": range(5), "title": [f"movie {x}" for x in range(5)]})
+    handler, sent = _server()
+    async with HttpxAsyncClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        tasks = await AsyncIndex(client, "movies").add_dataframe(df, batch_size=2, primary_key="id")
+
+    assert len(tasks) == 3
+    assert {x.method for x in sent} == {"POST"}
+    assert sent[0].url.params["primaryKey"] == "id"
+    assert [x["id"] for r in sent for x in _documents(r.content)] == [0, 1, 2, 3, 4]
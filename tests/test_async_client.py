@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import json
 from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
 from urllib.parse import quote_plus
@@ -627,6 +628,33 @@ async def test_swap_indexes_rename(async_client, async_empty_index):
     assert new_name in uids
 
 
+@pytest.mark.no_parallel
+async def test_reindex(async_client, async_index_with_documents, small_movies):
+    index = await async_index_with_documents()
+    task = await index.update_displayed_attributes(["id", "title"])
+    await async_client.wait_for_task(task.task_uid)
+    reindexed = await async_client.reindex(index.uid, small_movies[:10], concurrency_limit=2)
+    stats = await reindexed.get_stats()
+    uids = [x.uid for x in await async_client.get_indexes()]
+
+    assert stats.number_of_documents == 10
+    assert reindexed.primary_key == index.primary_key
+    assert await reindexed.get_displayed_attributes() == ["id", "title"]
+    assert f"{index.uid}_shadow" not in uids
+
+
+@pytest.mark.no_parallel
+async def test_reindex_new_index(async_client, small_movies, tmp_path):
+    uid = str(uuid4())
+    path = tmp_path / "movies.json"
+    path.write_text(json.dumps(small_movies))
+    reindexed = await async_client.reindex(uid, path, primary_key="id")
+    stats = await reindexed.get_stats()
+
+    assert reindexed.uid == uid
+    assert stats.number_of_documents == len(small_movies)
+
+
 @pytest.mark.usefixtures("create_tasks")
 @pytest.mark.no_parallel
 async def test_cancel_task_statuses(async_client):
@@ -974,6 +1002,19 @@ async def test_get_tasks_for_index_reverse(async_client, async_empty_index, smal
     assert next(iter(uid)) == index.uid
 
 
+@pytest.mark.no_parallel
+async def test_get_tasks_statuses(async_client, async_empty_index, small_movies):
+    index = await async_empty_index()
+    response = await index.add_documents(small_movies)
+    await async_client.wait_for_task(response.task_uid)
+    response = await async_client.get_tasks(index_ids=[index.uid], statuses=["succeeded"], limit=1)
+    assert len(response.results) == 1
+    assert response.total >= 1
+    assert response.results[0].status == "succeeded"
+    response = await async_client.get_tasks(index_ids=[index.uid], statuses="enqueued")
+    assert response.results == []
+
+
 @pytest.mark.no_parallel
 async def test_get_task(async_client, async_empty_index, small_movies):
     index = await async_empty_index()
@@ -9,6 +9,9 @@ import aiofiles
 import pytest
 
 from meilisearch_python_sdk._task import async_wait_for_task
+from meilisearch_python_sdk.adaptive import AdaptiveBatching
+from meilisearch_python_sdk.backpressure import Backpressure
+from meilisearch_python_sdk.checkpoint import Checkpoint
 from meilisearch_python_sdk.errors import (
     InvalidDocumentError,
     MeilisearchApiError,
@@ -179,6 +182,58 @@ async def test_add_documents_in_batches_with_concurrency_limit(async_empty_index
     assert {"succeeded"} == {x.status for x in tasks}
 
 
+async def test_add_documents_in_batches_adaptive(async_empty_index, small_movies):
+    index = await async_empty_index()
+    adaptive = AdaptiveBatching(initial_batch_size=5, min_batch_size=5, initial_concurrency=1)
+    response = await index.add_documents_in_batches(
+        small_movies, primary_key="id", adaptive=adaptive
+    )
+
+    tasks = await asyncio.gather(
+        *[
+            async_wait_for_task(index.http_client, x.task_uid, json_handler=index._json_handler)
+            for x in response
+        ]
+    )
+    assert {"succeeded"} == {x.status for x in tasks}
+    assert adaptive.history
+
+
+async def test_add_documents_in_batches_checkpoint(async_empty_index, small_movies, tmp_path):
+    index = await async_empty_index()
+    path = tmp_path / "movies.checkpoint"
+    first = await index.add_documents_in_batches(
+        small_movies, batch_size=5, primary_key="id", checkpoint=Checkpoint(path)
+    )
+    checkpoint = Checkpoint(path)
+    second = await index.add_documents_in_batches(
+        small_movies, batch_size=5, primary_key="id", checkpoint=checkpoint
+    )
+
+    assert [x.task_uid for x in second] == [x.task_uid for x in first]
+    assert checkpoint.stats()["skipped"] == len(first)
+
+
+async def test_add_documents_in_batches_with_backpressure(async_empty_index, small_movies):
+    index = await async_empty_index()
+    batch_size = 5
+    response = await index.add_documents_in_batches(
+        small_movies,
+        batch_size=batch_size,
+        primary_key="id",
+        backpressure=Backpressure(high_water=2, low_water=1, poll_interval_ms=10),
+    )
+    assert ceil(len(small_movies) / batch_size) == len(response)
+
+    tasks = await asyncio.gather(
+        *[
+            async_wait_for_task(index.http_client, x.task_uid, json_handler=index._json_handler)
+            for x in response
+        ]
+    )
+    assert {"succeeded"} == {x.status for x in tasks}
+
+
 @pytest.mark.parametrize("path_type", ("path", "str"))
 @pytest.mark.parametrize("combine_documents", (True, False))
 @pytest.mark.parametrize(
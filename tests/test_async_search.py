@@ -787,3 +787,5 @@ async def test_search_show_performance_parameters(async_index_with_documents):
     index = await async_index_with_documents()
     response = await index.search(show_performance_details=True)
     assert response.performance_details is not None
+    assert response.performance_trace.total_ms is not None
+    assert response.performance_trace.stages
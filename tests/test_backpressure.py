@@ -0,0 +1,83 @@
+import pytest
+from httpx2 import AsyncClient as HttpxAsyncClient
+from httpx2 import Client as HttpxClient
+from httpx2 import MockTransport, Response
+
+from meilisearch_python_sdk.backpressure import AsyncTaskQueueGate, Backpressure, TaskQueueGate
+from meilisearch_python_sdk.json_handler import BuiltinHandler
+
+
+def _tasks_handler(depths, queries):
+    def handler(request):
+        queries.append(dict(request.url.params))
+        return Response(200, json={"results": [], "total": depths.pop(0), "limit": 1, "from": None})
+
+    return handler
+
+
+@pytest.mark.parametrize(
+    "backpressure",
+    (
+        Backpressure(high_water=0, low_water=0),
+        Backpressure(high_water=5, low_water=5),
+        Backpressure(high_water=5, low_water=-1),
+    ),
+)
+def test_backpressure_invalid(backpressure):
+    with pytest.raises(ValueError):
+        TaskQueueGate(HttpxClient(), "movies", backpressure, json_handler=BuiltinHandler())
+
+
+async def test_gate_checks_only_at_high_water():
+    queries = []
+    transport = MockTransport(_tasks_handler([0, 1], queries))
+    async with HttpxAsyncClient(base_url="http://test", transport=transport) as client:
+        gate = AsyncTaskQueueGate(
+            client, "movies", Backpressure(high_water=3, low_water=1), json_handler=BuiltinHandler()
+        )
+        for _ in range(4):
+            await gate.wait()
+
+    # The depth is checked before the first batch and when the estimate reaches 3.
+    assert len(queries) == 2
+    assert queries[0] == {"indexUids": "movies", "statuses": "enqueued", "limit": "1"}
+    assert gate.stats() == {"estimated_depth": 2, "pauses": 0, "paused_seconds": 0.0}
+
+
+async def test_gate_pauses_until_low_water():
+    queries = []
+    transport = MockTransport(_tasks_handler([5, 4, 2, 1], queries))
+    async with HttpxAsyncClient(base_url="http://test", transport=transport) as client:
+        gate = AsyncTaskQueueGate(
+            client,
+            "movies",
+            Backpressure(high_water=5, low_water=1, poll_interval_ms=1),
+            json_handler=BuiltinHandler(),
+        )
+        await gate.wait()
+
+    assert len(queries) == 4
+    stats = gate.stats()
+    assert stats["estimated_depth"] == 2
+    assert stats["pauses"] == 1
+    assert stats["paused_seconds"] > 0
+
+
+def test_task_queue_gate():
+    queries = []
+    transport = MockTransport(_tasks_handler([10, 3, 0], queries))
+    with HttpxClient(base_url="http://test", transport=transport) as client:
+        gate = TaskQueueGate(
+            client,
+            "movies",
+            Backpressure(high_water=10, low_water=3, poll_interval_ms=1),
+            json_handler=BuiltinHandler(),
+        )
+        gate.wait()
+        for _ in range(7):
+            gate.wait()
+
+    # The pause ends at a depth of 3 and the estimate reaches 10 after 7 more batches.
+    assert len(queries) == 3
+    assert gate.stats()["pauses"] == 1
+    assert gate.stats()["estimated_depth"] == 1
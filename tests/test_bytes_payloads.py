@@ -0,0 +1,169 @@
+import gzip
+import threading
+
+import pytest
+from httpx2 import AsyncClient as HttpxAsyncClient
+from httpx2 import Client as HttpxClient
+from httpx2 import MockTransport, Response
+
+from meilisearch_python_sdk.index._common import MAX_PENDING_PAYLOADS, batch_ndjson
+from meilisearch_python_sdk.index.async_index import AsyncIndex
+from meilisearch_python_sdk.index.index import Index
+
+
+def _server():
+    """Mock Meilisearch that records the requests sent."""
+    sent = []
+
+    def handler(request):
+        sent.append(request)
+        return Response(
+            202,
+            json={
+                "taskUid": len(sent),
+                "indexUid": "movies",
+                "status": "enqueued",
+                "type": "documentAdditionOrUpdate",
+                "enqueuedAt": "2024-01-01T00:00:00Z",
+            },
+        )
+
+    return handler, sent
+
+
+def _messages(count):
+    return [b'{"id":%d}' % x for x in range(count)]
+
+
+def test_batch_ndjson():
+    chunks = [b'{"id":0}', b'{"id":1}\n{"id":2}\n\n', b"  \n", b'{"id":3}\r\n{"id":4}']
+
+    assert list(batch_ndjson(chunks, 2)) == [
+        b'{"id":0}\n{"id":1}\n',
+        b'{"id":2}\n{"id":3}\n',
+        b'{"id":4}\n',
+    ]
+
+
+def test_batch_ndjson_large_chunk():
+    chunk = b"".join(b'{"id":%d}\n' % i for i in range(7))
+
+    assert list(batch_ndjson([chunk, b'{"id":7}'], 3)) == [
+        b'{"id":0}\n{"id":1}\n{"id":2}\n',
+        b'{"id":3}\n{"id":4}\n{"id":5}\n',
+        b'{"id":6}\n{"id":7}\n',
+    ]
+
+
+def test_add_documents_from_bytes_batches_messages():
+    handler, sent = _server()
+    with HttpxClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        tasks = Index(client, "movies").add_documents_from_bytes(
+            iter(_messages(5)), batch_size=2, primary_key="id"
+        )
+
+    assert len(tasks) == 3
+    assert {x.method for x in sent} == {"POST"}
+    assert sent[0].headers["content-type"] == "application/x-ndjson"
+    assert sent[0].url.params["primaryKey"] == "id"
+    assert [x.content for x in sent] == [
+        b'{"id":0}\n{"id":1}\n',
+        b'{"id":2}\n{"id":3}\n',
+        b'{"id":4}\n',
+    ]
+
+
+def test_add_documents_from_bytes_json_blob():
+    payload = b'[{"id": 1}, {"id": 2}]'
+    handler, sent = _server()
+    with HttpxClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        Index(client, "movies").add_documents_from_bytes(
+            payload, content_type="application/json", compress=True
+        )
+
+    assert len(sent) == 1
+    assert sent[0].headers["content-type"] == "application/json"
+    assert sent[0].headers["content-encoding"] == "gzip"
+    assert gzip.decompress(sent[0].content) == payload
+
+
+def test_add_documents_from_bytes_batches_by_default():
+    handler, sent = _server()
+    with HttpxClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        tasks = Index(client, "movies").add_documents_from_bytes(_messages(5))
+
+    assert len(tasks) == 1
+    assert sent[0].content == b"\n".join(_messages(5)) + b"\n"
+
+
+@pytest.mark.parametrize(
+    "content_type, batch_size", [("application/x-ndjson", 0), ("text/csv", None)]
+)
+def test_add_documents_from_bytes_invalid(content_type, batch_size):
+    handler, sent = _server()
+    with (
+        HttpxClient(base_url="http://test", transport=MockTransport(handler)) as client,
+        pytest.raises(ValueError),
+    ):
+        Index(client, "movies").add_documents_from_bytes(
+            b"[]", content_type=content_type, batch_size=batch_size
+        )
+
+    assert sent == []
+
+
+async def test_async_update_documents_from_bytes():
+    handler, sent = _server()
+    async with HttpxAsyncClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        tasks = await AsyncIndex(client, "movies").update_documents_from_bytes(
+            _messages(5), batch_size=2, skip_creation=True, concurrency_limit=2
+        )
+
+    assert [x.task_uid for x in tasks] == [1, 2, 3]
+    assert {x.method for x in sent} == {"PUT"}
+    assert sent[0].url.params["skipCreation"] == "true"
+    assert b"".join(x.content for x in sent) == b"\n".join(_messages(5)) + b"\n"
+
+
+async def test_async_add_documents_from_bytes_iterates_on_event_loop():
+    threads = set()
+
+    def messages():
+        for message in _messages(3):
+            threads.add(threading.get_ident())
+            yield message
+
+    handler, sent = _server()
+    async with HttpxAsyncClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        tasks = await AsyncIndex(client, "movies").add_documents_from_bytes(
+            messages(), batch_size=None
+        )
+
+    assert threads == {threading.get_ident()}
+    assert len(tasks) == 3
+    assert [x.content for x in sent] == _messages(3)
+
+
+async def test_async_add_documents_from_bytes_limits_pending_payloads_by_default():
+    read = []
+    read_at_first_request = []
+
+    def messages():
+        for message in _messages(MAX_PENDING_PAYLOADS * 3):
+            read.append(message)
+            yield message
+
+    server, sent = _server()
+
+    def handler(request):
+        if not sent:
+            read_at_first_request.append(len(read))
+        return server(request)
+
+    async with HttpxAsyncClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        tasks = await AsyncIndex(client, "movies").add_documents_from_bytes(
+            messages(), batch_size=None
+        )
+
+    assert len(tasks) == MAX_PENDING_PAYLOADS * 3
+    assert read_at_first_request == [MAX_PENDING_PAYLOADS + 1]
@@ -0,0 +1,208 @@
+import json
+
+import pytest
+from httpx2 import AsyncClient as HttpxAsyncClient
+from httpx2 import Client as HttpxClient
+from httpx2 import MockTransport, Response
+
+from meilisearch_python_sdk.adaptive import AdaptiveBatching
+from meilisearch_python_sdk.checkpoint import Checkpoint
+from meilisearch_python_sdk.errors import MeilisearchApiError
+from meilisearch_python_sdk.index.async_index import AsyncIndex
+from meilisearch_python_sdk.index.index import Index
+
+
+def _server(statuses=None, fail_after=None):
+    """Mock Meilisearch that records the documents sent and reports the given task statuses."""
+    state = {"sent": [], "task_checks": 0}
+    statuses = statuses or {}
+
+    def handler(request):
+        path = request.url.path
+        if request.method in ("POST", "PUT") and path.endswith("/documents"):
+            if fail_after is not None and len(state["sent"]) >= fail_after:
+                return Response(
+                    500, json={"message": "down", "code": "internal", "type": "internal"}
+                )
+            uid = len(state["sent"])
+            state["sent"].append([x["id"] for x in json.loads(request.content)])
+            return Response(
+                202,
+                json={
+                    "taskUid": uid,
+                    "indexUid": "movies",
+                    "status": "enqueued",
+                    "type": "documentAdditionOrUpdate",
+                    "enqueuedAt": "2024-01-01T00:00:00Z",
+                },
+            )
+        if path.startswith("/tasks/"):
+            state["task_checks"] += 1
+            uid = int(path.rsplit("/", 1)[1])
+            if uid not in statuses:
+                return Response(
+                    404, json={"message": "not found", "code": "task_not_found", "type": "invalid"}
+                )
+            return Response(
+                200,
+                json={
+                    "uid": uid,
+                    "indexUid": "movies",
+                    "status": statuses[uid],
+                    "type": "documentAdditionOrUpdate",
+                    "enqueuedAt": "2024-01-01T00:00:00Z",
+                },
+            )
+        return Response(404, json={})
+
+    return handler, state
+
+
+def _documents(count):
+    return [{"id": x} for x in range(count)]
+
+
+def test_resume_skips_completed_batches(tmp_path):
+    path = tmp_path / "movies.checkpoint"
+    handler, state = _server(fail_after=2)
+    with HttpxClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        with pytest.raises(MeilisearchApiError):
+            Index(client, "movies").add_documents_in_batches(
+                _documents(8), batch_size=2, checkpoint=Checkpoint(path)
+            )
+
+    assert state["sent"] == [[0, 1], [2, 3]]
+
+    # The first batch succeeded and the second failed so it is sent again.
+    handler, state = _server(statuses={0: "succeeded", 1: "failed"})
+    checkpoint = Checkpoint(path)
+    with HttpxClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        tasks = Index(client, "movies").add_documents_in_batches(
+            _documents(8), batch_size=2, checkpoint=checkpoint
+        )
+
+    assert state["sent"] == [[2, 3], [4, 5], [6, 7]]
+    assert [x.task_uid for x in tasks] == [0, 0, 1, 2]
+    assert checkpoint.stats() == {"batches": 4, "succeeded": 1, "skipped": 1}
+
+
+@pytest.mark.parametrize(
+    "status, expected_sent",
+    (("enqueued", 0), ("processing", 0), ("succeeded", 0), ("canceled", 1), (None, 1)),
+)
+def test_resume_checks_task_status(tmp_path, status, expected_sent):
+    path = tmp_path / "movies.checkpoint"
+    handler, _ = _server()
+    with HttpxClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        Index(client, "movies").update_documents_in_batches(
+            _documents(2), batch_size=2, checkpoint=Checkpoint(path)
+        )
+
+    handler, state = _server(statuses={} if status is None else {0: status})
+    with HttpxClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        Index(client, "movies").update_documents_in_batches(
+            _documents(2), batch_size=2, checkpoint=Checkpoint(path)
+        )
+
+    assert len(state["sent"]) == expected_sent
+
+
+def test_succeeded_batches_are_not_checked_again(tmp_path):
+    path = tmp_path / "movies.checkpoint"
+    for statuses in ({}, {0: "succeeded"}, {}):
+        handler, state = _server(statuses=statuses)
+        with HttpxClient(base_url="http://test", transport=MockTransport(handler)) as client:
+            Index(client, "movies").add_documents_in_batches(
+                _documents(2), batch_size=2, checkpoint=Checkpoint(path)
+            )
+
+    assert state["sent"] == []
+    assert state["task_checks"] == 0
+
+
+def test_operations_and_indexes_are_separate(tmp_path):
+    checkpoint = Checkpoint(tmp_path / "movies.checkpoint")
+    handler, state = _server(statuses={0: "succeeded"})
+    with HttpxClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        Index(client, "movies").add_documents_in_batches(_documents(2), checkpoint=checkpoint)
+        Index(client, "movies").update_documents_in_batches(_documents(2), checkpoint=checkpoint)
+        Index(client, "books").add_documents_in_batches(_documents(2), checkpoint=checkpoint)
+
+    assert len(state["sent"]) == 3
+
+
+def test_truncated_line_is_ignored(tmp_path):
+    path = tmp_path / "movies.checkpoint"
+    handler, _ = _server()
+    with HttpxClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        Index(client, "movies").add_documents_in_batches(
+            _documents(4), batch_size=2, checkpoint=Checkpoint(path)
+        )
+
+    content = path.read_text()
+    path.write_text(content[:-10])
+
+    assert Checkpoint(path).stats()["batches"] == 1
+
+
+def test_clear(tmp_path):
+    path = tmp_path / "movies.checkpoint"
+    checkpoint = Checkpoint(path)
+    handler, _ = _server()
+    with HttpxClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        Index(client, "movies").add_documents_in_batches(_documents(2), checkpoint=checkpoint)
+
+    checkpoint.clear()
+
+    assert not path.exists()
+    assert checkpoint.stats() == {"batches": 0, "succeeded": 0, "skipped": 0}
+
+
+async def test_async_add_documents_from_file_resume(tmp_path):
+    path = tmp_path / "movies.checkpoint"
+    file_path = tmp_path / "movies.json"
+    file_path.write_text(json.dumps(_documents(6)))
+    handler, state = _server()
+    async with HttpxAsyncClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        first = await AsyncIndex(client, "movies").add_documents_from_file_in_batches(
+            file_path, batch_size=2, concurrency_limit=2, checkpoint=Checkpoint(path)
+        )
+
+    assert len(state["sent"]) == 3
+
+    handler, state = _server(statuses={0: "enqueued", 1: "processing", 2: "succeeded"})
+    async with HttpxAsyncClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        second = await AsyncIndex(client, "movies").add_documents_from_file_in_batches(
+            file_path, batch_size=2, checkpoint=Checkpoint(path)
+        )
+
+    assert state["sent"] == []
+    assert [x.task_uid for x in second] == [x.task_uid for x in first]
+
+
+def test_checkpoint_with_adaptive_raises(tmp_path):
+    handler, state = _server()
+    with (
+        HttpxClient(base_url="http://test", transport=MockTransport(handler)) as client,
+        pytest.raises(ValueError, match="adaptive and checkpoint"),
+    ):
+        Index(client, "movies").add_documents_in_batches(
+            _documents(2),
+            adaptive=AdaptiveBatching(),
+            checkpoint=Checkpoint(tmp_path / "movies.checkpoint"),
+        )
+
+    assert state["sent"] == []
+
+
+async def test_async_checkpoint_with_adaptive_raises(tmp_path):
+    handler, state = _server()
+    async with HttpxAsyncClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        with pytest.raises(ValueError, match="adaptive and checkpoint"):
+            await AsyncIndex(client, "movies").update_documents_in_batches(
+                _documents(2),
+                adaptive=AdaptiveBatching(),
+                checkpoint=Checkpoint(tmp_path / "movies.checkpoint"),
+            )
+
+    assert state["sent"] == []
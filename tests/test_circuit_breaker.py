@@ -0,0 +1,231 @@
+import asyncio
+
+import pytest
+from httpx2 import AsyncClient as HttpxAsyncClient
+from httpx2 import Client as HttpxClient
+from httpx2 import ConnectError, MockTransport, Response
+
+from meilisearch_python_sdk import AsyncClient, Client
+from meilisearch_python_sdk.circuit_breaker import (
+    AsyncCircuitBreakerTransport,
+    CircuitBreaker,
+    CircuitBreakerTransport,
+)
+from meilisearch_python_sdk.errors import MeilisearchCircuitOpenError
+from meilisearch_python_sdk.multi_node import AsyncRoutingTransport, NodeRouter
+
+BASE_URL = "http://test:7700"
+
+
+def _handler(statuses, calls):
+    def handler(request):
+        calls.append(request.url.path)
+        status = statuses.pop(0) if statuses else 200
+        if status == 0:
+            raise ConnectError("down", request=request)
+        return Response(status, json={"host": request.url.host})
+
+    return handler
+
+
+def _async_http_client(breaker, statuses, calls):
+    transport = AsyncCircuitBreakerTransport(MockTransport(_handler(statuses, calls)), breaker)
+    return HttpxAsyncClient(base_url=BASE_URL, transport=transport)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    (
+        {"failure_rate_threshold": 0.0},
+        {"failure_rate_threshold": 1.1},
+        {"slow_call_rate_threshold": 0.0},
+        {"min_requests": 0},
+        {"half_open_probes": 0},
+    ),
+)
+def test_circuit_breaker_invalid(kwargs):
+    with pytest.raises(ValueError):
+        CircuitBreaker(**kwargs)
+
+
+async def test_opens_on_error_rate():
+    breaker = CircuitBreaker(failure_rate_threshold=0.5, min_requests=4)
+    calls = []
+    async with _async_http_client(breaker, [200, 503, 0, 503], calls) as client:
+        await client.get("health")
+        await client.get("health")
+        with pytest.raises(ConnectError):
+            await client.get("health")
+        await client.get("health")
+        with pytest.raises(MeilisearchCircuitOpenError) as e:
+            await client.get("health")
+
+    assert len(calls) == 4
+    assert e.value.circuit == BASE_URL
+    assert e.value.retry_after > 0
+    assert breaker.states() == {BASE_URL: "open"}
+
+
+async def test_stays_closed_below_threshold():
+    breaker = CircuitBreaker(failure_rate_threshold=0.5, min_requests=4)
+    calls = []
+    async with _async_http_client(breaker, [503, 200, 200, 200, 503, 200], calls) as client:
+        for _ in range(6):
+            await client.get("health")
+
+    assert breaker.states() == {BASE_URL: "closed"}
+
+
+async def test_opens_on_latency():
+    breaker = CircuitBreaker(slow_call_ms=20, slow_call_rate_threshold=0.5, min_requests=2)
+
+    async def handler(request):
+        await asyncio.sleep(0.05)
+        return Response(200, json={})
+
+    transport = AsyncCircuitBreakerTransport(MockTransport(handler), breaker)
+    async with HttpxAsyncClient(base_url=BASE_URL, transport=transport) as client:
+        await client.get("health")
+        await client.get("health")
+        with pytest.raises(MeilisearchCircuitOpenError):
+            await client.get("health")
+
+
+async def test_half_open_closes_after_probes():
+    breaker = CircuitBreaker(min_requests=1, open_seconds=0.05, half_open_probes=2)
+    calls = []
+    async with _async_http_client(breaker, [503], calls) as client:
+        await client.get("health")
+        with pytest.raises(MeilisearchCircuitOpenError):
+            await client.get("health")
+
+        await asyncio.sleep(0.06)
+        await client.get("health")
+        assert breaker.states() == {BASE_URL: "half_open"}
+        await client.get("health")
+
+    assert breaker.states() == {BASE_URL: "closed"}
+    assert len(calls) == 3
+
+
+async def test_half_open_reopens_on_failure():
+    breaker = CircuitBreaker(min_requests=1, open_seconds=0.05)
+    calls = []
+    async with _async_http_client(breaker, [503, 503], calls) as client:
+        await client.get("health")
+        await asyncio.sleep(0.06)
+        await client.get("health")
+        with pytest.raises(MeilisearchCircuitOpenError):
+            await client.get("health")
+
+    assert breaker.states() == {BASE_URL: "open"}
+
+
+def test_half_open_limits_probes():
+    breaker = CircuitBreaker(min_requests=1, open_seconds=0.0, half_open_probes=1)
+    breaker.acquire(BASE_URL)
+    breaker.record(BASE_URL, failed=True, elapsed_ms=1.0)
+    probe = breaker.acquire(BASE_URL)
+
+    with pytest.raises(MeilisearchCircuitOpenError):
+        breaker.acquire(BASE_URL)
+
+    breaker.release(BASE_URL, probe)
+    breaker.acquire(BASE_URL)
+
+
+def test_half_open_ignores_requests_from_before():
+    breaker = CircuitBreaker(min_requests=2, open_seconds=0.0, half_open_probes=1)
+    before = breaker.acquire(BASE_URL)
+    breaker.acquire(BASE_URL)
+    breaker.record(BASE_URL, failed=True, elapsed_ms=1.0)
+    breaker.acquire(BASE_URL)
+    breaker.record(BASE_URL, failed=True, elapsed_ms=1.0)
+    probe = breaker.acquire(BASE_URL)
+
+    breaker.record(BASE_URL, failed=False, elapsed_ms=1.0, probe=before)
+    breaker.release(BASE_URL, before)
+
+    assert probe is not None
+    assert breaker.states() == {BASE_URL: "half_open"}
+    with pytest.raises(MeilisearchCircuitOpenError):
+        breaker.acquire(BASE_URL)
+
+    breaker.record(BASE_URL, failed=False, elapsed_ms=1.0, probe=probe)
+
+    assert breaker.states() == {BASE_URL: "closed"}
+
+
+async def test_per_index():
+    breaker = CircuitBreaker(min_requests=1, per_index=True)
+    calls = []
+    async with _async_http_client(breaker, [503], calls) as client:
+        await client.post("indexes/movies/search", content=b"{}")
+        with pytest.raises(MeilisearchCircuitOpenError):
+            await client.post("indexes/movies/search", content=b"{}")
+        await client.post("indexes/books/search", content=b"{}")
+        await client.get("health")
+
+    assert breaker.states() == {
+        f"{BASE_URL}/indexes/movies": "open",
+        f"{BASE_URL}/indexes/books": "closed",
+        BASE_URL: "closed",
+    }
+
+
+async def test_reads_skip_open_node():
+    breaker = CircuitBreaker(min_requests=1)
+    router = NodeRouter(BASE_URL, ["http://replica-1:7700", "http://replica-2:7700"])
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.host)
+        status = 503 if request.url.host == "replica-1" else 200
+        return Response(status, json={"host": request.url.host})
+
+    transport = AsyncRoutingTransport(
+        AsyncCircuitBreakerTransport(MockTransport(handler), breaker), router
+    )
+    async with HttpxAsyncClient(base_url=BASE_URL, transport=transport) as client:
+        hosts = [
+            (await client.post("indexes/movies/search", content=b"{}")).json()["host"]
+            for _ in range(4)
+        ]
+
+    assert calls.count("replica-1") == 1
+    assert hosts.count("replica-2") == 3
+    assert breaker.states()["http://replica-1:7700"] == "open"
+
+
+def test_circuit_breaker_transport():
+    breaker = CircuitBreaker(min_requests=2)
+    calls = []
+    transport = CircuitBreakerTransport(MockTransport(_handler([0, 500], calls)), breaker)
+    with HttpxClient(base_url=BASE_URL, transport=transport) as client:
+        with pytest.raises(ConnectError):
+            client.get("health")
+        client.get("health")
+        with pytest.raises(MeilisearchCircuitOpenError):
+            client.get("health")
+
+    assert len(calls) == 2
+    breaker.reset()
+    assert breaker.states() == {}
+
+
+async def test_async_client_circuit_breaker(base_url, master_key, ssl_verify):
+    breaker = CircuitBreaker()
+    async with AsyncClient(
+        base_url, master_key, verify=ssl_verify, circuit_breaker=breaker
+    ) as client:
+        await client.health()
+
+    assert list(breaker.states().values()) == ["closed"]
+
+
+def test_client_circuit_breaker(base_url, master_key, ssl_verify):
+    breaker = CircuitBreaker()
+    with Client(base_url, master_key, verify=ssl_verify, circuit_breaker=breaker) as client:
+        client.health()
+
+    assert list(breaker.states().values()) == ["closed"]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from datetime import datetime, timedelta, timezone
 from time import sleep
 from unittest.mock import patch
@@ -615,6 +616,33 @@ def test_swap_indexes_rename(client, empty_index):
     assert new_name in uids
 
 
+@pytest.mark.no_parallel
+def test_reindex(client, index_with_documents, small_movies):
+    index = index_with_documents()
+    task = index.update_displayed_attributes(["id", "title"])
+    client.wait_for_task(task.task_uid)
+    reindexed = client.reindex(index.uid, small_movies[:10])
+    stats = reindexed.get_stats()
+    uids = [x.uid for x in client.get_indexes()]
+
+    assert stats.number_of_documents == 10
+    assert reindexed.primary_key == index.primary_key
+    assert reindexed.get_displayed_attributes() == ["id", "title"]
+    assert f"{index.uid}_shadow" not in uids
+
+
+@pytest.mark.no_parallel
+def test_reindex_new_index(client, small_movies, tmp_path):
+    uid = str(uuid4())
+    path = tmp_path / "movies.json"
+    path.write_text(json.dumps(small_movies))
+    reindexed = client.reindex(uid, path, primary_key="id")
+    stats = reindexed.get_stats()
+
+    assert reindexed.uid == uid
+    assert stats.number_of_documents == len(small_movies)
+
+
 @pytest.mark.usefixtures("create_tasks")
 @pytest.mark.no_parallel
 def test_cancel_statuses(client):
@@ -958,6 +986,18 @@ def test_get_tasks_for_index_reverse(client, empty_index, small_movies):
     assert next(iter(uid)) == index.uid
 
 
+def test_get_tasks_statuses(client, empty_index, small_movies):
+    index = empty_index()
+    response = index.add_documents(small_movies)
+    client.wait_for_task(response.task_uid)
+    response = client.get_tasks(index_ids=[index.uid], statuses=["succeeded"], limit=1)
+    assert len(response.results) == 1
+    assert response.total >= 1
+    assert response.results[0].status == "succeeded"
+    response = client.get_tasks(index_ids=[index.uid], statuses="enqueued")
+    assert response.results == []
+
+
 def test_get_task(client, empty_index, small_movies):
     index = empty_index()
     response = index.add_documents(small_movies)
@@ -0,0 +1,181 @@
+import json
+from io import StringIO
+
+import pytest
+from httpx2 import AsyncClient as HttpxAsyncClient
+from httpx2 import Client as HttpxClient
+from httpx2 import MockTransport, Response
+
+from meilisearch_python_sdk.csv_schema import CsvSchema
+from meilisearch_python_sdk.errors import InvalidDocumentError
+from meilisearch_python_sdk.index.async_index import AsyncIndex
+from meilisearch_python_sdk.index.index import Index
+
+MOVIES = """id,title,rating,year,available,zip,genres
+1,Alien,8.5,1979,true,02134,horror|sci-fi
+2,Heat,8.3,1995,FALSE,,crime
+
+3,Up,,2009,true,90210,
+"""
+
+
+def _server():
+    """Mock Meilisearch that records the documents sent."""
+    sent = []
+
+    def handler(request):
+        sent.append(json.loads(request.content))
+        return Response(
+            202,
+            json={
+                "taskUid": len(sent),
+                "indexUid": "movies",
+                "status": "enqueued",
+                "type": "documentAdditionOrUpdate",
+                "enqueuedAt": "2024-01-01T00:00:00Z",
+            },
+        )
+
+    return handler, sent
+
+
+def _read(schema, content=MOVIES, **kwargs):
+    return [x for chunk in schema.read(StringIO(content), **kwargs) for x in chunk]
+
+
+def test_infer():
+    documents = _read(CsvSchema({"genres": "list"}, list_separator="|"))
+
+    assert documents == [
+        {
+            "id": 1,
+            "title": "Alien",
+            "rating": 8.5,
+            "year": 1979,
+            "available": True,
+            "zip": "02134",
+            "genres": ["horror", "sci-fi"],
+        },
+        {
+            "id": 2,
+            "title": "Heat",
+            "rating": 8.3,
+            "year": 1995,
+            "available": False,
+            "zip": "",
+            "genres": ["crime"],
+        },
+        {
+            "id": 3,
+            "title": "Up",
+            "rating": None,
+            "year": 2009,
+            "available": True,
+            "zip": "90210",
+            "genres": None,
+        },
+    ]
+
+
+def test_no_infer():
+    documents = _read(CsvSchema({"year": "int"}, infer=False))
+
+    assert documents[0]["year"] == 1979
+    assert documents[0]["rating"] == "8.5"
+    assert documents[0]["id"] == "1"
+
+
+def test_header_annotations():
+    content = "id,price:number,available:boolean,code:string\n1,10,true,7\n2,10.5,false,8\n"
+
+    documents = _read(CsvSchema(), content)
+
+    assert documents == [
+        {"id": 1, "price": 10, "available": True, "code": "7"},
+        {"id": 2, "price": 10.5, "available": False, "code": "8"},
+    ]
+
+
+def test_declared_type_overrides_header_annotation():
+    documents = _read(CsvSchema({"price": "string"}), "price:number\n10\n")
+
+    assert documents == [{"price": "10"}]
+
+
+def test_inferred_numbers_across_chunks():
+    content = "id,price\n1,10\n2,11\n3,12.5\n"
+
+    chunks = list(CsvSchema().read(StringIO(content), chunk_size=2))
+
+    assert chunks == [
+        [{"id": 1, "price": 10}, {"id": 2, "price": 11}],
+        [{"id": 3, "price": 12.5}],
+    ]
+
+
+def test_value_not_fitting_inferred_type_stays_string():
+    content = "id,available\n1,true\n2,false\n3,unknown\n"
+
+    assert _read(CsvSchema(), content, chunk_size=2) == [
+        {"id": 1, "available": True},
+        {"id": 2, "available": False},
+        {"id": 3, "available": "unknown"},
+    ]
+
+    with pytest.raises(InvalidDocumentError, match="Row 3: 'unknown' in column 'available'"):
+        _read(CsvSchema({"available": "bool"}), content, chunk_size=2)
+
+
+def test_invalid_declared_value():
+    with pytest.raises(InvalidDocumentError, match="'Alien' in column 'title' is not a valid int"):
+        _read(CsvSchema({"title": "int"}))
+
+
+def test_short_and_long_rows():
+    assert _read(CsvSchema(), "id,title,year\n1,Alien\n") == [
+        {"id": 1, "title": "Alien", "year": None}
+    ]
+
+    with pytest.raises(InvalidDocumentError, match="Row 2 has more fields"):
+        _read(CsvSchema(), "id,title\n1,Alien\n2,Heat,1995\n")
+
+
+def test_delimiter():
+    assert _read(CsvSchema(), "id;year\n1;1979\n", delimiter=";") == [{"id": 1, "year": 1979}]
+
+
+def test_empty_file():
+    assert _read(CsvSchema(), "") == []
+
+
+def test_add_documents_from_file_in_batches(tmp_path):
+    path = tmp_path / "movies.csv"
+    path.write_text(MOVIES)
+    handler, sent = _server()
+    with HttpxClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        Index(client, "movies").add_documents_from_file_in_batches(
+            path, batch_size=2, csv_schema=CsvSchema()
+        )
+
+    assert [[x["year"] for x in batch] for batch in sent] == [[1979, 1995], [2009]]
+
+
+async def test_async_update_documents_from_directory_in_batches(tmp_path):
+    (tmp_path / "movies.csv").write_text(MOVIES)
+    handler, sent = _server()
+    async with HttpxAsyncClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        await AsyncIndex(client, "movies").update_documents_from_directory_in_batches(
+            tmp_path, document_type="csv", csv_schema=CsvSchema()
+        )
+
+    assert [x["rating"] for x in sent[0]] == [8.5, 8.3, None]
+
+
+async def test_async_add_documents_from_file_in_batches_without_schema(tmp_path):
+    path = tmp_path / "movies.csv"
+    path.write_text(MOVIES)
+    handler, sent = _server()
+    async with HttpxAsyncClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        await AsyncIndex(client, "movies").add_documents_from_file_in_batches(path, batch_size=2)
+
+    assert [[x["year"] for x in batch] for batch in sent] == [["1979", "1995"], ["2009"]]
@@ -0,0 +1,154 @@
+import json
+
+import pytest
+from httpx2 import AsyncClient as HttpxAsyncClient
+from httpx2 import Client as HttpxClient
+from httpx2 import MockTransport, Response
+
+from meilisearch_python_sdk.delta_sync import HashStore, async_delta_sync, delta_sync
+from meilisearch_python_sdk.errors import InvalidDocumentError
+from meilisearch_python_sdk.index.async_index import AsyncIndex
+from meilisearch_python_sdk.index.index import Index
+from meilisearch_python_sdk.json_handler import BuiltinHandler
+
+
+def _server(failed=()):
+    """Mock Meilisearch that records the documents updated and deleted."""
+    state = {"updated": [], "deleted": []}
+
+    def task(uid):
+        return Response(
+            202,
+            json={
+                "taskUid": uid,
+                "indexUid": "movies",
+                "status": "enqueued",
+                "type": "documentAdditionOrUpdate",
+                "enqueuedAt": "2024-01-01T00:00:00Z",
+            },
+        )
+
+    def handler(request):
+        path = request.url.path
+        uid = len(state["updated"]) + len(state["deleted"])
+        if request.method == "PUT" and path.endswith("/documents"):
+            state["updated"].append([x["id"] for x in json.loads(request.content)])
+            return task(uid)
+        if path.endswith("/documents/delete-batch"):
+            state["deleted"].append(json.loads(request.content))
+            return task(uid)
+        if path.startswith("/tasks/"):
+            uid = int(path.rsplit("/", 1)[1])
+            return Response(
+                200,
+                json={
+                    "uid": uid,
+                    "indexUid": "movies",
+                    "status": "failed" if uid in failed else "succeeded",
+                    "type": "documentAdditionOrUpdate",
+                    "enqueuedAt": "2024-01-01T00:00:00Z",
+                },
+            )
+        return Response(404, json={})
+
+    return handler, state
+
+
+def _documents(count, title="movie"):
+    return [{"id": x, "title": title} for x in range(count)]
+
+
+def test_hash_store_diff(tmp_path):
+    with HashStore(tmp_path / "hashes.sqlite") as store:
+        changed, hashes = store.diff("movies", _documents(3), "id", json_handler=BuiltinHandler())
+        assert len(changed) == 3
+        store.save("movies", hashes)
+
+        documents = _documents(3)
+        documents[1] = {"id": 1, "title": "changed"}
+        changed, _ = store.diff("movies", documents[1:], "id", json_handler=BuiltinHandler())
+
+        assert changed == [{"id": 1, "title": "changed"}]
+        assert store.missing("movies") == ["0"]
+        assert store.count("movies") == 3
+        assert store.count("books") == 0
+
+
+def test_hash_store_missing_primary_key(tmp_path):
+    with HashStore(tmp_path / "hashes.sqlite") as store, pytest.raises(InvalidDocumentError):
+        store.diff("movies", [{"title": "movie"}], "id", json_handler=BuiltinHandler())
+
+
+def test_hash_store_clear(tmp_path):
+    with HashStore(tmp_path / "hashes.sqlite") as store:
+        for index_uid in ("movies", "books"):
+            _, hashes = store.diff(index_uid, _documents(2), "id", json_handler=BuiltinHandler())
+            store.save(index_uid, hashes)
+
+        store.clear("movies")
+        assert store.count("movies") == 0
+        assert store.count("books") == 2
+
+        store.clear()
+        assert store.count("books") == 0
+
+
+def test_delta_sync(tmp_path):
+    path = tmp_path / "hashes.sqlite"
+    handler, state = _server()
+    with HttpxClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        index = Index(client, "movies")
+        with HashStore(path) as store:
+            first = delta_sync(index, _documents(5), store, primary_key="id", batch_size=2)
+
+        documents = _documents(4)
+        documents[2] = {"id": 2, "title": "changed"}
+        with HashStore(path) as store:
+            second = delta_sync(
+                index, documents, store, primary_key="id", batch_size=2, delete_missing=True
+            )
+
+    assert (first.sent, first.unchanged, first.deleted) == (5, 0, 0)
+    assert (second.sent, second.unchanged, second.deleted) == (1, 3, 1)
+    assert state["updated"] == [[0, 1], [2, 3], [4], [2]]
+    assert state["deleted"] == [["4"]]
+    assert len(second.tasks) == 2
+
+
+def test_delta_sync_failed_task_is_sent_again(tmp_path):
+    handler, state = _server(failed={1})
+    with (
+        HttpxClient(base_url="http://test", transport=MockTransport(handler)) as client,
+        HashStore(tmp_path / "hashes.sqlite") as store,
+    ):
+        index = Index(client, "movies")
+        delta_sync(index, _documents(4), store, primary_key="id", batch_size=2)
+        result = delta_sync(index, _documents(4), store, primary_key="id", batch_size=2)
+
+    assert result.sent == 2
+    assert state["updated"][-1] == [2, 3]
+
+
+async def test_async_delta_sync(tmp_path):
+    handler, state = _server()
+    async with HttpxAsyncClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        index = AsyncIndex(client, "movies")
+        with HashStore(tmp_path / "hashes.sqlite") as store:
+            await async_delta_sync(index, _documents(3), store, primary_key="id")
+            result = await async_delta_sync(
+                index, _documents(3, "changed")[:1], store, primary_key="id", delete_missing=True
+            )
+
+    assert (result.sent, result.unchanged, result.deleted) == (1, 0, 2)
+    assert state["updated"] == [[0, 1, 2], [0]]
+    assert sorted(state["deleted"][0]) == ["1", "2"]
+
+
+def test_delta_sync_index(empty_index, small_movies, tmp_path):
+    index = empty_index()
+    with HashStore(tmp_path / "hashes.sqlite") as store:
+        delta_sync(index, small_movies, store, primary_key="id")
+        result = delta_sync(index, small_movies[:-1], store, delete_missing=True)
+
+    assert (result.sent, result.deleted) == (0, 1)
+    assert index.get_documents().total == len(small_movies) - 1
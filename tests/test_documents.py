@@ -7,6 +7,8 @@ from uuid import UUID, uuid4
 import pytest
 
 from meilisearch_python_sdk._task import wait_for_task
+from meilisearch_python_sdk.adaptive import AdaptiveBatching
+from meilisearch_python_sdk.backpressure import Backpressure
 from meilisearch_python_sdk.errors import (
     InvalidDocumentError,
     MeilisearchApiError,
@@ -137,6 +139,37 @@ def test_add_documents_in_batches(
     assert index.get_primary_key() == expected_primary_key
 
 
+def test_update_documents_in_batches_adaptive(empty_index, small_movies):
+    index = empty_index()
+    adaptive = AdaptiveBatching(initial_batch_size=5, min_batch_size=5)
+    response = index.update_documents_in_batches(small_movies, primary_key="id", adaptive=adaptive)
+
+    tasks = [
+        wait_for_task(index.http_client, x.task_uid, json_handler=index._json_handler)
+        for x in response
+    ]
+    assert {"succeeded"} == {x.status for x in tasks}
+    assert adaptive.history
+
+
+def test_update_documents_in_batches_with_backpressure(empty_index, small_movies):
+    index = empty_index()
+    batch_size = 5
+    response = index.update_documents_in_batches(
+        small_movies,
+        batch_size=batch_size,
+        primary_key="id",
+        backpressure=Backpressure(high_water=2, low_water=1, poll_interval_ms=10),
+    )
+    assert ceil(len(small_movies) / batch_size) == len(response)
+
+    tasks = [
+        wait_for_task(index.http_client, x.task_uid, json_handler=index._json_handler)
+        for x in response
+    ]
+    assert {"succeeded"} == {x.status for x in tasks}
+
+
 @pytest.mark.parametrize("path_type", ("path", "str"))
 @pytest.mark.parametrize("combine_documents", (True, False))
 @pytest.mark.parametrize(
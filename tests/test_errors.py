@@ -5,6 +5,7 @@ from httpx2 import HTTPStatusError, Request, Response
 
 from meilisearch_python_sdk.errors import (
     MeilisearchApiError,
+    MeilisearchCircuitOpenError,
     MeilisearchCommunicationError,
     MeilisearchError,
     MeilisearchTaskFailedError,
@@ -39,6 +40,13 @@ def test_meilisearch_api_error_json_not_a_dict():
     assert expected in str(got)
 
 
+def test_meilisearch_circuit_open_error():
+    got = MeilisearchCircuitOpenError("http://localhost:7700", 2.5)
+
+    assert "http://localhost:7700" in str(got)
+    assert got.retry_after == 2.5
+
+
 def test_meilisearch_communication_error():
     expected = "test"
     got = MeilisearchCommunicationError(expected)
@@ -0,0 +1,543 @@
+import asyncio
+import gzip
+import json
+import threading
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from httpx2 import AsyncClient as HttpxAsyncClient
+from httpx2 import Client as HttpxClient
+from httpx2 import MockTransport, Response
+
+from meilisearch_python_sdk.errors import InvalidDocumentError, MeilisearchError
+from meilisearch_python_sdk.index import _common, async_index
+from meilisearch_python_sdk.index._common import (
+    STREAM_CHUNK_BATCHES,
+    compression,
+    document_suffix,
+    iter_json_array,
+    iter_ndjson,
+    load_files_in_processes,
+    take_chunks,
+    validate_file_type,
+)
+from meilisearch_python_sdk.index.async_index import (
+    AsyncIndex,
+    _async_load_documents_from_file,
+    _async_send_files_in_processes,
+)
+from meilisearch_python_sdk.index.index import Index, _load_documents_from_file
+from meilisearch_python_sdk.json_handler import BuiltinHandler
+
+
+def _server():
+    """Mock Meilisearch that records the size of each batch of documents sent."""
+    sizes = []
+
+    def handler(request):
+        sizes.append(len(json.loads(request.content)))
+        return Response(
+            202,
+            json={
+                "taskUid": len(sizes),
+                "indexUid": "movies",
+                "status": "enqueued",
+                "type": "documentAdditionOrUpdate",
+                "enqueuedAt": "2024-01-01T00:00:00Z",
+            },
+        )
+
+    return handler, sizes
+
+
+def _raw_server():
+    """Mock Meilisearch that records the raw requests sent."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return Response(
+            202,
+            json={
+                "taskUid": len(requests),
+                "indexUid": "movies",
+                "status": "enqueued",
+                "type": "documentAdditionOrUpdate",
+                "enqueuedAt": "2024-01-01T00:00:00Z",
+            },
+        )
+
+    return handler, requests
+
+
+def _write_documents(path, count=5):
+    """Write documents in the format given by the file extensions, compressing them if needed."""
+    documents = [{"id": str(x), "title": f"movie {x}"} for x in range(count)]
+    suffix = document_suffix(path)
+    if suffix == ".json":
+        content = json.dumps(documents)
+    elif suffix == ".ndjson":
+        content = "\n".join(json.dumps(x) for x in documents) + "\n"
+    else:
+        content = "id,title\n" + "".join(f"{x['id']},{x['title']}\n" for x in documents)
+
+    data = content.encode()
+    if compression(path) == "gzip":
+        data = gzip.compress(data)
+    elif compression(path) == "zstd":
+        data = pytest.importorskip("zstandard").ZstdCompressor().compress(data)
+    path.write_bytes(data)
+
+    return documents
+
+
+@pytest.fixture
+def ndjson_file(tmp_path):
+    path = tmp_path / "movies.ndjson"
+    lines = [json.dumps({"id": x}) for x in range(95)]
+    lines.insert(10, "")
+    path.write_text("\n".join(lines) + "\n")
+
+    return path
+
+
+@pytest.fixture
+def json_file(tmp_path):
+    path = tmp_path / "movies.json"
+    path.write_text(json.dumps([{"id": x} for x in range(95)], indent=2))
+
+    return path
+
+
+def test_iter_ndjson():
+    lines = ['{"id": 1}\n', "\n", '{"id": 2}\n', '{"id": 3}\n']
+
+    assert list(iter_ndjson(lines, BuiltinHandler())) == [{"id": 1}, {"id": 2}, {"id": 3}]
+
+
+@pytest.mark.parametrize("read_size", (1, 3, 7, 1024))
+def test_iter_json_array(read_size):
+    documents = [
+        {"id": 1, "title": 'A "quoted", [bracketed] {title}', "rating": 12345.5},
+        {"id": 2, "genres": ["comedy", "drama"], "cast": {"lead": "\\ \u00e9"}},
+        12345,
+        "text",
+        None,
+        [],
+    ]
+    content = "\n  " + json.dumps(documents, indent=4) + "\n"
+
+    assert list(iter_json_array(StringIO(content), read_size)) == documents
+
+
+@pytest.mark.parametrize("content", ("[]", " [ ] ", "[\n]\n"))
+def test_iter_json_array_empty(content):
+    assert list(iter_json_array(StringIO(content), 1)) == []
+
+
+@pytest.mark.parametrize("content", ('{"id": 1}', "1"))
+def test_iter_json_array_not_a_list(content):
+    with pytest.raises(InvalidDocumentError):
+        list(iter_json_array(StringIO(content)))
+
+
+@pytest.mark.parametrize(
+    "content",
+    ("", '[{"id": 1}', '[{"id": 1}, ', '[{"id": 1} {"id": 2}]', '[{"id": 1', "[tru]", '["a'),
+)
+def test_iter_json_array_invalid(content):
+    with pytest.raises(InvalidDocumentError):
+        list(iter_json_array(StringIO(content), 4))
+
+
+@pytest.mark.parametrize("read_size", (1, 4, 9))
+def test_iter_json_array_cut_off(read_size):
+    documents = [12.5, -1e-3, 1.5e10, True, None, "\u00e9\U0001f600", {"a": [-7.25e2, False]}]
+    content = "[" + ", ".join(json.dumps(x) for x in documents) + "]"
+
+    assert list(iter_json_array(StringIO(content), read_size)) == documents
+
+
+def test_iter_json_array_invalid_fails_fast():
+    read = []
+
+    class File(StringIO):
+        def read(self, size=-1):
+            read.append(size)
+            return super().read(size)
+
+    content = '[{"id": 1}, {"id": 2,, "title": "Alien"}, ' + '{"id": 3}, ' * 1000 + '{"id": 4}]'
+
+    with pytest.raises(InvalidDocumentError):
+        list(iter_json_array(File(content), 64))
+
+    assert len(read) < 5
+
+
+@pytest.mark.parametrize("read_size", (4, 1024))
+@pytest.mark.parametrize("content", ("[1]garbage", "[1] [2]", '[{"id": 1}]\n{"id": 2}\n'))
+def test_iter_json_array_trailing_data(content, read_size):
+    with pytest.raises(InvalidDocumentError, match="after the JSON array"):
+        list(iter_json_array(StringIO(content), read_size))
+
+
+@pytest.mark.parametrize("read_size", (4, 1024))
+def test_iter_json_array_trailing_whitespace(read_size):
+    assert list(iter_json_array(StringIO("[1, 2] \n\t\n"), read_size)) == [1, 2]
+
+
+def test_iter_json_array_small_file_uses_json_handler():
+    class Handler(BuiltinHandler):
+        calls = 0
+
+        @classmethod
+        def loads(cls, json_string):
+            cls.calls += 1
+            return super().loads(json_string)
+
+    content = json.dumps([{"id": x} for x in range(10)])
+
+    assert list(iter_json_array(StringIO(content), json_handler=Handler())) == [
+        {"id": x} for x in range(10)
+    ]
+    assert Handler.calls == 1
+
+    list(iter_json_array(StringIO(content), 8, json_handler=Handler()))
+    assert Handler.calls == 1
+
+
+def test_load_ndjson(ndjson_file):
+    documents = _load_documents_from_file(ndjson_file, json_handler=BuiltinHandler())
+
+    assert documents == [{"id": x} for x in range(95)]
+
+
+async def test_async_load_ndjson(ndjson_file):
+    documents = await _async_load_documents_from_file(ndjson_file, json_handler=BuiltinHandler())
+
+    assert documents == [{"id": x} for x in range(95)]
+
+
+def test_add_ndjson_from_file_in_batches_streams(ndjson_file):
+    handler, sizes = _server()
+    with HttpxClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        tasks = Index(client, "movies").add_documents_from_file_in_batches(
+            ndjson_file, batch_size=10
+        )
+
+    # The file is read in several chunks but the batches are the same as loading it all at once.
+    assert STREAM_CHUNK_BATCHES * 10 < 95
+    assert sizes == [10] * 9 + [5]
+    assert len(tasks) == len(sizes)
+
+
+def test_add_json_from_file_in_batches_streams(json_file):
+    handler, sizes = _server()
+    with HttpxClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        tasks = Index(client, "movies").add_documents_from_file_in_batches(json_file, batch_size=10)
+
+    assert sizes == [10] * 9 + [5]
+    assert len(tasks) == len(sizes)
+
+
+async def test_async_add_json_from_file_in_batches_streams(json_file):
+    handler, sizes = _server()
+    async with HttpxAsyncClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        tasks = await AsyncIndex(client, "movies").add_documents_from_file_in_batches(
+            json_file, batch_size=10
+        )
+
+    assert sorted(sizes) == [5] + [10] * 9
+    assert len(tasks) == len(sizes)
+
+
+async def test_async_add_from_file_in_batches_reads_ahead_off_the_loop(ndjson_file, monkeypatch):
+    threads = set()
+    read = []
+
+    def open_document_file(path):
+        threads.add(threading.get_ident())
+        return _common.open_document_file(path)
+
+    def iter_document_chunks(*args, **kwargs):
+        for chunk in _common.iter_document_chunks(*args, **kwargs):
+            threads.add(threading.get_ident())
+            read.append(len(chunk))
+            yield chunk
+
+    monkeypatch.setattr(async_index, "open_document_file", open_document_file)
+    monkeypatch.setattr(async_index, "iter_document_chunks", iter_document_chunks)
+    server, sizes = _server()
+    requests = []
+    read_at_first_request = []
+
+    async def handler(request):
+        requests.append(request)
+        if len(requests) == 1:
+            # Give the chunk being read ahead time to be read.
+            await asyncio.sleep(0.05)
+            read_at_first_request.append(list(read))
+        return server(request)
+
+    async with HttpxAsyncClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        tasks = await AsyncIndex(client, "movies").add_documents_from_file_in_batches(
+            ndjson_file, batch_size=10
+        )
+
+    assert threading.get_ident() not in threads
+    assert read_at_first_request == [[STREAM_CHUNK_BATCHES * 10, 95 - STREAM_CHUNK_BATCHES * 10]]
+    assert len(tasks) == 10
+
+
+async def test_async_update_ndjson_from_file_in_batches_streams(ndjson_file):
+    handler, sizes = _server()
+    async with HttpxAsyncClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        tasks = await AsyncIndex(client, "movies").update_documents_from_file_in_batches(
+            ndjson_file, batch_size=10, concurrency_limit=2
+        )
+
+    assert sum(sizes) == 95
+    assert len(tasks) == len(sizes)
+
+
+@pytest.mark.parametrize(
+    "name, expected_suffix, expected_compression",
+    (
+        ("movies.json", ".json", None),
+        ("movies.ndjson.gz", ".ndjson", "gzip"),
+        ("movies.csv.zst", ".csv", "zstd"),
+        ("movies.gz", "", "gzip"),
+    ),
+)
+def test_document_suffix(name, expected_suffix, expected_compression):
+    assert document_suffix(Path(name)) == expected_suffix
+    assert compression(Path(name)) == expected_compression
+
+
+@pytest.mark.parametrize("name", ("movies.txt.gz", "movies.gz", "movies.json.bz2"))
+def test_validate_file_type_compressed_invalid(name):
+    with pytest.raises(MeilisearchError):
+        validate_file_type(Path(name))
+
+
+@pytest.mark.parametrize(
+    "name",
+    (
+        "movies.json.gz",
+        "movies.ndjson.gz",
+        "movies.csv.gz",
+        "movies.json.zst",
+        "movies.ndjson.zst",
+        "movies.csv.zst",
+    ),
+)
+def test_load_compressed(tmp_path, name):
+    path = tmp_path / name
+    documents = _write_documents(path)
+
+    assert _load_documents_from_file(path, json_handler=BuiltinHandler()) == documents
+
+
+@pytest.mark.parametrize("name", ("movies.json.gz", "movies.csv.gz", "movies.ndjson.zst"))
+async def test_async_load_compressed(tmp_path, name):
+    path = tmp_path / name
+    documents = _write_documents(path)
+
+    assert await _async_load_documents_from_file(path, json_handler=BuiltinHandler()) == documents
+
+
+@pytest.mark.parametrize("name", ("movies.json.gz", "movies.ndjson.gz"))
+def test_add_compressed_from_file_in_batches(tmp_path, name):
+    path = tmp_path / name
+    _write_documents(path, 25)
+    handler, sizes = _server()
+    with HttpxClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        Index(client, "movies").add_documents_from_file_in_batches(path, batch_size=10)
+
+    assert sizes == [10, 10, 5]
+
+
+async def test_async_add_compressed_from_directory(tmp_path):
+    _write_documents(tmp_path / "one.ndjson.gz", 3)
+    _write_documents(tmp_path / "two.ndjson", 2)
+    _write_documents(tmp_path / "three.json.gz", 4)
+    handler, sizes = _server()
+    async with HttpxAsyncClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        await AsyncIndex(client, "movies").add_documents_from_directory(
+            tmp_path, document_type="ndjson", combine_documents=False
+        )
+
+    assert sorted(sizes) == [2, 3]
+
+
+@pytest.mark.parametrize("compress", (True, False))
+def test_add_gzip_raw_file_is_sent_as_is(tmp_path, compress):
+    path = tmp_path / "movies.ndjson.gz"
+    _write_documents(path)
+    handler, requests = _raw_server()
+    with HttpxClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        Index(client, "movies").add_documents_from_raw_file(path, compress=compress)
+
+    assert requests[0].content == path.read_bytes()
+    assert requests[0].headers["Content-Encoding"] == "gzip"
+    assert requests[0].headers["Content-Type"] == "application/x-ndjson"
+
+
+async def test_async_update_gzip_raw_file_is_sent_as_is(tmp_path):
+    path = tmp_path / "movies.csv.gz"
+    _write_documents(path)
+    handler, requests = _raw_server()
+    async with HttpxAsyncClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        await AsyncIndex(client, "movies").update_documents_from_raw_file(
+            path, csv_delimiter=",", compress=True
+        )
+
+    assert requests[0].content == path.read_bytes()
+    assert requests[0].headers["Content-Encoding"] == "gzip"
+    assert requests[0].headers["Content-Type"] == "text/csv"
+
+
+@pytest.mark.parametrize("compress", (True, False))
+def test_update_zstd_raw_file(tmp_path, compress):
+    path = tmp_path / "movies.ndjson.zst"
+    documents = _write_documents(path)
+    handler, requests = _raw_server()
+    with HttpxClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        Index(client, "movies").update_documents_from_raw_file(path, compress=compress)
+
+    content = gzip.decompress(requests[0].content) if compress else requests[0].content
+    assert list(iter_ndjson(content.decode().splitlines(), BuiltinHandler())) == documents
+    assert ("Content-Encoding" in requests[0].headers) is compress
+
+
+def test_plain_raw_file(tmp_path):
+    path = tmp_path / "movies.ndjson"
+    _write_documents(path)
+    handler, requests = _raw_server()
+    with HttpxClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        Index(client, "movies").add_documents_from_raw_file(path)
+
+    assert requests[0].content == path.read_bytes()
+    assert "Content-Encoding" not in requests[0].headers
+
+
+@pytest.fixture
+def ndjson_directory(tmp_path):
+    for i, count in enumerate((7, 12, 3, 9)):
+        _write_documents(tmp_path / f"movies{i}.ndjson.gz", count)
+
+    return tmp_path
+
+
+@pytest.mark.parametrize("combine_documents", (True, False))
+def test_add_documents_from_directory_in_batches_processes(ndjson_directory, combine_documents):
+    handler, sizes = _server()
+    with HttpxClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        index = Index(client, "movies")
+        index.add_documents_from_directory_in_batches(
+            ndjson_directory,
+            batch_size=5,
+            document_type="ndjson",
+            combine_documents=combine_documents,
+        )
+        expected = list(sizes)
+        sizes.clear()
+        tasks = index.add_documents_from_directory_in_batches(
+            ndjson_directory,
+            batch_size=5,
+            document_type="ndjson",
+            combine_documents=combine_documents,
+            max_workers=2,
+        )
+
+    assert sorted(sizes) == sorted(expected)
+    assert len(tasks) == len(sizes)
+
+
+@pytest.mark.parametrize("combine_documents", (True, False))
+async def test_async_update_documents_from_directory_in_batches_processes(
+    ndjson_directory, combine_documents
+):
+    handler, sizes = _server()
+    async with HttpxAsyncClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        tasks = await AsyncIndex(client, "movies").update_documents_from_directory_in_batches(
+            ndjson_directory,
+            batch_size=5,
+            document_type="ndjson",
+            combine_documents=combine_documents,
+            max_workers=2,
+        )
+
+    assert sum(sizes) == 31
+    assert len(tasks) == len(sizes)
+    if combine_documents:
+        assert sorted(sizes) == [1] + [5] * 6
+
+
+def test_take_chunks():
+    documents = list(range(7))
+
+    assert list(take_chunks(documents, 3)) == [[0, 1, 2], [3, 4, 5]]
+    assert documents == [6]
+
+
+def test_load_files_in_processes_order(tmp_path):
+    paths = [tmp_path / f"movies{i}.json" for i in range(6)]
+    for i, path in enumerate(paths):
+        path.write_text(json.dumps([{"id": i}]))
+
+    files = load_files_in_processes(paths, json_handler=BuiltinHandler(), max_workers=2)
+
+    assert list(files) == [[{"id": i}] for i in range(6)]
+
+
+def test_load_files_in_processes_error(tmp_path):
+    paths = [tmp_path / "good.json", tmp_path / "bad.json"]
+    paths[0].write_text(json.dumps([{"id": 1}]))
+    paths[1].write_text(json.dumps({"id": 2}))
+
+    with pytest.raises(InvalidDocumentError):
+        list(load_files_in_processes(paths, json_handler=BuiltinHandler(), max_workers=2))
+
+
+async def test_async_add_documents_from_directory_in_batches_processes_error(tmp_path):
+    (tmp_path / "bad.json").write_text(json.dumps({"id": 2}))
+    handler, _ = _server()
+    async with HttpxAsyncClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        with pytest.raises(InvalidDocumentError):
+            await AsyncIndex(client, "movies").add_documents_from_directory_in_batches(
+                tmp_path, max_workers=2
+            )
+
+
+async def test_async_send_files_in_processes_order(tmp_path):
+    paths = [tmp_path / f"movies{i}.json" for i in range(5)]
+    for i, path in enumerate(paths):
+        path.write_text(json.dumps([{"id": i * 2}, {"id": i * 2 + 1}]))
+    sent = []
+
+    async def send(documents):
+        await asyncio.sleep(0.01)
+        sent.append([x["id"] for x in documents])
+        return []
+
+    await _async_send_files_in_processes(
+        paths, send, chunk_size=3, json_handler=BuiltinHandler(), max_workers=2
+    )
+
+    assert sent == [[0, 1, 2], [3, 4, 5], [6, 7, 8], [9]]
+
+
+async def test_async_send_files_in_processes_send_error(tmp_path):
+    paths = [tmp_path / f"movies{i}.json" for i in range(6)]
+    for i, path in enumerate(paths):
+        path.write_text(json.dumps([{"id": i}]))
+
+    async def send(documents):
+        raise MeilisearchError("down")
+
+    with pytest.raises(MeilisearchError, match="down"):
+        await _async_send_files_in_processes(
+            paths, send, json_handler=BuiltinHandler(), max_workers=1
+        )
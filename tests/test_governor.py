@@ -0,0 +1,174 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from httpx2 import AsyncClient as HttpxAsyncClient
+from httpx2 import Client as HttpxClient
+from httpx2 import MockTransport, Response
+
+from meilisearch_python_sdk import AsyncClient, Client
+from meilisearch_python_sdk.governor import (
+    AsyncGovernorTransport,
+    Governor,
+    GovernorLimits,
+    GovernorTransport,
+)
+
+BASE_URL = "http://test:7700"
+
+
+def _concurrency_handler(delay):
+    state = {"in_flight": 0, "max_in_flight": 0}
+
+    async def handler(request):
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        await asyncio.sleep(delay)
+        state["in_flight"] -= 1
+        return Response(200, json={})
+
+    return handler, state
+
+
+@pytest.mark.parametrize(
+    "limits",
+    (
+        GovernorLimits(requests_per_second=0),
+        GovernorLimits(bytes_per_second=-1),
+        GovernorLimits(max_concurrent=0),
+    ),
+)
+def test_governor_invalid(limits):
+    with pytest.raises(ValueError):
+        Governor(writes=limits)
+
+
+@pytest.mark.parametrize(
+    "method, path, expected",
+    (
+        ("GET", "/tasks", "reads"),
+        ("POST", "/indexes/movies/search", "reads"),
+        ("POST", "/multi-search", "reads"),
+        ("POST", "/indexes/movies/documents/fetch", "reads"),
+        ("POST", "/indexes/movies/documents", "writes"),
+        ("PATCH", "/indexes/movies/settings", "writes"),
+        ("DELETE", "/indexes/movies", "writes"),
+    ),
+)
+def test_governor_pool(method, path, expected):
+    governor = Governor(reads=GovernorLimits(), writes=GovernorLimits())
+    request = HttpxClient(base_url=BASE_URL).build_request(method, path)
+
+    assert governor.pool(request) is getattr(governor, expected)
+
+
+async def test_request_rate():
+    governor = Governor(writes=GovernorLimits(requests_per_second=20, burst_seconds=0.1))
+    transport = AsyncGovernorTransport(MockTransport(lambda _: Response(202, json={})), governor)
+    async with HttpxAsyncClient(base_url=BASE_URL, transport=transport) as client:
+        start = time.perf_counter()
+        for _ in range(5):
+            await client.post("indexes/movies/documents", content=b"[]")
+        elapsed = time.perf_counter() - start
+
+    # The first 2 requests are in the burst and the other 3 wait 50ms each.
+    assert elapsed >= 0.14
+    assert governor.stats()["writes"]["delayed"] == 3
+
+
+async def test_bytes_rate():
+    governor = Governor(writes=GovernorLimits(bytes_per_second=1000, burst_seconds=0.1))
+    transport = AsyncGovernorTransport(MockTransport(lambda _: Response(202, json={})), governor)
+    async with HttpxAsyncClient(base_url=BASE_URL, transport=transport) as client:
+        start = time.perf_counter()
+        await client.post("indexes/movies/documents", content=b"x" * 100)
+        await client.post("indexes/movies/documents", content=b"x" * 100)
+        elapsed = time.perf_counter() - start
+
+    assert elapsed >= 0.09
+
+
+async def test_reads_not_limited_by_writes():
+    governor = Governor(writes=GovernorLimits(requests_per_second=1, burst_seconds=1))
+    transport = AsyncGovernorTransport(MockTransport(lambda _: Response(200, json={})), governor)
+    async with HttpxAsyncClient(base_url=BASE_URL, transport=transport) as client:
+        await client.post("indexes/movies/documents", content=b"[]")
+        start = time.perf_counter()
+        for _ in range(5):
+            await client.post("indexes/movies/search", content=b"{}")
+
+    assert time.perf_counter() - start < 0.5
+    assert governor.stats()["reads"] is None
+
+
+async def test_max_concurrent():
+    governor = Governor(reads=GovernorLimits(max_concurrent=2))
+    handler, state = _concurrency_handler(0.02)
+    transport = AsyncGovernorTransport(MockTransport(handler), governor)
+    async with HttpxAsyncClient(base_url=BASE_URL, transport=transport) as client:
+        await asyncio.gather(
+            *(client.post("indexes/movies/search", content=b"{}") for _ in range(6))
+        )
+
+    assert state["max_in_flight"] == 2
+    assert governor.stats()["reads"]["in_flight"] == 0
+
+
+async def test_max_concurrent_cancelled_waiter():
+    governor = Governor(reads=GovernorLimits(max_concurrent=1))
+    handler, _ = _concurrency_handler(0.05)
+    transport = AsyncGovernorTransport(MockTransport(handler), governor)
+    async with HttpxAsyncClient(base_url=BASE_URL, transport=transport) as client:
+        first = asyncio.create_task(client.post("indexes/movies/search", content=b"{}"))
+        waiting = asyncio.create_task(client.post("indexes/movies/search", content=b"{}"))
+        await asyncio.sleep(0.01)
+        waiting.cancel()
+        await first
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        await client.post("indexes/movies/search", content=b"{}")
+
+    assert governor.stats()["reads"]["in_flight"] == 0
+
+
+def test_governor_transport():
+    governor = Governor(reads=GovernorLimits(max_concurrent=2))
+    state = {"in_flight": 0, "max_in_flight": 0}
+    lock = threading.Lock()
+
+    def handler(request):
+        with lock:
+            state["in_flight"] += 1
+            state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        time.sleep(0.02)
+        with lock:
+            state["in_flight"] -= 1
+        return Response(200, json={})
+
+    transport = GovernorTransport(MockTransport(handler), governor)
+    with HttpxClient(base_url=BASE_URL, transport=transport) as client:
+        threads = [threading.Thread(target=client.get, args=("indexes",)) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert state["max_in_flight"] == 2
+    assert governor.stats()["reads"]["requests"] == 6
+
+
+async def test_async_client_governor(base_url, master_key, ssl_verify):
+    governor = Governor(reads=GovernorLimits(max_concurrent=1))
+    async with AsyncClient(base_url, master_key, verify=ssl_verify, governor=governor) as client:
+        await asyncio.gather(client.health(), client.get_version())
+
+    assert governor.stats()["reads"]["requests"] == 2
+
+
+def test_client_governor(base_url, master_key, ssl_verify):
+    governor = Governor(reads=GovernorLimits(max_concurrent=1))
+    with Client(base_url, master_key, verify=ssl_verify, governor=governor) as client:
+        client.health()
+
+    assert governor.stats()["reads"]["requests"] == 1
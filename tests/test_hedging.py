@@ -0,0 +1,135 @@
+import asyncio
+import time
+
+import pytest
+from httpx2 import AsyncClient as HttpxAsyncClient
+from httpx2 import ConnectError, MockTransport, Response
+
+from meilisearch_python_sdk import AsyncClient
+from meilisearch_python_sdk.hedging import AsyncHedgingTransport, Hedging
+from meilisearch_python_sdk.metrics import MetricsCollector
+
+
+def _slow_first_handler(delays):
+    calls = []
+
+    async def handler(request):
+        calls.append(request.url.path)
+        await asyncio.sleep(delays[len(calls) - 1])
+        return Response(200, json={"call": len(calls)})
+
+    return handler, calls
+
+
+@pytest.mark.parametrize("percentile", (-0.1, 1.1))
+def test_hedging_invalid_percentile(percentile):
+    with pytest.raises(ValueError):
+        Hedging(percentile=percentile)
+
+
+def test_hedging_invalid_budget():
+    with pytest.raises(ValueError):
+        Hedging(budget=-1.0)
+
+
+def test_hedging_delay():
+    hedging = Hedging(percentile=0.9, initial_delay_ms=50, min_samples=10)
+
+    assert hedging.delay_ms() == 50
+    for latency in range(1, 11):
+        hedging.observe(latency)
+
+    assert hedging.delay_ms() == 10
+
+
+def test_hedging_min_delay():
+    hedging = Hedging(initial_delay_ms=0, min_delay_ms=5)
+
+    assert hedging.delay_ms() == 5
+
+
+def test_hedging_budget():
+    hedging = Hedging(budget=0.5, max_burst=1.0)
+
+    assert not hedging.try_hedge()
+    hedging.start_request()
+    hedging.start_request()
+    hedging.start_request()
+
+    assert hedging.try_hedge()
+    assert not hedging.try_hedge()
+
+
+async def test_hedged_request_wins():
+    hedging = Hedging(initial_delay_ms=10, budget=1.0)
+    metrics = MetricsCollector()
+    handler, calls = _slow_first_handler([5.0, 0.0])
+    transport = AsyncHedgingTransport(MockTransport(handler), hedging, metrics)
+    async with HttpxAsyncClient(base_url="http://test", transport=transport) as client:
+        start = time.perf_counter()
+        response = await client.post("indexes/movies/search", content=b"{}")
+        elapsed = time.perf_counter() - start
+
+    assert response.json() == {"call": 2}
+    assert elapsed < 2.0
+    assert len(calls) == 2
+    assert hedging.stats()["hedged"] == 1
+    assert hedging.stats()["hedge_wins"] == 1
+    assert metrics.to_dict()["search"]["movies"]["retries"] == 1
+
+
+async def test_fast_request_not_hedged():
+    hedging = Hedging(initial_delay_ms=1000, budget=1.0)
+    handler, calls = _slow_first_handler([0.0])
+    transport = AsyncHedgingTransport(MockTransport(handler), hedging)
+    async with HttpxAsyncClient(base_url="http://test", transport=transport) as client:
+        await client.post("multi-search", content=b"{}")
+
+    assert len(calls) == 1
+    assert hedging.stats()["hedged"] == 0
+
+
+async def test_no_budget_not_hedged():
+    hedging = Hedging(initial_delay_ms=1, budget=0.0)
+    handler, calls = _slow_first_handler([0.1])
+    transport = AsyncHedgingTransport(MockTransport(handler), hedging)
+    async with HttpxAsyncClient(base_url="http://test", transport=transport) as client:
+        await client.post("indexes/movies/search", content=b"{}")
+
+    assert len(calls) == 1
+
+
+async def test_write_not_hedged():
+    hedging = Hedging(initial_delay_ms=1, budget=1.0)
+    handler, calls = _slow_first_handler([0.1])
+    transport = AsyncHedgingTransport(MockTransport(handler), hedging)
+    async with HttpxAsyncClient(base_url="http://test", transport=transport) as client:
+        await client.post("indexes/movies/documents", content=b"[]")
+
+    assert len(calls) == 1
+    assert hedging.stats()["requests"] == 0
+
+
+async def test_hedged_request_errors():
+    hedging = Hedging(initial_delay_ms=1, budget=1.0)
+
+    async def handler(request):
+        await asyncio.sleep(0.05)
+        raise ConnectError("down", request=request)
+
+    transport = AsyncHedgingTransport(MockTransport(handler), hedging)
+    async with HttpxAsyncClient(base_url="http://test", transport=transport) as client:
+        with pytest.raises(ConnectError):
+            await client.post("indexes/movies/search", content=b"{}")
+
+    assert hedging.stats()["hedged"] == 1
+
+
+async def test_async_client_hedging(base_url, master_key, ssl_verify):
+    hedging = Hedging(initial_delay_ms=0, min_delay_ms=0, budget=1.0)
+    async with AsyncClient(base_url, master_key, verify=ssl_verify, hedging=hedging) as client:
+        index = await client.create_index("movies")
+        result = await index.search("")
+
+    assert result.hits == []
+    assert hedging.stats()["requests"] == 1
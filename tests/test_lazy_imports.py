@@ -0,0 +1,73 @@
+import subprocess
+import sys
+
+import pytest
+
+import meilisearch_python_sdk
+
+
+def _loaded_modules(statement, modules):
+    code = f"{statement}; import sys; print(' '.join(m for m in {modules!r} if m in sys.modules))"
+    process = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    )
+
+    return set(process.stdout.split())
+
+
+def test_import_package_is_lazy():
+    got = _loaded_modules(
+        "import meilisearch_python_sdk",
+        ("httpx2", "pydantic", "aiofiles", "meilisearch_python_sdk._client._client"),
+    )
+
+    assert got == set()
+
+
+def test_import_client_does_not_load_async_modules():
+    got = _loaded_modules(
+        "from meilisearch_python_sdk import Client",
+        (
+            "aiofiles",
+            "meilisearch_python_sdk._client._async_client",
+            "meilisearch_python_sdk.index.async_index",
+            "meilisearch_python_sdk.metrics",
+            "meilisearch_python_sdk.slow_log",
+        ),
+    )
+
+    assert got == set()
+
+
+def test_import_clients_does_not_load_optional_features():
+    got = _loaded_modules(
+        "from meilisearch_python_sdk import AsyncClient, Client",
+        (
+            "meilisearch_python_sdk.adaptive",
+            "meilisearch_python_sdk.arrow",
+            "meilisearch_python_sdk.backpressure",
+            "meilisearch_python_sdk.checkpoint",
+        ),
+    )
+
+    assert got == set()
+
+
+def test_import_index_does_not_load_pyarrow():
+    got = _loaded_modules(
+        "from meilisearch_python_sdk.index import AsyncIndex, Index",
+        ("pyarrow", "meilisearch_python_sdk.arrow"),
+    )
+
+    assert got == set()
+
+
+@pytest.mark.parametrize("name", ("AsyncClient", "AsyncIndex", "Client", "Index"))
+def test_lazy_attributes(name):
+    assert getattr(meilisearch_python_sdk, name).__name__ == name
+    assert name in dir(meilisearch_python_sdk)
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        meilisearch_python_sdk.NotAClient  # noqa: B018
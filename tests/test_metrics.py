@@ -0,0 +1,216 @@
+import pytest
+from httpx2 import AsyncClient as HttpxAsyncClient
+from httpx2 import Client as HttpxClient
+from httpx2 import MockTransport, Response
+
+from meilisearch_python_sdk import AsyncClient, Client
+from meilisearch_python_sdk.metrics import (
+    AsyncMetricsTransport,
+    Histogram,
+    MetricsCollector,
+    MetricsTransport,
+    PerformanceAggregator,
+    operation_name,
+)
+from meilisearch_python_sdk.models.search import SearchResults, SearchResultsWithUID
+
+
+@pytest.mark.parametrize(
+    "method, path, expected",
+    (
+        ("POST", "/indexes/movies/search", ("search", "movies")),
+        ("POST", "/indexes/movies/facet-search", ("facet_search", "movies")),
+        ("POST", "/multi-search", ("multi_search", None)),
+        ("POST", "/indexes/movies/documents", ("add_documents", "movies")),
+        ("PUT", "/indexes/movies/documents", ("update_documents", "movies")),
+        ("POST", "/indexes/movies/documents/fetch", ("get_documents", "movies")),
+        ("POST", "/indexes/movies/documents/delete-batch", ("delete_documents", "movies")),
+        ("DELETE", "/indexes/movies/documents/1", ("delete_document", "movies")),
+        ("PATCH", "/indexes/movies/settings/ranking-rules", ("update_settings", "movies")),
+        ("GET", "/indexes/movies", ("get_index", "movies")),
+        ("POST", "/indexes", ("create_index", None)),
+        ("GET", "/tasks/1", ("get_task", None)),
+        ("GET", "/tasks", ("get_tasks", None)),
+        ("GET", "/prefix/indexes/movies/search", ("search", "movies")),
+        ("GET", "/health", ("get_health", None)),
+    ),
+)
+def test_operation_name(method, path, expected):
+    assert operation_name(method, path) == expected
+
+
+def test_histogram_buckets():
+    histogram = Histogram((0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+
+    assert histogram.count == 4
+    assert histogram.sum == pytest.approx(2.65)
+    assert histogram.cumulative_counts() == [2, 3, 4]
+
+
+def test_histogram_quantile():
+    histogram = Histogram((1.0, 2.0))
+    for _ in range(10):
+        histogram.observe(1.5)
+
+    assert histogram.quantile(0.5) == pytest.approx(1.5)
+    assert Histogram().quantile(0.5) is None
+
+
+def test_histogram_quantile_inf_bucket():
+    histogram = Histogram((1.0,))
+    histogram.observe(5.0)
+
+    assert histogram.quantile(0.99) == 1.0
+
+
+def test_histogram_quantile_invalid():
+    with pytest.raises(ValueError):
+        Histogram().quantile(2.0)
+
+
+def test_collector_to_dict():
+    metrics = MetricsCollector(buckets=(0.1,))
+    metrics.observe("search", 0.05, index="movies", bytes_sent=10)
+    metrics.observe("search", 0.5, index="movies", bytes_sent=10, error=True)
+    metrics.record_retry("search", index="movies")
+
+    got = metrics.to_dict()["search"]["movies"]
+
+    assert got["latency"]["count"] == 2
+    assert got["latency"]["buckets"] == {"0.1": 1, "+Inf": 2}
+    assert got["errors"] == 1
+    assert got["retries"] == 1
+    assert got["bytes_sent"] == 20
+
+
+def test_collector_time_records_errors():
+    metrics = MetricsCollector()
+
+    with pytest.raises(RuntimeError):
+        with metrics.time("reindex"):
+            raise RuntimeError("boom")
+
+    assert metrics.to_dict()["reindex"][None]["errors"] == 1
+
+
+def test_collector_reset():
+    metrics = MetricsCollector()
+    metrics.observe("search", 0.1)
+    metrics.reset()
+
+    assert metrics.to_dict() == {}
+
+
+def test_collector_to_prometheus():
+    metrics = MetricsCollector(buckets=(0.1,), namespace="test")
+    metrics.observe("search", 0.05, index='mo"vies', bytes_sent=5)
+
+    got = metrics.to_prometheus()
+
+    assert "# TYPE test_request_duration_seconds histogram" in got
+    assert (
+        'test_request_duration_seconds_bucket{operation="search",index="mo\\"vies",le="0.1"} 1'
+        in got
+    )
+    assert (
+        'test_request_duration_seconds_bucket{operation="search",index="mo\\"vies",le="+Inf"} 1'
+        in got
+    )
+    assert 'test_sent_bytes_total{operation="search",index="mo\\"vies"} 5' in got
+    assert 'test_errors_total{operation="search",index="mo\\"vies"} 0' in got
+
+
+async def test_async_metrics_transport():
+    metrics = MetricsCollector()
+    transport = AsyncMetricsTransport(
+        MockTransport(lambda request: Response(500 if "fail" in request.url.path else 200)),
+        metrics,
+    )
+    async with HttpxAsyncClient(base_url="http://test", transport=transport) as client:
+        await client.post("indexes/movies/search", content=b"{}")
+        await client.post("indexes/fail/search", content=b"{}")
+
+    got = metrics.to_dict()["search"]
+
+    assert got["movies"]["latency"]["count"] == 1
+    assert got["movies"]["bytes_sent"] == 2
+    assert got["movies"]["errors"] == 0
+    assert got["fail"]["errors"] == 1
+
+
+def test_metrics_transport():
+    metrics = MetricsCollector()
+    transport = MetricsTransport(MockTransport(lambda request: Response(200)), metrics)
+    with HttpxClient(base_url="http://test", transport=transport) as client:
+        client.get("multi-search")
+
+    assert metrics.to_dict()["multi_search"][None]["latency"]["count"] == 1
+
+
+async def test_async_client_metrics(base_url, master_key, ssl_verify):
+    metrics = MetricsCollector()
+    async with AsyncClient(base_url, master_key, verify=ssl_verify, metrics=metrics) as client:
+        index = await client.create_index("movies")
+        task = await index.add_documents([{"id": 1}])
+        await client.wait_for_task(task.task_uid)
+        await index.search("")
+
+    got = metrics.to_dict()
+
+    assert got["search"]["movies"]["latency"]["count"] == 1
+    assert got["add_documents"]["movies"]["bytes_sent"] > 0
+    assert got["create_index"][None]["latency"]["count"] == 1
+    assert got["wait_for_task"][None]["latency"]["count"] == 1
+
+
+def test_client_metrics(base_url, master_key, ssl_verify):
+    metrics = MetricsCollector()
+    with Client(base_url, master_key, verify=ssl_verify, metrics=metrics) as client:
+        index = client.create_index("movies")
+        index.search("")
+
+    got = metrics.to_dict()
+
+    assert got["search"]["movies"]["latency"]["count"] == 1
+    assert got["create_index"][None]["latency"]["count"] == 1
+
+
+def test_performance_aggregator():
+    aggregator = PerformanceAggregator()
+    for server, client in ((1, 3.0), (3, 5.0)):
+        results = SearchResults(
+            hits=[],
+            processingTimeMs=server,
+            query="",
+            performanceDetails={"search > keyword search": f"{server}ms", "search": f"{server}ms"},
+        )
+        aggregator.record(results, index="movies", client_ms=client)
+
+    got = aggregator.summary()["movies"]
+
+    assert got["stages"]["search > keyword search"] == {"count": 2, "p50": 2.0, "p95": 2.9}
+    assert got["server_ms"]["p50"] == 2.0
+    assert got["client_ms"]["p50"] == 4.0
+    assert got["overhead_ms"]["p50"] == 2.0
+
+
+def test_performance_aggregator_processing_time_fallback():
+    aggregator = PerformanceAggregator()
+    results = SearchResultsWithUID(hits=[], processingTimeMs=7, query="", indexUid="movies")
+    aggregator.record(results)
+
+    got = aggregator.summary(quantiles=(0.5,))["movies"]
+
+    assert got["server_ms"] == {"count": 1, "p50": 7.0}
+    assert got["client_ms"] == {"count": 0, "p50": None}
+    assert got["stages"] == {}
+
+
+def test_performance_aggregator_reset():
+    aggregator = PerformanceAggregator()
+    aggregator.record(SearchResults(hits=[], processingTimeMs=1, query=""))
+    aggregator.reset()
+
+    assert aggregator.summary() == {}
@@ -0,0 +1,234 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from httpx2 import AsyncClient as HttpxAsyncClient
+from httpx2 import Client as HttpxClient
+from httpx2 import ConnectError, MockTransport, Response
+
+from meilisearch_python_sdk.multi_node import (
+    AsyncMultiNodeClient,
+    AsyncRoutingTransport,
+    MultiNodeClient,
+    NodeRouter,
+    RoutingTransport,
+)
+
+PRIMARY = "http://primary:7700"
+REPLICAS = ["http://replica-1:7700", "http://replica-2:7700/meili"]
+
+
+def _handler(down=()):
+    def handler(request):
+        if request.url.host in down:
+            raise ConnectError("down", request=request)
+        if request.url.path.endswith("/health"):
+            return Response(200, json={"status": "available"})
+        return Response(200, json={"host": request.url.host, "path": request.url.path})
+
+    return handler
+
+
+async def _async_http_client(router, down=()):
+    transport = AsyncRoutingTransport(MockTransport(_handler(down)), router)
+    return HttpxAsyncClient(base_url=PRIMARY, transport=transport)
+
+
+def test_router_invalid_strategy():
+    with pytest.raises(ValueError):
+        NodeRouter(PRIMARY, REPLICAS, strategy="random")
+
+
+def test_router_invalid_max_failures():
+    with pytest.raises(ValueError):
+        NodeRouter(PRIMARY, REPLICAS, max_failures=0)
+
+
+async def test_reads_go_to_replicas():
+    router = NodeRouter(PRIMARY, REPLICAS)
+    async with await _async_http_client(router) as client:
+        hosts = [
+            (await client.post("indexes/movies/search", content=b"{}")).json() for _ in range(4)
+        ]
+
+    assert {x["host"] for x in hosts} == {"replica-1", "replica-2"}
+    assert {x["path"] for x in hosts} == {"/indexes/movies/search", "/meili/indexes/movies/search"}
+    assert router.primary.requests == 0
+
+
+async def test_writes_go_to_primary():
+    router = NodeRouter(PRIMARY, REPLICAS)
+    async with await _async_http_client(router) as client:
+        response = await client.post("indexes/movies/documents", content=b"[]")
+        task = await client.get("tasks/1")
+
+    assert response.json()["host"] == "primary"
+    assert task.json()["host"] == "primary"
+
+
+async def test_least_outstanding():
+    router = NodeRouter(PRIMARY, REPLICAS)
+    router.replicas[0].outstanding = 5
+
+    assert router.read_candidates()[0] is router.replicas[1]
+
+
+async def test_ewma():
+    router = NodeRouter(PRIMARY, REPLICAS, strategy="ewma")
+    router.replicas[0].ewma_ms = 1.0
+    router.replicas[1].ewma_ms = 10.0
+
+    assert router.read_candidates()[0] is router.replicas[0]
+
+
+async def test_read_from_primary():
+    router = NodeRouter(PRIMARY, REPLICAS, read_from_primary=True)
+
+    assert len(router.read_candidates()) == 3
+
+
+async def test_failed_read_is_retried_and_node_ejected():
+    router = NodeRouter(PRIMARY, REPLICAS, max_failures=1)
+    async with await _async_http_client(router, down=("replica-1",)) as client:
+        responses = [
+            (await client.post("indexes/movies/search", content=b"{}")).json() for _ in range(3)
+        ]
+
+    assert {x["host"] for x in responses} == {"replica-2"}
+    assert not router.replicas[0].healthy
+    assert router.replicas[1].healthy
+
+
+async def test_reads_fall_back_to_primary():
+    router = NodeRouter(PRIMARY, REPLICAS, max_failures=1)
+    async with await _async_http_client(router, down=("replica-1", "replica-2")) as client:
+        response = await client.post("multi-search", content=b"{}")
+
+    assert response.json()["host"] == "primary"
+
+
+async def test_all_nodes_down():
+    router = NodeRouter(PRIMARY, REPLICAS)
+    async with await _async_http_client(
+        router, down=("primary", "replica-1", "replica-2")
+    ) as client:
+        with pytest.raises(ConnectError):
+            await client.post("indexes/movies/search", content=b"{}")
+
+
+async def test_ejected_node_is_probed():
+    router = NodeRouter(PRIMARY, REPLICAS, max_failures=1, eject_seconds=0)
+    async with await _async_http_client(router, down=("replica-1",)) as client:
+        await client.post("indexes/movies/search", content=b"{}")
+        await client.post("indexes/movies/search", content=b"{}")
+
+    assert not router.replicas[0].healthy
+
+    transport = AsyncRoutingTransport(MockTransport(_handler()), router)
+    async with HttpxAsyncClient(base_url=PRIMARY, transport=transport) as client:
+        response = await client.post("indexes/movies/search", content=b"{}")
+        await asyncio.gather(*transport._probes)
+
+    # The request was routed before the probe in the background added the node back.
+    assert response.json()["host"] == "replica-2"
+    assert router.replicas[0].healthy
+
+
+async def test_request_does_not_wait_for_probe():
+    release = asyncio.Event()
+
+    async def handler(request):
+        if request.url.path.endswith("/health"):
+            await release.wait()
+            return Response(200, json={"status": "available"})
+        return Response(200, json={"host": request.url.host})
+
+    router = NodeRouter(PRIMARY, REPLICAS)
+    router.replicas[0].ejected_until = 0.0
+    transport = AsyncRoutingTransport(MockTransport(handler), router)
+    async with HttpxAsyncClient(base_url=PRIMARY, transport=transport) as client:
+        response = await asyncio.wait_for(
+            client.post("indexes/movies/search", content=b"{}"), timeout=1
+        )
+
+        assert response.json()["host"] == "replica-2"
+        assert router.replicas[0].probing
+
+        release.set()
+        await asyncio.gather(*transport._probes)
+
+    assert router.replicas[0].healthy
+
+
+async def test_cancelled_probe_is_retried_later():
+    async def handler(request):
+        if request.url.path.endswith("/health"):
+            await asyncio.Event().wait()
+        return Response(200, json={"host": request.url.host})
+
+    router = NodeRouter(PRIMARY, REPLICAS)
+    router.replicas[0].ejected_until = 0.0
+    transport = AsyncRoutingTransport(MockTransport(handler), router)
+    async with HttpxAsyncClient(base_url=PRIMARY, transport=transport) as client:
+        await client.post("indexes/movies/search", content=b"{}")
+        await asyncio.sleep(0)
+
+    assert not router.replicas[0].probing
+    assert not router.replicas[0].healthy
+
+
+def test_routing_transport_probes_in_background():
+    release = threading.Event()
+
+    def handler(request):
+        if request.url.path.endswith("/health"):
+            release.wait(timeout=5)
+            return Response(200, json={"status": "available"})
+        return Response(200, json={"host": request.url.host})
+
+    router = NodeRouter(PRIMARY, REPLICAS)
+    router.replicas[0].ejected_until = 0.0
+    transport = RoutingTransport(MockTransport(handler), router)
+    with HttpxClient(base_url=PRIMARY, transport=transport) as client:
+        host = client.post("indexes/movies/search", content=b"{}").json()["host"]
+        release.set()
+        while router.replicas[0].probing:
+            time.sleep(0.001)
+
+    assert host == "replica-2"
+    assert router.replicas[0].healthy
+
+
+def test_routing_transport():
+    router = NodeRouter(PRIMARY, REPLICAS, max_failures=1)
+    transport = RoutingTransport(MockTransport(_handler(("replica-2",))), router)
+    with HttpxClient(base_url=PRIMARY, transport=transport) as client:
+        reads = [client.get("indexes/movies/documents").json()["host"] for _ in range(3)]
+        write = client.delete("indexes/movies/documents/1").json()["host"]
+
+    assert set(reads) == {"replica-1"}
+    assert write == "primary"
+    assert [x["healthy"] for x in router.stats()] == [True, True, False]
+
+
+async def test_async_multi_node_client(base_url, master_key, ssl_verify):
+    async with AsyncMultiNodeClient(base_url, [base_url], master_key, verify=ssl_verify) as client:
+        index = await client.create_index("movies")
+        await index.search("")
+        health = await client.check_nodes()
+        stats = client.node_stats()
+
+    assert all(health.values())
+    assert stats[1]["requests"] == 1
+
+
+def test_multi_node_client(base_url, master_key, ssl_verify):
+    with MultiNodeClient(base_url, [base_url], master_key, verify=ssl_verify) as client:
+        index = client.create_index("movies")
+        index.search("")
+        health = client.check_nodes()
+        stats = client.node_stats()
+
+    assert all(health.values())
+    assert stats[1]["requests"] == 1
@@ -0,0 +1,145 @@
+import json
+
+import pytest
+from httpx2 import AsyncClient as HttpxAsyncClient
+from httpx2 import Client as HttpxClient
+from httpx2 import MockTransport, Response
+
+from meilisearch_python_sdk._task import async_wait_for_task
+from meilisearch_python_sdk.errors import InvalidDocumentError
+from meilisearch_python_sdk.index.async_index import AsyncIndex
+from meilisearch_python_sdk.index.index import Index
+from meilisearch_python_sdk.partial_update import (
+    async_update_changed_fields,
+    field_diff,
+    update_changed_fields,
+)
+
+
+def _server(stored):
+    """Mock Meilisearch that serves the stored documents and records what is sent."""
+    state = {"updated": [], "added": [], "fetched": []}
+
+    def handler(request):
+        path = request.url.path
+        if path.endswith("/documents/fetch"):
+            ids = json.loads(request.content)["ids"]
+            state["fetched"].append(ids)
+            results = [stored[x] for x in ids if x in stored]
+            return Response(200, json={"results": results, "offset": 0, "limit": 20, "total": 1})
+        if path.endswith("/documents"):
+            state["updated" if request.method == "PUT" else "added"].append(
+                json.loads(request.content)
+            )
+            return Response(
+                202,
+                json={
+                    "taskUid": 1,
+                    "indexUid": "movies",
+                    "status": "enqueued",
+                    "type": "documentAdditionOrUpdate",
+                    "enqueuedAt": "2024-01-01T00:00:00Z",
+                },
+            )
+        return Response(404, json={})
+
+    return handler, state
+
+
+STORED = {
+    "1": {"id": 1, "title": "Movie 1", "genre": "comedy", "cast": ["a", "b"]},
+    "2": {"id": 2, "title": "Movie 2", "genre": "drama"},
+    "3": {"id": 3, "title": "Movie 3", "genre": "drama", "year": 2000},
+}
+
+DOCUMENTS = [
+    {"id": 1, "title": "Movie 1", "genre": "comedy", "cast": ["a", "c"]},
+    {"id": 2, "title": "Movie 2", "genre": "drama"},
+    {"id": 3, "title": "Movie 3", "genre": "drama"},
+    {"id": 4, "title": "Movie 4"},
+]
+
+
+@pytest.mark.parametrize(
+    "previous, current, expected",
+    (
+        (None, {"id": 1, "title": "a"}, {"id": 1, "title": "a"}),
+        ({"id": 1, "title": "a"}, {"id": 1, "title": "a"}, None),
+        ({"id": 1, "title": "a"}, {"id": 1, "title": "b"}, {"id": 1, "title": "b"}),
+        ({"id": 1, "title": "a"}, {"id": 1, "title": "a", "year": 1}, {"id": 1, "year": 1}),
+        ({"id": 1, "info": {"a": 1}}, {"id": 1, "info": {"a": 2}}, {"id": 1, "info": {"a": 2}}),
+    ),
+)
+def test_field_diff(previous, current, expected):
+    assert field_diff(previous, current, "id") == expected
+
+
+def test_update_changed_fields_fetches_previous():
+    handler, state = _server(STORED)
+    with HttpxClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        result = update_changed_fields(
+            Index(client, "movies"), DOCUMENTS, primary_key="id", batch_size=2
+        )
+
+    assert (result.updated, result.replaced, result.unchanged) == (2, 1, 1)
+    assert state["fetched"] == [["1", "2"], ["3", "4"]]
+    assert state["updated"] == [[{"id": 1, "cast": ["a", "c"]}, {"id": 4, "title": "Movie 4"}]]
+    assert state["added"] == [[{"id": 3, "title": "Movie 3", "genre": "drama"}]]
+    assert len(result.tasks) == 2
+
+
+def test_update_changed_fields_local_previous():
+    handler, state = _server({})
+    with HttpxClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        result = update_changed_fields(
+            Index(client, "movies"), DOCUMENTS[:2], primary_key="id", previous=STORED
+        )
+
+    assert (result.updated, result.replaced, result.unchanged) == (1, 0, 1)
+    assert state["fetched"] == []
+
+
+def test_update_changed_fields_nothing_changed():
+    handler, state = _server(STORED)
+    with HttpxClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        result = update_changed_fields(
+            Index(client, "movies"), [STORED["2"]], primary_key="id", previous=STORED
+        )
+
+    assert result.tasks == []
+    assert state["updated"] == state["added"] == []
+
+
+def test_update_changed_fields_missing_primary_key():
+    handler, _ = _server(STORED)
+    with (
+        HttpxClient(base_url="http://test", transport=MockTransport(handler)) as client,
+        pytest.raises(InvalidDocumentError),
+    ):
+        update_changed_fields(Index(client, "movies"), [{"title": "a"}], primary_key="id")
+
+
+async def test_async_update_changed_fields():
+    handler, state = _server(STORED)
+    async with HttpxAsyncClient(base_url="http://test", transport=MockTransport(handler)) as client:
+        result = await async_update_changed_fields(
+            AsyncIndex(client, "movies"), DOCUMENTS, primary_key="id", concurrency_limit=2
+        )
+
+    assert (result.updated, result.replaced, result.unchanged) == (2, 1, 1)
+    assert state["fetched"] == [["1", "2", "3", "4"]]
+    assert state["updated"] == [[{"id": 1, "cast": ["a", "c"]}, {"id": 4, "title": "Movie 4"}]]
+
+
+async def test_async_update_changed_fields_index(async_index_with_documents):
+    index = await async_index_with_documents()
+    documents = (await index.get_documents(limit=2)).results
+    changed = [{**documents[0], "title": "Changed"}, documents[1]]
+
+    result = await async_update_changed_fields(index, changed)
+    await async_wait_for_task(
+        index.http_client, result.tasks[0].task_uid, json_handler=index._json_handler
+    )
+
+    assert (result.updated, result.unchanged) == (1, 1)
+    assert (await index.get_document(documents[0]["id"]))["title"] == "Changed"
@@ -0,0 +1,198 @@
+import json
+
+import pytest
+from httpx2 import AsyncClient as HttpxAsyncClient
+from httpx2 import Client as HttpxClient
+from httpx2 import MockTransport, Response
+
+from meilisearch_python_sdk import AsyncClient, Client
+from meilisearch_python_sdk._http_requests import AsyncHttpRequests, HttpRequests
+from meilisearch_python_sdk.errors import MeilisearchTaskFailedError
+from meilisearch_python_sdk.models.settings import MeilisearchSettings
+
+
+class _Server:
+    """Mock Meilisearch that keeps the task history of each index uid.
+
+    As in Meilisearch, the tasks of a deleted index are kept, and a swap moves the tasks of each
+    index to the other uid. A rename fails unless the first index exists and the second does not,
+    and a plain swap fails unless both exist.
+    """
+
+    def __init__(self):
+        self.indexes = {"movies"}
+        self.tasks = []
+        self.fail_documents = False
+
+    def task(self, index_uid, status="succeeded"):
+        uid = len(self.tasks)
+        self.tasks.append({"uid": uid, "indexUid": index_uid, "status": status})
+        return Response(
+            202,
+            json={
+                "taskUid": uid,
+                "indexUid": index_uid,
+                "status": "enqueued",
+                "type": "documentAdditionOrUpdate",
+                "enqueuedAt": "2024-01-01T00:00:00Z",
+            },
+        )
+
+    def result(self, task):
+        return {
+            **task,
+            "type": "documentAdditionOrUpdate",
+            "enqueuedAt": "2024-01-01T00:00:00Z",
+        }
+
+    def handler(self, request):
+        method, path = request.method, request.url.path.strip("/").split("/")
+        if path == ["tasks"]:
+            params = request.url.params
+            matches = [
+                x
+                for x in self.tasks
+                if x["indexUid"] in params["indexUids"].split(",")
+                and x["status"] in params["statuses"].split(",")
+                and ("uids" not in params or str(x["uid"]) in params["uids"].split(","))
+            ]
+            return Response(
+                200,
+                json={
+                    "results": [self.result(x) for x in matches],
+                    "total": len(matches),
+                    "limit": 1,
+                },
+            )
+        if path[0] == "tasks":
+            return Response(200, json=self.result(self.tasks[int(path[1])]))
+        if path == ["swap-indexes"]:
+            payload = json.loads(request.content)[0]
+            a, b = payload["indexes"]
+            if payload.get("rename"):
+                if a not in self.indexes or b in self.indexes:
+                    return self.task(None, "failed")
+                self.indexes.remove(a)
+                self.indexes.add(b)
+            elif a not in self.indexes or b not in self.indexes:
+                return self.task(None, "failed")
+            for task in self.tasks:
+                if task["indexUid"] in (a, b):
+                    task["indexUid"] = b if task["indexUid"] == a else a
+            return self.task(None)
+        if path == ["indexes"]:
+            uid = json.loads(request.content)["uid"]
+            self.indexes.add(uid)
+            return self.task(uid)
+        if len(path) == 2 and method == "GET":
+            if path[1] not in self.indexes:
+                return Response(404, json={"code": "index_not_found", "message": "not found"})
+            return Response(
+                200,
+                json={
+                    "uid": path[1],
+                    "primaryKey": "id",
+                    "createdAt": "2024-01-01T00:00:00Z",
+                    "updatedAt": "2024-01-01T00:00:00Z",
+                },
+            )
+        if len(path) == 2 and method == "DELETE":
+            existed = path[1] in self.indexes
+            self.indexes.discard(path[1])
+            return self.task(path[1], "succeeded" if existed else "failed")
+        if path[2:] == ["documents"]:
+            return self.task(path[1], "failed" if self.fail_documents else "succeeded")
+
+        return self.task(path[1])
+
+
+def _client(server):
+    client = Client("http://test")
+    client.http_client = HttpxClient(
+        base_url="http://test", transport=MockTransport(server.handler)
+    )
+    client._http_requests = HttpRequests(client.http_client, client.json_handler)
+    return client
+
+
+def _async_client(server):
+    client = AsyncClient("http://test")
+    client.http_client = HttpxAsyncClient(
+        base_url="http://test", transport=MockTransport(server.handler)
+    )
+    client._http_requests = AsyncHttpRequests(client.http_client, client.json_handler)
+    return client
+
+
+def test_reindex_after_failed_reindex():
+    server = _Server()
+    documents = [{"id": 1, "title": "Alien"}]
+    with _client(server) as client:
+        server.fail_documents = True
+        with pytest.raises(MeilisearchTaskFailedError):
+            client.reindex("movies", documents, settings=MeilisearchSettings())
+
+        server.fail_documents = False
+        client.reindex("movies", documents, settings=MeilisearchSettings())
+        index = client.reindex("movies", documents, settings=MeilisearchSettings())
+
+    assert index.uid == "movies"
+    assert any(x["status"] == "failed" for x in server.tasks if x["indexUid"] != "movies")
+
+
+async def test_async_reindex_after_failed_reindex():
+    server = _Server()
+    documents = [{"id": 1, "title": "Alien"}]
+    async with _async_client(server) as client:
+        server.fail_documents = True
+        with pytest.raises(MeilisearchTaskFailedError):
+            await client.reindex("movies", documents, settings=MeilisearchSettings())
+
+        server.fail_documents = False
+        await client.reindex("movies", documents, settings=MeilisearchSettings())
+        index = await client.reindex("movies", documents, settings=MeilisearchSettings())
+
+    assert index.uid == "movies"
+
+
+def test_reindex_new_index():
+    server = _Server()
+    with _client(server) as client:
+        index = client.reindex(
+            "books", [{"id": 1, "title": "Dune"}], settings=MeilisearchSettings()
+        )
+
+    assert index.uid == "books"
+    assert server.indexes == {"movies", "books"}
+
+
+def test_reindex_new_index_failed_deletes_shadow():
+    server = _Server()
+    server.fail_documents = True
+    with _client(server) as client, pytest.raises(MeilisearchTaskFailedError):
+        client.reindex("books", [{"id": 1, "title": "Dune"}], settings=MeilisearchSettings())
+
+    assert server.indexes == {"movies"}
+
+
+async def test_async_reindex_new_index():
+    server = _Server()
+    async with _async_client(server) as client:
+        index = await client.reindex(
+            "books", [{"id": 1, "title": "Dune"}], settings=MeilisearchSettings()
+        )
+
+    assert index.uid == "books"
+    assert server.indexes == {"movies", "books"}
+
+
+async def test_async_reindex_new_index_failed_deletes_shadow():
+    server = _Server()
+    server.fail_documents = True
+    async with _async_client(server) as client:
+        with pytest.raises(MeilisearchTaskFailedError):
+            await client.reindex(
+                "books", [{"id": 1, "title": "Dune"}], settings=MeilisearchSettings()
+            )
+
+    assert server.indexes == {"movies"}
@@ -0,0 +1,72 @@
+import pytest
+
+from meilisearch_python_sdk.models.search import (
+    PerformanceDetails,
+    SearchResults,
+    parse_duration_ms,
+)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    (
+        ("12ns", 0.000012),
+        ("295.29µs", 0.29529),
+        ("3.56ms", 3.56),
+        ("1.5s", 1500.0),
+        (4, 4.0),
+        ("fast", None),
+        (None, None),
+        (True, None),
+    ),
+)
+def test_parse_duration_ms(value, expected):
+    got = parse_duration_ms(value)
+    if expected is None:
+        assert got is None
+    else:
+        assert got == pytest.approx(expected)
+
+
+def test_performance_details():
+    details = PerformanceDetails(
+        {
+            "wait for permit": "200µs",
+            "search > tokenize": "400µs",
+            "search > keyword search": "1ms",
+            "search": "3ms",
+        }
+    )
+
+    assert details["search"] == "3ms"
+    assert details.get("missing") is None
+    assert list(details) == details.keys()
+    assert len(details) == 4
+    assert details.total_ms == pytest.approx(3.2)
+    assert details.stages[1].path == ["search", "tokenize"]
+    assert details.stages[1].depth == 1
+    assert details.durations_ms()["search > keyword search"] == pytest.approx(1.0)
+
+
+def test_performance_details_no_durations():
+    assert PerformanceDetails({"search": "unknown"}).total_ms is None
+
+
+def test_search_results_performance_details():
+    results = SearchResults(
+        hits=[],
+        processingTimeMs=3,
+        query="",
+        performanceDetails={"search": "3ms"},
+    )
+
+    assert results.performance_details == {"search": "3ms"}
+    assert isinstance(results.performance_trace, PerformanceDetails)
+    assert results.performance_trace.total_ms == pytest.approx(3.0)
+    assert results.model_dump(by_alias=True)["performanceDetails"] == {"search": "3ms"}
+
+
+def test_search_results_without_performance_details():
+    results = SearchResults(hits=[], processingTimeMs=3, query="")
+
+    assert results.performance_trace is None
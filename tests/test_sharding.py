@@ -0,0 +1,111 @@
+import pytest
+
+from meilisearch_python_sdk import AsyncClient
+from meilisearch_python_sdk.errors import InvalidDocumentError
+from meilisearch_python_sdk.models.search import SearchResults
+from meilisearch_python_sdk.sharding import AsyncShardedIndex, merge_search_results, shard_for
+
+
+def _results(scores, *, facets=None, facet_stats=None, total=None):
+    return SearchResults(
+        hits=[{"id": f"{score}", "_rankingScore": score} for score in scores],
+        query="tron",
+        processingTimeMs=len(scores),
+        estimatedTotalHits=len(scores) if total is None else total,
+        facetDistribution=facets,
+        facetStats=facet_stats,
+    )
+
+
+def test_shard_for_is_stable():
+    assert [shard_for(x, 4) for x in range(10)] == [shard_for(x, 4) for x in range(10)]
+    assert shard_for(1, 4) == shard_for("1", 4)
+    assert {shard_for(x, 4) for x in range(100)} == {0, 1, 2, 3}
+
+
+def test_merge_search_results():
+    got = merge_search_results(
+        [_results([0.9, 0.5, 0.1]), _results([0.8, 0.7])],
+        offset=1,
+        limit=3,
+        keep_ranking_score=False,
+    )
+
+    assert got.hits == [{"id": "0.8"}, {"id": "0.7"}, {"id": "0.5"}]
+    assert got.offset == 1
+    assert got.limit == 3
+    assert got.estimated_total_hits == 5
+    assert got.processing_time_ms == 3
+
+
+def test_merge_search_results_keep_ranking_score():
+    got = merge_search_results(
+        [_results([0.9]), _results([0.95])], offset=0, limit=20, keep_ranking_score=True
+    )
+
+    assert [x["_rankingScore"] for x in got.hits] == [0.95, 0.9]
+
+
+def test_merge_search_results_facets():
+    got = merge_search_results(
+        [
+            _results(
+                [0.9],
+                facets={"genre": {"action": 2, "drama": 1}},
+                facet_stats={"year": {"min": 1980, "max": 2000}},
+            ),
+            _results(
+                [0.8],
+                facets={"genre": {"action": 3, "comedy": 4}},
+                facet_stats={"year": {"min": 1970, "max": 1990}},
+            ),
+        ],
+        offset=0,
+        limit=20,
+        keep_ranking_score=False,
+    )
+
+    assert got.facet_distribution == {"genre": {"action": 5, "drama": 1, "comedy": 4}}
+    assert got.facet_stats == {"year": {"min": 1970, "max": 2000}}
+
+
+def test_sharded_index_no_clients():
+    with pytest.raises(ValueError):
+        AsyncShardedIndex([], "movies", primary_key="id")
+
+
+async def test_sharded_index_missing_primary_key():
+    clients = [AsyncClient("http://localhost:7700"), AsyncClient("http://localhost:7701")]
+    index = AsyncShardedIndex(clients, "movies", primary_key="id")
+
+    with pytest.raises(InvalidDocumentError):
+        await index.add_documents([{"title": "Tron"}])
+
+
+def test_sharded_index_split():
+    clients = [AsyncClient("http://localhost:7700"), AsyncClient("http://localhost:7701")]
+    index = AsyncShardedIndex(clients, "movies", primary_key="id")
+    documents = [{"id": x} for x in range(20)]
+
+    got = index._split(documents)
+
+    assert sorted(x["id"] for shard in got for x in shard) == list(range(20))
+    for i, shard in enumerate(got):
+        assert all(index.shard_for(x["id"]) == i for x in shard)
+
+
+async def test_sharded_index(async_client, small_movies):
+    index = await AsyncShardedIndex.create([async_client], "movies", "id")
+    tasks = await index.add_documents(small_movies)
+    await index.wait_for_tasks(tasks)
+
+    results = await index.search("Dragon", limit=5, show_ranking_score=True)
+    document = await index.get_document(small_movies[0]["id"])
+
+    assert results.hits
+    assert len(results.hits) <= 5
+    assert all("_rankingScore" in x for x in results.hits)
+    assert document["id"] == small_movies[0]["id"]
+
+    task = await index.delete_document(small_movies[0]["id"])
+    await index.wait_for_tasks([task])
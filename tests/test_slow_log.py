@@ -0,0 +1,168 @@
+import logging
+
+import pytest
+from httpx2 import AsyncClient as HttpxAsyncClient
+from httpx2 import Client as HttpxClient
+from httpx2 import ConnectError, MockTransport, Response
+
+from meilisearch_python_sdk import AsyncClient, Client
+from meilisearch_python_sdk.slow_log import (
+    AsyncSlowLogTransport,
+    SlowLogTransport,
+    SlowOperationLogger,
+    normalize_body,
+)
+
+
+@pytest.mark.parametrize(
+    "body, content_type, expected",
+    (
+        (
+            b'{"q": "tron", "filter": "year > 1980 AND genre = \'action\'", "limit": 20}',
+            "application/json",
+            '{"filter": "year > ? AND genre = ?", "limit": 20, "q": "?"}',
+        ),
+        (b'{"vector": [0.1, 0.2, 0.3]}', "application/json", '{"vector": "<vector 3>"}'),
+        (
+            b'[{"id": 1, "title": "a"}, {"id": 2, "title": "b"}]',
+            "application/json",
+            '{"documents": 2, "fields": ["id", "title"]}',
+        ),
+        (
+            b'{"queries": [{"indexUid": "movies", "q": "tron"}]}',
+            "application/json",
+            '{"queries": [{"indexUid": "movies", "q": "?"}]}',
+        ),
+        (b"id,title\n1,a\n", "text/csv", "<13 bytes text/csv>"),
+        (b"not json", "application/json", "<8 bytes application/json>"),
+        (b"", "application/json", ""),
+    ),
+)
+def test_normalize_body(body, content_type, expected):
+    assert normalize_body(body, content_type) == expected
+
+
+def test_normalize_body_truncated():
+    got = normalize_body(
+        b'{"q": "' + b"a" * 100 + b'", "sort": ["' + b"b" * 100 + b'"]}', max_length=10
+    )
+
+    assert got == '{"q": "?",...'
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    ({"sample_rate": 1.5}, {"sample_rate": -0.1}, {"max_per_second": 0}),
+)
+def test_slow_operation_logger_invalid(kwargs):
+    with pytest.raises(ValueError):
+        SlowOperationLogger(**kwargs)
+
+
+def _record(slow_log, total_ms):
+    return slow_log.record(
+        operation="search",
+        index="movies",
+        status_code=200,
+        request_body=b'{"q": "tron"}',
+        request_bytes=13,
+        content_type="application/json",
+        response_bytes=100,
+        time_to_headers_ms=total_ms / 2,
+        total_ms=total_ms,
+    )
+
+
+def test_slow_operation_logger_threshold(caplog):
+    slow_log = SlowOperationLogger(threshold_ms=100)
+
+    with caplog.at_level(logging.WARNING, logger="meilisearch_python_sdk.slow_log"):
+        assert _record(slow_log, 50) is None
+        got = _record(slow_log, 200)
+
+    assert got == {
+        "operation": "search",
+        "index": "movies",
+        "status_code": 200,
+        "body": '{"q": "?"}',
+        "request_bytes": 13,
+        "response_bytes": 100,
+        "timing_ms": {"total": 200, "time_to_headers": 100, "body_read": 100},
+    }
+    assert len(caplog.records) == 1
+    assert caplog.records[0].meilisearch == got
+
+
+def test_slow_operation_logger_sample_rate_zero():
+    slow_log = SlowOperationLogger(threshold_ms=0, sample_rate=0.0)
+
+    assert _record(slow_log, 10) is None
+
+
+def test_slow_operation_logger_max_per_second():
+    slow_log = SlowOperationLogger(threshold_ms=0, max_per_second=2)
+
+    got = [_record(slow_log, 10) for _ in range(5)]
+
+    assert len([x for x in got if x is not None]) == 2
+
+
+def test_slow_operation_logger_operations():
+    slow_log = SlowOperationLogger(operations=["search"])
+
+    assert slow_log.is_tracked("search")
+    assert not slow_log.is_tracked("get_tasks")
+    assert SlowOperationLogger(operations=None).is_tracked("get_tasks")
+
+
+async def test_async_slow_log_transport(caplog):
+    transport = AsyncSlowLogTransport(
+        MockTransport(lambda request: Response(200, content=b"{}")),
+        SlowOperationLogger(threshold_ms=0),
+    )
+    with caplog.at_level(logging.WARNING, logger="meilisearch_python_sdk.slow_log"):
+        async with HttpxAsyncClient(base_url="http://test", transport=transport) as client:
+            await client.post("indexes/movies/search", content=b'{"q": "tron"}')
+            await client.get("tasks")
+
+    assert len(caplog.records) == 1
+    assert caplog.records[0].meilisearch["index"] == "movies"
+    assert caplog.records[0].meilisearch["body"] == '{"q": "?"}'
+    assert caplog.records[0].meilisearch["response_bytes"] == 2
+
+
+def test_slow_log_transport_error(caplog):
+    def raise_error(request):
+        raise ConnectError("boom")
+
+    transport = SlowLogTransport(MockTransport(raise_error), SlowOperationLogger(threshold_ms=0))
+    with caplog.at_level(logging.WARNING, logger="meilisearch_python_sdk.slow_log"):
+        with HttpxClient(base_url="http://test", transport=transport) as client:
+            with pytest.raises(ConnectError):
+                client.post("multi-search", content=b"{}")
+
+    assert caplog.records[0].meilisearch["operation"] == "multi_search"
+    assert caplog.records[0].meilisearch["status_code"] is None
+
+
+async def test_async_client_slow_log(base_url, master_key, ssl_verify, caplog):
+    slow_log = SlowOperationLogger(threshold_ms=0)
+    with caplog.at_level(logging.WARNING, logger="meilisearch_python_sdk.slow_log"):
+        async with AsyncClient(
+            base_url, master_key, verify=ssl_verify, slow_log=slow_log
+        ) as client:
+            index = await client.create_index("movies")
+            await index.search("Tron")
+
+    assert caplog.records[-1].meilisearch["operation"] == "search"
+    assert caplog.records[-1].meilisearch["index"] == "movies"
+
+
+def test_client_slow_log(base_url, master_key, ssl_verify, caplog):
+    slow_log = SlowOperationLogger(threshold_ms=0)
+    with caplog.at_level(logging.WARNING, logger="meilisearch_python_sdk.slow_log"):
+        with Client(base_url, master_key, verify=ssl_verify, slow_log=slow_log) as client:
+            index = client.create_index("movies")
+            index.search("Tron")
+
+    assert caplog.records[-1].meilisearch["operation"] == "search"
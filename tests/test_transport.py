@@ -0,0 +1,88 @@
+import pytest
+from httpx2 import AsyncClient as HttpxAsyncClient
+from httpx2 import Client as HttpxClient
+from httpx2 import MockTransport, Response, Timeout
+
+from meilisearch_python_sdk import AsyncClient, Client
+from meilisearch_python_sdk.transport import (
+    AsyncOperationTimeoutTransport,
+    OperationTimeoutTransport,
+    TransportConfig,
+)
+
+
+def _timeout_handler(request):
+    return Response(200, json=request.extensions["timeout"])
+
+
+def test_transport_config_timeout():
+    config = TransportConfig(connect_timeout=1.0, pool_timeout=0.5)
+
+    assert config.timeout(10.0) == Timeout(10.0, connect=1.0, pool=0.5)
+    assert config.timeout(None) == Timeout(None, connect=1.0, pool=0.5)
+
+
+def test_transport_config_limits():
+    limits = TransportConfig(max_connections=500, keepalive_expiry=30.0).limits()
+
+    assert limits.max_connections == 500
+    assert limits.max_keepalive_connections == 20
+    assert limits.keepalive_expiry == 30.0
+
+
+async def test_async_operation_timeout_transport():
+    transport = AsyncOperationTimeoutTransport(
+        MockTransport(_timeout_handler),
+        {"search": 1.0, "add_documents": Timeout(5.0, write=60.0)},
+    )
+    async with HttpxAsyncClient(
+        base_url="http://test", timeout=10.0, transport=transport
+    ) as client:
+        search = await client.post("indexes/movies/search", content=b"{}")
+        add = await client.post("indexes/movies/documents", content=b"[]")
+        other = await client.get("tasks/1")
+
+    assert search.json() == Timeout(1.0).as_dict()
+    assert add.json() == Timeout(5.0, write=60.0).as_dict()
+    assert other.json() == Timeout(10.0).as_dict()
+
+
+def test_operation_timeout_transport():
+    transport = OperationTimeoutTransport(MockTransport(_timeout_handler), {"multi_search": 2.0})
+    with HttpxClient(base_url="http://test", timeout=10.0, transport=transport) as client:
+        response = client.post("multi-search", content=b"{}")
+
+    assert response.json() == Timeout(2.0).as_dict()
+
+
+@pytest.mark.parametrize("client_type", (AsyncClient, Client))
+def test_client_transport_config_timeout(client_type):
+    config = TransportConfig(read_timeout=30.0)
+    client = client_type("http://localhost:7700", timeout=5, transport_config=config)
+
+    assert client.http_client.timeout == Timeout(5, read=30.0)
+    assert client.transport_config == config
+
+
+async def test_async_client_transport_config(base_url, master_key, ssl_verify):
+    config = TransportConfig(
+        max_connections=10, pool_timeout=5.0, operation_timeouts={"search": 5.0}
+    )
+    async with AsyncClient(
+        base_url, master_key, verify=ssl_verify, transport_config=config
+    ) as client:
+        index = await client.create_index("movies")
+        result = await index.search("")
+
+    assert result.hits == []
+
+
+def test_client_transport_config(base_url, master_key, ssl_verify):
+    config = TransportConfig(
+        max_connections=10, pool_timeout=5.0, operation_timeouts={"search": 5.0}
+    )
+    with Client(base_url, master_key, verify=ssl_verify, transport_config=config) as client:
+        index = client.create_index("movies")
+        result = index.search("")
+
+    assert result.hits == []